@@ -21,6 +21,7 @@
 # *                                                                         *
 # ***************************************************************************
 
+import itertools
 import unittest
 
 from Path.Post.GcodeProcessingUtils import (
@@ -28,6 +29,10 @@ from Path.Post.GcodeProcessingUtils import (
     suppress_redundant_axes_words,
     filter_inefficient_moves,
     deduplicate_repeated_commands,
+    iter_insert_line_numbers,
+    iter_suppress_redundant_axes_words,
+    iter_filter_inefficient_moves,
+    iter_deduplicate_repeated_commands,
     NumberGenerator,
 )
 
@@ -533,3 +538,39 @@ class TestDeduplicateRepeatedCommands(unittest.TestCase):
         # Blockdelete commands should still follow modal rules
         expected = ["/G1 X10.0", "/G1 X20.0"]  # Full line kept (blockdelete handling)
         self.assertEqual(result, expected)
+
+
+class TestStreamingPipeline(unittest.TestCase):
+    """Test the iter_* versions chained into a streaming pipeline."""
+
+    @staticmethod
+    def _pipeline(gcode):
+        gcode = iter_deduplicate_repeated_commands(gcode)
+        gcode = iter_suppress_redundant_axes_words(gcode)
+        gcode = iter_filter_inefficient_moves(gcode)
+        return iter_insert_line_numbers(gcode)
+
+    def test_same_as_lists(self):
+        """Test the pipeline yields what the list functions return."""
+        gcode = [
+            "(header)",
+            "G0 Z5.0",
+            "G0 X0.0 Y0.0",
+            "G0 X10.0",
+            "G1 X10.0 Y10.0 F100.0",
+            "G1 X20.0 Y10.0 F100.0",
+            "M6 T2",
+            "G0 Z5.0",
+        ]
+        expected = insert_line_numbers(
+            filter_inefficient_moves(
+                suppress_redundant_axes_words(deduplicate_repeated_commands(gcode))
+            )
+        )
+        self.assertEqual(list(self._pipeline(iter(gcode))), expected)
+
+    def test_lazy(self):
+        """Test the pipeline works on an endless program."""
+        gcode = (f"G1 X{i}.0 Y{i % 7}.0" for i in itertools.count())
+        result = list(itertools.islice(self._pipeline(gcode), 3))
+        self.assertEqual(result, ["N10 G1 X0.0 Y0.0", "N20 X1.0 Y1.0", "N30 X2.0 Y2.0"])
@@ -232,6 +232,21 @@ class TestPathAdaptive(PathTestBase):
         total_cleared = sum(r.ClearedArea for r in results)
         return total_cleared, a2d
 
+    def _batchJobs(self, opTypes, stockPath2d, path2d):
+        """Create one Adaptive2d.ExecuteBatch job with default settings for each opType."""
+        jobs = []
+        for opType in opTypes:
+            a2d = area.Adaptive2d()
+            a2d.stepOverFactor = 0.20
+            a2d.toolDiameter = 5.0
+            a2d.tolerance = 0.1
+            a2d.forceInsideOut = False
+            a2d.finishingProfile = True
+            a2d.keepToolDownDistRatio = 3.0
+            a2d.opType = opType
+            jobs.append((a2d, stockPath2d, path2d, []))
+        return jobs
+
     def _calculateCornerUnclearableArea(self, tool_diameter):
         """Calculate unclearable area in a single corner due to circular tool."""
         tool_radius = tool_diameter / 2.0
@@ -362,6 +377,66 @@ class TestPathAdaptive(PathTestBase):
             msg=f"Total cleared area {total_cleared} should be within {delta} of {expected_area}",
         )
 
+    def testExecuteBatch(self):
+        """testExecuteBatch() Test C++ Adaptive2d batch execution matches single executions."""
+        stockPath2d, path2d, _ = self._createRectangleGeometry(50.0, 50.0, 40.0, 40.0)
+        opTypes = [
+            area.AdaptiveOperationType.ClearingInside,
+            area.AdaptiveOperationType.ClearingOutside,
+            area.AdaptiveOperationType.ProfilingInside,
+        ]
+
+        expected = [self._executeAdaptive(opType, stockPath2d, path2d)[0] for opType in opTypes]
+
+        jobs = self._batchJobs(opTypes, stockPath2d, path2d)
+        calls = []
+
+        def progressFn(tpaths):
+            calls.append(len(tpaths))
+            return False
+
+        batch = area.Adaptive2d.ExecuteBatch(jobs, progressFn, threads=2)
+
+        self.assertEqual(len(batch), len(jobs))
+        for results, total in zip(batch, expected):
+            for result in results:
+                self.checkAdaptiveErrors(result)
+            self.assertAlmostEqual(sum(r.ClearedArea for r in results), total, places=6)
+        self.assertTrue(len(calls) > 0, "progress callback should be called")
+
+    def testExecuteBatchStop(self):
+        """testExecuteBatchStop() Test C++ Adaptive2d batch execution stops all workers."""
+        stockPath2d, path2d, _ = self._createRectangleGeometry(50.0, 50.0, 40.0, 40.0)
+        opTypes = [area.AdaptiveOperationType.ClearingInside] * 8
+
+        start = time.monotonic()
+        complete = area.Adaptive2d.ExecuteBatch(
+            self._batchJobs(opTypes, stockPath2d, path2d), lambda tpaths: False, threads=2
+        )
+        completeTime = time.monotonic() - start
+
+        calls = []
+
+        def progressFn(tpaths):
+            # the first call lets the jobs go on, every later call stops them
+            calls.append(len(tpaths))
+            return len(calls) > 1
+
+        jobs = self._batchJobs(opTypes, stockPath2d, path2d)
+        start = time.monotonic()
+        batch = area.Adaptive2d.ExecuteBatch(jobs, progressFn, threads=2)
+        stopTime = time.monotonic() - start
+
+        self.assertGreater(len(calls), 1, "progress callback should be called again")
+        self.assertLess(stopTime, completeTime, "stopped batch should return promptly")
+        self.assertEqual(len(batch), len(jobs))
+        # the jobs which were not started before the stop are skipped by all workers
+        self.assertTrue(any(len(results) == 0 for results in batch))
+        self.assertLess(
+            sum(r.ClearedArea for results in batch for r in results),
+            sum(r.ClearedArea for results in complete for r in results),
+        )
+
     def testProfilingInside(self):
         """testProfilingInside() Test C++ Adaptive2d profiling inside a rectangle."""
         # Create geometry
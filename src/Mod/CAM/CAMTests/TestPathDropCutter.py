@@ -0,0 +1,171 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association <www.freecad.org>      *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import math
+import os
+import tempfile
+import unittest
+
+import Path
+import Path.Op.DropCutter as PathDropCutter
+from CAMTests import PathTestUtils
+
+try:
+    import ocl
+
+    HAVE_OCL = True
+except ImportError:
+    try:
+        import opencamlib as ocl
+
+        HAVE_OCL = True
+    except ImportError:
+        HAVE_OCL = False
+
+Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
+Path.Log.trackModule(Path.Log.thisModule())
+
+
+def _build_dome_stl(radius, n_lat=12, n_lon=24):
+    """Upper half of a sphere centered at the origin."""
+    stl = ocl.STLSurf()
+    for i in range(n_lat):
+        phi1 = 0.5 * math.pi * i / n_lat
+        phi2 = 0.5 * math.pi * (i + 1) / n_lat
+        for j in range(n_lon):
+            t1 = 2 * math.pi * j / n_lon
+            t2 = 2 * math.pi * (j + 1) / n_lon
+            p1, p2, p3, p4 = [
+                ocl.Point(
+                    radius * math.cos(phi) * math.cos(t),
+                    radius * math.cos(phi) * math.sin(t),
+                    radius * math.sin(phi),
+                )
+                for phi, t in ((phi1, t1), (phi2, t1), (phi2, t2), (phi1, t2))
+            ]
+            stl.addTriangle(ocl.Triangle(p1, p2, p3))
+            stl.addTriangle(ocl.Triangle(p1, p3, p4))
+    return stl
+
+
+@unittest.skipUnless(HAVE_OCL, "OpenCamLib not available")
+class TestPathDropCutter(PathTestUtils.PathTestBase):
+    """Test that the scans of DropCutterScheduler match serial OCL scans."""
+
+    cutterSpec = ("BallCutter", (4.0, 20.0))
+
+    @classmethod
+    def tearDownClass(cls):
+        PathDropCutter.shutdown()
+
+    def setUp(self):
+        # send even the small scans of these tests to the workers
+        self.limits = (PathDropCutter.MinParallelSamples, PathDropCutter.MinParallelTriangles)
+        PathDropCutter.MinParallelSamples = 0
+        PathDropCutter.MinParallelTriangles = 0
+
+    def tearDown(self):
+        PathDropCutter.MinParallelSamples, PathDropCutter.MinParallelTriangles = self.limits
+
+    def _scheduler(self, stl, processes):
+        cutter = PathDropCutter.makeCutter(ocl, self.cutterSpec)
+        return PathDropCutter.DropCutterScheduler(stl, cutter, self.cutterSpec, 0.5, processes)
+
+    def _serialDropCut(self, stl, spans, z):
+        pdc = ocl.PathDropCutter()
+        pdc.setSTL(stl)
+        pdc.setCutter(PathDropCutter.makeCutter(ocl, self.cutterSpec))
+        pdc.setZ(z)
+        pdc.setSampling(0.5)
+        scans = []
+        for span in spans:
+            path = ocl.Path()
+            path.append(ocl.Line(ocl.Point(span[1], span[2], 0), ocl.Point(span[3], span[4], 0)))
+            pdc.setPath(path)
+            pdc.run()
+            scans.append([(p.x, p.y, p.z) for p in pdc.getCLPoints()])
+        return scans
+
+    def _serialWaterlines(self, stl, zheights):
+        awl = ocl.AdaptiveWaterline()
+        awl.setSTL(stl)
+        awl.setCutter(PathDropCutter.makeCutter(ocl, self.cutterSpec))
+        awl.setSampling(0.5)
+        awl.setMinSampling(0.05)
+        layers = []
+        for z in zheights:
+            awl.setZ(z)
+            awl.run()
+            layers.append([[(p.x, p.y, p.z) for p in loop] for loop in awl.getLoops()])
+        return layers
+
+    def _loopPoints(self, layers):
+        """Return the points of every loop of layers, sorted.
+        AdaptiveWaterline starts the loops at varying points, even in serial runs."""
+        return [sorted(sorted(loop) for loop in loops) for loops in layers]
+
+    def _singleSTL(self, stl):
+        """Return stl read back by ocl.STLReader, so it holds single precision values."""
+        fd, fileName = tempfile.mkstemp(suffix=".stl")
+        os.close(fd)
+        try:
+            PathDropCutter.writeSTL(stl, fileName)
+            single = PathDropCutter.readSTL(ocl, fileName, True)
+        finally:
+            os.remove(fileName)
+        self.assertEqual(single.size(), stl.size())
+        return single
+
+    def test00(self):
+        """Verify writeSTL and readSTL keep the triangles at full precision."""
+        stl = _build_dome_stl(10.0)
+        fd, fileName = tempfile.mkstemp(suffix=".stl")
+        os.close(fd)
+        try:
+            self.assertFalse(PathDropCutter.writeSTL(stl, fileName))
+            copy = PathDropCutter.readSTL(ocl, fileName, False)
+        finally:
+            os.remove(fileName)
+        self.assertEqual(PathDropCutter.stlTriangles(copy), PathDropCutter.stlTriangles(stl))
+
+    def test10(self):
+        """Verify dropCut matches a serial scan with 1 and 2 processes."""
+        spans = [("L", -12.0, y / 2.0, 12.0, y / 2.0) for y in range(-20, 21)]
+        for stl in (_build_dome_stl(10.0), self._singleSTL(_build_dome_stl(10.0))):
+            expected = self._serialDropCut(stl, spans, -1.0)
+            for processes in (1, 2):
+                scheduler = self._scheduler(stl, processes)
+                self.assertEqual(scheduler.dropCut(spans, -1.0), expected)
+                self.assertEqual(scheduler.processes, processes)
+
+    def test20(self):
+        """Verify waterlines matches serial scans with 1 and 2 processes."""
+        zheights = [1.0, 3.0, 5.0, 7.0]
+        for stl in (_build_dome_stl(10.0), self._singleSTL(_build_dome_stl(10.0))):
+            expected = self._loopPoints(self._serialWaterlines(stl, zheights))
+            self.assertTrue(all(expected))
+            for processes in (1, 2):
+                scheduler = self._scheduler(stl, processes)
+                layers = scheduler.waterlines(zheights, 0.05)
+                self.assertEqual(self._loopPoints(layers), expected)
+                self.assertEqual(scheduler.processes, processes)
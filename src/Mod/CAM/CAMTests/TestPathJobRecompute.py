@@ -0,0 +1,120 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association <www.freecad.org>      *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import os
+import tempfile
+
+import FreeCAD
+import Path.Main.Job as PathJob
+import Path.Main.Recompute as PathRecompute
+import Path.Op.Custom as PathCustom
+import CAMTests.PathTestUtils as PathTestUtils
+
+
+class TestPathJobRecompute(PathTestUtils.PathTestBase):
+    """Test the dependency aware recompute of a job's operations."""
+
+    def setUp(self):
+        self.doc = FreeCAD.newDocument("TestPathJobRecompute")
+        box = self.doc.addObject("Part::Box", "Box")
+        self.doc.recompute()
+        self.job = PathJob.Create("Job", [box], None)
+        self.doc.recompute()
+
+    def tearDown(self):
+        FreeCAD.closeDocument(self.doc.Name)
+
+    def _makeOp(self, name, gcode):
+        op = PathCustom.Create(name, parentJob=self.job)
+        op.Gcode = gcode
+        return op
+
+    def _groupNames(self):
+        return [[obj.Name for obj in objs] for objs in PathRecompute.operationGroups(self.job)]
+
+    def test00(self):
+        """Verify independent operations are recomputed in separate groups."""
+        a = self._makeOp("A", ["G0 X1"])
+        b = self._makeOp("B", ["G0 X2"])
+        c = self._makeOp("C", ["G0 X3"])
+        self.assertEqual(self._groupNames(), [[a.Name], [b.Name], [c.Name]])
+
+    def test01(self):
+        """Verify linked operations are recomputed in the same group."""
+        a = self._makeOp("A", ["G0 X1"])
+        b = self._makeOp("B", ["G0 X2"])
+        c = self._makeOp("C", ["G0 X3"])
+        c.addProperty("App::PropertyLink", "Reference", "Test")
+        c.Reference = a
+        self.assertEqual(self._groupNames(), [[a.Name, c.Name], [b.Name]])
+
+    def test02(self):
+        """Verify rest machining depends on all previous operations."""
+        a = self._makeOp("A", ["G0 X1"])
+        b = self._makeOp("B", ["G0 X2"])
+        c = self._makeOp("C", ["G0 X3"])
+        d = self._makeOp("D", ["G0 X4"])
+        c.addProperty("App::PropertyBool", "UseRestMachining", "Test")
+        c.UseRestMachining = True
+        self.assertEqual(self._groupNames(), [[a.Name, b.Name, c.Name], [d.Name]])
+
+    def test10(self):
+        """Verify the results of a worker are committed to the document."""
+        a = self._makeOp("A", ["G0 X1"])
+        b = self._makeOp("B", ["G0 X2"])
+        self.doc.recompute()
+
+        a.Gcode = ["G0 X5", "G1 Y3"]
+        with tempfile.TemporaryDirectory() as tmpDir:
+            docFile = os.path.join(tmpDir, "copy.FCStd")
+            self.doc.saveCopy(docFile)
+            result = PathRecompute.recomputeGroup(docFile, [a.Name], [a.Name])
+            FreeCAD.closeDocument(PathRecompute._documents.pop(docFile).Name)
+
+        self.assertEqual(len(result), 1)
+        self.assertIn("Path", result[0][1])
+        PathRecompute._commit(self.doc, [a], result)
+        self.assertTrue(any(c.Parameters.get("Y") == 3 for c in a.Path.Commands))
+        self.assertNotIn("Touched", a.State)
+        self.assertNotIn("Touched", b.State)
+
+    def test20(self):
+        """Verify a job is recomputed in place with a single process."""
+        a = self._makeOp("A", ["G0 X1"])
+        self._makeOp("B", ["G0 X2"])
+        self.assertEqual(self.job.Proxy.recomputeOperations(1), 0)
+        self.assertFalse(self.doc.isTouched())
+        self.assertTrue(a.Path.Commands)
+
+    def test21(self):
+        """Verify the independent operations of a job are recomputed by two workers."""
+        a = self._makeOp("A", ["G0 X1"])
+        b = self._makeOp("B", ["G0 X2"])
+        self.doc.recompute()
+
+        a.Gcode = ["G0 X5", "G1 Y3"]
+        b.Gcode = ["G0 X6", "G1 Y4"]
+        self.assertEqual(self.job.Proxy.recomputeOperations(2), 2)
+        self.assertFalse(self.doc.isTouched())
+        self.assertTrue(any(c.Parameters.get("Y") == 3 for c in a.Path.Commands))
+        self.assertTrue(any(c.Parameters.get("Y") == 4 for c in b.Path.Commands))
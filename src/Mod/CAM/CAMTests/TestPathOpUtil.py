@@ -1103,6 +1103,37 @@ class TestGetClearedAreasWorkplane(PathTestUtils.PathTestBase):
         areas = PathOpUtil.getClearedAreas(current, self._bbox())
         self.assertEqual(len(areas), 1, "A previous op without Workplane should default to Z-up")
 
+    def test_clearedAreaCached(self):
+        """Cleared areas of unchanged previous ops are reused, changed ops are recomputed."""
+        z_up = Vector(0, 0, 1)
+        prev = self._makeOp("Prev", z_up, _makeRectanglePath(-20, -20, 20, 20, -1))
+        current = self._makeOp("Current", z_up, _makeRectanglePath(-10, -10, 10, 10, -1))
+
+        areas = PathOpUtil.getClearedAreas(current, self._bbox())
+        self.assertIs(PathOpUtil.getClearedAreas(current, self._bbox())[0], areas[0])
+
+        # another region has an area of its own, which is reused as well
+        bb = FreeCAD.BoundBox()
+        bb.add(FreeCAD.Vector(-5, -5, -10))
+        bb.add(FreeCAD.Vector(5, 5, 10))
+        smaller = PathOpUtil.getClearedAreas(current, bb)
+        self.assertIsNot(smaller[0], areas[0])
+        self.assertIs(PathOpUtil.getClearedAreas(current, bb)[0], smaller[0])
+        self.assertIs(PathOpUtil.getClearedAreas(current, self._bbox())[0], areas[0])
+
+        prev.Path = _makeRectanglePath(-25, -25, 25, 25, -1)
+        changed = PathOpUtil.getClearedAreas(current, self._bbox())
+        self.assertIsNot(changed[0], areas[0])
+        self.assertTrue(
+            changed[0].toTopoShape().BoundBox.XLength > areas[0].toTopoShape().BoundBox.XLength
+        )
+
+        name = prev.Name
+        self.job.Operations.removeObject(prev)
+        self.doc.removeObject(name)
+        self.assertEqual(len(PathOpUtil.getClearedAreas(current, self._bbox())), 0)
+        self.assertNotIn(name, PathOpUtil.getClearedAreaCache(self.job).entries)
+
 
 class TestStripRotaryAxes(PathTestUtils.PathTestBase):
     """Verify _stripRotaryAxes drops rotary parameters from path commands."""
@@ -0,0 +1,162 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association <www.freecad.org>      *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import types
+import unittest
+
+import FreeCAD
+import MeshPart
+import Part
+
+import Path
+import Path.Op.SurfaceSupport as PathSurfaceSupport
+from CAMTests import PathTestUtils
+
+try:
+    import ocl
+
+    HAVE_OCL = True
+except ImportError:
+    try:
+        import opencamlib as ocl
+
+        HAVE_OCL = True
+    except ImportError:
+        HAVE_OCL = False
+
+Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
+Path.Log.trackModule(Path.Log.thisModule())
+
+
+def _stlBounds(stl):
+    """Return the (min, max) coordinate tuples of the triangles of stl."""
+    points = [(p.x, p.y, p.z) for tri in stl.getTriangles() for p in tri.getPoints()]
+    return tuple(map(min, zip(*points))), tuple(map(max, zip(*points)))
+
+
+@unittest.skipUnless(HAVE_OCL, "OpenCamLib not available")
+class TestPathSurfaceSupport(PathTestUtils.PathTestBase):
+    """Test the OCL surfaces made of model shapes and their cache."""
+
+    def setUp(self):
+        self.doc = FreeCAD.newDocument("TestPathSurfaceSupport")
+        self.model = self.doc.addObject("Part::Feature", "Model")
+        self.model.Shape = Part.makeSphere(10.0).fuse(Part.makeBox(15.0, 15.0, 5.0))
+        self.doc.recompute()
+        PathSurfaceSupport._stlCache.clear()
+
+    def tearDown(self):
+        if self.doc is not None:
+            FreeCAD.closeDocument(self.doc.Name)
+        PathSurfaceSupport._stlCache.clear()
+
+    def _op(self, linearDeflection=0.1, angularDeflection=0.5):
+        return types.SimpleNamespace(
+            Document=self.doc,
+            LinearDeflection=FreeCAD.Units.Quantity(linearDeflection, "mm"),
+            AngularDeflection=FreeCAD.Units.Quantity(angularDeflection, "deg"),
+        )
+
+    def _mesh(self):
+        return MeshPart.meshFromShape(
+            Shape=self.model.Shape, LinearDeflection=0.1, AngularDeflection=0.5
+        )
+
+    def assertSameSurface(self, stl, expected):
+        self.assertEqual(stl.size(), expected.size())
+        for bound, expectedBound in zip(_stlBounds(stl), _stlBounds(expected)):
+            for value, expectedValue in zip(bound, expectedBound):
+                self.assertAlmostEqual(value, expectedValue, places=4)
+
+    def test00(self):
+        """Verify the STLReader path and its fallback match a surface built per facet."""
+        mesh = self._mesh()
+        expected = ocl.STLSurf()
+        for facet in mesh.Facets:
+            v1, v2, v3 = facet.Points
+            expected.addTriangle(ocl.Triangle(ocl.Point(*v1), ocl.Point(*v2), ocl.Point(*v3)))
+        self.assertEqual(expected.size(), mesh.CountFacets)
+
+        self.assertSameSurface(PathSurfaceSupport._meshToSTL(mesh, ocl), expected)
+
+        # the fallback is used if OCL lacks STLReader
+        noReader = types.SimpleNamespace(
+            STLSurf=ocl.STLSurf, Triangle=ocl.Triangle, Point=ocl.Point
+        )
+        self.assertSameSurface(PathSurfaceSupport._meshToSTL(mesh, noReader), expected)
+
+    def test10(self):
+        """Verify cached surfaces are reused for the same shape and deflection only."""
+        stl = PathSurfaceSupport._makeSTL(self.model, self._op(), ocl, cache=True)
+        self.assertIs(PathSurfaceSupport._makeSTL(self.model, self._op(), ocl, cache=True), stl)
+        self.assertIsNot(PathSurfaceSupport._makeSTL(self.model, self._op(), ocl), stl)
+
+        coarse = PathSurfaceSupport._makeSTL(self.model, self._op(0.5), ocl, cache=True)
+        self.assertIsNot(coarse, stl)
+        self.assertLess(coarse.size(), stl.size())
+        self.assertEqual(len(PathSurfaceSupport._stlCache), 2)
+
+    def test11(self):
+        """Verify the least recently used surface is evicted from the cache."""
+        size = PathSurfaceSupport.STLCacheSize
+        stls = [
+            PathSurfaceSupport._makeSTL(self.model, self._op(0.1 * (i + 1)), ocl, cache=True)
+            for i in range(size)
+        ]
+        # using the first surface makes the second one the least recently used
+        self.assertIs(
+            PathSurfaceSupport._makeSTL(self.model, self._op(0.1), ocl, cache=True), stls[0]
+        )
+        PathSurfaceSupport._makeSTL(self.model, self._op(0.1 * (size + 1)), ocl, cache=True)
+
+        self.assertEqual(len(PathSurfaceSupport._stlCache), size)
+        self.assertNotIn(stls[1], [stl for _, stl in PathSurfaceSupport._stlCache.values()])
+        self.assertIs(
+            PathSurfaceSupport._makeSTL(self.model, self._op(0.1), ocl, cache=True), stls[0]
+        )
+
+    def test12(self):
+        """Verify the cached surfaces of a document are dropped when it is closed."""
+        PathSurfaceSupport._makeSTL(self.model, self._op(), ocl, cache=True)
+        self.assertEqual(len(PathSurfaceSupport._stlCache), 1)
+
+        FreeCAD.closeDocument(self.doc.Name)
+        self.doc = None
+        self.assertEqual(len(PathSurfaceSupport._stlCache), 0)
+
+    def test13(self):
+        """Verify an edit of the model inside its bound box rebuilds the surface."""
+        block = Part.makeBox(40.0, 40.0, 20.0)
+        self.model.Shape = block.cut(Part.makeBox(10.0, 10.0, 10.0, FreeCAD.Vector(5, 5, 10)))
+        self.doc.recompute()
+        stl = PathSurfaceSupport._makeSTL(self.model, self._op(), ocl, cache=True)
+
+        # the pocket moves, the bound box and the facet count stay the same
+        self.model.Shape = block.cut(Part.makeBox(10.0, 10.0, 10.0, FreeCAD.Vector(25, 25, 10)))
+        self.doc.recompute()
+        moved = PathSurfaceSupport._makeSTL(self.model, self._op(), ocl, cache=True)
+
+        self.assertIsNot(moved, stl)
+        points = [(p.x, p.y, p.z) for tri in moved.getTriangles() for p in tri.getPoints()]
+        self.assertTrue(any(x > 30 and y > 30 and abs(z - 10) < 1e-6 for x, y, z in points))
+        self.assertFalse(any(x < 10 and y < 10 and abs(z - 10) < 1e-6 for x, y, z in points))
@@ -0,0 +1,135 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association <www.freecad.org>      *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import FreeCAD
+import Path.Post.Batch as PostBatch
+from Path.Post.Utils import gcode_newline_handling, write_gcode_lines
+
+
+class TestPostBatch(unittest.TestCase):
+    """Test headless batch post processing."""
+
+    doc_file = FreeCAD.getHomePath() + "/Mod/CAM/CAMTests/boxtest.fcstd"
+
+    def setUp(self):
+        FreeCAD.ConfigSet("SuppressRecomputeRequiredDialog", "True")
+        self.output_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.output_dir.cleanup()
+        FreeCAD.ConfigSet("SuppressRecomputeRequiredDialog", "")
+
+    def _post(self, sections, machines):
+        machine = MagicMock()
+        machine.postprocessor_file_name = "mock"
+        postprocessor = MagicMock()
+        postprocessor.export2_stream.side_effect = lambda: (
+            None if sections is None else [(name, iter(lines)) for name, lines in sections]
+        )
+        postprocessor.values = {"END_OF_LINE_CHARS": "\n"}
+        postprocessor.get_file_extension.return_value = "ngc"
+        with patch.object(PostBatch.MachineFactory, "get_machine", return_value=machine), patch(
+            "Path.Post.Batch._get_squawks",
+            return_value=[{"type": "NOTE", "operator": "Test", "note": "note"}],
+        ), patch.object(
+            PostBatch.PostProcessorFactory, "get_post_processor", return_value=postprocessor
+        ):
+            return PostBatch.post_files(
+                [self.doc_file], self.output_dir.name, machines=machines, processes=1
+            )
+
+    def test010_newline_handling(self):
+        self.assertEqual(gcode_newline_handling("G0\n"), ("G0\n", None))
+        self.assertEqual(gcode_newline_handling("\n\nG0\n"), ("G0\n", ""))
+        self.assertEqual(gcode_newline_handling("G0\r\n"), ("G0\r\n", ""))
+
+    def test015_write_gcode_lines(self):
+        filename = os.path.join(self.output_dir.name, "test.nc")
+        self.assertEqual(write_gcode_lines(filename, iter([])), 0)
+        self.assertFalse(os.path.exists(filename))
+
+        self.assertEqual(write_gcode_lines(filename, iter(["G0 X1", "G1 X2"]), "\r\n"), 2)
+        with open(filename, "rb") as f:
+            self.assertEqual(f.read(), b"G0 X1\r\nG1 X2")
+
+    def test020_list_tasks(self):
+        tasks = PostBatch.list_tasks([self.doc_file], machines=["MillA", "MillB"])
+        self.assertEqual([t["machine"] for t in tasks], ["MillA", "MillB"])
+        self.assertTrue(all(t["job"] == "Job" for t in tasks))
+        self.assertNotIn("boxtest", FreeCAD.listDocuments())
+
+    def test030_post_files(self):
+        summary = self._post([("allitems", ["G0 X1", "G1 X2"])], ["MillA", "MillB"])
+
+        self.assertEqual(summary["jobs"], 2)
+        self.assertEqual(summary["failed"], 0)
+        self.assertEqual(summary["lines"], 4)
+        self.assertEqual(summary["squawks"], 2)
+        for result in summary["results"]:
+            self.assertEqual(result["status"], "ok")
+            self.assertEqual(len(result["outputs"]), 1)
+            self.assertTrue(result["outputs"][0]["file"].endswith(".ngc"))
+            self.assertTrue(os.path.isfile(result["outputs"][0]["file"]))
+            self.assertIn("total", result["timings"])
+
+        with open(os.path.join(self.output_dir.name, PostBatch.SUMMARY_FILE)) as f:
+            self.assertEqual(json.load(f)["lines"], 4)
+        self.assertNotIn("boxtest", FreeCAD.listDocuments())
+
+    def test040_post_files_sections(self):
+        summary = self._post([("G54", ["G0 X1"]), ("G55", []), ("G56", ["G0 X2"])], ["MillA"])
+
+        outputs = summary["results"][0]["outputs"]
+        self.assertEqual([o["section"] for o in outputs], ["G54", "G56"])
+        self.assertEqual(summary["lines"], 2)
+
+    def test050_post_files_failure(self):
+        summary = self._post(None, ["MillA"])
+
+        self.assertEqual(summary["failed"], 1)
+        self.assertEqual(summary["results"][0]["status"], "error")
+        self.assertIn("error", summary["results"][0])
+
+    def test060_post_files_processes(self):
+        # mocks don't reach the workers, the unknown machines make every task fail there
+        machines = ["NoSuchMachineA", "NoSuchMachineB", "NoSuchMachineC"]
+        summary = PostBatch.post_files(
+            [self.doc_file], self.output_dir.name, machines=machines, processes=2
+        )
+
+        self.assertEqual(summary["processes"], 2)
+        self.assertEqual(summary["jobs"], 3)
+        self.assertEqual(summary["failed"], 3)
+        # results are in the order of the tasks
+        self.assertEqual([r["machine"] for r in summary["results"]], machines)
+        for result in summary["results"]:
+            self.assertEqual(result["status"], "error")
+            self.assertEqual(result["job"], "Job")
+            self.assertIn("open", result["timings"])
+        self.assertNotIn("boxtest", FreeCAD.listDocuments())
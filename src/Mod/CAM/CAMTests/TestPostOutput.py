@@ -1331,6 +1331,141 @@ class TestExport2Integration(unittest.TestCase):
                 len(g43_lines), 0, "Should have no G43 commands when tool length offset is disabled"
             )
 
+    def test112_command_stages_single_walk(self):
+        """
+        Test that the fused command stages give the same paths as the separate passes.
+
+        Given:  A tool_controller postable [M6 T1] and an operation postable
+                with rapid, spindle start and coolant commands
+        When:   _run_command_stages runs all _command_stages() in one walk
+        Then:   The paths equal those of the individual _expand_* passes
+        """
+        config = self._get_full_machine_config()
+        config["output"]["output_tool_length_offset"] = True
+        config["processing"]["translate_rapid_moves"] = True
+        config["processing"]["xy_before_z_after_tool_change"] = True
+        config["machine"]["spindles"][0]["spindle_wait"] = 2.5
+        config["machine"]["spindles"][0]["coolant_delay"] = 1.5
+        machine = Machine.from_dict(config)
+        post = self._create_postprocessor(machine)
+
+        def make_postables():
+            tc_item = PostList.Postable(
+                item_type="tool_controller",
+                label="6mm Endmill",
+                path=Path.Path([Path.Command("M6", {"T": 1})]),
+                source=None,
+                data={"tool_number": 1},
+            )
+            op_item = PostList.Postable(
+                item_type="operation",
+                label="TestProfile",
+                path=Path.Path(
+                    [
+                        Path.Command("M3", {"S": 1000.0}),
+                        Path.Command("M8"),
+                        Path.Command("G0", {"X": 10.0, "Y": 20.0, "Z": 5.0}),
+                        Path.Command("G1", {"X": 20.0, "Y": 30.0, "Z": -5.0, "F": 100.0}),
+                    ]
+                ),
+                source=None,
+                data={},
+            )
+            return [("allitems", [tc_item, op_item])]
+
+        separate = make_postables()
+        post._expand_canned_cycles(separate)
+        post._expand_split_arcs(separate)
+        post._expand_spindle_wait(separate)
+        post._expand_coolant_delay(separate)
+        post._expand_translate_rapids(separate)
+        post._expand_xy_before_z(separate)
+        post._expand_bcnc_commands(separate)
+        post._expand_tool_length_offset(separate)
+        post._expand_tool_change(separate)
+
+        fused = make_postables()
+        post._run_command_stages(fused)
+
+        for expected, item in zip(separate[0][1], fused[0][1]):
+            self.assertEqual(
+                [c.toGCode() for c in item.path.Commands],
+                [c.toGCode() for c in expected.path.Commands],
+            )
+        op_names = [c.Name for c in fused[0][1][1].path.Commands]
+        self.assertEqual(op_names, ["M3", "G4", "M8", "G4", "G1", "G1", "G1"])
+
+    def test113_command_stages_overridden_expand(self):
+        """
+        Test that an _expand_* method overridden by a subclass replaces its stage.
+
+        Given:  A PostProcessor subclass overriding _expand_spindle_wait
+        When:   _run_command_stages runs the command stages
+        Then:   The override is called once and the spindle wait is not added
+        """
+        from Path.Post.Processor import PostProcessor
+
+        calls = []
+
+        class NoSpindleWaitPost(PostProcessor):
+            def _expand_spindle_wait(self, postables):
+                calls.append(postables)
+
+        config = self._get_full_machine_config()
+        config["machine"]["spindles"][0]["spindle_wait"] = 2.5
+        config["machine"]["spindles"][0]["coolant_delay"] = 1.5
+        post = NoSpindleWaitPost(self.job, "", "", "mm")
+        post._machine = Machine.from_dict(config)
+        post.apply_configuration_bundle()
+
+        op_item = PostList.Postable(
+            item_type="operation",
+            label="TestProfile",
+            path=Path.Path(
+                [
+                    Path.Command("M3", {"S": 1000.0}),
+                    Path.Command("M8"),
+                    Path.Command("G1", {"X": 20.0, "Y": 30.0, "Z": -5.0, "F": 100.0}),
+                ]
+            ),
+            source=None,
+            data={},
+        )
+        postables = [("allitems", [op_item])]
+        post._run_command_stages(postables)
+
+        self.assertEqual(calls, [postables])
+        op_names = [c.Name for c in op_item.path.Commands]
+        self.assertEqual(op_names, ["M3", "M8", "G4", "G1"])
+
+    def test114_edit_command_list_keeps_emptied_path(self):
+        """
+        Test that an edit removing every command leaves the path unchanged.
+
+        Given:  An operation postable with two commands
+        When:   _edit_command_list replaces every command with nothing
+        Then:   The path keeps its original commands
+        """
+        post = self._create_postprocessor()
+        op_item = PostList.Postable(
+            item_type="operation",
+            label="TestProfile",
+            path=Path.Path(
+                [
+                    Path.Command("G0", {"X": 10.0, "Y": 20.0, "Z": 5.0}),
+                    Path.Command("G1", {"X": 20.0, "Y": 30.0, "Z": -5.0, "F": 100.0}),
+                ]
+            ),
+            source=None,
+            data={},
+        )
+        post._edit_command_list(
+            [("allitems", [op_item])],
+            lambda section_name, item, cmd, section_state: (0, []),
+        )
+
+        self.assertEqual([c.Name for c in op_item.path.Commands], ["G0", "G1"])
+
     # ===== 120-139: Output formatting tests =====
 
     def test120_line_numbers_exclude_header(self):
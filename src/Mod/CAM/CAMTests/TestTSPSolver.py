@@ -633,6 +633,63 @@ class TestTSPSolver(PathTestBase):
             self.assertRoughly(pair["xAlt"], pair["x"])
             self.assertRoughly(pair["yAlt"], pair["y"])
 
+    def test_19_sort_locations(self):
+        """Test nearest neighbour ordering of PathUtils.sort_locations."""
+        self.assertEqual(PathUtils.sort_locations([], ["x", "y"]), [])
+
+        result = PathUtils.sort_locations(list(self.dict_points), ["x", "y"])
+        self.assertEqual(
+            [(p["x"], p["y"]) for p in result], [(1, 3), (3, 7), (5, 5), (8, 2), (9, 8)]
+        )
+
+    def test_20_sort_locations_reference(self):
+        """Test PathUtils.sort_locations against a brute force nearest neighbour search."""
+
+        def reference(locations, attractors):
+            remaining = list(enumerate(locations))
+            last = {"x": 0, "y": 0}
+            out = []
+            while remaining:
+                best = min(
+                    remaining,
+                    key=lambda item: (
+                        (item[1]["x"] - last["x"]) ** 2
+                        + (item[1]["y"] - last["y"]) ** 2
+                        + sum(abs(item[1][k]) for k in attractors),
+                        item[0],
+                    ),
+                )
+                remaining.remove(best)
+                last = best[1]
+                out.append(best[0])
+            return out
+
+        # a perforated plate with plenty of equidistant candidates
+        grid = [{"x": (i % 13) * 2.5, "y": (i // 13) * 2.5 - 10, "i": i} for i in range(200)]
+        for attractors in (["x"], ["y"], ["x", "y"]):
+            result = PathUtils.sort_locations(list(grid), ["x", "y"], attractors)
+            self.assertEqual([p["i"] for p in result], reference(grid, attractors))
+
+    def test_21_sort_locations_optimize(self):
+        """Test 2-opt improvement of PathUtils.sort_locations."""
+
+        def length(locations):
+            return sum(
+                math.hypot(b["x"] - a["x"], b["y"] - a["y"])
+                for a, b in zip(locations, locations[1:])
+            )
+
+        points = [
+            {"x": math.cos(i * 2.4) * (i % 7) * 3, "y": math.sin(i * 2.4) * (i % 5) * 4, "i": i}
+            for i in range(100)
+        ]
+        nearest = PathUtils.sort_locations(list(points), ["x", "y"])
+        optimized = PathUtils.sort_locations(list(points), ["x", "y"], optimize=True)
+
+        self.assertEqual(sorted(p["i"] for p in optimized), list(range(100)))
+        self.assertEqual(optimized[0]["i"], nearest[0]["i"])
+        self.assertLess(length(optimized), length(nearest))
+
 
 if __name__ == "__main__":
     import unittest
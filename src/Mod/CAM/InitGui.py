@@ -286,7 +286,7 @@ class CAMWorkbench(Workbench):
             [QT_TRANSLATE_NOOP("Workbench", "&CAM")],
             projcmdlist
             + postcmdlist
-            + ["CAM_ExportTemplate", "Separator"]
+            + ["CAM_ExportTemplate", "CAM_RecomputeJob", "Separator"]
             + simcmdlist
             + toolcmdlist
             + toolbitcmdlist
@@ -401,7 +401,9 @@ class CAMWorkbench(Workbench):
                 "Path Modification", ["CAM_Array", "CAM_OperationCopy", "CAM_SimpleCopy"]
             )
         if onlyJob:
-            self.appendContextMenu("", ["CAM_OpActiveToggle", "CAM_ExportTemplate", "CAM_Sanity"])
+            self.appendContextMenu(
+                "", ["CAM_OpActiveToggle", "CAM_ExportTemplate", "CAM_RecomputeJob", "CAM_Sanity"]
+            )
         if startPoint:
             self.appendContextMenu("", ["CAM_SetStartPoint"])
         if onlyOps:
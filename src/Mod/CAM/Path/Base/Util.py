@@ -32,6 +32,7 @@ other than Path.Log, then it probably doesn't belong here.
 
 import FreeCAD
 import Path
+import multiprocessing
 
 translate = FreeCAD.Qt.translate
 
@@ -170,3 +171,14 @@ def clearExpressionEngine(obj):
     if hasattr(obj, "ExpressionEngine"):
         for attr, expr in obj.ExpressionEngine:
             obj.setExpression(attr, None)
+
+
+def processPoolContext():
+    """processPoolContext() ... returns the multiprocessing context for worker processes.
+
+    Workers are fresh interpreters, the FreeCAD executable itself can't host them."""
+    from freecad import utils
+
+    context = multiprocessing.get_context("spawn")
+    context.set_executable(utils.get_python_exe())
+    return context
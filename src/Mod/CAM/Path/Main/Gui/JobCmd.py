@@ -203,9 +203,40 @@ class CommandJobTemplateExport:
             json.dump(encoded, fp, sort_keys=True, indent=2)
 
 
+class CommandJobRecompute:
+    """
+    Command to recompute a job, its independent operations are recomputed concurrently
+    in worker processes, see Path.Main.Recompute.
+    """
+
+    def __init__(self):
+        pass
+
+    def GetResources(self):
+        return {
+            "Pixmap": "view-refresh",
+            "MenuText": QT_TRANSLATE_NOOP("CAM_RecomputeJob", "Recompute Job"),
+            "ToolTip": QT_TRANSLATE_NOOP(
+                "CAM_RecomputeJob",
+                "Recomputes the operations of the CAM job, independent operations in parallel",
+            ),
+        }
+
+    def GetJob(self):
+        return CommandJobTemplateExport.GetJob(self)
+
+    def IsActive(self):
+        return self.GetJob() is not None
+
+    def Activated(self):
+        recomputed = self.GetJob().Proxy.recomputeOperations()
+        Path.Log.debug("{} operation groups recomputed in parallel".format(recomputed))
+
+
 if FreeCAD.GuiUp:
     # register the FreeCAD command
     FreeCADGui.addCommand("CAM_Job", CommandJobCreate())
     FreeCADGui.addCommand("CAM_ExportTemplate", CommandJobTemplateExport())
+    FreeCADGui.addCommand("CAM_RecomputeJob", CommandJobRecompute())
 
 FreeCAD.Console.PrintLog("Loading PathJobCmd… done\n")
@@ -37,6 +37,7 @@ import time
 from lazy_loader.lazy_loader import LazyLoader
 
 Draft = LazyLoader("Draft", globals(), "Draft")
+PathRecompute = LazyLoader("Path.Main.Recompute", globals(), "Path.Main.Recompute")
 
 
 if False:
@@ -864,6 +865,11 @@ class ObjectJob:
 
         return ops
 
+    def recomputeOperations(self, processes=None):
+        """recomputeOperations(processes=None) ... Recompute the job, operations which don't
+        depend on each other are recomputed concurrently in processes worker processes."""
+        return PathRecompute.recomputeJob(self.obj, processes)
+
     def setCenterOfRotation(self, center):
         if center != self.obj.Path.Center:
             self.obj.Path.Center = center
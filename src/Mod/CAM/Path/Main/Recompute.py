@@ -0,0 +1,248 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association <www.freecad.org>      *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import FreeCAD
+import Path
+import Path.Base.Util as PathUtil
+import Path.Dressup.Utils as PathDressup
+import concurrent.futures
+import os
+import tempfile
+
+__title__ = "Recompute - Parallel recompute of CAM jobs"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+__doc__ = "Recomputes the independent operations of a job concurrently in worker processes."
+
+# Document objects can't be shared between processes.  Every worker opens a copy
+# of the document, recomputes the operations of the groups it is given and sends
+# back the serialized content of all properties which changed.  The calling
+# process restores these properties in the order of the operations in the job, so
+# the document ends up as if it had been recomputed in place.
+#
+# Operations end up in the same group if one of them depends on the other:
+#   - through links, e.g. a dressup and its base operation, or an operation
+#     using another one as its base geometry
+#   - through rest machining, which depends on all operations before it
+# Everything else the operations depend on, like models, stock, tool controllers
+# and the setup sheet, is recomputed in the calling process first.
+
+
+if False:
+    Path.Log.setLevel(Path.Log.Level.DEBUG, Path.Log.thisModule())
+    Path.Log.trackModule(Path.Log.thisModule())
+else:
+    Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
+
+
+# properties which are never sent back from the workers, links are skipped as well
+SkipProperties = ["Proxy", "ExpressionEngine", "Label", "Label2", "Visibility"]
+
+# documents opened by this (worker) process, keyed by file name
+_documents = {}
+
+
+def _members(op, operations):
+    """Return op and the operations it is built on which are not part of the job's
+    operations themselves, e.g. the base of a dressup."""
+    members = [op]
+    for obj in op.OutListRecursive:
+        if obj.Name in operations and obj not in members:
+            members.append(obj)
+    return members
+
+
+def operationGroups(job):
+    """operationGroups(job) ... Return the operations of job in groups which can be
+    recomputed independently of each other.
+    Each group is a list of document objects, the top level operation of the job
+    followed by the operations it is built on.  Groups are in job order and so
+    are the operations in every group."""
+    ops = list(job.Operations.Group)
+    operations = {op.Name for op in job.Proxy.allOperations()} - {op.Name for op in ops}
+    members = [_members(op, operations) for op in ops]
+
+    # union find over the top level operations
+    parent = list(range(len(ops)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i, j):
+        i, j = find(i), find(j)
+        if i != j:
+            parent[max(i, j)] = min(i, j)
+
+    owner = {}
+    for i, objs in enumerate(members):
+        for obj in objs:
+            if obj.Name in owner:
+                union(owner[obj.Name], i)
+            else:
+                owner[obj.Name] = i
+
+    for i, op in enumerate(ops):
+        if getattr(PathDressup.baseOp(op), "UseRestMachining", False):
+            for j in range(i):
+                union(i, j)
+        for obj in members[i]:
+            for dep in obj.OutListRecursive:
+                if dep.Name in owner:
+                    union(owner[dep.Name], i)
+
+    groups = {}
+    for i in range(len(ops)):
+        groups.setdefault(find(i), []).extend(members[i])
+    return [groups[root] for root in sorted(groups)]
+
+
+def _mustRecompute(obj):
+    state = obj.State
+    return "Touched" in state or "Invalid" in state
+
+
+def _dumpProperties(obj):
+    content = {}
+    for prop in obj.PropertiesList:
+        if prop in SkipProperties or "Link" in obj.getTypeIdOfProperty(prop):
+            continue
+        content[prop] = bytes(obj.dumpPropertyContent(prop, Compression=1))
+    return content
+
+
+def _openDocument(docFile):
+    """Return the document of docFile, opening it only once per process."""
+    doc = _documents.get(docFile)
+    if doc is None or doc.Name not in FreeCAD.listDocuments():
+        doc = FreeCAD.openDocument(docFile, True)
+        _documents[docFile] = doc
+    # operations still rely on the active document in places
+    FreeCAD.setActiveDocument(doc.Name)
+    return doc
+
+
+def recomputeGroup(docFile, names, touched):
+    """recomputeGroup(docFile, names, touched) ... Recompute the operations of a group.
+    touched are the names of the operations which must be recomputed, names those of
+    all operations of the group.  Returns a list of (name, {property: content}) of the
+    changed properties, or None if any operation failed."""
+    try:
+        doc = _openDocument(docFile)
+        objs = [doc.getObject(name) for name in names]
+        before = [_dumpProperties(obj) for obj in objs]
+
+        for name in touched:
+            doc.getObject(name).enforceRecompute()
+        # operations built on a recomputed one are recomputed as well
+        doc.recompute(objs)
+    except Exception as e:
+        Path.Log.error("Recompute of {} failed: {}".format(", ".join(names), e))
+        return None
+
+    result = []
+    for obj, content in zip(objs, before):
+        if "Invalid" in obj.State:
+            Path.Log.debug("{} failed to recompute".format(obj.Label))
+            return None
+        changed = {
+            prop: data for prop, data in _dumpProperties(obj).items() if content.get(prop) != data
+        }
+        result.append((obj.Name, changed))
+    return result
+
+
+def _recomputeLocally(doc, objs):
+    for obj in objs:
+        if _mustRecompute(obj):
+            obj.enforceRecompute()
+    doc.recompute(objs)
+
+
+def _commit(doc, objs, result):
+    for name, content in result:
+        obj = doc.getObject(name)
+        for prop, data in content.items():
+            if prop in obj.PropertiesList:
+                obj.restorePropertyContent(prop, data)
+    for obj in objs:
+        obj.purgeTouched()
+
+
+def recomputeJob(job, processes=None):
+    """recomputeJob(job, processes=None) ... Recompute job, running the independent
+    groups of its operations concurrently in worker processes.
+    processes defaults to the JobRecomputeProcesses preference, if it is 1, or there
+    are not at least two groups to recompute, the document is recomputed in place.
+    Returns the number of operation groups which were recomputed by the workers."""
+    doc = job.Document
+    if processes is None:
+        processes = Path.Preferences.jobRecomputeProcesses()
+    processes = processes or os.cpu_count() or 1
+
+    groups = operationGroups(job)
+    inGroups = {obj.Name for objs in groups for obj in objs}
+
+    # everything the operations depend on is recomputed here first
+    prerequisites = {}
+    for objs in groups:
+        for obj in objs:
+            for dep in obj.OutListRecursive:
+                if dep.Name not in inGroups and dep.Name != job.Name:
+                    prerequisites[dep.Name] = dep
+    if prerequisites:
+        doc.recompute(list(prerequisites.values()))
+
+    pending = [objs for objs in groups if any(_mustRecompute(obj) for obj in objs)]
+    recomputed = 0
+    if processes > 1 and len(pending) > 1:
+        processes = min(processes, len(pending))
+        Path.Log.info(
+            "Recomputing {} operation groups with {} processes".format(len(pending), processes)
+        )
+        with tempfile.TemporaryDirectory() as tmpDir:
+            docFile = os.path.join(tmpDir, "{}.FCStd".format(doc.Name))
+            doc.saveCopy(docFile)
+            names = [[obj.Name for obj in objs] for objs in pending]
+            touched = [[obj.Name for obj in objs if _mustRecompute(obj)] for objs in pending]
+            try:
+                with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=processes, mp_context=PathUtil.processPoolContext()
+                ) as executor:
+                    # results are committed in job order, as soon as they are available
+                    results = executor.map(recomputeGroup, [docFile] * len(pending), names, touched)
+                    for objs, result in zip(pending, results):
+                        if result is None:
+                            _recomputeLocally(doc, objs)
+                        else:
+                            _commit(doc, objs, result)
+                            recomputed += 1
+            except (OSError, concurrent.futures.BrokenExecutor) as e:
+                # whatever was not committed yet is still touched
+                Path.Log.warning("Recompute processes failed, recomputing serially: {}".format(e))
+        job.enforceRecompute()
+
+    doc.recompute()
+    return recomputed
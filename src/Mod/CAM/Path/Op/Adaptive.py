@@ -688,18 +688,14 @@ def ExecuteModelAware(op, obj):
             # stepping down depths like this. If we don't, it will keep history
             # from the last region we did.
 
-            # TODO: QThread/QRunnable trigger Python's global interpreter lock
-            # (GIL). To calculate toolpaths in parallel, making a C++ shim that
-            # takes in the array of regions/stock paths and parallelizes in
-            # C++-land is probably the way to do it.
+            # The regions are independent, ExecuteBatch calculates them in
+            # parallel on native threads without holding the GIL. Progress is
+            # still reported (and StopProcessing checked) on this thread.
 
             # Create a toolpath for each region to avoid re-calculating for
             # identical stepdowns
+            jobs = []
             for rdict in regionOps:
-                path2d = rdict["path2d"]
-                clearedArea = rdict["clearedArea"]
-                opType = rdict["opType"]
-
                 a2d = area.Adaptive2d()
                 a2d.stepOverFactor = 0.01 * obj.StepOverPercent
                 a2d.toolDiameter = op.tool.Diameter.Value
@@ -711,12 +707,21 @@ def ExecuteModelAware(op, obj):
                 a2d.tolerance = obj.Tolerance
                 a2d.forceInsideOut = obj.ForceInsideOut
                 a2d.finishingProfile = obj.FinishingProfile
-                a2d.opType = opType
-
-                rdict["toolpaths"] = a2d.Execute(
-                    stockPaths[rdict["startdepth"]], path2d, clearedArea, progressFn
+                a2d.opType = rdict["opType"]
+
+                jobs.append(
+                    (
+                        a2d,
+                        stockPaths[rdict["startdepth"]],
+                        rdict["path2d"],
+                        rdict["clearedArea"],
+                    )
                 )
 
+            toolpaths = area.Adaptive2d.ExecuteBatch(jobs, progressFn)
+            for rdict, regionToolpaths in zip(regionOps, toolpaths):
+                rdict["toolpaths"] = regionToolpaths
+
             # Sort regions to cut by either depth or area.
             # TODO: Bonus points for ordering to minimize rapids
             cutlist = list()
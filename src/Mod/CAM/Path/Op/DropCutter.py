@@ -0,0 +1,360 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association <www.freecad.org>      *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import Path
+import Path.Base.Util as PathUtil
+import array
+import atexit
+import collections
+import concurrent.futures
+import itertools
+import math
+import os
+import tempfile
+
+__title__ = "DropCutter - Parallel OpenCamLib scans"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+__doc__ = "Runs OpenCamLib drop-cutter and waterline scans of an STL surface in worker processes."
+
+# OCL objects can't be pickled, so the STL surface is written to an ASCII STL file
+# once and every worker reads it, and builds the cutter from its OCL_Tool spec,
+# with the first scan it gets for them.  Scans are sent as plain tuples:
+#
+#     ("L", x1, y1, x2, y2)              line from (x1, y1) to (x2, y2)
+#     ("A", x1, y1, x2, y2, cx, cy, ccw) arc around (cx, cy)
+#
+# PathDropCutter samples every span on its own, so splitting a scan into
+# consecutive batches of spans and joining the results in order yields exactly
+# the points of a single serial run.
+#
+# The worker processes are started with the first large scan and kept for the
+# scans of later recomputes, see shutdown().
+
+
+if False:
+    Path.Log.setLevel(Path.Log.Level.DEBUG, Path.Log.thisModule())
+    Path.Log.trackModule(Path.Log.thisModule())
+else:
+    Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
+
+
+# Scans with fewer sample points, or surfaces with fewer triangles for waterlines,
+# are cheaper than sending them to the worker processes.
+MinParallelSamples = 20000
+MinParallelTriangles = 5000
+# batches per worker, more batches balance uneven scan lines better
+BatchesPerProcess = 4
+# number of STL files kept for the workers
+STLFileCacheSize = 4
+
+# worker processes shared by all schedulers and their number
+_pool = None
+_poolProcesses = 0
+# (stl, source) of the surfaces written for the workers, by id of the stl
+_stlFiles = collections.OrderedDict()
+_stlSerial = itertools.count()
+
+# per process scan state of the worker processes
+_worker = None
+
+
+def _importOcl():
+    try:
+        import ocl
+    except ImportError:
+        import opencamlib as ocl
+    return ocl
+
+
+def stlTriangles(stl):
+    """stlTriangles(stl) ... Return the triangles of an ocl.STLSurf as flat array of coordinates."""
+    coords = array.array("d")
+    for tri in stl.getTriangles():
+        for p in tri.getPoints():
+            coords.extend((p.x, p.y, p.z))
+    return coords
+
+
+def makeSTL(ocl, coords):
+    """makeSTL(ocl, coords) ... Return an ocl.STLSurf built from a flat array of coordinates."""
+    stl = ocl.STLSurf()
+    for i in range(0, len(coords), 9):
+        stl.addTriangle(
+            ocl.Triangle(
+                ocl.Point(coords[i], coords[i + 1], coords[i + 2]),
+                ocl.Point(coords[i + 3], coords[i + 4], coords[i + 5]),
+                ocl.Point(coords[i + 6], coords[i + 7], coords[i + 8]),
+            )
+        )
+    return stl
+
+
+def writeSTL(stl, fileName):
+    """writeSTL(stl, fileName) ... Write the triangles of an ocl.STLSurf to an ASCII STL file.
+    Returns True if all coordinates are single precision values, which ocl.STLReader reads
+    back exactly.  This holds for surfaces read by ocl.STLReader in the first place."""
+    coords = stlTriangles(stl)
+    facet = (
+        "facet normal 0 0 0\nouter loop\n" + "vertex {!r} {!r} {!r}\n" * 3 + "endloop\nendfacet\n"
+    )
+    with open(fileName, "w") as f:
+        f.write("solid ocl\n")
+        for i in range(0, len(coords), 9):
+            f.write(facet.format(*coords[i : i + 9]))
+        f.write("endsolid ocl\n")
+    return array.array("d", array.array("f", coords)) == coords
+
+
+def readSTL(ocl, fileName, single):
+    """readSTL(ocl, fileName, single) ... Return an ocl.STLSurf read from an ASCII STL file.
+    If single is True the file holds single precision values only and is read by
+    ocl.STLReader, otherwise the coordinates are parsed at full precision."""
+    if single and hasattr(ocl, "STLReader"):
+        stl = ocl.STLSurf()
+        ocl.STLReader(fileName, stl)
+        return stl
+    coords = array.array("d")
+    with open(fileName) as f:
+        for line in f:
+            if line.startswith("vertex"):
+                coords.extend(float(v) for v in line.split()[1:])
+    return makeSTL(ocl, coords)
+
+
+def makeCutter(ocl, spec):
+    """makeCutter(ocl, spec) ... Return the OCL cutter described by OCL_Tool.getOclToolSpec()."""
+    method, args = spec
+    return getattr(ocl, method)(*args)
+
+
+def shutdown():
+    """shutdown() ... Stop the worker processes and remove the STL files written for them."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+    while _stlFiles:
+        _removeSTLFile(_stlFiles.popitem()[1][1])
+
+
+atexit.register(shutdown)
+
+
+def releaseSTL(stl):
+    """releaseSTL(stl) ... Remove the STL file written for stl, if any, once stl is discarded."""
+    entry = _stlFiles.pop(id(stl), None)
+    if entry is not None:
+        _removeSTLFile(entry[1])
+
+
+def _getPool(processes):
+    global _pool, _poolProcesses
+    if _pool is not None and _poolProcesses != processes:
+        _pool.shutdown()
+        _pool = None
+    if _pool is None:
+        Path.Log.debug("Starting {} OCL scan processes".format(processes))
+        _pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=PathUtil.processPoolContext(),
+            initializer=_initWorker,
+        )
+        _poolProcesses = processes
+    return _pool
+
+
+def _stlSource(stl):
+    """Return the (fileName, single, serial) source of stl for the workers, the file is
+    written for the first scan of stl and kept for the STLFileCacheSize latest surfaces."""
+    entry = _stlFiles.get(id(stl))
+    if entry is not None:
+        _stlFiles.move_to_end(id(stl))
+        return entry[1]
+
+    fd, fileName = tempfile.mkstemp(suffix=".stl")
+    os.close(fd)
+    try:
+        single = writeSTL(stl, fileName)
+    except Exception:
+        _removeSTLFile((fileName,))
+        raise
+    # the entry holds on to stl, so its id is not reused while the file exists
+    source = (fileName, single, next(_stlSerial))
+    _stlFiles[id(stl)] = (stl, source)
+    while len(_stlFiles) > STLFileCacheSize:
+        _removeSTLFile(_stlFiles.popitem(last=False)[1][1])
+    return source
+
+
+def _removeSTLFile(source):
+    try:
+        os.remove(source[0])
+    except OSError as e:
+        Path.Log.debug("Could not remove {}: {}".format(source[0], e))
+
+
+def _spanSamples(span, sampling):
+    if span[0] == "A":
+        # upper bound, a full circle
+        length = 2 * math.pi * math.hypot(span[1] - span[5], span[2] - span[6])
+    else:
+        length = math.hypot(span[3] - span[1], span[4] - span[2])
+    return length / sampling + 2
+
+
+def _makeState(ocl, stl, cutter):
+    return {"ocl": ocl, "stl": stl, "cutter": cutter, "ops": {}}
+
+
+def _dropCut(state, spans, z, sampling):
+    ocl = state["ocl"]
+    key = ("pdc", z, sampling)
+    pdc = state["ops"].get(key)
+    if pdc is None:
+        pdc = ocl.PathDropCutter()
+        pdc.setSTL(state["stl"])
+        pdc.setCutter(state["cutter"])
+        pdc.setZ(z)
+        pdc.setSampling(sampling)
+        state["ops"][key] = pdc
+
+    scans = []
+    for span in spans:
+        p1 = ocl.Point(span[1], span[2], 0)
+        p2 = ocl.Point(span[3], span[4], 0)
+        if span[0] == "A":
+            obj = ocl.Arc(p1, p2, ocl.Point(span[5], span[6], 0), span[7])
+        else:
+            obj = ocl.Line(p1, p2)
+        path = ocl.Path()
+        path.append(obj)
+        pdc.setPath(path)
+        pdc.run()
+        scans.append([(p.x, p.y, p.z) for p in pdc.getCLPoints()])
+    return scans
+
+
+def _waterline(state, z, sampling, minSampling):
+    ocl = state["ocl"]
+    key = ("awl", sampling, minSampling)
+    awl = state["ops"].get(key)
+    if awl is None:
+        awl = ocl.AdaptiveWaterline()
+        awl.setSTL(state["stl"])
+        awl.setCutter(state["cutter"])
+        awl.setSampling(sampling)
+        awl.setMinSampling(minSampling)
+        state["ops"][key] = awl
+    awl.setZ(z)
+    awl.run()
+    return [[(p.x, p.y, p.z) for p in loop] for loop in awl.getLoops()]
+
+
+def _initWorker():
+    # OCL may itself be built with OpenMP, one thread per worker avoids oversubscribing
+    # the cores.  This has to happen before OCL is loaded.
+    os.environ["OMP_NUM_THREADS"] = "1"
+
+
+def _workerState(source, cutterSpec):
+    global _worker
+    key = (source[2], cutterSpec)
+    if _worker is None or _worker["key"] != key:
+        ocl = _importOcl()
+        _worker = _makeState(ocl, readSTL(ocl, source[0], source[1]), makeCutter(ocl, cutterSpec))
+        _worker["key"] = key
+    return _worker
+
+
+def _workerDropCut(source, cutterSpec, spans, z, sampling):
+    return _dropCut(_workerState(source, cutterSpec), spans, z, sampling)
+
+
+def _workerWaterline(source, cutterSpec, z, sampling, minSampling):
+    return _waterline(_workerState(source, cutterSpec), z, sampling, minSampling)
+
+
+def _batches(items, count):
+    size = max(1, int(math.ceil(len(items) / count)))
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+class DropCutterScheduler:
+    """DropCutterScheduler(stl, cutter, cutterSpec, sampling, processes=None)
+    Performs OCL scans of stl with cutter, splitting large scans into batches which
+    are run by the shared pool of worker processes.  The results are returned in scan
+    order.  cutterSpec is the cutter description returned by OCL_Tool.getOclToolSpec()
+    and processes defaults to the OCLScanProcesses preference, 0 being one process per
+    core.  Small scans, and all scans if processes is 1, are run in the calling process."""
+
+    def __init__(self, stl, cutter, cutterSpec, sampling, processes=None):
+        self.stl = stl
+        self.cutterSpec = cutterSpec
+        self.sampling = sampling
+        if processes is None:
+            processes = Path.Preferences.oclScanProcesses()
+        self.processes = processes or os.cpu_count() or 1
+        self._local = _makeState(_importOcl(), stl, cutter)
+
+    def _map(self, fn, *args):
+        """Run fn over args in the workers, returns None if the pool is not usable."""
+        try:
+            pool = _getPool(self.processes)
+            count = len(args[0])
+            source = _stlSource(self.stl)
+            return list(pool.map(fn, [source] * count, [self.cutterSpec] * count, *args))
+        except (OSError, concurrent.futures.BrokenExecutor) as e:
+            Path.Log.warning("OCL scan processes failed, scanning serially: {}".format(e))
+            shutdown()
+            self.processes = 1
+            return None
+
+    def dropCut(self, spans, z):
+        """dropCut(spans, z) ... Drop the cutter along every span down to z.
+        Returns one list of (x, y, z) cutter location tuples per span."""
+        samples = sum(_spanSamples(span, self.sampling) for span in spans)
+        if self.processes > 1 and len(spans) > 1 and samples >= MinParallelSamples:
+            batches = _batches(spans, self.processes * BatchesPerProcess)
+            Path.Log.debug(
+                "OCL scan of {} spans, {} samples in {} batches".format(
+                    len(spans), int(samples), len(batches)
+                )
+            )
+            count = len(batches)
+            results = self._map(_workerDropCut, batches, [z] * count, [self.sampling] * count)
+            if results is not None:
+                return [scan for batch in results for scan in batch]
+        return _dropCut(self._local, spans, z, self.sampling)
+
+    def waterlines(self, zheights, minSampling):
+        """waterlines(zheights, minSampling) ... Run OCL AdaptiveWaterline for every height.
+        Returns one list of loops per height, each loop being a list of (x, y, z) tuples."""
+        if self.processes > 1 and len(zheights) > 1 and self.stl.size() >= MinParallelTriangles:
+            count = len(zheights)
+            results = self._map(
+                _workerWaterline, zheights, [self.sampling] * count, [minSampling] * count
+            )
+            if results is not None:
+                return results
+        return [_waterline(self._local, z, self.sampling, minSampling) for z in zheights]
@@ -48,6 +48,7 @@ except ImportError:
 from PySide.QtCore import QT_TRANSLATE_NOOP
 import Path
 import Path.Op.Base as PathOp
+import Path.Op.DropCutter as PathDropCutter
 import Path.Op.SurfaceSupport as PathSurfaceSupport
 import PathScripts.PathUtils as PathUtils
 import math
@@ -790,6 +791,7 @@ class ObjectSurface(PathOp.ObjectOp):
         # Setup cutter for OCL and cutout value for operation - based on tool controller properties
         oclTool = PathSurfaceSupport.OCL_Tool(ocl, obj)
         self.cutter = oclTool.getOclTool()
+        self.cutterSpec = oclTool.getOclToolSpec()
         if not self.cutter:
             Path.Log.error(
                 translate(
@@ -1107,6 +1109,11 @@ class ObjectSurface(PathOp.ObjectOp):
             self.cutter,
         )
 
+        # Scans of the cut area are split across worker processes for large models
+        scheduler = PathDropCutter.DropCutterScheduler(
+            self.modelSTLs[mdlIdx], self.cutter, self.cutterSpec, obj.SampleInterval.Value
+        )
+        scanDep = depthparams[lenDP - 1]
         profScan = []
         if obj.ProfileEdges != "None":
             prflShp = self.profileShapes[mdlIdx][fsi]
@@ -1121,7 +1128,7 @@ class ObjectSurface(PathOp.ObjectOp):
                 msg = translate("PathSurface", "No profile path geometry returned.")
                 Path.Log.error(msg)
                 return []
-            profScan = [self._planarPerformOclScan(obj, pdc, pathOffsetGeom, True)]
+            profScan = [self._planarPerformOclScan(obj, scheduler, scanDep, pathOffsetGeom, True)]
 
         geoScan = []
         if obj.ProfileEdges != "Only":
@@ -1142,9 +1149,9 @@ class ObjectSurface(PathOp.ObjectOp):
                     msg = translate("PathSurface", "No clearing path geometry returned.")
                     Path.Log.error(msg)
                     return []
-                geoScan = [self._planarPerformOclScan(obj, pdc, useGeom, True)]
+                geoScan = [self._planarPerformOclScan(obj, scheduler, scanDep, useGeom, True)]
             else:
-                geoScan = self._planarPerformOclScan(obj, pdc, pathGeom, False)
+                geoScan = self._planarPerformOclScan(obj, scheduler, scanDep, pathGeom, False)
 
         if obj.ProfileEdges == "Only":  # ['None', 'Only', 'First', 'Last']
             SCANDATA.extend(profScan)
@@ -1219,13 +1226,27 @@ class ObjectSurface(PathOp.ObjectOp):
 
         return offsetLists
 
-    def _planarPerformOclScan(self, obj, pdc, pathGeom, offsetPoints=False):
-        """_planarPerformOclScan(obj, pdc, pathGeom, offsetPoints=False)...
+    def _planarPerformOclScan(self, obj, scheduler, scanDep, pathGeom, offsetPoints=False):
+        """_planarPerformOclScan(obj, scheduler, scanDep, pathGeom, offsetPoints=False)...
         Switching function for calling the appropriate path-geometry to OCL points conversion function
-        for the various cut patterns."""
+        for the various cut patterns.  All lines and arcs of the pattern are collected first
+        and dropped to scanDep with a single scheduler scan."""
         Path.Log.debug("_planarPerformOclScan()")
         SCANS = []
+        SPANS = []
+
+        def addLine(A, B):
+            # D format is ((p1, p2), (p3, p4))
+            (x1, y1), (x2, y2) = A, B
+            SPANS.append(("L", x1, y1, x2, y2))
+            return len(SPANS) - 1
+
+        def addArc(Arc, cMode):
+            sp, ep, cp = Arc
+            SPANS.append(("A", sp[0], sp[1], ep[0], ep[1], cp[0], cp[1], cMode))
+            return len(SPANS) - 1
 
+        # First pass, replace every line and arc by the index of its scan
         if offsetPoints or obj.CutPattern == "Offset":
             PNTSET = PathSurfaceSupport.pathGeomToOffsetPointSet(obj, pathGeom)
             for D in PNTSET:
@@ -1237,9 +1258,8 @@ class ObjectSurface(PathOp.ObjectOp):
                         stpOvr.append(I)
                         ofst = []
                     else:
-                        # D format is ((p1, p2), (p3, p4))
                         A, B = I
-                        ofst.extend(self._planarDropCutScan(pdc, A, B))
+                        ofst.append(addLine(A, B))
                 if len(ofst) > 0:
                     stpOvr.append(ofst)
                 SCANS.extend(stpOvr)
@@ -1259,9 +1279,8 @@ class ObjectSurface(PathOp.ObjectOp):
                     if LN == "BRK":
                         stpOvr.append(LN)
                     else:
-                        # D format is ((p1, p2), (p3, p4))
                         A, B = LN
-                        stpOvr.append(self._planarDropCutScan(pdc, A, B))
+                        stpOvr.append(addLine(A, B))
                 SCANS.append(stpOvr)
                 stpOvr = []
         elif obj.CutPattern in ["Circular", "CircularZigZag"]:
@@ -1272,7 +1291,6 @@ class ObjectSurface(PathOp.ObjectOp):
 
             for so in range(0, len(PNTSET)):
                 stpOvr = []
-                erFlg = False
                 aTyp, dirFlg, ARCS = PNTSET[so]
 
                 if dirFlg == 1:  # 1
@@ -1285,18 +1303,37 @@ class ObjectSurface(PathOp.ObjectOp):
                     if Arc == "BRK":
                         stpOvr.append("BRK")
                     else:
-                        scan = self._planarCircularDropCutScan(pdc, Arc, cMode)
-                        if scan is False:
-                            erFlg = True
-                        else:
-                            if aTyp == "L":
-                                scan.append(FreeCAD.Vector(scan[0].x, scan[0].y, scan[0].z))
-                            stpOvr.append(scan)
-                if erFlg is False:
-                    SCANS.append(stpOvr)
+                        stpOvr.append(addArc(Arc, cMode))
+                SCANS.append(stpOvr)
         # Eif
 
-        return SCANS
+        # Second pass, scan all spans at once and convert OCL data to FreeCAD vectors
+        CLP = [
+            [FreeCAD.Vector(x, y, z) for x, y, z in scan]
+            for scan in scheduler.dropCut(SPANS, scanDep)
+        ]
+
+        def resolve(item):
+            if item == "BRK":
+                return item
+            if isinstance(item, list):
+                return [P for i in item for P in CLP[i]]
+            return CLP[item]
+
+        if offsetPoints or obj.CutPattern == "Offset":
+            return [resolve(item) for item in SCANS]
+        elif obj.CutPattern in ["Circular", "CircularZigZag"]:
+            for so in range(0, len(SCANS)):
+                aTyp = PNTSET[so][0]
+                stpOvr = []
+                for item in SCANS[so]:
+                    scan = resolve(item)
+                    if aTyp == "L" and item != "BRK":
+                        scan.append(FreeCAD.Vector(scan[0].x, scan[0].y, scan[0].z))
+                    stpOvr.append(scan)
+                SCANS[so] = stpOvr
+            return SCANS
+        return [[resolve(item) for item in STEP] for STEP in SCANS]
 
     def _planarDropCutScan(self, pdc, A, B):
         x1, y1 = A
@@ -1312,23 +1349,6 @@ class ObjectSurface(PathOp.ObjectOp):
         PNTS = [FreeCAD.Vector(p.x, p.y, p.z) for p in CLP]
         return PNTS  # pdc.getCLPoints()
 
-    def _planarCircularDropCutScan(self, pdc, Arc, cMode):
-        path = ocl.Path()  # create an empty path object
-        sp, ep, cp = Arc
-
-        # process list of segment tuples (vect, vect)
-        p1 = ocl.Point(sp[0], sp[1], 0)  # start point of arc
-        p2 = ocl.Point(ep[0], ep[1], 0)  # end point of arc
-        C = ocl.Point(cp[0], cp[1], 0)  # center point of arc
-        ao = ocl.Arc(p1, p2, C, cMode)  # arc object
-        path.append(ao)  # add the arc to the path
-        pdc.setPath(path)
-        pdc.run()  # run dropcutter algorithm on path
-        CLP = pdc.getCLPoints()
-
-        # Convert OCL object data to FreeCAD vectors
-        return [FreeCAD.Vector(p.x, p.y, p.z) for p in CLP]
-
     # Main planar scan functions
     def _planarDropCutSingle(self, JOB, obj, pdc, safePDC, depthparams, SCANDATA):
         Path.Log.debug("_planarDropCutSingle()")
@@ -2498,6 +2518,7 @@ class ObjectSurface(PathOp.ObjectOp):
         self.faceZMax = -999999999999.0
         if all is True:
             self.cutter = None
+            self.cutterSpec = None
             self.stl = None
             self.fullSTL = None
             self.cutOut = 0.0
@@ -2523,6 +2544,7 @@ class ObjectSurface(PathOp.ObjectOp):
         del self.faceZMax
         if all is True:
             del self.cutter
+            del self.cutterSpec
             del self.stl
             del self.fullSTL
             del self.cutOut
@@ -30,9 +30,13 @@ __contributors__ = ""
 
 import FreeCAD
 import Path
+import Path.Op.DropCutter as PathDropCutter
 import Path.Op.Util as PathOpUtil
 import PathScripts.PathUtils as PathUtils
+import collections
 import math
+import os
+import tempfile
 
 # lazily loaded modules
 from lazy_loader.lazy_loader import LazyLoader
@@ -50,6 +54,27 @@ else:
 
 translate = FreeCAD.Qt.translate
 
+# OCL surfaces of the most recently tessellated model shapes, shared by all operations
+# of a document, as (shape, stl)
+STLCacheSize = 4
+_stlCache = collections.OrderedDict()
+
+
+class _STLCacheObserver:
+    """Drops the cached OCL surfaces of a document when it is closed."""
+
+    _instance = None
+
+    @classmethod
+    def attach(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+            FreeCAD.addDocumentObserver(cls._instance)
+
+    def slotDeletedDocument(self, doc):
+        for key in [key for key in _stlCache if key[0] == doc.Name]:
+            PathDropCutter.releaseSTL(_stlCache.pop(key)[1])
+
 
 class PathGeometryGenerator:
     """Creates a path geometry shape from an assigned pattern for conversion to tool paths.
@@ -1160,7 +1185,9 @@ def _prepareModelSTLs(self, JOB, obj, m, ocl):
     objects"""
     if self.modelSTLs[m] is True:
         model = JOB.Model.Group[m]
-        self.modelSTLs[m] = _makeSTL(model, obj, ocl, self.modelTypes[m])
+        # rotational scans rotate the STL in place, it must not be shared
+        cache = getattr(obj, "ScanType", None) != "Rotational"
+        self.modelSTLs[m] = _makeSTL(model, obj, ocl, self.modelTypes[m], cache)
 
 
 def _makeSafeSTL(self, JOB, obj, mdlIdx, faceShapes, voidShapes, ocl):
@@ -1248,9 +1275,38 @@ def _makeSafeSTL(self, JOB, obj, mdlIdx, faceShapes, voidShapes, ocl):
     self.safeSTLs[mdlIdx] = _makeSTL(fused, obj, ocl)
 
 
-def _makeSTL(model, obj, ocl, model_type=None):
+def _meshToSTL(mesh, ocl):
+    """_meshToSTL(mesh, ocl) ... Return an ocl.STLSurf with the facets of mesh.
+    Mesh writes and OCL reads an ASCII STL file, so no Python object is created per facet."""
+    if mesh.CountFacets and hasattr(ocl, "STLReader"):
+        stl = ocl.STLSurf()
+        fd, fileName = tempfile.mkstemp(suffix=".ast")
+        os.close(fd)
+        try:
+            mesh.write(fileName, "AST")
+            ocl.STLReader(fileName, stl)
+        except Exception as e:
+            Path.Log.warning("Bulk STL transfer failed: {}".format(e))
+        finally:
+            os.remove(fileName)
+        if stl.size() == mesh.CountFacets:
+            return stl
+        Path.Log.debug("STL file holds {} of {} facets".format(stl.size(), mesh.CountFacets))
+
+    # Fallback, one OCL point per mesh point, shared by all its facets
+    points, facets = mesh.Topology
+    pnts = [ocl.Point(p.x, p.y, p.z) for p in points]
+    stl = ocl.STLSurf()
+    for i, j, k in facets:
+        stl.addTriangle(ocl.Triangle(pnts[i], pnts[j], pnts[k]))
+    return stl
+
+
+def _makeSTL(model, obj, ocl, model_type=None, cache=False):
     """Convert a mesh or shape into an OCL STL, using the tessellation
     tolerance specified in obj.LinearDeflection.
+    With cache the STL of a shape is shared with all later calls of the document
+    for the same shape and deflection values, it must not be modified then.
     Returns an ocl.STLSurf()."""
     # Determine Deflection Values
     lin_def = obj.LinearDeflection.Value
@@ -1269,31 +1325,43 @@ def _makeSTL(model, obj, ocl, model_type=None):
         ang_def = 0.15
 
     if model_type == "M":
-        facets = model.Mesh.Facets.Points
+        return _meshToSTL(model.Mesh, ocl)
+
+    if hasattr(model, "Shape"):
+        shape = model.Shape
     else:
-        if hasattr(model, "Shape"):
-            shape = model.Shape
-        else:
-            shape = model
-        # vertices, facet_indices = shape.tessellate(obj.LinearDeflection.Value) # tessellate workaround
-        # Workaround for tessellate bug
-        mesh = MeshPart.meshFromShape(
-            Shape=shape,
-            LinearDeflection=lin_def,
-            AngularDeflection=ang_def,
-        )
-        vertices = [point.Vector for point in mesh.Points]
-        facet_indices = [facet.PointIndices for facet in mesh.Facets]
-        facets = ((vertices[f[0]], vertices[f[1]], vertices[f[2]]) for f in facet_indices)
-    stl = ocl.STLSurf()
-    for tri in facets:
-        v1, v2, v3 = tri
-        t = ocl.Triangle(
-            ocl.Point(v1[0], v1[1], v1[2]),
-            ocl.Point(v2[0], v2[1], v2[2]),
-            ocl.Point(v3[0], v3[1], v3[2]),
-        )
-        stl.addTriangle(t)
+        shape = model
+
+    key = None
+    if cache:
+        bb = shape.BoundBox
+        key = (obj.Document.Name, shape.hashCode())
+        key += (bb.XMin, bb.YMin, bb.ZMin, bb.XMax, bb.YMax, bb.ZMax, lin_def, ang_def)
+        # hashCode() only identifies the shape while it exists, the entry keeps the
+        # shape alive and isSame() rules out another shape with the same hashCode
+        entry = _stlCache.get(key)
+        if entry is not None and entry[0].isSame(shape):
+            Path.Log.debug("_makeSTL() reusing STL of {} facets".format(entry[1].size()))
+            _stlCache.move_to_end(key)
+            return entry[1]
+
+    # vertices, facet_indices = shape.tessellate(obj.LinearDeflection.Value) # tessellate workaround
+    # Workaround for tessellate bug
+    mesh = MeshPart.meshFromShape(
+        Shape=shape,
+        LinearDeflection=lin_def,
+        AngularDeflection=ang_def,
+    )
+    stl = _meshToSTL(mesh, ocl)
+
+    if cache:
+        _STLCacheObserver.attach()
+        stale = _stlCache.pop(key, None)
+        if stale is not None:
+            PathDropCutter.releaseSTL(stale[1])
+        _stlCache[key] = (shape, stl)
+        while len(_stlCache) > STLCacheSize:
+            PathDropCutter.releaseSTL(_stlCache.popitem(last=False)[1][1])
     return stl
 
 
@@ -2442,6 +2510,7 @@ class OCL_Tool:
         self.tiltCutter = False
         self.safe = safe
         self.oclTool = None
+        self.oclToolSpec = None
         self.toolType = None
         self.toolMode = None
         self.toolMethod = None
@@ -2637,7 +2706,7 @@ class OCL_Tool:
         # OCL -> CylCutter::CylCutter(diameter, length)
         if self.diameter == -1.0 or self.cutEdgeHeight == -1.0:
             return
-        self.oclTool = self.ocl.CylCutter(self.diameter, self.cutEdgeHeight + self.lengthOffset)
+        self._makeOclTool("CylCutter", self.diameter, self.cutEdgeHeight + self.lengthOffset)
 
     def _oclBallCutter(self):
         # Standard Ball End Mill
@@ -2647,7 +2716,7 @@ class OCL_Tool:
         self.tiltCutter = True
         if self.cutEdgeHeight == 0:
             self.cutEdgeHeight = self.diameter / 2
-        self.oclTool = self.ocl.BallCutter(self.diameter, self.cutEdgeHeight + self.lengthOffset)
+        self._makeOclTool("BallCutter", self.diameter, self.cutEdgeHeight + self.lengthOffset)
 
     def _oclBullCutter(self):
         # Standard Bull Nose cutter
@@ -2655,7 +2724,8 @@ class OCL_Tool:
         # OCL -> BullCutter::BullCutter(diameter, minor radius, length)
         if self.diameter == -1.0 or self.flatRadius == -1.0 or self.cutEdgeHeight == -1.0:
             return
-        self.oclTool = self.ocl.BullCutter(
+        self._makeOclTool(
+            "BullCutter",
             self.diameter,
             self.diameter / 2 - self.flatRadius,
             self.cutEdgeHeight + self.lengthOffset,
@@ -2666,7 +2736,12 @@ class OCL_Tool:
         # OCL -> ConeCutter::ConeCutter(diameter, angle, length)
         if self.diameter == -1.0 or self.cutEdgeAngle == -1.0 or self.cutEdgeHeight == -1.0:
             return
-        self.oclTool = self.ocl.ConeCutter(self.diameter, self.cutEdgeAngle / 2, self.lengthOffset)
+        self._makeOclTool("ConeCutter", self.diameter, self.cutEdgeAngle / 2, self.lengthOffset)
+
+    def _makeOclTool(self, method, *args):
+        # Keep the arguments, worker processes rebuild the tool from them
+        self.oclToolSpec = (method, args)
+        self.oclTool = getattr(self.ocl, method)(*args)
 
     def _setToolMethod(self):
         toolMap = dict()
@@ -2720,6 +2795,12 @@ class OCL_Tool:
         FreeCAD.Console.PrintError(err + "\n")
         return False
 
+    def getOclToolSpec(self):
+        """getOclToolSpec()... Call this method after getOclTool() method
+        to return the (OCL class name, arguments) tuple the OCL tool was made from.
+        Unlike the OCL tool itself, it can be passed to other processes."""
+        return self.oclToolSpec
+
     def useTiltCutter(self):
         """useTiltCutter()... Call this method after getOclTool() method
         to return status of cutter tilt availability - generally this
@@ -26,6 +26,7 @@ import FreeCAD
 import Path
 import Path.Dressup.Utils as PathDressup
 import PathScripts.PathUtils as PathUtils
+import collections
 import math
 
 # lazily loaded modules
@@ -536,6 +537,65 @@ def _stripRotaryAxes(path):
     return Path.Path(stripped)
 
 
+# number of Z height and region queries for which the cleared area of an operation is kept
+ClearedAreaCacheQueries = 64
+
+
+class ClearedAreaCache:
+    """ClearedAreaCache() ... Cleared areas of the operations of a job.
+    The cleared area of an operation only depends on its path, tool and workplane,
+    which form the key of its entry.  An entry holds the areas of the Z heights and
+    XY regions queried so far.  A changed operation only invalidates its own entry,
+    so rest machining doesn't have to replay the swept areas of all previous
+    operations on every recompute."""
+
+    def __init__(self):
+        self.entries = {}
+
+    def clearedArea(self, name, key, path, diameter, z, bbox, rotated=False):
+        """clearedArea(name, key, path, diameter, z, bbox, rotated=False) ... Return the
+        area cleared by path of operation name below z within the XY region of bbox.
+        key identifies path, diameter and workplane of the operation, if it differs
+        from the one cached for name, all cleared areas of name are recomputed."""
+        entry = self.entries.get(name)
+        if entry is None or entry[0] != key:
+            entry = (key, collections.OrderedDict())
+            self.entries[name] = entry
+        areas = entry[1]
+
+        # the area only equals a fresh one for the same region, a cached area of a
+        # larger region would make the result depend on the queries before
+        queryKey = tuple(round(v, 6) for v in (z, bbox.XMin, bbox.YMin, bbox.XMax, bbox.YMax))
+        area = areas.get(queryKey)
+        if area is not None:
+            areas.move_to_end(queryKey)
+            return area
+
+        Path.Log.debug("cleared area of {} at z={}".format(name, z))
+        if rotated:
+            path = _stripRotaryAxes(path)
+        area = path.getClearedArea(diameter, z, bbox)
+        areas[queryKey] = area
+        while len(areas) > ClearedAreaCacheQueries:
+            areas.popitem(last=False)
+        return area
+
+    def prune(self, doc):
+        """prune(doc) ... Remove the entries of operations which no longer exist in doc."""
+        for name in [name for name in self.entries if doc.getObject(name) is None]:
+            del self.entries[name]
+
+
+def getClearedAreaCache(job):
+    """getClearedAreaCache(job) ... Return the ClearedAreaCache of job.
+    The cache lives as long as the job's proxy and is not saved with the document."""
+    cache = getattr(job.Proxy, "clearedAreaCache", None)
+    if cache is None:
+        cache = ClearedAreaCache()
+        job.Proxy.clearedAreaCache = cache
+    return cache
+
+
 def getClearedAreas(currentOp, bbox):
     """
     Returns the cleared area relevant to the operation
@@ -550,9 +610,14 @@ def getClearedAreas(currentOp, bbox):
     workplanes has no meaningful 2D interpretation. For ops that share a
     non-Z-up Workplane the path's leading rotary G0 is stripped before
     walking so positions are read in the same rotated frame as bbox.
+
+    The cleared areas are taken from the job's ClearedAreaCache, only ops
+    whose path, tool or workplane changed are walked again.
     """
     clearedAreas = []
     job = currentOp.Proxy.job
+    cache = getClearedAreaCache(job)
+    cache.prune(job.Document)
     z = bbox.ZMin + job.GeometryTolerance.getValueAs("mm")
     z_up = FreeCAD.Vector(0, 0, 1)
     currentWp = getattr(currentOp, "Workplane", z_up)
@@ -563,7 +628,8 @@ def getClearedAreas(currentOp, bbox):
             break
         if getattr(op, "RestMachiningPass", None):
             op = baseOp
-        if not (getattr(baseOp, "Active", False) and op.Path):
+        opPath = op.Path
+        if not (getattr(baseOp, "Active", False) and opPath):
             continue
         opWp = getattr(baseOp, "Workplane", z_up)
         if not opWp.isEqual(currentWp, 1e-6):
@@ -572,6 +638,8 @@ def getClearedAreas(currentOp, bbox):
         diameter = tool.Diameter.getValueAs("mm")
         # for drills, dz translates to the full width part of the tool
         dz = 0 if not hasattr(tool, "TipAngle") else -PathUtils.drillTipLength(tool)
-        opPath = _stripRotaryAxes(op.Path) if rotated else op.Path
-        clearedAreas.append(opPath.getClearedArea(diameter, z + dz, bbox))
+        key = (hash(opPath.toGCode()), diameter, dz, (opWp.x, opWp.y, opWp.z))
+        clearedAreas.append(
+            cache.clearedArea(op.Name, key, opPath, diameter, z + dz, bbox, rotated)
+        )
     return clearedAreas
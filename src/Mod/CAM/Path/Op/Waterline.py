@@ -45,6 +45,7 @@ except ImportError:
 
 import Path
 import Path.Op.Base as PathOp
+import Path.Op.DropCutter as PathDropCutter
 import Path.Op.SurfaceSupport as PathSurfaceSupport
 import PathScripts.PathUtils as PathUtils
 import math
@@ -810,6 +811,7 @@ class ObjectWaterline(PathOp.ObjectOp):
         # Setup cutter for OCL and cutout value for operation - based on tool controller properties
         oclTool = PathSurfaceSupport.OCL_Tool(ocl, obj)
         self.cutter = oclTool.getOclTool()
+        self.cutterSpec = oclTool.getOclToolSpec()
         if not self.cutter:
             Path.Log.error(
                 translate(
@@ -1322,7 +1324,7 @@ class ObjectWaterline(PathOp.ObjectOp):
             # Run Scan (Grid  based)
             fd = depthparams[-1]
             oclScan = self._waterlineDropCutScan(stl, smplInt, xmin, xmax, ymin, fd, numScanLines)
-            oclScan = [FreeCAD.Vector(P.x, P.y, P.z + depOfst) for P in oclScan]
+            oclScan = [FreeCAD.Vector(x, y, z + depOfst) for x, y, z in oclScan]
 
             # Convert point list to grid (scanLines)
             lenOS = len(oclScan)
@@ -1355,53 +1357,37 @@ class ObjectWaterline(PathOp.ObjectOp):
 
     def _waterlineDropCutScan(self, stl, smplInt, xmin, xmax, ymin, fd, numScanLines):
         """_waterlineDropCutScan(stl, smplInt, xmin, xmax, ymin, fd, numScanLines) ...
-        Perform OCL scan for waterline purpose."""
-        pdc = ocl.PathDropCutter()  # create a pdc
-        pdc.setSTL(stl)
-        pdc.setCutter(self.cutter)
-        pdc.setZ(fd)  # set minimumZ (final / target depth value)
-        pdc.setSampling(smplInt)
-
-        # Create line object as path
-        path = ocl.Path()  # create an empty path object
+        Perform OCL scan for waterline purpose, returns a list of (x, y, z) tuples.
+        Large scans are split across worker processes."""
+        spans = []
         for nSL in range(0, numScanLines):
             yVal = ymin + (nSL * smplInt)
-            p1 = ocl.Point(xmin, yVal, fd)  # start-point of line
-            p2 = ocl.Point(xmax, yVal, fd)  # end-point of line
-            path.append(ocl.Line(p1, p2))
-            # path.append(l)        # add the line to the path
-        pdc.setPath(path)
-        pdc.run()  # run drop-cutter on the path
+            spans.append(("L", xmin, yVal, xmax, yVal))
+
+        scheduler = PathDropCutter.DropCutterScheduler(stl, self.cutter, self.cutterSpec, smplInt)
+        scans = scheduler.dropCut(spans, fd)
 
         # return the list of points
-        return pdc.getCLPoints()
+        return [P for scan in scans for P in scan]
 
     def _waterlineAdaptiveScan(self, stl, smplInt, minSmplInt, zheights, depOfst):
-        """Perform OCL Adaptive scan for waterline purpose."""
+        """Perform OCL Adaptive scan for waterline purpose.
+        The layers are scanned in worker processes for large models."""
 
         msg = translate(
             "Waterline", ": Steps below the model's top Face will be the only ones processed."
         )
         Path.Log.info("Waterline " + msg)
 
-        # Setup OCL AdaptiveWaterline
-        awl = ocl.AdaptiveWaterline()
-        awl.setSTL(stl)
-        awl.setCutter(self.cutter)
-        awl.setSampling(smplInt)
-        awl.setMinSampling(minSmplInt)
+        # Run OCL AdaptiveWaterline for each Z-depth
+        scheduler = PathDropCutter.DropCutterScheduler(stl, self.cutter, self.cutterSpec, smplInt)
+        layers = scheduler.waterlines(zheights, minSmplInt)
 
         adapt_loops = []
 
-        # Iterate through each Z-depth
-        for zh in zheights:
-            awl.setZ(zh)
-            awl.run()
-
+        for zh, temp_loops in zip(zheights, layers):
             # OCL returns a list of separate loops (list of lists of Points)
             # Example: [[PerimeterPoints], [HolePoints]]
-            temp_loops = awl.getLoops()
-
             if not temp_loops:
                 # Warn if the step is outside the model bounds
                 newPropMsg = translate("PathWaterline", "Step Down above model. Skipping height : ")
@@ -1413,7 +1399,7 @@ class ObjectWaterline(PathOp.ObjectOp):
             # This ensures that islands (holes) remain distinct from perimeters.
             for loop in temp_loops:
                 # Convert OCL Points to FreeCAD Vectors and apply Z offset
-                fc_loop = [FreeCAD.Vector(P.x, P.y, P.z + depOfst) for P in loop]
+                fc_loop = [FreeCAD.Vector(x, y, z + depOfst) for x, y, z in loop]
                 adapt_loops.append(fc_loop)
 
         return adapt_loops
@@ -2416,6 +2402,7 @@ class ObjectWaterline(PathOp.ObjectOp):
         self.faceZMax = -999999999999.0
         if all is True:
             self.cutter = None
+            self.cutterSpec = None
             self.stl = None
             self.fullSTL = None
             self.cutOut = 0.0
@@ -2441,6 +2428,7 @@ class ObjectWaterline(PathOp.ObjectOp):
         del self.faceZMax
         if all is True:
             del self.cutter
+            del self.cutterSpec
             del self.stl
             del self.fullSTL
             del self.cutOut
@@ -0,0 +1,275 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association <www.freecad.org>      *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+"""Headless batch post processing.
+
+Posts every Job of a set of FreeCAD documents for one or more machines without
+any GUI interaction.  Each job/machine pair is an independent task which is run
+in a pool of worker processes.  All G-code files are written below a single
+output directory, together with a JSON summary holding the timings, line counts
+and sanity squawks of every task.
+
+From FreeCADCmd or any Python interpreter which can import FreeCAD:
+
+    import Path.Post.Batch as PostBatch
+    summary = PostBatch.post_files(["a.FCStd", "b.FCStd"], "/tmp/gcode", machines=["Mill"])
+
+or from a shell:
+
+    FreeCADCmd -c "import Path.Post.Batch as B; B.main(['-o', '/tmp/gcode', 'a.FCStd'])"
+"""
+
+import argparse
+import concurrent.futures
+import json
+import os
+import re
+import time
+from datetime import datetime
+
+import FreeCAD
+import Path
+import Path.Base.Util as PathUtil
+import Path.Main.Job as PathJob
+from Machine.models.machine import MachineFactory
+from Path.Post.CAMErrors import CAMError
+from Path.Post.Processor import PostProcessorFactory
+from Path.Post.Utils import write_gcode_lines
+
+if False:
+    Path.Log.setLevel(Path.Log.Level.DEBUG, Path.Log.thisModule())
+    Path.Log.trackModule(Path.Log.thisModule())
+else:
+    Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
+
+
+SUMMARY_FILE = "post_summary.json"
+
+# documents opened by this (worker) process, keyed by file name
+_documents = {}
+
+
+def _safe_name(name):
+    """Return name reduced to characters which are safe in a file name."""
+    return re.sub(r"[^\w.-]+", "_", name).strip("_") or "unnamed"
+
+
+def _open_document(doc_file):
+    """Return the document of doc_file, opening it only once per process."""
+    doc = _documents.get(doc_file)
+    if doc is None or doc.Name not in FreeCAD.listDocuments():
+        doc = FreeCAD.openDocument(doc_file, True)
+        _documents[doc_file] = doc
+    # some helpers (e.g. the postprocessors' header) still rely on the active document
+    FreeCAD.setActiveDocument(doc.Name)
+    return doc
+
+
+def _close_documents():
+    for doc in _documents.values():
+        if doc.Name in FreeCAD.listDocuments():
+            FreeCAD.closeDocument(doc.Name)
+    _documents.clear()
+
+
+def _get_jobs(doc):
+    return [
+        obj for obj in doc.Objects if isinstance(getattr(obj, "Proxy", None), PathJob.ObjectJob)
+    ]
+
+
+def list_tasks(doc_files, machines=None):
+    """list_tasks(doc_files, machines=None) ... Return the post tasks of a batch.
+
+    One task is created for every job in doc_files and every machine in machines.
+    If no machines are given the machine assigned to the job is used.
+    """
+    tasks = []
+    for doc_file in doc_files:
+        doc_file = os.path.abspath(doc_file)
+        doc = _open_document(doc_file)
+        for job in _get_jobs(doc):
+            for machine in machines or [getattr(job, "Machine", "")]:
+                tasks.append({"file": doc_file, "job": job.Name, "machine": machine})
+    _close_documents()
+    return tasks
+
+
+def _get_squawks(job):
+    try:
+        from Path.Main.Sanity.Sanity import CAMSanity
+
+        all_squawks, _ = CAMSanity.validate_job(job)
+    except Exception as e:
+        Path.Log.warning(f"Sanity check failed: {e}")
+        return []
+    return [
+        {
+            "type": sq.get("squawkType", "NOTE"),
+            "operator": sq.get("Operator"),
+            "note": sq.get("Note"),
+        }
+        for sq in all_squawks
+    ]
+
+
+def post_task(task, output_dir):
+    """post_task(task, output_dir) ... Post a single job/machine pair.
+
+    Returns a dictionary describing the result, it never raises so that one
+    broken job does not abort the whole batch.
+    """
+    result = dict(task)
+    result.update({"status": "ok", "outputs": [], "lines": 0, "squawks": [], "timings": {}})
+    start = time.perf_counter()
+    try:
+        doc = _open_document(task["file"])
+        job = doc.getObject(task["job"])
+        result["job_label"] = job.Label
+        result["timings"]["open"] = time.perf_counter() - start
+
+        if not task["machine"]:
+            raise ValueError(f"Job '{job.Label}' has no machine assigned")
+        # the document is never saved, so the job can be retargeted freely
+        job.Machine = task["machine"]
+        machine = MachineFactory.get_machine(task["machine"])
+        if machine is None or not machine.postprocessor_file_name:
+            raise ValueError(f"Machine '{task['machine']}' does not specify a postprocessor")
+        result["postprocessor"] = machine.postprocessor_file_name
+
+        checkpoint = time.perf_counter()
+        result["squawks"] = _get_squawks(job)
+        result["timings"]["sanity"] = time.perf_counter() - checkpoint
+
+        checkpoint = time.perf_counter()
+        postprocessor = PostProcessorFactory.get_post_processor(
+            job, machine.postprocessor_file_name
+        )
+        if isinstance(postprocessor, CAMError):
+            raise postprocessor
+        # G-code is produced while it is written, the program is never held in memory
+        post_data = postprocessor.export2_stream()
+        result["timings"]["prepare"] = time.perf_counter() - checkpoint
+        if post_data is None:
+            raise ValueError("Postprocessor did not produce any output")
+
+        checkpoint = time.perf_counter()
+        line_ending = postprocessor.values.get("END_OF_LINE_CHARS", "\n")
+        ext = (postprocessor.get_file_extension() or "nc").lstrip(".")
+        basename = "_".join(
+            _safe_name(n)
+            for n in (
+                os.path.splitext(os.path.basename(task["file"]))[0],
+                job.Label,
+                task["machine"],
+            )
+        )
+        for section, gcode_lines in post_data:
+            name = basename if section == "allitems" else f"{basename}_{_safe_name(section)}"
+            filename = os.path.join(output_dir, f"{name}.{ext}")
+            lines = write_gcode_lines(filename, gcode_lines, line_ending)
+            # like export2(), sections without any output are dropped
+            if lines:
+                result["outputs"].append({"section": section, "file": filename, "lines": lines})
+                result["lines"] += lines
+        result["timings"]["post"] = time.perf_counter() - checkpoint
+    except Exception as e:
+        Path.Log.error(f"Posting {task['job']} of {task['file']} failed: {e}")
+        result["status"] = "error"
+        result["error"] = str(e)
+    result["timings"]["total"] = time.perf_counter() - start
+    return result
+
+
+def post_files(doc_files, output_dir, machines=None, processes=None, summary_file=SUMMARY_FILE):
+    """post_files(doc_files, output_dir, machines=None, processes=None, summary_file=SUMMARY_FILE)
+    ... Post all jobs of doc_files and return the batch summary.
+
+    processes is the number of worker processes, it defaults to the number of
+    CPUs and posting happens in the calling process if it is 1.  The summary is
+    also written as JSON to summary_file, relative to output_dir, unless it is
+    empty.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    start = time.perf_counter()
+    tasks = list_tasks(doc_files, machines)
+    processes = min(processes or os.cpu_count() or 1, max(len(tasks), 1))
+    Path.Log.info(f"Posting {len(tasks)} jobs with {processes} processes")
+
+    if processes == 1:
+        results = [post_task(task, output_dir) for task in tasks]
+        _close_documents()
+    else:
+        # tasks of the same document go to the same worker as often as possible
+        chunksize = max(1, len(tasks) // (processes * 4))
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=processes, mp_context=PathUtil.processPoolContext()
+        ) as executor:
+            results = list(
+                executor.map(post_task, tasks, [output_dir] * len(tasks), chunksize=chunksize)
+            )
+
+    summary = {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "processes": processes,
+        "elapsed": time.perf_counter() - start,
+        "jobs": len(results),
+        "failed": sum(1 for r in results if r["status"] != "ok"),
+        "lines": sum(r["lines"] for r in results),
+        "squawks": sum(len(r["squawks"]) for r in results),
+        "results": results,
+    }
+    if summary_file:
+        with open(os.path.join(output_dir, summary_file), "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Post process all CAM jobs of FreeCAD documents")
+    parser.add_argument("files", nargs="+", help="FreeCAD documents (.FCStd) to post")
+    parser.add_argument("-o", "--output", required=True, help="directory for the G-code files")
+    parser.add_argument(
+        "-m",
+        "--machine",
+        action="append",
+        dest="machines",
+        help="post every job for this machine, may be repeated (default: the job's machine)",
+    )
+    parser.add_argument("-j", "--processes", type=int, help="number of worker processes")
+    parser.add_argument("--summary", default=SUMMARY_FILE, help="name of the JSON summary")
+    args = parser.parse_args(argv)
+
+    summary = post_files(args.files, args.output, args.machines, args.processes, args.summary)
+    FreeCAD.Console.PrintMessage(
+        f"Posted {summary['jobs'] - summary['failed']}/{summary['jobs']} jobs, "
+        f"{summary['lines']} lines, {summary['squawks']} squawks "
+        f"in {summary['elapsed']:.1f}s\n"
+    )
+    return summary["failed"]
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(main())
@@ -28,7 +28,7 @@ import FreeCAD
 import FreeCADGui
 import Path
 from PathScripts import PathUtils
-from Path.Post.Utils import FilenameGenerator, GCodeEditorDialog
+from Path.Post.Utils import FilenameGenerator, GCodeEditorDialog, gcode_newline_handling
 import os
 from Path.Post.Processor import PostProcessor, PostProcessorFactory
 from Machine.models.machine import MachineFactory
@@ -124,33 +124,7 @@ class CommandPathPost:
         return self.candidate is not None
 
     def _write_file(self, filename, gcode, policy):
-        #
-        # Up to this point the postprocessors have been using "\n" as the end-of-line
-        # characters in the gcode and using the process of writing out the file as a way
-        # to convert the "\n" into whatever end-of-line characters match the system
-        # running the postprocessor.  This can be a problem if the controller which will
-        # run the gcode doesn't like the same end-of-line characters as the system that
-        # ran the postprocessor to generate the gcode.
-        # The refactored code base now allows for four possible types of end-of-line
-        # characters in the gcode.
-        #
-        if len(gcode) > 1 and gcode[0:2] == "\n\n":
-            # The gcode shouldn't normally start with "\n\n".
-            # This means that the gcode contains "\n" as the end-of-line characters and
-            # that the gcode should be written out exactly that way.
-            newline_handling = ""
-            gcode = gcode[2:]
-        elif "\r" in gcode:
-            # Write out the gcode with whatever end-of-line characters it already has,
-            # presumably either "\r" or "\r\n".
-            newline_handling = ""
-        else:
-            # The gcode is assumed to contain "\n" as the end-of-line characters (if
-            # there are any end-of-line characters in the gcode).  This case also
-            # handles a zero-length gcode string.
-            # Write out the gcode but convert "\n" to whatever the system uses.
-            # This is also backwards compatible with the "previous" way of doing things.
-            newline_handling = None
+        gcode, newline_handling = gcode_newline_handling(gcode)
 
         if policy.casefold() == "open file dialog":
             dlg = QtGui.QFileDialog()
@@ -26,9 +26,14 @@
 Various utilities for handling G-code.
 These utilities do NOT operate on Path.Command objects. They
 operate on strings of pre-processed G-code.
+
+Every utility exists as a generator (iter_*) which consumes and produces
+one line at a time, so they can be chained into a pipeline whose memory use
+does not depend on the length of the program, and as a function taking and
+returning a list of lines.
 """
 
-from typing import List
+from typing import Iterable, Iterator, List
 
 
 class NumberGenerator:
@@ -73,21 +78,25 @@ def insert_line_numbers(gcode: List[str], start: int = 10, increment: int = 10)
     Returns:
         List of G-code strings with line numbers inserted
     """
-    result = []
+    return list(iter_insert_line_numbers(gcode, start=start, increment=increment))
+
+
+def iter_insert_line_numbers(
+    gcode: Iterable[str], start: int = 10, increment: int = 10
+) -> Iterator[str]:
+    """Streaming version of insert_line_numbers()."""
     line_generator = NumberGenerator(template="N{}", start=start, increment=increment)
 
     for line in gcode:
         # Skip empty lines and comments
         stripped = line.strip()
         if not stripped or stripped.startswith("("):
-            result.append(line)
+            yield line
             continue
 
         # Insert line number at the beginning
         line_number = line_generator.get()
-        result.append(f"{line_number} {line}")
-
-    return result
+        yield f"{line_number} {line}"
 
 
 # Suppress redundant axes words
@@ -105,7 +114,11 @@ def suppress_redundant_axes_words(gcode: List[str]) -> List[str]:
     Returns:
         List of G-code strings with redundant words suppressed
     """
-    result = []
+    return list(iter_suppress_redundant_axes_words(gcode))
+
+
+def iter_suppress_redundant_axes_words(gcode: Iterable[str]) -> Iterator[str]:
+    """Streaming version of suppress_redundant_axes_words()."""
     current_pos = {
         "X": None,
         "Y": None,
@@ -124,7 +137,7 @@ def suppress_redundant_axes_words(gcode: List[str]) -> List[str]:
 
         # Keep comments and empty lines unchanged
         if not stripped or stripped.startswith("("):
-            result.append(line)
+            yield line
             continue
 
         # Reset tracked state on tool change so post-change commands are not
@@ -132,7 +145,7 @@ def suppress_redundant_axes_words(gcode: List[str]) -> List[str]:
         if any(stripped.startswith(cmd) for cmd in ["M6", "M06"]):
             current_pos = {k: None for k in current_pos}
             current_feed = None
-            result.append(line)
+            yield line
             continue
 
         # Check for drill cycle commands - these need ALL parameters, don't suppress
@@ -145,11 +158,11 @@ def suppress_redundant_axes_words(gcode: List[str]) -> List[str]:
 
         if is_parametric_drill_cycle:
             # Parametric drill cycles need all parameters preserved
-            result.append(line)
+            yield line
             continue
         elif is_drill_mode_command:
             # G80 (cancel), G98 (retract to initial), G99 (retract to R) have no parameters
-            result.append(line)
+            yield line
             continue
 
         # Check for blockdelete slash
@@ -214,12 +227,10 @@ def suppress_redundant_axes_words(gcode: List[str]) -> List[str]:
 
         # Join the filtered words back into a line with preserved blockdelete
         if filtered_words:
-            result.append(f"{blockdelete_prefix}{' '.join(filtered_words)}")
+            yield f"{blockdelete_prefix}{' '.join(filtered_words)}"
         else:
             # If no words left, keep the original line (shouldn't happen for valid G-code)
-            result.append(line)
-
-    return result
+            yield line
 
 
 # Filter inefficient moves
@@ -237,6 +248,14 @@ def filter_inefficient_moves(gcode: List[str]) -> List[str]:
     Returns:
         List of G-code strings with inefficient moves filtered out
     """
+    return list(iter_filter_inefficient_moves(gcode))
+
+
+def iter_filter_inefficient_moves(gcode: Iterable[str]) -> Iterator[str]:
+    """Streaming version of filter_inefficient_moves().
+
+    Only a pending chain of rapid moves is held back until it can be collapsed.
+    """
     AXES = ("X", "Y", "Z", "A", "B", "C")
 
     SIDE_EFFECT_KEYS = {
@@ -367,23 +386,18 @@ def filter_inefficient_moves(gcode: List[str]) -> List[str]:
         return [c["original"] for c in chain]
 
     # Main optimization logic
-    result = []
     rapid_chain = []
     last_full_pos = {ax: None for ax in AXES}
 
-    def flush_chain():
-        nonlocal rapid_chain
-        if rapid_chain:
-            result.extend(collapse_rapid_chain(rapid_chain))
-            rapid_chain = []
-
     for line in gcode:
         parsed = parse_gcode_line(line)
 
         # Skip comments and empty lines
         if parsed["name"] in ("COMMENT", "EMPTY"):
-            flush_chain()  # Flush any pending rapid chain
-            result.append(line)
+            # Flush any pending rapid chain
+            yield from collapse_rapid_chain(rapid_chain)
+            rapid_chain = []
+            yield line
             continue
 
         # Get full position for this command
@@ -394,13 +408,13 @@ def filter_inefficient_moves(gcode: List[str]) -> List[str]:
         if is_rapid(parsed) and not has_side_effects(parsed):
             rapid_chain.append({"parsed": parsed, "pos": pos, "original": line})
         else:
-            flush_chain()  # Flush any pending rapid chain before adding this command
-            result.append(line)
+            # Flush any pending rapid chain before adding this command
+            yield from collapse_rapid_chain(rapid_chain)
+            rapid_chain = []
+            yield line
 
     # Flush any remaining rapid chain
-    flush_chain()
-
-    return result
+    yield from collapse_rapid_chain(rapid_chain)
 
 
 def deduplicate_repeated_commands(gcode: List[str]) -> List[str]:
@@ -421,7 +435,11 @@ def deduplicate_repeated_commands(gcode: List[str]) -> List[str]:
     Returns:
         List of G-code strings with modal command words removed
     """
-    result = []
+    return list(iter_deduplicate_repeated_commands(gcode))
+
+
+def iter_deduplicate_repeated_commands(gcode: Iterable[str]) -> Iterator[str]:
+    """Streaming version of deduplicate_repeated_commands()."""
     last_cmd = None
 
     for line in gcode:
@@ -429,14 +447,14 @@ def deduplicate_repeated_commands(gcode: List[str]) -> List[str]:
 
         # Keep comments and empty lines unchanged
         if not stripped or stripped.startswith("("):
-            result.append(line)
+            yield line
             continue
 
         # Reset modal command tracking on tool change so the first command
         # after M6 is always output with its full command word.
         if any(stripped.startswith(cmd) for cmd in ["M6", "M06"]):
             last_cmd = None
-            result.append(line)
+            yield line
             continue
 
         # Extract the primary command (first word)
@@ -451,12 +469,10 @@ def deduplicate_repeated_commands(gcode: List[str]) -> List[str]:
                 # Same command - output only parameters (remove command word)
                 params = " ".join(words[1:])
                 if params:  # Only if there are parameters
-                    result.append(params)
+                    yield params
             else:
                 # Different command - output full line
-                result.append(line)
+                yield line
                 last_cmd = cmd
         else:
-            result.append(line)
-
-    return result
+            yield line
@@ -30,10 +30,10 @@ import importlib.util
 import json
 import os
 import sys
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 import datetime
 from contextlib import contextmanager
-from itertools import groupby
+from itertools import chain, groupby
 
 import FreeCAD
 import Constants
@@ -204,6 +204,7 @@ Defaults = Dict[str, bool]
 FormatHelp = str
 GCodeOrNone = Optional[str]
 GCodeSections = List[Tuple[str, GCodeOrNone]]
+GCodeStreams = List[Tuple[str, Iterator[str]]]
 Parser = argparse.ArgumentParser
 ParserArgs = Union[None, str, argparse.Namespace]
 Postables = Union[List, List[Tuple[str, List]]]
@@ -596,7 +597,6 @@ class PostProcessor:
         self._units = units  # not used by MBPP
         self._args = args
         self._kwargs = kwargs
-        self._optimize_start = None
         self._bcnc_postamble_commands = None
         self._operation = None
 
@@ -1072,7 +1072,74 @@ class PostProcessor:
 
         return gcodeheader
 
-    def _expand_canned_cycles(self, postables):
+    def _expand_commands(self, postables, stage_factories) -> None:
+        """Run per-command expansion stages over all items in a single walk.
+
+        stage_factories are called at the start of each section, each returns a
+        stage or None if the stage is disabled.  A stage is called with
+        (section_name, item, commands), commands being an iterator over the
+        item's commands as left by the previous stage, and returns an iterator
+        over the edited commands.  State a stage needs across the items of a
+        section lives in the closure its factory returns.  Items without a path
+        are passed through the stages with no commands, so stages still see them.
+        Each item.path is rebuilt once, after all stages.
+        """
+        for section_name, sublist in postables:
+            stages = [stage for stage in (factory() for factory in stage_factories) if stage]
+            if not stages:
+                continue
+
+            for item in sublist:
+                commands = iter(item.path.Commands) if item.path else iter(())
+                for stage in stages:
+                    commands = stage(section_name, item, commands)
+                commands = list(commands)
+                if item.path:
+                    item.path = Path.Path(commands)
+
+    def _command_stages(self) -> list:
+        """Return the (expand method name, stage factory) pairs run in export2().
+
+        Subclasses can override to add, remove or reorder stages.
+        """
+        return [
+            ("_expand_canned_cycles", self._canned_cycles_stage),
+            ("_expand_split_arcs", self._split_arcs_stage),
+            ("_expand_spindle_wait", self._spindle_wait_stage),
+            ("_expand_coolant_delay", self._coolant_delay_stage),
+            ("_expand_translate_rapids", self._translate_rapids_stage),
+            ("_expand_xy_before_z", self._xy_before_z_stage),
+            ("_expand_bcnc_commands", self._bcnc_removal_stage),
+            ("_expand_tool_length_offset", self._tool_length_offset_stage),
+            ("_expand_tool_change", self._tool_change_stage),
+        ]
+
+    def _run_command_stages(self, postables) -> None:
+        """Run the expansions of _command_stages() with as few walks as possible.
+
+        The stages of consecutive expansions share one _expand_commands() walk.
+        An _expand_* method overridden by a subclass is called instead of its
+        stage, in its place in the order.
+        """
+        stage_factories = []
+        for expand_name, stage_factory in self._command_stages():
+            if self._overrides(expand_name):
+                self._expand_commands(postables, stage_factories)
+                stage_factories = []
+                getattr(self, expand_name)(postables)
+            else:
+                stage_factories.append(stage_factory)
+        self._expand_commands(postables, stage_factories)
+
+        # an overridden _expand_bcnc_commands() inserts its own blocks
+        if not self._overrides("_expand_bcnc_commands"):
+            self._insert_bcnc_blocks(postables)
+
+    def _overrides(self, method_name) -> bool:
+        """Return True if a subclass overrides PostProcessor.method_name"""
+        return getattr(type(self), method_name) is not getattr(PostProcessor, method_name)
+
+    def _canned_cycles_stage(self):
         """Terminate canned drill cycles in postable paths.
 
         Adds cycle termination commands (G80) after canned cycle sequences.
@@ -1081,30 +1148,19 @@ class PostProcessor:
 
         Subclasses can override to customize canned cycle handling.
         """
+
+        def stage(section_name, item, commands):
+            # paths without drill cycles pass through unchanged
+            return PostUtils.iterCannedCycleTerminator(commands)
+
+        return stage
+
+    def _expand_canned_cycles(self, postables):
+        """Run _canned_cycles_stage() on its own."""
         Path.Log.track("Expanding canned cycles")
-        for section_name, sublist in postables:
-            for item in sublist:
-                has_drill_cycles = False
-                if item.path:
-                    drill_commands = [
-                        "G73",
-                        "G74",
-                        "G81",
-                        "G82",
-                        "G83",
-                        "G84",
-                        "G85",
-                        "G86",
-                        "G87",
-                        "G88",
-                        "G89",
-                    ]
-                    has_drill_cycles = any(cmd.Name in drill_commands for cmd in item.path.Commands)
-
-                if has_drill_cycles:
-                    item.path = PostUtils.cannedCycleTerminator(item.path)
+        self._expand_commands(postables, [self._canned_cycles_stage])
 
-    def _expand_split_arcs(self, postables):
+    def _split_arcs_stage(self):
         """Split arc commands into linear segments if configured.
 
         When machine processing.split_arcs is True, replaces G2/G3 arc
@@ -1113,14 +1169,21 @@ class PostProcessor:
         Subclasses can override to customize arc handling.
         """
         if not self.values["SPLIT_ARCS"]:
-            return
+            return None
 
-        for section_name, sublist in postables:
-            for item in sublist:
-                if item.path:
-                    item.path = PostUtils.splitArcs(item.path)
+        prefGrp = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/CAM")
+        deflection = prefGrp.GetFloat("LibAreaCurveAccuracy", 0.01) or 0.01
 
-    def _expand_spindle_wait(self, postables):
+        def stage(section_name, item, commands):
+            return PostUtils.iterSplitArcs(commands, deflection)
+
+        return stage
+
+    def _expand_split_arcs(self, postables):
+        """Run _split_arcs_stage() on its own."""
+        self._expand_commands(postables, [self._split_arcs_stage])
+
+    def _spindle_wait_stage(self):
         """Inject G4 dwell after spindle start commands (M3/M4).
 
         When a spindle has spindle_wait > 0, inserts a G4 pause command
@@ -1131,21 +1194,23 @@ class PostProcessor:
 
         spindle = self._machine.get_spindle_by_index(0)  # FIXME: should be an annotation
         if not (spindle and spindle.spindle_wait > 0):
-            return
+            return None
 
         wait_time = spindle.spindle_wait
-        for section_name, sublist in postables:
-            for item in sublist:
-                if item.path:
-                    new_commands = []
-                    for cmd in item.path.Commands:
-                        new_commands.append(cmd)
-                        if cmd.Name in Constants.MCODE_SPINDLE_ON:
-                            pause_cmd = Path.Command("G4", {"P": wait_time})
-                            new_commands.append(pause_cmd)
-                    item.path = Path.Path(new_commands)
 
-    def _expand_coolant_delay(self, postables):
+        def stage(section_name, item, commands):
+            for cmd in commands:
+                yield cmd
+                if cmd.Name in Constants.MCODE_SPINDLE_ON:
+                    yield Path.Command("G4", {"P": wait_time})
+
+        return stage
+
+    def _expand_spindle_wait(self, postables):
+        """Run _spindle_wait_stage() on its own."""
+        self._expand_commands(postables, [self._spindle_wait_stage])
+
+    def _coolant_delay_stage(self):
         """Inject G4 dwell after coolant on commands.
 
         When a spindle has coolant_delay > 0, inserts a G4 pause command
@@ -1155,20 +1220,21 @@ class PostProcessor:
         """
         spindle = self._machine.get_spindle_by_index(0)  # FIXME: needs to be in .values
         if not (spindle and spindle.coolant_delay > 0):
-            return
+            return None
 
-        for section_name, sublist in postables:
-            for item in sublist:
-                if item.path:
-                    new_commands = []
-                    for cmd in item.path.Commands:
-                        new_commands.append(cmd)
-                        if cmd.Name in Constants.MCODE_COOLANT_ON:
-                            pause_cmd = Path.Command("G4", {"P": spindle.coolant_delay})
-                            new_commands.append(pause_cmd)
-                    item.path = Path.Path(new_commands)
+        def stage(section_name, item, commands):
+            for cmd in commands:
+                yield cmd
+                if cmd.Name in Constants.MCODE_COOLANT_ON:
+                    yield Path.Command("G4", {"P": spindle.coolant_delay})
 
-    def _expand_translate_rapids(self, postables):
+        return stage
+
+    def _expand_coolant_delay(self, postables):
+        """Run _coolant_delay_stage() on its own."""
+        self._expand_commands(postables, [self._coolant_delay_stage])
+
+    def _translate_rapids_stage(self):
         """Replace G0 rapid moves with G1 linear moves.
 
         When machine processing.translate_rapid_moves is True, replaces
@@ -1177,18 +1243,19 @@ class PostProcessor:
         Subclasses can override to customize rapid move translation.
         """
         if not self.values["TRANSLATE_RAPID_MOVES"]:
-            return
+            return None
 
-        for section_name, sublist in postables:
-            for item in sublist:
-                if item.path:
-                    new_commands = []
-                    Path.Log.debug(f"Translating rapid moves for {item.label}")
-                    for cmd in item.path.Commands:
-                        if cmd.Name in Constants.GCODE_MOVE_RAPID:
-                            cmd.Name = "G1"
-                        new_commands.append(cmd)
-                    item.path = Path.Path(new_commands)
+        def stage(section_name, item, commands):
+            for cmd in commands:
+                if cmd.Name in Constants.GCODE_MOVE_RAPID:
+                    cmd.Name = "G1"
+                yield cmd
+
+        return stage
+
+    def _expand_translate_rapids(self, postables):
+        """Run _translate_rapids_stage() on its own."""
+        self._expand_commands(postables, [self._translate_rapids_stage])
 
     def _expand_translate_drill_cycles(self, postables):
         """Translate canned drill cycles to G0/G1 move sequences.
@@ -1231,7 +1298,7 @@ class PostProcessor:
         finally:
             self.machine_state = None
 
-    def _expand_xy_before_z(self, postables):
+    def _xy_before_z_stage(self):
         """Decompose first move after tool change into XY then Z.
 
         When machine processing.xy_before_z_after_tool_change is True,
@@ -1242,84 +1309,80 @@ class PostProcessor:
         Subclasses can override to customize post-tool-change move ordering.
         """
         if not self.values["XY_BEFORE_Z_AFTER_TOOL_CHANGE"]:
-            return
+            return None
 
-        Path.Log.debug("Processing XY before Z after tool change")
-        for section_name, sublist in postables:
-            # Track whether we just saw a tool change
-            tool_change_seen = False
+        # Track whether we just saw a tool change, for the whole section
+        state = {"tool_change_seen": False}
 
-            for item in sublist:
-                if item.item_type == "tool_controller":
-                    tool_change_seen = True
-                    Path.Log.debug(f"Tool change detected: T{item.data['tool_number']}")
+        def stage(section_name, item, commands):
+            if item.item_type == "tool_controller":
+                state["tool_change_seen"] = True
+                Path.Log.debug(f"Tool change detected: T{item.data['tool_number']}")
+                yield from commands
+                return
+
+            first_move_processed = False
+
+            for cmd in commands:
+                # Check if this is a tool change command (M6)
+                if cmd.Name in Constants.MCODE_TOOL_CHANGE:
+                    yield cmd
+                    state["tool_change_seen"] = True
+                    first_move_processed = False
+                    Path.Log.debug("M6 tool change detected in operation")
                     continue
 
-                if item.path:
-                    new_commands = []
-                    first_move_processed = False
+                # Check if this is the first move after tool change
+                if (
+                    state["tool_change_seen"]
+                    and not first_move_processed
+                    and cmd.Name in Constants.GCODE_MOVE_ALL
+                ):
+                    # Check if this move has both XY and Z components
+                    has_xy = "X" in cmd.Parameters or "Y" in cmd.Parameters
+                    has_z = "Z" in cmd.Parameters
+
+                    if has_xy and has_z:
+                        Path.Log.debug(f"Decomposing first move after tool change: {cmd.Name}")
+
+                        # Create XY-only move (first)
+                        xy_params = {}
+                        for param in ["X", "Y", "A", "B", "C"]:
+                            if param in cmd.Parameters:
+                                xy_params[param] = cmd.Parameters[param]
+
+                        if xy_params:
+                            yield Path.Command(cmd.Name, xy_params)
+                            Path.Log.debug(f"  XY move: {cmd.Name} {xy_params}")
+
+                        # Create Z-only move (second)
+                        z_params = {"Z": cmd.Parameters["Z"]}
+                        # Preserve other non-XY parameters (like F, S, etc.)
+                        for param in cmd.Parameters:
+                            if param not in ["X", "Y", "Z", "A", "B", "C"]:
+                                z_params[param] = cmd.Parameters[param]
+
+                        yield Path.Command(cmd.Name, z_params)
+                        Path.Log.debug(f"  Z move: {cmd.Name} {z_params}")
+
+                        first_move_processed = True
+                        state["tool_change_seen"] = False  # Reset after decomposing the move
+                    else:
+                        # Move doesn't have both XY and Z, just add it as-is
+                        yield cmd
+                        if has_xy or has_z:
+                            first_move_processed = True
+                            state["tool_change_seen"] = False  # Reset after processing any move
+                else:
+                    # Not the first move or not a move command
+                    yield cmd
 
-                    for cmd in item.path.Commands:
-                        # Check if this is a tool change command (M6)
-                        if cmd.Name in Constants.MCODE_TOOL_CHANGE:
-                            new_commands.append(cmd)
-                            tool_change_seen = True
-                            first_move_processed = False
-                            Path.Log.debug("M6 tool change detected in operation")
-                            continue
-
-                        # Check if this is the first move after tool change
-                        if (
-                            tool_change_seen
-                            and not first_move_processed
-                            and cmd.Name in Constants.GCODE_MOVE_ALL
-                        ):
-                            # Check if this move has both XY and Z components
-                            has_xy = "X" in cmd.Parameters or "Y" in cmd.Parameters
-                            has_z = "Z" in cmd.Parameters
-
-                            if has_xy and has_z:
-                                Path.Log.debug(
-                                    f"Decomposing first move after tool change: {cmd.Name}"
-                                )
-
-                                # Create XY-only move (first)
-                                xy_params = {}
-                                for param in ["X", "Y", "A", "B", "C"]:
-                                    if param in cmd.Parameters:
-                                        xy_params[param] = cmd.Parameters[param]
-
-                                if xy_params:
-                                    xy_cmd = Path.Command(cmd.Name, xy_params)
-                                    new_commands.append(xy_cmd)
-                                    Path.Log.debug(f"  XY move: {cmd.Name} {xy_params}")
-
-                                # Create Z-only move (second)
-                                z_params = {"Z": cmd.Parameters["Z"]}
-                                # Preserve other non-XY parameters (like F, S, etc.)
-                                for param in cmd.Parameters:
-                                    if param not in ["X", "Y", "Z", "A", "B", "C"]:
-                                        z_params[param] = cmd.Parameters[param]
-
-                                z_cmd = Path.Command(cmd.Name, z_params)
-                                new_commands.append(z_cmd)
-                                Path.Log.debug(f"  Z move: {cmd.Name} {z_params}")
-
-                                first_move_processed = True
-                                tool_change_seen = False  # Reset after decomposing the move
-                            else:
-                                # Move doesn't have both XY and Z, just add it as-is
-                                new_commands.append(cmd)
-                                if has_xy or has_z:
-                                    first_move_processed = True
-                                    tool_change_seen = False  # Reset after processing any move
-                        else:
-                            # Not the first move or not a move command
-                            new_commands.append(cmd)
+        return stage
 
-                    if len(new_commands) != len(item.path.Commands):
-                        item.path = Path.Path(new_commands)
-                        Path.Log.debug(f"Updated path for {item.label}")
+    def _expand_xy_before_z(self, postables):
+        """Run _xy_before_z_stage() on its own."""
+        Path.Log.debug("Processing XY before Z after tool change")
+        self._expand_commands(postables, [self._xy_before_z_stage])
 
     def _expand_bcnc_commands(self, postables):
         """Inject or remove bCNC block annotation commands.
@@ -1330,10 +1393,16 @@ class PostProcessor:
 
         When OUTPUT_BCNC is False, removes any existing bCNC commands.
 
-        Subclasses can override to customize bCNC command handling.
+        Subclasses can override _insert_bcnc_blocks() and _bcnc_removal_stage()
+        to customize bCNC command handling.
 
         nb: add Annotation{"bcnc":...} to any bCNC comment, to force it to be included
         """
+        self._expand_commands(postables, [self._bcnc_removal_stage])
+        return self._insert_bcnc_blocks(postables)
+
+    def _insert_bcnc_blocks(self, postables):
+        """Inject the bCNC block annotations if OUTPUT_BCNC is True."""
         output_bcnc = self.values["OUTPUT_BCNC"]
         Path.Log.debug(f"OUTPUT_BCNC value: {output_bcnc}")
         # Clear any existing bCNC postamble commands to avoid state leakage
@@ -1369,25 +1438,29 @@ class PostProcessor:
 
             return self._edit_postable_list(postables, insert_op_bcnc)
 
-        else:
-            Path.Log.debug("Removing existing bCNC commands")
-            for section_name, sublist in postables:
-                for item in sublist:
-                    if item.item_type == "operation" and item.path:
-                        filtered_commands = []
-                        for cmd in item.path.Commands:
-                            if not (
-                                cmd.Name.startswith("(Block-name:")
-                                or cmd.Name.startswith("(Block-expand:")
-                                or cmd.Name.startswith("(Block-enable:")
-                            ):
-                                filtered_commands.append(cmd)
-
-                        if len(filtered_commands) != len(item.path.Commands):
-                            item.path = Path.Path(filtered_commands)
-            return postables
+        return postables
 
-    def _expand_tool_length_offset(self, postables):
+    def _bcnc_removal_stage(self):
+        """Remove existing bCNC commands from operations if OUTPUT_BCNC is False."""
+        if self.values["OUTPUT_BCNC"]:
+            return None
+
+        def stage(section_name, item, commands):
+            if item.item_type != "operation":
+                return commands
+            return (
+                cmd
+                for cmd in commands
+                if not (
+                    cmd.Name.startswith("(Block-name:")
+                    or cmd.Name.startswith("(Block-expand:")
+                    or cmd.Name.startswith("(Block-enable:")
+                )
+            )
+
+        return stage
+
+    def _tool_length_offset_stage(self):
         """Inject or remove G43 tool length offset commands.
 
         When OUTPUT_TOOL_LENGTH_OFFSET is True, adds G43 commands after M6
@@ -1396,7 +1469,7 @@ class PostProcessor:
         When OUTPUT_TOOL_LENGTH_OFFSET is False, removes any existing G43
         commands from operation paths.
 
-        Simplified single-pass implementation.
+        Subclasses can override to customize tool length offset handling.
         """
         output_tool_length_offset = self.values["OUTPUT_TOOL_LENGTH_OFFSET"]
         Path.Log.debug(f"OUTPUT_TOOL_LENGTH_OFFSET value: {output_tool_length_offset}")
@@ -1418,7 +1491,11 @@ class PostProcessor:
                 else:
                     return None, None
 
-        self._edit_command_list(postables, edit)
+        return self._edit_stage(edit)
+
+    def _expand_tool_length_offset(self, postables):
+        """Run _tool_length_offset_stage() on its own."""
+        self._expand_commands(postables, [self._tool_length_offset_stage])
 
     def _expand_prefix(self, postables) -> None:
         """Add prefix to each section"""
@@ -1574,50 +1651,31 @@ class PostProcessor:
 
         self._edit_item_list(postables, wrap_rotary)
 
-    def _expand_tool_change(self, postables):
-        """Suppress M6 if not TOOL_CHANGE"""
-
-        def suppress_m6(section_name: str, item, section_state: dict):
-            """We edit-in-place it with a comment"""
-
-            if item.Path:
-                locations = any(c.Name in ("M6", "M06") for c in item.Path.Commands)
-                if locations:
-                    new_commands = []
-                    for cmd in item.Path.Commands:
-                        if cmd.Name in ("M6", "M06"):
-                            new_commands.append(
-                                Path.Command(f"(Tool change suppressed: {cmd.toGCode()})")
-                            )
-                        else:
-                            new_commands.append(cmd)
-                    item.Path = Path.Path(new_commands)
-                return None, None
-            else:
-                return None, None
+    def _tool_change_stage(self):
+        """Suppress M6 if not TOOL_CHANGE, we edit-in-place it with a comment"""
 
         if self.values["TOOL_CHANGE"]:
-            return  # no suppress
+            return None  # no suppress
 
-        self._edit_item_list(postables, suppress_m6)
+        def stage(section_name, item, commands):
+            for cmd in commands:
+                if cmd.Name in ("M6", "M06"):
+                    yield Path.Command(f"(Tool change suppressed: {cmd.toGCode()})")
+                else:
+                    yield cmd
 
-    def _convert_item_commands(self, item, gcode_lines) -> None:
-        """Convert Path.Commands to G-code strings for a single item.
+        return stage
 
-        Notes start of [optimizable] postables
-        """
+    def _expand_tool_change(self, postables):
+        """Run _tool_change_stage() on its own."""
+        self._expand_commands(postables, [self._tool_change_stage])
 
-        if item.data.get("optimizable", None):
-            # we rely on gcode_lines being accumulated per-section
-            # this is for ._optimize_gcode() to bypass the header
-            self._optimize_start = len(gcode_lines)
+    def _iter_item_lines(self, item) -> Iterator[str]:
+        """Convert Path.Commands to G-code lines for a single item."""
 
         if item.item_type == "str":
-            # append the output & done
-            str_lines = item.data["str"].rstrip("\n").split("\n")
-            # no empty
-            if str_lines:
-                gcode_lines.extend(str_lines)
+            # the output & done
+            yield from item.data["str"].rstrip("\n").split("\n")
             return
 
         if not item.path:
@@ -1630,14 +1688,24 @@ class PostProcessor:
         for cmd in item.path.Commands:
             try:
                 gcode = self.convert_command_to_gcode(cmd)
-
-                if gcode is not None and gcode.strip():
-                    gcode_lines.extend(gcode.split("\n"))
-
             except (ValueError, AttributeError) as e:  # FIXCAME
                 Path.Log.error(f"Failed to convert a command to output {cmd.Name}: {e}")
                 raise e
 
+            if gcode is not None and gcode.strip():
+                yield from gcode.split("\n")
+
+    def _iter_items_lines(self, items) -> Iterator[str]:
+        """Convert the items of a section to G-code lines."""
+        for item in items:
+            # for error context
+            if item.item_type == "operation":
+                self._operation = item.source
+
+            yield from self._iter_item_lines(item)
+
+            self._operation = None  # operation `item` is over
+
     def _expand_post_item(self, postables) -> None:
         """Expand post-block lines for a postable item based on its type.
 
@@ -1737,46 +1805,50 @@ class PostProcessor:
                 None    no action
             eliding None commands in the list
         """
-        for section_name, sublist in postables:
-            section_state = {}
-            for item in sublist:
-                if item.path:
-                    new_commands = []
-                    for cmd in item.Path.Commands:
-                        editflag, edit_commands = edit_fn(section_name, item, cmd, section_state)
-
-                        # reduce None's
-                        rez = (
-                            [x for x in edit_commands if x is not None]
-                            if editflag is not None
-                            else None
-                        )
+        self._expand_commands(postables, [lambda: self._edit_stage(edit_fn)])
 
-                        # no-edit just leaves the command
-                        if editflag is None:
-                            new_commands.append(cmd)
+    def _edit_stage(self, edit_fn):
+        """Return a _expand_commands() stage applying edit_fn, see _edit_command_list()"""
+        section_state = {}  # the stage is made for each section
 
-                        # before
-                        elif editflag == -1 and rez:
-                            new_commands.extend(rez)
-                            new_commands.append(cmd)
+        def stage(section_name, item, commands):
+            commands = list(commands)
+            new_commands = list(edit(section_name, item, commands))
+            # an edit removing every command leaves the path as it was
+            return new_commands if new_commands else commands
 
-                        # replace
-                        elif editflag == 0:
-                            new_commands.extend(rez)
+        def edit(section_name, item, commands):
+            for cmd in commands:
+                editflag, edit_commands = edit_fn(section_name, item, cmd, section_state)
 
-                        # after
-                        elif editflag == 1:
-                            new_commands.append(cmd)
-                            new_commands.extend(rez)
+                # reduce None's
+                rez = [x for x in edit_commands if x is not None] if editflag is not None else None
 
-                        else:
-                            # Not a user-level CAM error
-                            raise ValueError(
-                                f"Internal: Expected -1|0|1|None from edit_fn, saw {editflag.__class__.__name__} {editflag}"
-                            )
-                    if new_commands:
-                        item.path = Path.Path(new_commands)
+                # no-edit just leaves the command
+                if editflag is None:
+                    yield cmd
+
+                # before
+                elif editflag == -1 and rez:
+                    yield from rez
+                    yield cmd
+
+                # replace
+                elif editflag == 0:
+                    yield from rez
+
+                # after
+                elif editflag == 1:
+                    yield cmd
+                    yield from rez
+
+                else:
+                    # Not a user-level CAM error
+                    raise ValueError(
+                        f"Internal: Expected -1|0|1|None from edit_fn, saw {editflag.__class__.__name__} {editflag}"
+                    )
+
+        return stage
 
     def _edit_item_list(self, postables: list[Postable], edit_fn):
         """in place edit items in postables
@@ -1875,51 +1947,36 @@ class PostProcessor:
             new_sections.append((section_name, new_sublist))
         return new_sections
 
-    def _optimize_gcode(self, gcode_lines) -> str:
-        """Apply G-code optimizations and produce a final string.
-        Starting at self._optimize_start line (to skip prefix material)
+    def _optimize_gcode(self, body_lines: Iterable[str]) -> Iterator[str]:
+        """Apply G-code optimizations to the body lines of a section.
 
-        Separates header comments from body, applies deduplication,
-        redundant-axis suppression, inefficient-move filtering, and
-        line numbering to the body only, then reassembles with the
-        configured line ending.
+        Chains deduplication, redundant-axis suppression, inefficient-move
+        filtering and line numbering as streaming stages, so only the lines
+        in flight are held in memory.  The stages are selected when this is
+        called, the returned iterator does the work.
         """
         from Path.Post.GcodeProcessingUtils import (
-            deduplicate_repeated_commands,
-            suppress_redundant_axes_words,
-            filter_inefficient_moves,
-            insert_line_numbers,
+            iter_deduplicate_repeated_commands,
+            iter_suppress_redundant_axes_words,
+            iter_filter_inefficient_moves,
+            iter_insert_line_numbers,
         )
 
-        if not gcode_lines:
-            return ""
+        body_lines = iter(body_lines)
+        if not self.values["OUTPUT_DUPLICATE_COMMANDS"]:
+            body_lines = iter_deduplicate_repeated_commands(body_lines)
+        if not self.values["OUTPUT_DOUBLES"]:
+            body_lines = iter_suppress_redundant_axes_words(body_lines)
 
-        num_header_lines = self._optimize_start
-        if num_header_lines is None:
-            # not a user-level CAM error
-            raise AttributeError(
-                "Internal: expected self._optimize_start, set by an item w/ {optimizable:True}"
-            )
+        if self.values["FILTER_INEFFICIENT_MOVES"]:
+            body_lines = iter_filter_inefficient_moves(body_lines)
 
-        header_part = gcode_lines[:num_header_lines]
-        body_part = gcode_lines[num_header_lines:]
-
-        if body_part:
-            if not self.values["OUTPUT_DUPLICATE_COMMANDS"]:
-                body_part = deduplicate_repeated_commands(body_part)
-            if not self.values["OUTPUT_DOUBLES"]:
-                body_part = suppress_redundant_axes_words(body_part)
-
-        if body_part and self.values["FILTER_INEFFICIENT_MOVES"]:
-            body_part = filter_inefficient_moves(body_part)
-
-        if body_part and self.values["OUTPUT_LINE_NUMBERS"]:
+        if self.values["OUTPUT_LINE_NUMBERS"]:
             start = self.values["LINE_NUMBER_START"]
             increment = self.values["LINE_INCREMENT"]
-            body_part = insert_line_numbers(body_part, start=start, increment=increment)
+            body_lines = iter_insert_line_numbers(body_lines, start=start, increment=increment)
 
-        final_lines = header_part + body_part
-        return final_lines
+        return body_lines
 
     def _expand_trailing_lines(self, postables) -> None:
         """Append post_job and postamble lines, to each section."""
@@ -1948,35 +2005,55 @@ class PostProcessor:
         else:
             Path.Log.debug("No bCNC postamble commands to process")
 
-    def _convert_job_sections(self, postables):
-        """Convert each section to output-code"""
+    def _iter_section_lines(self, sublist) -> Iterator[str]:
+        """Yield the output-code of a section line by line.
 
-        job_sections = []
-        for section_name, sublist in postables:
-            gcode_lines = []
-            self._optimize_start = None
+        The lines of the items before the first {optimizable: True} item (the
+        header) are passed through, all following lines go through
+        _optimize_gcode().
+        """
+        self._operation = None
 
-            self._operation = None
+        items = iter(sublist)
+        header_lines = 0
+        for item in items:
+            if item.data.get("optimizable", None):
+                body_items = chain([item], items)
+                break
+            for line in self._iter_items_lines([item]):
+                header_lines += 1
+                yield line
+        else:
+            if header_lines:
+                # not a user-level CAM error
+                raise AttributeError(
+                    "Internal: expected an item w/ {optimizable:True} to start optimization"
+                )
+            return
 
-            for item in sublist:
-                # for error context
-                if item.item_type == "operation":
-                    self._operation = item.source
+        # ===== STAGE 4: G-CODE OPTIMIZATION =====
+        yield from self._optimize_gcode(self._iter_items_lines(body_items))
 
-                self._convert_item_commands(item, gcode_lines)
+    def _iter_job_sections(self, postables) -> GCodeStreams:
+        """Return each section with an iterator over its output-code lines.
 
-                self._operation = None  # operation `item` is over
+        The iterators share the postprocessor state, consume them in order.
+        """
+        return [
+            (section_name, self._iter_section_lines(sublist)) for section_name, sublist in postables
+        ]
 
-            # ===== STAGE 4: G-CODE OPTIMIZATION =====
-            gcode_string = self._optimize_gcode(gcode_lines)
+    def _convert_job_sections(self, postables):
+        """Convert each section to output-code"""
 
-            if gcode_string:
-                # one place for end-of-line_chars
-                gcode_string = "\n".join(gcode_string)
-                line_ending = self.values.get("END_OF_LINE_CHARS", "\n")
-                if line_ending != "\n":
-                    gcode_string = gcode_string.replace("\n", line_ending)
+        # one place for end-of-line_chars
+        line_ending = self.values.get("END_OF_LINE_CHARS", "\n")
 
+        job_sections = []
+        for section_name, lines in self._iter_job_sections(postables):
+            first_line = next(lines, None)
+            if first_line is not None:
+                gcode_string = line_ending.join(chain([first_line], lines))
                 job_sections.append((section_name, gcode_string))
 
         return job_sections
@@ -2012,6 +2089,51 @@ class PostProcessor:
         """
         Path.Log.debug("Starting export2()")
 
+        postables = self._build_postables()
+        if postables is None:
+            return None
+
+        # ===== STAGE 3: COMMAND CONVERSION =====
+
+        # convert postables to machine-specific gcode
+        all_job_sections = self._convert_job_sections(postables)
+
+        # ===== STAGE 5: OUTPUT PRODUCTION =====
+
+        Path.Log.debug(f"Returning {len(all_job_sections)} sections")
+        Path.Log.debug(f"Sections: {all_job_sections}")
+
+        # ===== STAGE 6: REMOTE POSTING =====
+        try:
+            self.remote_post(all_job_sections)
+        except Exception as e:
+            # Our output still might be interesting, so continue
+            # FIXME: can we make the user notice this situation?
+            Path.Log.error(f"Remote posting failed: {e}")
+
+        return all_job_sections
+
+    def export2_stream(self) -> Union[None, GCodeStreams]:
+        """
+        Like export2(), but return each section with an iterator over its G-code lines.
+
+        Stages 3 and 4 run while the lines are consumed, so a caller writing them
+        out (see Path.Post.Utils.write_gcode_lines) never holds the whole program
+        in memory.  The sections must be consumed in order.  Lines carry no
+        end-of-line characters, use END_OF_LINE_CHARS to join them.  Remote
+        posting (Stage 6) needs the complete program and is not done.
+        """
+        Path.Log.debug("Starting export2_stream()")
+
+        postables = self._build_postables()
+        if postables is None:
+            return None
+
+        return self._iter_job_sections(postables)
+
+    def _build_postables(self) -> Optional[Postables]:
+        """Run Stages 0 to 2 of export2(), return None if cancelled."""
+
         # ===== STAGE 0: PRE-PROCESSING DIALOG =====
         if not self.pre_processing_dialog():
             Path.Log.info("Pre-processing dialog cancelled - aborting export")
@@ -2021,7 +2143,6 @@ class PostProcessor:
             self.apply_configuration_bundle()
 
         # ===== STAGE 1: ORDERING =====
-        all_job_sections = []
         postables = self._buildPostList()
         self._expand_postprocessor_commands(postables)
 
@@ -2032,18 +2153,14 @@ class PostProcessor:
         postables = self._expand_pre_item(postables)
 
         self._expand_translate_drill_cycles(postables)
-        self._expand_canned_cycles(postables)
-        self._expand_split_arcs(postables)
-        self._expand_spindle_wait(postables)
-        self._expand_coolant_delay(postables)
-        self._expand_translate_rapids(postables)
-        self._expand_xy_before_z(postables)
-        self._expand_bcnc_commands(postables)
-        self._expand_tool_length_offset(postables)
+
+        # canned cycles, split arcs, spindle wait, coolant delay, translate rapids,
+        # XY before Z, bCNC removal, tool length offset and tool change suppression,
+        # in one walk over the commands
+        self._run_command_stages(postables)
 
         postables = self._expand_post_item(postables)
         self._expand_trailing_lines(postables)
-        self._expand_tool_change(postables)
         self._expand_rotary_move(postables)
 
         # must be last
@@ -2051,27 +2168,7 @@ class PostProcessor:
 
         Path.Log.debug(postables)
 
-        # ===== STAGE 3: COMMAND CONVERSION =====
-
-        # convert postables to machine-specific gcode
-        job_sections = self._convert_job_sections(postables)
-
-        all_job_sections.extend(job_sections)
-
-        # ===== STAGE 5: OUTPUT PRODUCTION =====
-
-        Path.Log.debug(f"Returning {len(all_job_sections)} sections")
-        Path.Log.debug(f"Sections: {all_job_sections}")
-
-        # ===== STAGE 6: REMOTE POSTING =====
-        try:
-            self.remote_post(all_job_sections)
-        except Exception as e:
-            # Our output still might be interesting, so continue
-            # FIXME: can we make the user notice this situation?
-            Path.Log.error(f"Remote posting failed: {e}")
-
-        return all_job_sections
+        return postables
 
     def export(self) -> Union[None, GCodeSections]:
         """Process the parser arguments, then postprocess the 'postables'."""
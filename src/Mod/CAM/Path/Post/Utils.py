@@ -372,6 +372,60 @@ def fcoms(string, commentsym):
     return comment
 
 
+def gcode_newline_handling(gcode):
+    """Return the gcode and the newline argument to use when writing it to a file.
+
+    Up to this point the postprocessors have been using "\n" as the end-of-line
+    characters in the gcode and using the process of writing out the file as a way
+    to convert the "\n" into whatever end-of-line characters match the system
+    running the postprocessor.  This can be a problem if the controller which will
+    run the gcode doesn't like the same end-of-line characters as the system that
+    ran the postprocessor to generate the gcode.
+    The refactored code base now allows for four possible types of end-of-line
+    characters in the gcode.
+    """
+    if len(gcode) > 1 and gcode[0:2] == "\n\n":
+        # The gcode shouldn't normally start with "\n\n".
+        # This means that the gcode contains "\n" as the end-of-line characters and
+        # that the gcode should be written out exactly that way.
+        return gcode[2:], ""
+    if "\r" in gcode:
+        # Write out the gcode with whatever end-of-line characters it already has,
+        # presumably either "\r" or "\r\n".
+        return gcode, ""
+    # The gcode is assumed to contain "\n" as the end-of-line characters (if
+    # there are any end-of-line characters in the gcode).  This case also
+    # handles a zero-length gcode string.
+    # Write out the gcode but convert "\n" to whatever the system uses.
+    # This is also backwards compatible with the "previous" way of doing things.
+    return gcode, None
+
+
+def write_gcode_lines(filename, lines, line_ending="\n"):
+    """Write gcode lines to filename as they are produced.
+
+    The lines must not contain end-of-line characters, they are joined with
+    line_ending, which like in gcode_newline_handling() is converted to the
+    system's convention if it is "\n".  Nothing is written if there are no
+    lines.  Returns the number of lines written.
+    """
+    newline_handling = None if line_ending == "\n" else ""
+    count = 0
+    f = None
+    try:
+        for line in lines:
+            if f is None:
+                f = open(filename, "w", encoding="utf-8", newline=newline_handling)
+            else:
+                f.write(line_ending)
+            f.write(line)
+            count += 1
+    finally:
+        if f is not None:
+            f.close()
+    return count
+
+
 def splitArcs(path, deflection=None):
     """Filter a path object and replace all G2/G3 moves with discrete G1 moves.
 
@@ -385,16 +439,20 @@ def splitArcs(path, deflection=None):
     if not isinstance(path, Path.Path):
         raise TypeError("path must be a Path object")
 
+    return Path.Path(list(iterSplitArcs(path.Commands, deflection)))
+
+
+def iterSplitArcs(commands, deflection=None):
+    """Like splitArcs() but for an iterable of commands, yielding the result."""
     if not deflection:
         prefGrp = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/CAM")
         deflection = prefGrp.GetFloat("LibAreaCurveAccuracy", 0.01) or 0.01
 
-    results = []
     machine = MachineState()
 
-    for command in path.Commands:
+    for command in commands:
         if command.Name not in Path.Geom.CmdMoveArc:
-            results.append(command)
+            yield command
         else:
             # Discretize arc into line segments
             edge = Path.Geom.edgeForCmd(command, machine.getPosition())
@@ -405,15 +463,18 @@ def splitArcs(path, deflection=None):
             for pt in pts[1:]:  # Skip first point (already at that position)
                 params = {"X": pt.x, "Y": pt.y, "Z": pt.z}
                 params.update(feed_params)
-                results.append(Path.Command("G1", params))
+                yield Path.Command("G1", params)
 
         machine.addCommand(command)
 
-    return Path.Path(results)
-
 
 def cannedCycleTerminator(path):
     """iterate through a Path object and insert G80 commands to terminate canned cycles at the correct time"""
+    return Path.Path(list(iterCannedCycleTerminator(path.Commands)))
+
+
+def iterCannedCycleTerminator(commands):
+    """Like cannedCycleTerminator() but for an iterable of commands, yielding the result."""
 
     # Canned cycles terminate if any parameter change other than XY coordinates.
     # - if Z depth changes
@@ -421,13 +482,12 @@ def cannedCycleTerminator(path):
     # - if retract plane changes
     # - if retract mode (G98/G99) changes
 
-    result = []
     cycle_active = False
     last_cycle_params = {}
     last_retract_mode = None
     explicit_retract_mode_set = False
 
-    for command in path.Commands:
+    for command in commands:
         if (
             command.Name == "G80"
         ):  # This shouldn't happen because cycle generators shouldn't be inserting it. Be safe anyway.
@@ -436,16 +496,16 @@ def cannedCycleTerminator(path):
             cycle_active = False
             last_retract_mode = None
             explicit_retract_mode_set = False
-            result.append(command)
+            yield command
         elif command.Name in ["G98", "G99"]:
             # Explicit retract mode in the path - track it
             if cycle_active and last_retract_mode and command.Name != last_retract_mode:
                 # Mode changed while cycle active - terminate
-                result.append(Path.Command("G80"))
+                yield Path.Command("G80")
                 cycle_active = False
             last_retract_mode = command.Name
             explicit_retract_mode_set = True
-            result.append(command)
+            yield command
         elif command.Name in CmdMoveDrill:
             # Check if this cycle has different parameters than the last one
             current_params = {k: v for k, v in command.Parameters.items() if k not in ["X", "Y"]}
@@ -458,7 +518,7 @@ def cannedCycleTerminator(path):
                 current_params != last_cycle_params or current_retract_mode != last_retract_mode
             ):
                 # Parameters or retract mode changed, terminate previous cycle
-                result.append(Path.Command("G80"))
+                yield Path.Command("G80")
                 cycle_active = False
                 explicit_retract_mode_set = False
 
@@ -467,10 +527,10 @@ def cannedCycleTerminator(path):
             if (
                 not cycle_active or current_retract_mode != last_retract_mode
             ) and not explicit_retract_mode_set:
-                result.append(Path.Command(current_retract_mode))
+                yield Path.Command(current_retract_mode)
 
             # Add the cycle command
-            result.append(command)
+            yield command
             cycle_active = True
             last_cycle_params = current_params
             last_retract_mode = current_retract_mode
@@ -479,14 +539,12 @@ def cannedCycleTerminator(path):
             # Non-cycle command (not G80 or drill cycle)
             if cycle_active:
                 # Terminate active cycle
-                result.append(Path.Command("G80"))
+                yield Path.Command("G80")
                 cycle_active = False
                 last_retract_mode = None
             explicit_retract_mode_set = False
-            result.append(command)
+            yield command
 
     # If cycle is still active at the end, terminate it
     if cycle_active:
-        result.append(Path.Command("G80"))
-
-    return Path.Path(result)
+        yield Path.Command("G80")
@@ -610,7 +610,7 @@ class OpenSBPPost(PostProcessor):
 
         return rez
 
-    def _optimize_gcode(self, gcode_lines) -> str:
+    def _optimize_gcode(self, body_lines):
         # There may be opensbp in the stream
         # so, you can't know the state for modal and axis-modal
         # FIXME: this override goes away when Processor's does
@@ -625,7 +625,8 @@ class OpenSBPPost(PostProcessor):
         self.values["OUTPUT_DUPLICATE_COMMANDS"] = True
 
         try:
-            return super()._optimize_gcode(gcode_lines)
+            # the stages are selected by the call, before the values are restored
+            return super()._optimize_gcode(body_lines)
         finally:
             for k in disable:
                 self.values[k] = was[k]
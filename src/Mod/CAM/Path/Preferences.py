@@ -68,6 +68,10 @@ WarningSuppressSelectionMode = "WarningSuppressSelectionMode"
 WarningSuppressOpenCamLib = "WarningSuppressOpenCamLib"
 EnableExperimentalFeatures = "EnableExperimentalFeatures"
 EnableAdvancedOCLFeatures = "EnableAdvancedOCLFeatures"
+# Number of processes for OpenCamLib scans, 0 uses all CPUs
+OCLScanProcesses = "OCLScanProcesses"
+# Number of processes recomputing independent operations of a job, 0 uses all CPUs
+JobRecomputeProcesses = "JobRecomputeProcesses"
 
 
 _observers = defaultdict(list)  # maps group name to callback functions
@@ -538,6 +542,14 @@ def advancedOCLFeaturesEnabled():
     return preferences().GetBool(EnableAdvancedOCLFeatures, False)
 
 
+def oclScanProcesses():
+    return preferences().GetInt(OCLScanProcesses, 0)
+
+
+def jobRecomputeProcesses():
+    return preferences().GetInt(JobRecomputeProcesses, 0)
+
+
 def experimentalFeaturesEnabled():
     return preferences().GetBool(EnableExperimentalFeatures, False)
 
@@ -28,6 +28,7 @@ from FreeCAD import Vector
 from PySide import QtCore
 import Path
 import Path.Main.Job as PathJob
+import heapq
 import math
 from numpy import linspace
 import tsp_solver
@@ -581,58 +582,238 @@ def addToJob(obj, jobname=None):
     return job
 
 
-def sort_locations(locations, keys, attractors=None):
+class _LocationTree:
+    """kd-tree over points supporting removal, used by sort_locations.
+    nearest() returns the point with the lowest squared distance plus weight, ties
+    are broken by the lower index."""
+
+    LeafSize = 8
+
+    def __init__(self, points, weights):
+        self.points = points
+        self.weights = weights
+        self.dims = range(len(points[0])) if points else range(0)
+        self.lo = []
+        self.hi = []
+        self.minWeight = []
+        self.minIndex = []
+        self.count = []
+        self.split = []
+        self.children = []
+        self.items = []
+        self.parent = []
+        self.leaf = [0] * len(points)
+        if points:
+            self._build(list(range(len(points))), -1)
+
+    def _build(self, indices, parent):
+        points = self.points
+        node = len(self.count)
+        lo = [min(points[i][d] for i in indices) for d in self.dims]
+        hi = [max(points[i][d] for i in indices) for d in self.dims]
+        self.lo.append(lo)
+        self.hi.append(hi)
+        self.minWeight.append(min(self.weights[i] for i in indices))
+        self.minIndex.append(min(indices))
+        self.count.append(len(indices))
+        self.parent.append(parent)
+        self.split.append(None)
+        self.children.append(None)
+        self.items.append(None)
+
+        if len(indices) <= self.LeafSize:
+            self.items[node] = sorted(indices)
+            for i in indices:
+                self.leaf[i] = node
+        else:
+            d = max(self.dims, key=lambda d: hi[d] - lo[d])
+            indices.sort(key=lambda i: points[i][d])
+            mid = len(indices) // 2
+            self.split[node] = (d, points[indices[mid]][d])
+            left = self._build(indices[:mid], node)
+            right = self._build(indices[mid:], node)
+            self.children[node] = (left, right)
+        return node
+
+    def remove(self, i):
+        node = self.leaf[i]
+        self.items[node].remove(i)
+        while node != -1:
+            self.count[node] -= 1
+            node = self.parent[node]
+
+    def nearest(self, q):
+        points = self.points
+        weights = self.weights
+        dims = self.dims
+        best = -1
+        bestScore = math.inf
+        stack = [0] if self.count else []
+        while stack:
+            node = stack.pop()
+            if not self.count[node]:
+                continue
+            # lower bound of the score of all points of node, the terms are added up
+            # in the same order as the scores themselves so it never exceeds them
+            lo = self.lo[node]
+            hi = self.hi[node]
+            bound = 0
+            for d in dims:
+                if q[d] < lo[d]:
+                    bound += (lo[d] - q[d]) ** 2
+                elif q[d] > hi[d]:
+                    bound += (hi[d] - q[d]) ** 2
+            bound += self.minWeight[node]
+            if bound > bestScore or (bound == bestScore and self.minIndex[node] > best):
+                continue
+
+            items = self.items[node]
+            if items is None:
+                d, value = self.split[node]
+                left, right = self.children[node]
+                # visit the closer child first
+                if q[d] < value:
+                    stack.append(right)
+                    stack.append(left)
+                else:
+                    stack.append(left)
+                    stack.append(right)
+                continue
+
+            for i in items:
+                p = points[i]
+                score = 0
+                for d in dims:
+                    score += (p[d] - q[d]) ** 2
+                score += weights[i]
+                if score < bestScore or (score == bestScore and i < best):
+                    best = i
+                    bestScore = score
+        return best
+
+    def nearestK(self, q, k):
+        """nearestK(q, k) ... Return the indices of the k points closest to q,
+        weights are ignored."""
+        points = self.points
+        dims = self.dims
+        heap = []
+        stack = [0] if self.count else []
+        while stack:
+            node = stack.pop()
+            if not self.count[node]:
+                continue
+            lo = self.lo[node]
+            hi = self.hi[node]
+            bound = 0
+            for d in dims:
+                if q[d] < lo[d]:
+                    bound += (lo[d] - q[d]) ** 2
+                elif q[d] > hi[d]:
+                    bound += (hi[d] - q[d]) ** 2
+            if len(heap) == k and bound >= -heap[0][0]:
+                continue
+
+            items = self.items[node]
+            if items is None:
+                d, value = self.split[node]
+                left, right = self.children[node]
+                if q[d] < value:
+                    stack.append(right)
+                    stack.append(left)
+                else:
+                    stack.append(left)
+                    stack.append(right)
+                continue
+
+            for i in items:
+                p = points[i]
+                dist = 0
+                for d in dims:
+                    dist += (p[d] - q[d]) ** 2
+                if len(heap) < k:
+                    heapq.heappush(heap, (-dist, i))
+                elif dist < -heap[0][0]:
+                    heapq.heapreplace(heap, (-dist, i))
+        return [i for _, i in sorted(heap, reverse=True)]
+
+
+def _two_opt(points, order, neighbours, passes):
+    """Improve the open path order, starting at order[0], by 2-opt moves between
+    each point and its neighbours."""
+    n = len(order)
+    pos = [0] * n
+    for i, p in enumerate(order):
+        pos[p] = i
+
+    def dist(a, b):
+        return math.dist(points[a], points[b])
+
+    for _ in range(passes):
+        improved = False
+        for i in range(n - 1):
+            a = order[i]
+            b = order[i + 1]
+            dab = dist(a, b)
+            for c in neighbours[a]:
+                j = pos[c]
+                if j <= i + 1:
+                    continue
+                # replace the edges a-b and c-d by a-c and b-d, the path may end at c
+                if j + 1 < n:
+                    d = order[j + 1]
+                    delta = dist(a, c) + dist(b, d) - dab - dist(c, d)
+                else:
+                    delta = dist(a, c) - dab
+                if delta < -1e-9:
+                    order[i + 1 : j + 1] = order[j:i:-1]
+                    for k in range(i + 1, j + 1):
+                        pos[order[k]] = k
+                    improved = True
+                    b = order[i + 1]
+                    dab = dist(a, b)
+        if not improved:
+            break
+    return order
+
+
+def sort_locations(locations, keys, attractors=None, optimize=False, neighbours=8, passes=10):
     """sort holes by the nearest neighbor method
     keys: two-element list of keys for X and Y coordinates. for example ['x','y']
+    attractors: keys whose absolute values are added to the squared distance of each
+    location, pulling the path towards them. Defaults to the first key.
+    optimize: improve the path by up to passes rounds of 2-opt moves between each
+    location and its nearest neighbours, this shortens the path but ignores attractors.
+    The nearest neighbours are found with a kd-tree, so it scales to 100k+ locations.
     originally written by m0n5t3r for PathHelix
     """
-    from queue import PriorityQueue
-    from collections import defaultdict
-
     if attractors is None:
         attractors = []
 
     attractors = attractors or [keys[0]]
 
-    def sqdist(a, b):
-        """square Euclidean distance"""
-        d = 0
-        for k in keys:
-            d += (a[k] - b[k]) ** 2
-
-        return d
-
-    def weight(location):
+    points = [tuple(loc[k] for k in keys) for loc in locations]
+    weights = []
+    for loc in locations:
         w = 0
-
         for k in attractors:
-            w += abs(location[k])
-
-        return w
-
-    def find_closest(location_list, location, dist):
-        q = PriorityQueue()
-
-        for i, j in enumerate(location_list):
-            # prevent dictionary comparison by inserting the index
-            q.put((dist(j, location) + weight(j), i, j))
+            w += abs(loc[k])
+        weights.append(w)
+
+    tree = _LocationTree(points, weights)
+    order = []
+    q = tuple(0 for _ in keys)
+    for _ in range(len(points)):
+        i = tree.nearest(q)
+        tree.remove(i)
+        order.append(i)
+        q = points[i]
+
+    if optimize and len(order) > 3:
+        tree = _LocationTree(points, [0] * len(points))
+        near = [tree.nearestK(p, neighbours + 1) for p in points]
+        order = _two_opt(points, order, near, passes)
 
-        prio, i, result = q.get()
-
-        return result
-
-    out = []
-    zero = defaultdict(lambda: 0)
-
-    out.append(find_closest(locations, zero, sqdist))
-    locations.remove(out[-1])
-
-    while locations:
-        closest = find_closest(locations, out[-1], sqdist)
-        out.append(closest)
-        locations.remove(closest)
-
-    return out
+    return [locations[i] for i in order]
 
 
 def sort_locations_tsp(locations, keys, attractors=None, startPoint=None, endPoint=None):
@@ -40,6 +40,7 @@ from CAMTests.TestPathCore import TestPathCore
 from CAMTests.TestPathDepthParams import TestDepthCases
 from CAMTests.TestPathDressupDogboneII import TestDressupDogboneII
 from CAMTests.TestPathDrillable import TestPathDrillable
+from CAMTests.TestPathDropCutter import TestPathDropCutter
 from CAMTests.TestPathDrillGenerator import TestPathDrillGenerator
 from CAMTests.TestPathDressupHoldingTags import TestHoldingTags
 from CAMTests.TestDrillCycleExpander import TestDrillCycleExpander
@@ -54,6 +55,7 @@ from CAMTests.TestPathHelixGenerator import TestPathHelixGenerator
 from CAMTests.TestPathSpiralGenerator import TestPathSpiralGenerator
 from CAMTests.TestPathLog import TestPathLog
 from CAMTests.TestPathLogNew import TestPathLogNew
+from CAMTests.TestPathJobRecompute import TestPathJobRecompute
 from CAMTests.TestPathOpUtil import (
     TestPathOpUtil,
     TestGetClearedAreasWorkplane,
@@ -75,6 +77,7 @@ from CAMTests.TestPostOutput import (
     TestFileNameGenerator,
     TestExport2Integration,
 )
+from CAMTests.TestPostBatch import TestPostBatch
 
 from CAMTests.TestPathPreferences import TestPathPreferences
 from CAMTests.TestPathPocket import TestPathPocket
@@ -89,6 +92,7 @@ from CAMTests.TestPathRotaryWrap import TestRotaryWrapStrategy
 from CAMTests.TestPathRotationGenerator import TestPathRotationGenerator
 from CAMTests.TestPathSetupSheet import TestPathSetupSheet
 from CAMTests.TestPathStock import TestPathStock
+from CAMTests.TestPathSurfaceSupport import TestPathSurfaceSupport
 from CAMTests.TestPathTapGenerator import TestPathTapGenerator
 from CAMTests.TestPathThreadMilling import TestPathThreadMilling
 from CAMTests.TestPathThreadMillingGenerator import TestPathThreadMillingGenerator
@@ -157,4 +161,5 @@ from CAMTests.TestGcodeProcessingUtils import (
     TestFilterInefficientMoves,
     TestNumberGenerator,
     TestDeduplicateRepeatedCommands,
+    TestStreamingPipeline,
 )
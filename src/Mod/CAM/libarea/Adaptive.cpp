@@ -29,6 +29,11 @@
 #include <ctime>
 #include <algorithm>
 #include <numbers>
+#include <atomic>
+#include <condition_variable>
+#include <exception>
+#include <mutex>
+#include <thread>
 
 namespace ClipperLib
 {
@@ -4022,4 +4027,143 @@ void Adaptive2d::ProcessPolyNode(
     results.push_back(output);
 }
 
+//********************************************
+// ExecuteBatch
+//********************************************
+
+// Serializes the console output of the worker threads, the stream buffer std::cout and
+// std::cerr are redirected to by the application is not thread safe
+class SyncStreamBuf: public std::streambuf
+{
+public:
+    explicit SyncStreamBuf(std::ostream& stream)
+        : stream(stream)
+        , target(stream.rdbuf(this))
+    {}
+    ~SyncStreamBuf() override
+    {
+        stream.rdbuf(target);
+    }
+
+protected:
+    int overflow(int ch) override
+    {
+        std::lock_guard<std::mutex> lock(outputMutex);
+        return ch == EOF ? 0 : target->sputc(char(ch));
+    }
+    std::streamsize xsputn(const char* s, std::streamsize count) override
+    {
+        std::lock_guard<std::mutex> lock(outputMutex);
+        return target->sputn(s, count);
+    }
+    int sync() override
+    {
+        std::lock_guard<std::mutex> lock(outputMutex);
+        return target->pubsync();
+    }
+
+private:
+    static std::mutex outputMutex;
+    std::ostream& stream;
+    std::streambuf* target;
+};
+
+std::mutex SyncStreamBuf::outputMutex;
+
+std::vector<std::list<AdaptiveOutput>> ExecuteBatch(
+    std::vector<AdaptiveJob>& jobs,
+    std::function<bool(TPaths)> progressCallbackFn,
+    unsigned int threadCount
+)
+{
+    std::vector<std::list<AdaptiveOutput>> batchResults(jobs.size());
+    if (threadCount == 0) {
+        threadCount = std::thread::hardware_concurrency();
+    }
+    threadCount = (unsigned int)max(size_t(1), min(size_t(threadCount), jobs.size()));
+
+    std::mutex mutex;
+    std::condition_variable changed;
+    TPaths pendingPaths;  // progress of the workers, not yet reported
+    unsigned int runningThreads = threadCount;
+    std::exception_ptr workerError;
+    std::atomic<size_t> nextJob {0};
+    std::atomic<bool> stop {false};
+
+    // workers only queue their progress, the callback may be a python function
+    // which has to run on the calling thread
+    std::function<bool(TPaths)> queueProgress = [&](TPaths progressPaths) {
+        {
+            std::lock_guard<std::mutex> lock(mutex);
+            pendingPaths.insert(pendingPaths.end(), progressPaths.begin(), progressPaths.end());
+        }
+        changed.notify_one();
+        return stop.load();
+    };
+
+    auto worker = [&]() {
+        try {
+            for (size_t i = nextJob++; i < jobs.size() && !stop; i = nextJob++) {
+                AdaptiveJob& job = jobs[i];
+                batchResults[i] = job.adaptive
+                                      ->Execute(job.stockPaths, job.paths, job.clearedPaths, queueProgress);
+            }
+        }
+        catch (...) {
+            std::lock_guard<std::mutex> lock(mutex);
+            if (!workerError) {
+                workerError = std::current_exception();
+            }
+            stop = true;
+        }
+        {
+            std::lock_guard<std::mutex> lock(mutex);
+            runningThreads--;
+        }
+        changed.notify_one();
+    };
+
+    SyncStreamBuf syncedOut(std::cout);
+    SyncStreamBuf syncedErr(std::cerr);
+    std::vector<std::thread> threads;
+    for (unsigned int i = 0; i < threadCount; i++) {
+        threads.emplace_back(worker);
+    }
+
+    std::exception_ptr callbackError;
+    bool done = false;
+    while (!done) {
+        TPaths progressPaths;
+        {
+            std::unique_lock<std::mutex> lock(mutex);
+            changed.wait(lock, [&] { return runningThreads == 0 || !pendingPaths.empty(); });
+            progressPaths.swap(pendingPaths);
+            done = runningThreads == 0;
+        }
+        if (progressPaths.empty() || !progressCallbackFn || callbackError) {
+            continue;
+        }
+        try {
+            if (progressCallbackFn(progressPaths)) {
+                stop = true;
+            }
+        }
+        catch (...) {
+            callbackError = std::current_exception();
+            stop = true;
+        }
+    }
+
+    for (auto& thread : threads) {
+        thread.join();
+    }
+    if (workerError) {
+        std::rethrow_exception(workerError);
+    }
+    if (callbackError) {
+        std::rethrow_exception(callbackError);
+    }
+    return batchResults;
+}
+
 }  // namespace AdaptivePath
@@ -27,6 +27,7 @@
 #include <vector>
 #include <list>
 #include <optional>
+#include <functional>
 #include <time.h>
 
 #pragma once
@@ -271,4 +272,22 @@ private:
     const long POINTS_PER_PASS_LIMIT = __LONG_MAX__;     // limit used while debugging
     const clock_t PROGRESS_TICKS = CLOCKS_PER_SEC / 10;  // progress report interval
 };
+
+// one independent Adaptive2d::Execute call of a batch
+struct AdaptiveJob
+{
+    Adaptive2d* adaptive;
+    DPaths stockPaths;
+    DPaths paths;
+    DPaths clearedPaths;
+};
+
+// Executes the jobs on threadCount worker threads (0 = one per core) and returns the results
+// in job order. progressCallbackFn is called on the calling thread only, with the progress
+// paths of all running jobs; if it returns true all jobs stop processing.
+std::vector<std::list<AdaptiveOutput>> ExecuteBatch(
+    std::vector<AdaptiveJob>& jobs,
+    std::function<bool(TPaths)> progressCallbackFn,
+    unsigned int threadCount = 0
+);
 }  // namespace AdaptivePath
@@ -276,6 +276,25 @@ double AreaGetArea(const CArea& a)
 }
 
 
+using AdaptiveJobTuple = std::
+    tuple<AdaptivePath::Adaptive2d*, AdaptivePath::DPaths, AdaptivePath::DPaths, AdaptivePath::DPaths>;
+
+// jobs is a list of (Adaptive2d, stockPaths, paths, clearedPaths) tuples
+static std::vector<std::list<AdaptivePath::AdaptiveOutput>> AdaptiveExecuteBatch(
+    const std::vector<AdaptiveJobTuple>& jobList,
+    std::function<bool(AdaptivePath::TPaths)> progressCallbackFn,
+    unsigned int threadCount
+)
+{
+    std::vector<AdaptivePath::AdaptiveJob> jobs;
+    for (const auto& [adaptive, stockPaths, paths, clearedPaths] : jobList) {
+        jobs.push_back({adaptive, stockPaths, paths, clearedPaths});
+    }
+    // the callback is run on this thread and acquires the GIL while it runs
+    py::gil_scoped_release release;
+    return AdaptivePath::ExecuteBatch(jobs, progressCallbackFn, threadCount);
+}
+
 void init_pyarea(py::module& m)
 {
     py::class_<Point>(m, "Point")
@@ -432,6 +451,13 @@ void init_pyarea(py::module& m)
     py::class_<Adaptive2d>(m, "Adaptive2d")
         .def(py::init<>())
         .def("Execute", &Adaptive2d::Execute)
+        .def_static(
+            "ExecuteBatch",
+            &AdaptiveExecuteBatch,
+            py::arg("jobs"),
+            py::arg("progressCallbackFn"),
+            py::arg("threads") = 0
+        )
         .def_readwrite("stepOverFactor", &Adaptive2d::stepOverFactor)
         .def_readwrite("toolDiameter", &Adaptive2d::toolDiameter)
         .def_readwrite("stockToLeave", &Adaptive2d::stockToLeave)
@@ -49,6 +49,10 @@ class FemMesh(ComplexGeoData):
         """Add a node by setting (x,y,z)."""
         ...
 
+    def addNodeList(self, coordinates: list[float], ids: list[int] | None = None, /) -> list[int]:
+        """Add list of nodes by flat list of x,y,z coordinates and optional node ids."""
+        ...
+
     @overload
     def addEdge(self, n1: int, n2: int, /) -> int: ...
     @overload
@@ -57,8 +61,10 @@ class FemMesh(ComplexGeoData):
         """Add an edge by setting two node indices."""
         ...
 
-    def addEdgeList(self, nodes: list[int], np: list[int], /) -> list[int]:
-        """Add list of edges by list of node indices and list of nodes per edge."""
+    def addEdgeList(
+        self, nodes: list[int], np: list[int], ids: list[int] | None = None, /
+    ) -> list[int]:
+        """Add list of edges by node indices, nodes per edge and optional element ids."""
         ...
 
     @overload
@@ -69,8 +75,10 @@ class FemMesh(ComplexGeoData):
         """Add a face by setting three node indices."""
         ...
 
-    def addFaceList(self, nodes: list[int], np: list[int], /) -> list[int]:
-        """Add list of faces by list of node indices and list of nodes per face."""
+    def addFaceList(
+        self, nodes: list[int], np: list[int], ids: list[int] | None = None, /
+    ) -> list[int]:
+        """Add list of faces by node indices, nodes per face and optional element ids."""
         ...
 
     def addQuad(self, n1: int, n2: int, n3: int, n4: int, /) -> int:
@@ -85,8 +93,10 @@ class FemMesh(ComplexGeoData):
         """Add a volume by setting an arbitrary number of node indices."""
         ...
 
-    def addVolumeList(self, nodes: list[int], np: list[int], /) -> list[int]:
-        """Add list of volumes by list of node indices and list of nodes per volume."""
+    def addVolumeList(
+        self, nodes: list[int], np: list[int], ids: list[int] | None = None, /
+    ) -> list[int]:
+        """Add list of volumes by node indices, nodes per volume and optional element ids."""
         ...
 
     def read(self, file_name: str, vtk_cell_group_array: str) -> None:
@@ -211,6 +221,12 @@ class FemMesh(ComplexGeoData):
         """Get the node position vector by a Node-ID"""
         ...
 
+    @constmethod
+    def getNodeList(self, after_id: int, count: int, /) -> tuple[list[int], list[float]]:
+        """Get the IDs and a flat list of x,y,z position coordinates of at most count
+        nodes with IDs greater than after_id, in ascending ID order"""
+        ...
+
     @constmethod
     def getNodesBySolid(self, shape: TopoShapeSolid, /) -> list[int]:
         """Return a list of node IDs which belong to a TopoSolid"""
@@ -28,6 +28,7 @@
 #include <SMESHDS_Mesh.hxx>
 #include <SMESH_Group.hxx>
 #include <SMESH_Mesh.hxx>
+#include <SMESH_MeshEditor.hxx>
 #include <TopoDS.hxx>
 #include <TopoDS_Face.hxx>
 #include <TopoDS_Shape.hxx>
@@ -198,6 +199,64 @@ PyObject* FemMeshPy::compute(PyObject* args)
     Py_Return;
 }
 
+namespace
+{
+
+// add elements with the given ids, used by the list methods if an id list is given
+PyObject* addElementListWithID(
+    SMESH_Mesh* mesh,
+    PyObject* nodesObj,
+    PyObject* npObj,
+    PyObject* idsObj,
+    SMDSAbs_ElementType type
+)
+{
+    Py::List nodesList(nodesObj);
+    Py::List npList(npObj);
+    Py::List idsList(idsObj);
+    if (npList.size() != idsList.size()) {
+        PyErr_SetString(PyExc_ValueError, "Node count list and id list differ in length");
+        return nullptr;
+    }
+
+    SMESHDS_Mesh* meshDS = mesh->GetMeshDS();
+    std::vector<const SMDS_MeshNode*> nodes;
+    nodes.reserve(nodesList.size());
+    for (Py::List::iterator it = nodesList.begin(); it != nodesList.end(); ++it) {
+        Py::Long n(*it);
+        const SMDS_MeshNode* node = meshDS->FindNode(static_cast<int>(n));
+        if (!node) {
+            throw std::runtime_error("Failed to get node of the given indices");
+        }
+        nodes.push_back(node);
+    }
+
+    SMESH_MeshEditor editor(mesh);
+    SMESH_MeshEditor::ElemFeatures features(type);
+    std::vector<const SMDS_MeshNode*>::iterator nodeIt = nodes.begin();
+    Py::List result;
+    long np = 0;
+    for (Py::List::size_type i = 0; i < npList.size(); ++i, nodeIt += np) {
+        np = static_cast<long>(Py::Long(npList[i]));
+        if (np < 1 || std::distance(nodeIt, nodes.end()) < np) {
+            PyErr_SetString(PyExc_ValueError, "Node count list does not match node list");
+            return nullptr;
+        }
+        std::vector<const SMDS_MeshNode*> nodesElem(nodeIt, nodeIt + np);
+        features.SetID(static_cast<int>(Py::Long(idsList[i])));
+        SMDS_MeshElement* elem = editor.AddElement(nodesElem, features);
+        if (!elem) {
+            PyErr_SetString(PyExc_TypeError, "Failed to add element with given ElementId");
+            return nullptr;
+        }
+        result.append(Py::Long(elem->GetID()));
+    }
+
+    return Py::new_reference_to(result);
+}
+
+}  // namespace
+
 PyObject* FemMeshPy::addNode(PyObject* args)
 {
     double x, y, z;
@@ -243,6 +302,51 @@ PyObject* FemMeshPy::addNode(PyObject* args)
     return nullptr;
 }
 
+PyObject* FemMeshPy::addNodeList(PyObject* args)
+{
+    PyObject* coordsObj = nullptr;
+    PyObject* idsObj = nullptr;
+    if (!PyArg_ParseTuple(args, "O!|O!", &PyList_Type, &coordsObj, &PyList_Type, &idsObj)) {
+        return nullptr;
+    }
+
+    Py::List coordsList(coordsObj);
+    if (coordsList.size() % 3 != 0) {
+        PyErr_SetString(PyExc_ValueError, "Coordinate list length is not a multiple of three");
+        return nullptr;
+    }
+    Py::List::size_type count = coordsList.size() / 3;
+    Py::List idsList;
+    if (idsObj) {
+        idsList = Py::List(idsObj);
+        if (idsList.size() != count) {
+            PyErr_SetString(PyExc_ValueError, "Coordinate list and id list differ in length");
+            return nullptr;
+        }
+    }
+
+    SMESHDS_Mesh* meshDS = getFemMeshPtr()->getSMesh()->GetMeshDS();
+    Py::List result;
+    for (Py::List::size_type i = 0; i < count; ++i) {
+        double x = static_cast<double>(Py::Float(coordsList[3 * i]));
+        double y = static_cast<double>(Py::Float(coordsList[3 * i + 1]));
+        double z = static_cast<double>(Py::Float(coordsList[3 * i + 2]));
+        SMDS_MeshNode* node = nullptr;
+        if (idsObj) {
+            node = meshDS->AddNodeWithID(x, y, z, static_cast<int>(Py::Long(idsList[i])));
+        }
+        else {
+            node = meshDS->AddNode(x, y, z);
+        }
+        if (!node) {
+            throw std::runtime_error("Failed to add node");
+        }
+        result.append(Py::Long(node->GetID()));
+    }
+
+    return Py::new_reference_to(result);
+}
+
 PyObject* FemMeshPy::addEdge(PyObject* args)
 {
     SMESH_Mesh* mesh = getFemMeshPtr()->getSMesh();
@@ -836,10 +940,28 @@ PyObject* FemMeshPy::addEdgeList(PyObject* args)
 {
     PyObject* nodesObj = nullptr;
     PyObject* npObj = nullptr;
-    ;
-    if (!PyArg_ParseTuple(args, "O!O!", &PyList_Type, &nodesObj, &PyList_Type, &npObj)) {
+    PyObject* idsObj = nullptr;
+    if (!PyArg_ParseTuple(
+            args,
+            "O!O!|O!",
+            &PyList_Type,
+            &nodesObj,
+            &PyList_Type,
+            &npObj,
+            &PyList_Type,
+            &idsObj
+        )) {
         return nullptr;
     }
+    if (idsObj) {
+        return addElementListWithID(
+            getFemMeshPtr()->getSMesh(),
+            nodesObj,
+            npObj,
+            idsObj,
+            SMDSAbs_Edge
+        );
+    }
 
     Py::List nodesList(nodesObj);
     Py::List npList(npObj);
@@ -890,10 +1012,28 @@ PyObject* FemMeshPy::addFaceList(PyObject* args)
 {
     PyObject* nodesObj = nullptr;
     PyObject* npObj = nullptr;
-    ;
-    if (!PyArg_ParseTuple(args, "O!O!", &PyList_Type, &nodesObj, &PyList_Type, &npObj)) {
+    PyObject* idsObj = nullptr;
+    if (!PyArg_ParseTuple(
+            args,
+            "O!O!|O!",
+            &PyList_Type,
+            &nodesObj,
+            &PyList_Type,
+            &npObj,
+            &PyList_Type,
+            &idsObj
+        )) {
         return nullptr;
     }
+    if (idsObj) {
+        return addElementListWithID(
+            getFemMeshPtr()->getSMesh(),
+            nodesObj,
+            npObj,
+            idsObj,
+            SMDSAbs_Face
+        );
+    }
 
     Py::List nodesList(nodesObj);
     Py::List npList(npObj);
@@ -966,10 +1106,28 @@ PyObject* FemMeshPy::addVolumeList(PyObject* args)
 {
     PyObject* nodesObj = nullptr;
     PyObject* npObj = nullptr;
-    ;
-    if (!PyArg_ParseTuple(args, "O!O!", &PyList_Type, &nodesObj, &PyList_Type, &npObj)) {
+    PyObject* idsObj = nullptr;
+    if (!PyArg_ParseTuple(
+            args,
+            "O!O!|O!",
+            &PyList_Type,
+            &nodesObj,
+            &PyList_Type,
+            &npObj,
+            &PyList_Type,
+            &idsObj
+        )) {
         return nullptr;
     }
+    if (idsObj) {
+        return addElementListWithID(
+            getFemMeshPtr()->getSMesh(),
+            nodesObj,
+            npObj,
+            idsObj,
+            SMDSAbs_Volume
+        );
+    }
 
     Py::List nodesList(nodesObj);
     Py::List npList(npObj);
@@ -1496,6 +1654,43 @@ PyObject* FemMeshPy::getNodeById(PyObject* args) const
     }
 }
 
+PyObject* FemMeshPy::getNodeList(PyObject* args) const
+{
+    int afterId;
+    int count;
+    if (!PyArg_ParseTuple(args, "ii", &afterId, &count)) {
+        return nullptr;
+    }
+    if (count < 1) {
+        PyErr_SetString(PyExc_ValueError, "Node count must be positive");
+        return nullptr;
+    }
+
+    Base::Matrix4D Mtrx = getFemMeshPtr()->getTransform();
+    const SMESHDS_Mesh* meshDS = getFemMeshPtr()->getSMesh()->GetMeshDS();
+    Py::List ids;
+    Py::List coords;
+    // 64 bit, the IDs may go up to the maximum int
+    const long long maxId = meshDS->MaxNodeID();
+    long long id = std::max<long long>(afterId, meshDS->MinNodeID() - 1LL);
+    int found = 0;
+    while (found < count && ++id <= maxId) {
+        const SMDS_MeshNode* aNode = meshDS->FindNode(static_cast<int>(id));
+        if (!aNode) {
+            continue;
+        }
+        Base::Vector3d vec(aNode->X(), aNode->Y(), aNode->Z());
+        vec = Mtrx * vec;
+        ids.append(Py::Long(aNode->GetID()));
+        coords.append(Py::Float(vec.x));
+        coords.append(Py::Float(vec.y));
+        coords.append(Py::Float(vec.z));
+        ++found;
+    }
+
+    return Py::new_reference_to(Py::TupleN(ids, coords));
+}
+
 PyObject* FemMeshPy::getNodesBySolid(PyObject* args) const
 {
     PyObject* pW;
@@ -163,9 +163,7 @@ def setup(doc=None, solvertype="ccxtools"):
     analysis.addObject(con_transform)
 
     # mesh
-    from .meshes.mesh_transform_torque_tetra10 import create_nodes, create_elements
-
-    fem_mesh = generate_mesh.mesh_from_existing(create_nodes, create_elements)
+    fem_mesh = generate_mesh.mesh_from_npz("mesh_transform_torque_tetra10")
     femmesh_obj = analysis.addObject(ObjectsFem.makeMeshGmsh(doc, get_meshname()))[0]
     femmesh_obj.FemMesh = fem_mesh
     femmesh_obj.Shape = geom_obj
@@ -135,9 +135,7 @@ def setup(doc=None, solvertype="elmer"):
     success = generate_mesh.mesh_from_mesher(femmesh_obj, "gmsh")
     if not success:
         # try to create from existing mesh
-        from .meshes.mesh_eigenvalue_of_elastic_beam_tetra10 import create_nodes, create_elements
-
-        fem_mesh = generate_mesh.mesh_from_existing(create_nodes, create_elements)
+        fem_mesh = generate_mesh.mesh_from_npz("mesh_eigenvalue_of_elastic_beam_tetra10")
         femmesh_obj.FemMesh = fem_mesh
 
     doc.recompute()
@@ -186,12 +186,7 @@ def setup(doc=None, solvertype="calculix"):
     success = generate_mesh.mesh_from_mesher(femmesh_obj, "gmsh")
     if not success:
         # try to create from existing rough mesh
-        from .meshes.mesh_capacitance_two_balls_tetra10 import (
-            create_nodes,
-            create_elements,
-        )
-
-        fem_mesh = generate_mesh.mesh_from_existing(create_nodes, create_elements)
+        fem_mesh = generate_mesh.mesh_from_npz("mesh_capacitance_two_balls_tetra10")
         femmesh_obj.FemMesh = fem_mesh
 
     doc.recompute()
@@ -21,11 +21,23 @@
 # *                                                                         *
 # ***************************************************************************
 
+import glob
+import hashlib
+import importlib
+import os
 import sys
+
+import numpy as np
+
 from FreeCAD import Console
 import Fem
 
 
+# the mesh modules are the source, the npz files are written from them by write_mesh_npz
+_MESHES_DIR = os.path.dirname(os.path.abspath(__file__))
+_ELEMENT_KINDS = ("edge", "face", "volume")
+
+
 def mesh_from_mesher(femmesh_obj, mesher=""):
     tool = None
     success = False
@@ -64,3 +76,126 @@ def mesh_from_existing(create_nodes, create_elements):
         Console.PrintError("Error on creating elements.\n")
 
     return fem_mesh
+
+
+def mesh_from_npz(mesh_name):
+    """Create the FemMesh of the mesh module mesh_name, e.g. "mesh_canticcx_tria3".
+
+    The mesh is loaded in bulk from mesh_name.npz. If the npz file is missing or was
+    not written from the current mesh module the functions of the module are used.
+    """
+    npz_file = os.path.join(_MESHES_DIR, mesh_name + ".npz")
+    if os.path.isfile(npz_file):
+        with np.load(npz_file) as data:
+            if str(data["source_sha256"]) == _get_source_hash(mesh_name):
+                return _femmesh_from_npz_data(data)
+        Console.PrintWarning(
+            f"Mesh file {npz_file} is outdated, it will not be used. "
+            "Update it with write_mesh_npz().\n"
+        )
+    module = importlib.import_module("femexamples.meshes." + mesh_name)
+    return mesh_from_existing(module.create_nodes, module.create_elements)
+
+
+def write_mesh_npz(mesh_name):
+    """Write the mesh of the mesh module mesh_name into mesh_name.npz."""
+    module = importlib.import_module("femexamples.meshes." + mesh_name)
+    recorder = _MeshRecorder()
+    module.create_nodes(recorder)
+    module.create_elements(recorder)
+
+    data = {
+        "source_sha256": np.array(_get_source_hash(mesh_name)),
+        "node_ids": np.array(recorder.node_ids, dtype=np.int32),
+        "node_coords": np.array(recorder.node_coords, dtype=np.float64).reshape(-1, 3),
+    }
+    for kind in _ELEMENT_KINDS:
+        ids, nodes, counts = recorder.elements[kind]
+        data[kind + "_ids"] = np.array(ids, dtype=np.int32)
+        data[kind + "_nodes"] = np.array(nodes, dtype=np.int32)
+        data[kind + "_np"] = np.array(counts, dtype=np.int8)
+    group_sizes = [len(elements) for name, group_type, elements in recorder.groups]
+    data["group_names"] = np.array([g[0] for g in recorder.groups], dtype=str)
+    data["group_types"] = np.array([g[1] for g in recorder.groups], dtype=str)
+    data["group_offsets"] = np.cumsum([0] + group_sizes, dtype=np.int64)
+    data["group_elements"] = np.array(
+        [e for g in recorder.groups for e in g[2]], dtype=np.int32
+    )
+
+    npz_file = os.path.join(_MESHES_DIR, mesh_name + ".npz")
+    np.savez_compressed(npz_file, **data)
+    Console.PrintMessage(f"Mesh file {npz_file} written.\n")
+    return npz_file
+
+
+def write_all_mesh_npz():
+    """Write the npz files of all mesh modules."""
+    for mesh_file in sorted(glob.glob(os.path.join(_MESHES_DIR, "mesh_*.py"))):
+        write_mesh_npz(os.path.splitext(os.path.basename(mesh_file))[0])
+
+
+def _get_source_hash(mesh_name):
+    with open(os.path.join(_MESHES_DIR, mesh_name + ".py"), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _femmesh_from_npz_data(data):
+    fem_mesh = Fem.FemMesh()
+    fem_mesh.addNodeList(data["node_coords"].ravel().tolist(), data["node_ids"].tolist())
+    add_lists = {
+        "edge": fem_mesh.addEdgeList,
+        "face": fem_mesh.addFaceList,
+        "volume": fem_mesh.addVolumeList,
+    }
+    for kind in _ELEMENT_KINDS:
+        ids = data[kind + "_ids"]
+        if ids.size:
+            add_lists[kind](
+                data[kind + "_nodes"].tolist(), data[kind + "_np"].tolist(), ids.tolist()
+            )
+    offsets = data["group_offsets"]
+    group_elements = data["group_elements"]
+    for i, (name, group_type) in enumerate(zip(data["group_names"], data["group_types"])):
+        group = fem_mesh.addGroup(str(name), str(group_type))
+        fem_mesh.addGroupElements(group, group_elements[offsets[i] : offsets[i + 1]].tolist())
+
+    return fem_mesh
+
+
+class _MeshRecorder:
+    # collects what the mesh module functions add to a FemMesh
+
+    def __init__(self):
+        self.node_ids = []
+        self.node_coords = []
+        # element ids, flat element node ids, node count per element
+        self.elements = {kind: ([], [], []) for kind in _ELEMENT_KINDS}
+        self.groups = []
+
+    def addNode(self, x, y, z, node_id):
+        self.node_ids.append(node_id)
+        self.node_coords.append((x, y, z))
+        return node_id
+
+    def addEdge(self, nodes, element_id):
+        return self._add_element("edge", nodes, element_id)
+
+    def addFace(self, nodes, element_id):
+        return self._add_element("face", nodes, element_id)
+
+    def addVolume(self, nodes, element_id):
+        return self._add_element("volume", nodes, element_id)
+
+    def addGroup(self, name, group_type):
+        self.groups.append((name, group_type, []))
+        return len(self.groups) - 1
+
+    def addGroupElements(self, group, elements):
+        self.groups[group][2].extend(elements)
+
+    def _add_element(self, kind, nodes, element_id):
+        ids, flat_nodes, counts = self.elements[kind]
+        ids.append(element_id)
+        flat_nodes.extend(nodes)
+        counts.append(len(nodes))
+        return element_id
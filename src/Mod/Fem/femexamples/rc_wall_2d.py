@@ -166,9 +166,7 @@ def setup(doc=None, solvertype="ccxtools"):
     analysis.addObject(con_disp)
 
     # mesh
-    from .meshes.mesh_rc_wall_2d_tria6 import create_nodes, create_elements
-
-    fem_mesh = generate_mesh.mesh_from_existing(create_nodes, create_elements)
+    fem_mesh = generate_mesh.mesh_from_npz("mesh_rc_wall_2d_tria6")
     femmesh_obj = analysis.addObject(ObjectsFem.makeMeshGmsh(doc, get_meshname()))[0]
     femmesh_obj.FemMesh = fem_mesh
     femmesh_obj.Shape = geom_obj
@@ -58,9 +58,7 @@ def setup(doc=None, solvertype="z88"):
     femmesh_obj = doc.getObject(get_meshname())
 
     # mesh
-    from .meshes.mesh_truss_crane_seg2 import create_nodes, create_elements
-
-    fem_mesh = generate_mesh.mesh_from_existing(create_nodes, create_elements)
+    fem_mesh = generate_mesh.mesh_from_npz("mesh_truss_crane_seg2")
 
     # overwrite mesh with the hexa20 mesh
     femmesh_obj.FemMesh = fem_mesh
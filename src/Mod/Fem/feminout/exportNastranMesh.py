@@ -27,17 +27,7 @@ __url__ = "https://www.freecad.org"
 
 ## @package exportPyNastranMesh
 #  \ingroup FEM
-#  \brief FreeCAD pyNastran Mesh writer for FEM workbench
-
-import FreeCAD
-
-# we need to import FreeCAD before the non FreeCAD library because of the print
-try:
-    from pyNastran.bdf.bdf import BDF
-except Exception:
-    FreeCAD.Console.PrintError(
-        "Module pyNastran not found. Writing Mystran solver input will not work.\n"
-    )
+#  \brief FreeCAD Nastran and pyNastran Mesh writer for FEM workbench
 
 from FreeCAD import Console
 
@@ -65,45 +55,72 @@ def export(objectslist, filename):
 # ********* module specific methods **************************************************************
 # writer:
 # - a method directly writes a FemMesh to the mesh file
+# - a method takes a FemMesh and writes the Nastran bulk data in chunks to the file handle
 # - a method generates the pyNastran code
 
 
 # ********* writer *******************************************************************************
 def write(fem_mesh, filename):
-    """directly write a FemMesh to a pyNastran mesh file format
-    fem_mesh: a FemMesh"""
+    """directly write a FemMesh to a Nastran mesh file format
+    fem_mesh: a FemMesh
+    The bulk data cards and the pyNastran code are written in chunks
+    straight from the FemMesh, thus the memory needed does not grow with the mesh size."""
 
     if not fem_mesh.isDerivedFrom("Fem::FemMesh"):
         Console.PrintError("Not a FemMesh was given as parameter.\n")
         return
-    femnodes_mesh = fem_mesh.Nodes
-    femelement_table = meshtools.get_femelement_table(fem_mesh)
-    export_element_type = get_export_element_type(fem_mesh, femelement_table)
-
-    model = BDF()
-    mesh_pynas_code = get_pynastran_mesh(femnodes_mesh, femelement_table, export_element_type)
-    mesh_pynas_code += missing_code_pnynasmesh
+    export_element_type = get_export_element_type(fem_mesh)
+    if export_element_type is None:
+        Console.PrintError("Error: wrong export_element_type.\n")
+        return
 
     # pynas file
     basefilename = filename[: len(filename) - 4]  # TODO basename is more failsafe
-    pynasf = open(basefilename + ".py", "w")
-    pynasf.write("# written by FreeCAD\n\n\n")
-    pynasf.write("from pyNastran.bdf.bdf import BDF\n")
-    pynasf.write("model = BDF()\n\n\n")
-    pynasf.write(mesh_pynas_code)
-
-    pynasf.write("model.write_bdf('{}', enddata=True)\n".format(basefilename + "_pyNas.bdf"))
-    pynasf.close()
-
-    # execute pyNastran code to add grid to the model
-    # print(model)
-    # print(model.get_bdf_stats())
-    exec(mesh_pynas_code)
-    # print(model)
-    # print(model.get_bdf_stats())
+    with open(basefilename + ".py", "w") as pynasf:
+        pynasf.write("# written by FreeCAD\n\n\n")
+        pynasf.write("from pyNastran.bdf.bdf import BDF\n")
+        pynasf.write("model = BDF()\n\n\n")
+        pynasf.write("# grid cards, geometric mesh points\n")
+        for ids, coords in meshtools.iter_femnodes_chunks(fem_mesh):
+            pynasf.write(get_pynastran_grids(zip(ids.tolist(), coords.tolist())))
+        pynasf.write("\n\n# elements cards\n")
+        for femelement_table in meshtools.iter_femelement_table_chunks(fem_mesh):
+            pynasf.write(get_pynastran_elements(femelement_table, export_element_type))
+        pynasf.write("\n\n")
+        pynasf.write(missing_code_pnynasmesh)
+        pynasf.write("model.write_bdf('{}', enddata=True)\n".format(basefilename + "_pyNas.bdf"))
 
     # write Nastran mesh file
-    model.write_bdf(filename, enddata=True)  # TODO FIXME "BEGIN BULK" is missing
+    with open(filename, "w") as f:
+        write_nastran_mesh_to_file(fem_mesh, export_element_type, f)
+
+
+def write_nastran_mesh_to_file(fem_mesh, export_element_type, f):
+    """write the mesh as Nastran bulk data in chunks straight from the FemMesh
+    nodes as large field GRID cards, elements as small field cards"""
+    f.write("$ written by FreeCAD\n")
+    f.write("BEGIN BULK\n")
+    for ids, coords in meshtools.iter_femnodes_chunks(fem_mesh):
+        f.write(
+            "".join(
+                f"GRID*   {node:>16}{'':16}{x:16.8E}{y:16.8E}\n*       {z:16.8E}\n"
+                for node, (x, y, z) in zip(ids.tolist(), coords.tolist())
+            )
+        )
+    ele_keyword, node_order = nastran_ele_cards[export_element_type]
+    for femelement_table in meshtools.iter_femelement_table_chunks(fem_mesh):
+        cards = []
+        for element, nodes in femelement_table.items():
+            fields = [element, 1] + [nodes[i] for i in node_order]
+            if export_element_type == "cbar":
+                # orientation vector x=[0.0, 0.0, 1.0]
+                fields += ["0.", "0.", "1."]
+            card = f"{ele_keyword:8}" + "".join(f"{field:>8}" for field in fields[:8])
+            for i in range(8, len(fields), 8):  # continuation lines
+                card += "\n" + 8 * " " + "".join(f"{field:>8}" for field in fields[i : i + 8])
+            cards.append(card + "\n")
+        f.write("".join(cards))
+    f.write("ENDDATA\n")
 
 
 def get_pynastran_mesh(
@@ -117,21 +134,36 @@ def get_pynastran_mesh(
 
     # nodes
     pynas_nodes = "# grid cards, geometric mesh points\n"
-    for node in femnodes_mesh:
-        vec = femnodes_mesh[node]
-        pynas_nodes += f"model.add_grid({node}, [{vec.x}, {vec.y}, {vec.z}])\n"
+    pynas_nodes += get_pynastran_grids(
+        (node, (vec.x, vec.y, vec.z)) for node, vec in femnodes_mesh.items()
+    )
     # print(pynas_nodes)
 
     # elements
+    pynas_elements = "# elements cards\n"
+    pynas_elements += get_pynastran_elements(femelement_table, export_element_type)
+    # print(pynas_elements)
+
+    mesh_pynas_code = f"{pynas_nodes}\n\n{pynas_elements}\n\n"
+    return mesh_pynas_code
+
+
+def get_pynastran_grids(nodes):
+    """pyNastran code of the grid cards, nodes: iterable of (node id, (x, y, z))"""
+    return "".join(f"model.add_grid({node}, [{x}, {y}, {z}])\n" for node, (x, y, z) in nodes)
+
+
+def get_pynastran_elements(femelement_table, export_element_type):
     # Nastran seems to have the same node order as SMESH (FreeCAD) has
     # thus just write the nodes at once
-    pynas_elements = "# elements cards\n"
+    ele_keyword, node_order = nastran_ele_cards[export_element_type]
+    pynas_elements = []
     for element in femelement_table:
         nodes = femelement_table[element]
         # print(element)  #  eleid
         # print(n)  # tuple of nodes
         if export_element_type == "cbar":
-            pynas_elements += (
+            pynas_elements.append(
                 "model.add_{ele_keyword}({eid}, {pid}, {nodes}, "
                 "{orientation_vec}, {gnull})\n".format(
                     ele_keyword=export_element_type,
@@ -143,35 +175,16 @@ def get_pynastran_mesh(
                 )
             )
         else:
-            if export_element_type == "ctetra4":
-                ele_keyword = "ctetra"
-                # N1, N3, N2, N4
-                the_nodes = [nodes[0], nodes[2], nodes[1], nodes[3]]
-            elif export_element_type == "ctetra10":
-                ele_keyword = "ctetra"
-                # N1, N3, N2, N4, N7, N6, N5, N8, N10, N9
-                the_nodes = [
-                    nodes[0],
-                    nodes[2],
-                    nodes[1],
-                    nodes[3],
-                    nodes[6],
-                    nodes[5],
-                    nodes[4],
-                    nodes[7],
-                    nodes[9],
-                    nodes[8],
-                ]
+            if export_element_type in ("ctetra4", "ctetra10"):
+                the_nodes = [nodes[i] for i in node_order]
             else:
-                ele_keyword = export_element_type
                 the_nodes = nodes
-            pynas_elements += "model.add_{ele_keyword}({eid}, {pid}, {nodes})\n".format(
-                ele_keyword=ele_keyword, eid=element, pid=1, nodes=the_nodes
+            pynas_elements.append(
+                "model.add_{ele_keyword}({eid}, {pid}, {nodes})\n".format(
+                    ele_keyword=ele_keyword.lower(), eid=element, pid=1, nodes=the_nodes
+                )
             )
-    # print(pynas_elements)
-
-    mesh_pynas_code = f"{pynas_nodes}\n\n{pynas_elements}\n\n"
-    return mesh_pynas_code
+    return "".join(pynas_elements)
 
 
 # Helper
@@ -179,6 +192,18 @@ def get_export_element_type(femmesh, femelement_table=None):
     return nastran_ele_types[meshtools.get_femmesh_eletype(femmesh, femelement_table)]
 
 
+# Nastran card name and the FreeCAD node indices in Nastran order
+nastran_ele_cards = {
+    # N1, N3, N2, N4
+    "ctetra4": ("CTETRA", [0, 2, 1, 3]),
+    # N1, N3, N2, N4, N7, N6, N5, N8, N10, N9
+    "ctetra10": ("CTETRA", [0, 2, 1, 3, 6, 5, 4, 7, 9, 8]),
+    "ctria3": ("CTRIA3", [0, 1, 2]),
+    "cquad4": ("CQUAD4", [0, 1, 2, 3]),
+    "cbar": ("CBAR", [0, 1]),
+}
+
+
 nastran_ele_types = {
     "tetra4": "ctetra4",
     "tetra10": "ctetra10",
@@ -33,6 +33,9 @@ __url__ = "https://www.freecad.org"
 
 import os
 import math
+from itertools import starmap
+
+import numpy as np
 
 import FreeCAD
 from FreeCAD import Console
@@ -65,6 +68,13 @@ def setupPipeline(doc, analysis, results_name, result_data):
     if not "BUILD_FEM_VTK" in FreeCAD.__cmake__:
         return
 
+    from femresult import resulttools
+
+    # result fields kept in field files are needed to fill the pipeline
+    result_objs = result_data if len(result_data) == 1 else result_data[0]
+    for res_obj in result_objs:
+        resulttools.load_result_fields(res_obj)
+
     # create a results pipeline (dependent on user settings)
     pipeline_name = "Pipeline_" + results_name
     pipelines = analysis.getObjectsOfType("Fem::FemPostPipeline")
@@ -94,6 +104,9 @@ def setupPipeline(doc, analysis, results_name, result_data):
         pipeline_obj.Label = pipeline_name
         pipeline_obj.load(*result_data)
 
+    for res_obj in result_objs:
+        resulttools.release_result_fields(res_obj)
+
     # update the pipeline
     pipeline_obj.recomputeChildren()
     pipeline_obj.recompute()
@@ -110,7 +123,15 @@ def setupPipeline(doc, analysis, results_name, result_data):
         pipeline_obj.ViewObject.Visibility = pipeline_visibility
 
 
-def importFrd(filename, analysis=None, result_name_prefix="", result_analysis_type=""):
+def importFrd(
+    filename, analysis=None, result_name_prefix="", result_analysis_type="", steps=None, fields=None
+):
+    """Import a frd file into result objects.
+
+    If steps or fields are given, the frd file is read by the array based reader
+    and only the selected result steps and fields are imported,
+    see read_frd_result_arrays() for their meaning.
+    """
     import ObjectsFem
     from . import importToolsFem
 
@@ -119,7 +140,15 @@ def importFrd(filename, analysis=None, result_name_prefix="", result_analysis_ty
     else:
         doc = FreeCAD.ActiveDocument
 
-    m = read_frd_result(filename)
+    # keep the result fields in a field file instead of the result objects
+    store_fields = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/General").GetBool(
+        "ResultFieldFile", False
+    )
+
+    if steps is None and fields is None:
+        m = read_frd_result(filename)
+    else:
+        m = read_frd_result_selected(filename, steps, fields)
     result_mesh_object = None
     res_obj = None
 
@@ -231,6 +260,8 @@ def importFrd(filename, analysis=None, result_name_prefix="", result_analysis_ty
                     res_obj = resulttools.add_principal_stress_std(res_obj)
                 # fill Stats
                 res_obj = resulttools.fill_femresult_stats(res_obj)
+                if store_fields:
+                    resulttools.store_result_fields(res_obj)
 
                 # if we have multiple results we delay the pipeline creation
                 if number_of_increments == 1:
@@ -318,17 +349,7 @@ def importFrd(filename, analysis=None, result_name_prefix="", result_analysis_ty
 # displacement vectors and stress values.
 def read_frd_result(frd_input):
     Console.PrintMessage(f"Read ccx results from frd file: {frd_input}\n")
-    inout_nodes = []
-    inout_nodes_file = frd_input.rsplit(".", 1)[0] + "_inout_nodes.txt"
-    if os.path.exists(inout_nodes_file):
-        Console.PrintMessage(f"Read special 1DFlow nodes data form: {inout_nodes_file}\n")
-        f = pyopen(inout_nodes_file, "r")
-        lines = f.readlines()
-        for line in lines:
-            a = line.split(",")
-            inout_nodes.append(a)
-        f.close()
-        Console.PrintMessage(f"{inout_nodes}\n")
+    inout_nodes = _read_frd_inout_nodes(frd_input)
     frd_file = pyopen(frd_input, "r")
     nodes = {}
     elements_hexa8 = {}
@@ -908,3 +929,371 @@ def read_frd_result(frd_input):
         "Penta15Elem": elements_penta15,
         "Results": results,
     }
+
+
+# ********* array based frd reader *********
+# The fixed-width records of a frd block are collected and converted into
+# numpy arrays in one go. Result steps are read one by one, thus only the
+# selected steps and fields are held in memory.
+
+FRD_RESULT_FIELDS = ("disp", "stress", "strain", "peeq", "temp", "heatflux", "mflow", "npressure")
+
+# frd block name: (result key, number of values, FreeCAD value order, scale factor)
+# CalculiX frd files: (Sxx, Syy, Szz, Sxy, Syz, Szx)
+# FreeCAD:            (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+# thus the last two entries of stress and strain are exchanged
+# mass flow is converted to kg/s from t/s
+_FRD_RESULT_BLOCKS = {
+    "DISP": ("disp", 3, None, 1.0),
+    "STRESS": ("stress", 6, (0, 1, 2, 3, 5, 4), 1.0),
+    "TOSTRAIN": ("strain", 6, (0, 1, 2, 3, 5, 4), 1.0),
+    "PE": ("peeq", 1, None, 1.0),
+    "NDTEMP": ("temp", 1, None, 1.0),
+    "FLUX": ("heatflux", 3, None, 1.0),
+    "MAFLOW": ("mflow", 1, None, 1000.0),
+    "STPRES": ("npressure", 1, None, 1.0),
+}
+
+# frd element type: (mesh data key, number of nodes, FreeCAD node order)
+# node order fits with node order in writeAbaqus() in FemMesh.cpp
+# for hexa20, penta15 and seg3 see the notes in read_frd_result()
+_FRD_ELEMENT_TYPES = {
+    1: ("Hexa8Elem", 8, (5, 6, 7, 4, 1, 2, 3, 0)),
+    2: ("Penta6Elem", 6, (4, 5, 3, 1, 2, 0)),
+    3: ("Tetra4Elem", 4, (1, 0, 2, 3)),
+    4: (
+        "Hexa20Elem",
+        20,
+        (7, 4, 5, 6, 3, 0, 1, 2, 19, 16, 17, 18, 11, 8, 9, 10, 15, 12, 13, 14),
+    ),
+    5: ("Penta15Elem", 15, (4, 5, 3, 1, 2, 0, 13, 14, 12, 7, 8, 6, 10, 11, 9)),
+    6: ("Tetra10Elem", 10, (1, 0, 2, 3, 4, 6, 5, 8, 7, 9)),
+    7: ("Tria3Elem", 3, None),
+    8: ("Tria6Elem", 6, None),
+    9: ("Quad4Elem", 4, None),
+    10: ("Quad8Elem", 8, None),
+    11: ("Seg2Elem", 2, None),
+    12: ("Seg3Elem", 3, None),
+}
+
+
+def read_frd_result_arrays(frd_input, steps=None, fields=None):
+    """Read mesh and results of a frd file into numpy arrays.
+
+    Returns the dictionary of read_frd_mesh_arrays() with the additional
+    key "Results", the list of the result steps of iter_frd_result_steps().
+    """
+    mesh_data = read_frd_mesh_arrays(frd_input)
+    mesh_data["Results"] = list(iter_frd_result_steps(frd_input, steps, fields))
+    return mesh_data
+
+
+def read_frd_mesh_arrays(frd_input):
+    """Read the mesh of a frd file into numpy arrays.
+
+    Returns a dictionary with the keys of read_frd_result() without "Results".
+    The value of "Nodes" is a tuple of the node ids (n,) and the coordinates (n, 3),
+    the value of each element key is a tuple of the element ids (n,) and
+    the node ids of the elements (n, number of nodes) in FreeCAD node order.
+    """
+    inout_nodes = _read_frd_inout_nodes(frd_input)
+    node_lines = []
+    element_lines = {}
+    element_node_lines = {}
+    nodes_found = False
+    elements_found = False
+    with pyopen(frd_input, "r") as frd_file:
+        for line in frd_file:
+            record = line[1:3]
+            if record == "-1":
+                if nodes_found:
+                    node_lines.append(line)
+                elif elements_found:
+                    elem_type = int(line[14:18])
+                    element_lines.setdefault(elem_type, []).append(line)
+                    node_lines_of_type = element_node_lines.setdefault(elem_type, [])
+            elif record == "-2":
+                if elements_found:
+                    node_lines_of_type.append(line)
+            elif record == "-3":
+                nodes_found = False
+                elements_found = False
+            elif line[4:6] == "2C":
+                nodes_found = True
+            elif line[4:6] == "3C":
+                elements_found = True
+            elif line[4:10] == "1PSTEP" or line[1:5] == "9999":
+                # the mesh is written before any result step
+                break
+
+    mesh_data = {}
+    if node_lines:
+        node_ids = _frd_lines_to_array(node_lines, 3, 10, 1, np.int64).reshape(-1)
+        node_coords = _frd_lines_to_array(node_lines, 13, 12, 3, np.float64)
+    else:
+        Console.PrintError("FEM: No nodes found in Frd file.\n")
+        node_ids = np.empty(0, dtype=np.int64)
+        node_coords = np.empty((0, 3), dtype=np.float64)
+    mesh_data["Nodes"] = (node_ids, node_coords)
+
+    for elem_type, (key, node_count, node_order) in _FRD_ELEMENT_TYPES.items():
+        if elem_type not in element_lines:
+            mesh_data[key] = (
+                np.empty(0, dtype=np.int64),
+                np.empty((0, node_count), dtype=np.int64),
+            )
+            continue
+        elem_ids = _frd_lines_to_array(element_lines[elem_type], 3, 10, 1, np.int64)
+        elem_ids = elem_ids.reshape(-1)
+        lines = element_node_lines[elem_type]
+        if node_count <= 10:
+            elem_nodes = _frd_lines_to_array(lines, 3, 10, node_count, np.int64)
+        else:
+            # ten nodes per line, the remaining nodes are on the second line
+            elem_nodes = np.hstack(
+                (
+                    _frd_lines_to_array(lines[0::2], 3, 10, 10, np.int64),
+                    _frd_lines_to_array(lines[1::2], 3, 10, node_count - 10, np.int64),
+                )
+            )
+        if node_order is not None:
+            elem_nodes = elem_nodes[:, node_order]
+        if key == "Seg3Elem" and inout_nodes:
+            elem_ids, elem_nodes = _apply_frd_inout_nodes_seg3(elem_ids, elem_nodes, inout_nodes)
+        mesh_data[key] = (elem_ids, elem_nodes)
+
+    return mesh_data
+
+
+def iter_frd_result_steps(frd_input, steps=None, fields=None):
+    """Iterate over the result steps of a frd file.
+
+    steps: iterable of step indices to read, negative indices count from the
+        last step, None reads all steps
+    fields: iterable of result keys of FRD_RESULT_FIELDS to read,
+        None reads all fields
+
+    Yields a dictionary for each selected step in file order. Besides "number"
+    (eigenmode number) and "time" it holds a tuple of the node ids (n,) and
+    the values (n,) or (n, number of components) for every field read.
+    The steps are grouped the same way read_frd_result() does.
+    """
+    if fields is not None:
+        fields = frozenset(fields)
+        unknown_fields = fields.difference(FRD_RESULT_FIELDS)
+        if unknown_fields:
+            raise ValueError(f"Unknown frd result fields: {sorted(unknown_fields)}")
+    inout_nodes = _read_frd_inout_nodes(frd_input)
+
+    last_step = None
+    if steps is None:
+        is_step_selected = None
+    else:
+        steps = set(steps)
+        if any(index < 0 for index in steps):
+            # a header only pass over the file to get the number of steps
+            with pyopen(frd_input, "r") as frd_file:
+                step_count = sum(1 for _ in _iter_frd_steps(frd_file, set(), fields, inout_nodes))
+            steps = {index + step_count if index < 0 else index for index in steps}
+        is_step_selected = steps
+        last_step = max(steps, default=-1)
+        if last_step < 0:
+            return
+
+    with pyopen(frd_input, "r") as frd_file:
+        for index, step in _iter_frd_steps(frd_file, is_step_selected, fields, inout_nodes):
+            if step is not None:
+                yield step
+            if index == last_step:
+                # no need to read the remaining steps
+                break
+
+
+def read_frd_result_selected(frd_input, steps=None, fields=None):
+    """Read the selected result steps and fields of a frd file.
+
+    Returns the same dictionary as read_frd_result() but uses the array
+    based reader, see iter_frd_result_steps() for steps and fields.
+    """
+    Console.PrintMessage(f"Read selected ccx results from frd file: {frd_input}\n")
+    mesh_data = read_frd_mesh_arrays(frd_input)
+    node_ids, node_coords = mesh_data.pop("Nodes")
+    m = {"Nodes": dict(zip(node_ids.tolist(), starmap(FreeCAD.Vector, node_coords.tolist())))}
+    for key, (elem_ids, elem_nodes) in mesh_data.items():
+        m[key] = dict(zip(elem_ids.tolist(), map(tuple, elem_nodes.tolist())))
+
+    results = []
+    for step in iter_frd_result_steps(frd_input, steps, fields):
+        result_set = {"number": step["number"], "time": step["time"]}
+        for key in FRD_RESULT_FIELDS:
+            if key not in step:
+                continue
+            ids, values = step[key]
+            if values.ndim == 1:
+                values = values.tolist()
+            elif values.shape[1] == 3:
+                values = starmap(FreeCAD.Vector, values.tolist())
+            else:
+                values = map(tuple, values.tolist())
+            result_set[key] = dict(zip(ids.tolist(), values))
+        results.append(result_set)
+    m["Results"] = results
+    return m
+
+
+def _read_frd_inout_nodes(frd_input):
+    # special 1DFlow nodes data, written by the CalculiX writer
+    inout_nodes = []
+    inout_nodes_file = frd_input.rsplit(".", 1)[0] + "_inout_nodes.txt"
+    if os.path.exists(inout_nodes_file):
+        Console.PrintMessage(f"Read special 1DFlow nodes data form: {inout_nodes_file}\n")
+        with pyopen(inout_nodes_file, "r") as f:
+            for line in f:
+                inout_nodes.append(line.split(","))
+        Console.PrintMessage(f"{inout_nodes}\n")
+    return inout_nodes
+
+
+def _iter_frd_steps(frd_file, selected_steps, fields, inout_nodes):
+    # yields (step index, step data) for every result step of an open frd file
+    # step data is None for a step not in selected_steps (None selects all),
+    # the values of such a step are not converted at all
+    step_index = 0
+    step = _new_frd_step(step_index, selected_steps)
+    step_has_blocks = False
+    eigenmode = 0
+    timestep = 0
+    time_found = False
+    block = None
+    block_lines = []
+
+    for line in frd_file:
+        record = line[1:3]
+        if record == "-1":
+            if block is not None:
+                block_lines.append(line)
+            continue
+        if record == "-2":
+            continue
+        if record == "-3":
+            if block is not None:
+                step[block[0]] = _frd_result_block_to_arrays(block, block_lines, inout_nodes)
+                block = None
+                block_lines = []
+            continue
+        if record == "-4":
+            # every result block counts for the step grouping, even if it is not read
+            step_has_blocks = True
+            if step is not None:
+                for name, block_spec in _FRD_RESULT_BLOCKS.items():
+                    if line[5 : 5 + len(name)] == name:
+                        if fields is None or block_spec[0] in fields:
+                            block = block_spec
+                        break
+            continue
+
+        changed = False
+        new_eigenmode = None
+        new_timestep = None
+        if line[5:10] == "PMODE":
+            eigentemp = int(line[30:36])
+            if eigentemp > eigenmode:
+                eigenmode = eigentemp
+                new_eigenmode = eigenmode
+                changed = True
+        elif line[4:10] == "1PSTEP":
+            time_found = True
+        elif time_found and line[2:7] == "100CL":
+            timetemp = float(line[13:25])
+            if timetemp > timestep:
+                timestep = timetemp
+                new_timestep = timestep
+                time_found = False
+                changed = True
+        elif line[1:5] == "9999":
+            break
+
+        if changed:
+            if step_has_blocks:
+                yield step_index, step
+                step_index += 1
+                step = _new_frd_step(step_index, selected_steps)
+                step_has_blocks = False
+            if step is not None:
+                if new_eigenmode is not None:
+                    step["number"] = new_eigenmode
+                if new_timestep is not None:
+                    step["time"] = new_timestep
+
+    if step_has_blocks:
+        yield step_index, step
+
+
+def _new_frd_step(step_index, selected_steps):
+    if selected_steps is not None and step_index not in selected_steps:
+        return None
+    return {"number": float("NaN"), "time": float("NaN")}
+
+
+def _frd_result_block_to_arrays(block, lines, inout_nodes):
+    key, value_count, value_order, scale = block
+    node_ids = _frd_lines_to_array(lines, 3, 10, 1, np.int64).reshape(-1)
+    values = _frd_lines_to_array(lines, 13, 12, value_count, np.float64)
+    if value_order is not None:
+        values = values[:, value_order]
+    if scale != 1.0:
+        values *= scale
+    if value_count == 1:
+        values = values.reshape(-1)
+        if inout_nodes and key in ("mflow", "npressure"):
+            node_ids, values = _apply_frd_inout_nodes_values(node_ids, values, inout_nodes)
+    return node_ids, values
+
+
+def _frd_lines_to_array(lines, start, width, count, dtype):
+    # converts count fixed-width columns starting at start into an (n, count) array
+    size = width * count
+    data = "".join([line[start : start + size].rstrip("\r\n").ljust(size) for line in lines])
+    # depending on c runtime lib and possibly locale calculix may format NAN differently
+    # keep the column width on sanitizing
+    data = data.replace("NAN(IND)", "     NAN")
+    values = np.frombuffer(data.encode("ascii"), dtype=f"S{width}")
+    return values.astype(dtype).reshape(len(lines), count)
+
+
+def _apply_frd_inout_nodes_seg3(elem_ids, elem_nodes, inout_nodes):
+    # fluid inlet and outlet node numbering of D elements, see read_frd_result()
+    # as there, elements without an inlet or outlet node are not imported
+    new_nodes = elem_nodes.copy()
+    matched = np.zeros(len(elem_ids), dtype=bool)
+    for inout in inout_nodes:
+        end_node = int(inout[1])
+        fluid_node = int(inout[2])
+        inlet = elem_nodes[:, 0] == end_node
+        outlet = ~inlet & (elem_nodes[:, 2] == end_node)
+        new_nodes[inlet, 0] = fluid_node
+        new_nodes[inlet, 1] = elem_nodes[inlet, 2]
+        new_nodes[inlet, 2] = elem_nodes[inlet, 0]
+        new_nodes[outlet] = elem_nodes[outlet]
+        new_nodes[outlet, 1] = fluid_node
+        matched |= inlet | outlet
+    return elem_ids[matched], new_nodes[matched]
+
+
+def _apply_frd_inout_nodes_values(node_ids, values, inout_nodes):
+    # the values of the inlet and outlet nodes are copied to the fluid nodes
+    node_ids = node_ids.tolist()
+    values = values.tolist()
+    positions = {node_id: i for i, node_id in enumerate(node_ids)}
+    for inout in inout_nodes:
+        i = positions.get(int(inout[1]))
+        if i is None:
+            continue
+        fluid_node = int(inout[2])
+        if fluid_node in positions:
+            values[positions[fluid_node]] = values[i]
+        else:
+            positions[fluid_node] = len(node_ids)
+            node_ids.append(fluid_node)
+            values.append(values[i])
+    return np.array(node_ids, dtype=np.int64), np.array(values, dtype=np.float64)
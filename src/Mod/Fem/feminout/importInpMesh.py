@@ -32,6 +32,9 @@ __date__ = "04/08/2016"
 #  \brief FreeCAD INP file reader for FEM workbench
 
 import os
+import re
+
+import numpy as np
 
 import FreeCAD
 from FreeCAD import Console
@@ -60,10 +63,23 @@ def insert(filename, docname):
 def read(filename):
     """read a FemMesh from a inp mesh file and return the FemMesh"""
     # no document object is created, just the FemMesh is returned
-    mesh_data = read_inp(filename)
     from . import importToolsFem
 
-    return importToolsFem.make_femmesh(mesh_data)
+    progress_bar = FreeCAD.Base.ProgressIndicator()
+    progress_bar.start(f"Reading inp mesh {os.path.basename(filename)} ...", 100)
+    steps = [0]
+
+    def progress(read_size, total_size):
+        percent = 100 * read_size // max(total_size, 1)
+        while steps[0] < percent:
+            progress_bar.next()
+            steps[0] += 1
+
+    try:
+        mesh_arrays = read_inp_arrays(filename, progress)
+    finally:
+        progress_bar.stop()
+    return importToolsFem.make_femmesh_arrays(mesh_arrays)
 
 
 def import_inp(filename):
@@ -294,3 +310,155 @@ def read_inp(file_name):
         "Penta6Elem": elements.penta6,
         "Penta15Elem": elements.penta15,
     }
+
+
+# ********* bulk reading into arrays *********
+# CalculiX element type: mesh data key, number of nodes
+_ELEMENT_TYPES = {
+    **dict.fromkeys(["S3", "CPS3", "CPE3", "CAX3"], ("Tria3Elem", 3)),
+    **dict.fromkeys(["S6", "CPS6", "CPE6", "CAX6"], ("Tria6Elem", 6)),
+    **dict.fromkeys(
+        ["S4", "S4R", "CPS4", "CPS4R", "CPE4", "CPE4R", "CAX4", "CAX4R"], ("Quad4Elem", 4)
+    ),
+    **dict.fromkeys(
+        ["S8", "S8R", "CPS8", "CPS8R", "CPE8", "CPE8R", "CAX8", "CAX8R"], ("Quad8Elem", 8)
+    ),
+    "C3D4": ("Tetra4Elem", 4),
+    "C3D10": ("Tetra10Elem", 10),
+    **dict.fromkeys(["C3D8", "C3D8R", "C3D8I"], ("Hexa8Elem", 8)),
+    **dict.fromkeys(["C3D20", "C3D20R", "C3D20RI"], ("Hexa20Elem", 20)),
+    "C3D6": ("Penta6Elem", 6),
+    "C3D15": ("Penta15Elem", 15),
+    **dict.fromkeys(["B31", "B31R", "T3D2"], ("Seg2Elem", 2)),
+    **dict.fromkeys(["B32", "B32R", "T3D3"], ("Seg3Elem", 3)),
+}
+
+# switch from the CalculiX node numbering to the FreeCAD node numbering
+# numbering do not change: tria3, tria6, quad4, quad8, seg2
+_NODE_ORDER = {
+    "Tetra4Elem": [1, 0, 2, 3],
+    "Tetra10Elem": [1, 0, 2, 3, 4, 6, 5, 8, 7, 9],
+    "Hexa8Elem": [5, 6, 7, 4, 1, 2, 3, 0],
+    "Hexa20Elem": [5, 6, 7, 4, 1, 2, 3, 0, 13, 14, 15, 12, 9, 10, 11, 8, 17, 18, 19, 16],
+    "Penta6Elem": [4, 5, 3, 1, 2, 0],
+    "Penta15Elem": [4, 5, 3, 1, 2, 0, 10, 11, 9, 7, 8, 6, 13, 14, 12],
+    "Seg3Elem": [0, 2, 1],
+}
+
+# a literal first character lets the regex engine skip the data lines quickly
+_KEYWORD_LINE = re.compile(r"\*.*")
+_DATA_LINE = re.compile(r"^[ \t]*[^\s]", re.MULTILINE)
+
+
+def read_inp_arrays(file_name, progress=None):
+    """read the mesh of an .inp file into numpy arrays
+
+    Every *NODE and *ELEMENT data block is parsed at once. *INCLUDE files are
+    followed. Returns a dict with the keys of read_inp(). "Nodes" is a tuple of
+    node ids and an (n, 3) coordinate array, every element key a tuple of element
+    ids and an (n, nodes per element) array in FreeCAD node order.
+    progress is called with the read and the total size of the files read so far.
+    """
+    blocks = {"Nodes": []}
+    for key, _ in _ELEMENT_TYPES.values():
+        blocks[key] = []
+    unsupported = set()
+    sizes = [0, 0]  # read size, total size
+
+    def read_file(path):
+        with pyopen(path, "r") as f:
+            text = f.read()
+        sizes[1] += len(text)
+        done = sizes[0]
+        block = None  # current data block: mesh data key, number of nodes, data
+        for match in _KEYWORD_LINE.finditer(text):
+            if text[text.rfind("\n", 0, match.start()) + 1 : match.start()].strip():
+                continue  # not at the start of a line
+            if block is not None:
+                block[2].append(text[data_start : match.start()])
+            data_start = match.end()
+            keyword_line = match.group().strip()
+            if keyword_line.startswith("**"):  # comment, data block continues
+                continue
+            if block is not None:
+                read_block(block, path)
+                block = None
+            sizes[0] = done + match.start()
+            if progress:
+                progress(*sizes)
+            params = [p.strip() for p in keyword_line.split(",")]
+            keyword = params[0].upper()
+            if keyword == "*STEP":
+                return False
+            elif keyword == "*INCLUDE":
+                include = keyword_line[1 + keyword_line.index("=") :].strip().strip('"')
+                include_path = os.path.normpath(include)
+                if not os.path.isfile(include_path):
+                    include_path = os.path.join(os.path.dirname(path), include_path)
+                if read_file(include_path) is False:
+                    return False
+                done = sizes[0] - match.end()
+            elif keyword == "*NODE":
+                block = ("Nodes", 3, [])
+            elif keyword == "*ELEMENT":
+                elm_type = ""
+                for param in params[1:]:
+                    if param.upper().startswith("TYPE"):
+                        elm_type = param.split("=")[1].strip().upper()
+                if elm_type in _ELEMENT_TYPES:
+                    block = (*_ELEMENT_TYPES[elm_type], [])
+                else:
+                    unsupported.add(elm_type)
+        if block is not None:
+            block[2].append(text[data_start:])
+            read_block(block, path)
+        sizes[0] = done + len(text)
+        if progress:
+            progress(*sizes)
+        return True
+
+    def read_block(block, path):
+        key, number_of_nodes, data = block
+        data = "".join(data).replace(",", " ")
+        if key == "Nodes":
+            values = np.fromstring(data, dtype=np.float64, sep=" ")
+            rows = data.count("\n") + (not data.endswith("\n"))
+            if values.size != 4 * rows:
+                rows = len(_DATA_LINE.findall(data))  # with empty lines
+            if values.size != 4 * rows:
+                raise ValueError(f"{path}: *NODE lines with other than three coordinates")
+            values = values.reshape(-1, 4)
+            blocks[key].append((values[:, 0].astype(np.int64), values[:, 1:]))
+        else:
+            values = np.fromstring(data, dtype=np.int64, sep=" ")
+            if values.size % (number_of_nodes + 1):
+                raise ValueError(f"{path}: *ELEMENT data does not fit {key} elements")
+            values = values.reshape(-1, number_of_nodes + 1)
+            blocks[key].append((values[:, 0], values[:, 1:]))
+        Console.PrintLog(f"{path}: {len(values)} {key} read\n")
+
+    read_file(file_name)
+    if blocks["Seg3Elem"]:  # to print "not supported"
+        Console.PrintError("Error: seg3 (3-node beam element type) not supported, yet.\n")
+    for elm_type in sorted(unsupported):
+        Console.PrintError(f"Error: {elm_type} not supported.\n")
+
+    mesh_arrays = {}
+    widths = {"Nodes": (3, np.float64)}
+    widths.update((key, (number, np.int64)) for key, number in _ELEMENT_TYPES.values())
+    for key, key_blocks in blocks.items():
+        if key_blocks:
+            ids = np.concatenate([b[0] for b in key_blocks])
+            values = np.concatenate([b[1] for b in key_blocks])
+        else:
+            ids = np.empty(0, dtype=np.int64)
+            values = np.empty((0, widths[key][0]), dtype=widths[key][1])
+        # an id defined more than once keeps its last definition
+        unique_ids, last = np.unique(ids[::-1], return_index=True)
+        if len(unique_ids) != len(ids):
+            ids = unique_ids
+            values = values[len(values) - 1 - last]
+        if key in _NODE_ORDER:
+            values = values[:, _NODE_ORDER[key]]
+        mesh_arrays[key] = (ids, values)
+    return mesh_arrays
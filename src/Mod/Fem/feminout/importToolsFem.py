@@ -80,13 +80,14 @@ def get_FemMeshObjectDimension(fem_mesh_obj):
     """
     dim = None
 
-    if fem_mesh_obj.FemMesh.Nodes != ():
+    # counts instead of the entities, to not copy all nodes of large meshes
+    if fem_mesh_obj.FemMesh.NodeCount > 0:
         dim = 0
-    if fem_mesh_obj.FemMesh.Edges != ():
+    if fem_mesh_obj.FemMesh.EdgeCount > 0:
         dim = 1
-    if fem_mesh_obj.FemMesh.Faces != ():
+    if fem_mesh_obj.FemMesh.FaceCount > 0:
         dim = 2
-    if fem_mesh_obj.FemMesh.Volumes != ():
+    if fem_mesh_obj.FemMesh.VolumeCount > 0:
         dim = 3
 
     return dim
@@ -279,6 +280,49 @@ def make_femmesh(mesh_data):
     return mesh
 
 
+def make_femmesh_arrays(mesh_arrays):
+    """makes an FreeCAD FEM Mesh object from FEM Mesh data arrays
+
+    mesh_arrays has the keys of the make_femmesh mesh_data, the values are tuples
+    of ids and numpy arrays with one row of coordinates or element nodes per id.
+    The nodes and each element type are added to the mesh in one bulk insert.
+    """
+    import Fem
+
+    mesh = Fem.FemMesh()
+    node_ids, coords = mesh_arrays.get("Nodes", ((), ()))
+    if len(node_ids) == 0:
+        Console.PrintError("No Nodes found!\n")
+        return mesh
+    mesh.addNodeList(coords.ravel().tolist(), node_ids.tolist())
+    add_lists = {
+        "Hexa8Elem": mesh.addVolumeList,
+        "Penta6Elem": mesh.addVolumeList,
+        "Tetra4Elem": mesh.addVolumeList,
+        "Tetra10Elem": mesh.addVolumeList,
+        "Penta15Elem": mesh.addVolumeList,
+        "Hexa20Elem": mesh.addVolumeList,
+        "Tria3Elem": mesh.addFaceList,
+        "Tria6Elem": mesh.addFaceList,
+        "Quad4Elem": mesh.addFaceList,
+        "Quad8Elem": mesh.addFaceList,
+        "Seg2Elem": mesh.addEdgeList,
+        "Seg3Elem": mesh.addEdgeList,
+    }
+    counts = []
+    element_count = 0
+    for key, add_list in add_lists.items():
+        ids, elements = mesh_arrays.get(key, ((), ()))
+        if len(ids):
+            add_list(elements.ravel().tolist(), [elements.shape[1]] * len(ids), ids.tolist())
+        counts.append(f"{len(ids)} {key[:-4].upper()}")
+        element_count += len(ids)
+    if element_count == 0:
+        Console.PrintError("No Elements found!\n")
+    Console.PrintLog(f"imported mesh: {len(node_ids)} nodes, {', '.join(counts)}\n")
+    return mesh
+
+
 def make_dict_from_femmesh(femmesh):
     """
     Converts FemMesh into dictionary structure which can immediately used
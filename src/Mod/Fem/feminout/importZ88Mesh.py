@@ -74,12 +74,7 @@ def export(objectslist, filename):
     if not obj.isDerivedFrom("Fem::FemMeshObject"):
         Console.PrintError("No FEM mesh object selected.\n")
         return
-    femnodes_mesh = obj.FemMesh.Nodes
-    femelement_table = meshtools.get_femelement_table(obj.FemMesh)
-    z88_element_type = get_z88_element_type(obj.FemMesh, femelement_table)
-    f = pyopen(filename, "w")
-    write_z88_mesh_to_file(femnodes_mesh, femelement_table, z88_element_type, f)
-    f.close()
+    write(obj.FemMesh, filename)
 
 
 # ************************************************************************************************
@@ -92,6 +87,7 @@ def export(objectslist, filename):
 # writer:
 # - a method directly writes a FemMesh to the mesh file
 # - a method takes a file handle, mesh data and writes to the file handle
+# - a method takes a file handle, a FemMesh and writes in chunks to the file handle
 
 
 # ********* reader *******************************************************************************
@@ -397,16 +393,45 @@ def write(fem_mesh, filename):
     if not fem_mesh.isDerivedFrom("Fem::FemMesh"):
         Console.PrintError("Not a FemMesh was given as parameter.\n")
         return
-    femnodes_mesh = fem_mesh.Nodes
-    femelement_table = meshtools.get_femelement_table(fem_mesh)
-    z88_element_type = get_z88_element_type(fem_mesh, femelement_table)
-    f = pyopen(filename, "w")
-    write_z88_mesh_to_file(femnodes_mesh, femelement_table, z88_element_type, f)
-    f.close()
+    z88_element_type = get_z88_element_type(fem_mesh)
+    with pyopen(filename, "w") as f:
+        write_z88_femmesh_to_file(fem_mesh, z88_element_type, f)
+
+
+def write_z88_femmesh_to_file(fem_mesh, z88_element_type, f):
+    """write nodes and elements in chunks straight from the FemMesh
+    thus the memory needed does not grow with the mesh size"""
+    node_dof = get_z88_node_dof(z88_element_type)
+    if node_dof is None:
+        return
+    element_count = len(meshtools.get_femelement_ids(fem_mesh))
+    write_z88_header(fem_mesh.NodeCount, element_count, node_dof, f)
+    for ids, coords in meshtools.iter_femnodes_chunks(fem_mesh):
+        f.write(
+            "".join(
+                f"{node} {node_dof} {x:.6f} {y:.6f} {z:.6f}\n"
+                for node, (x, y, z) in zip(ids.tolist(), coords.tolist())
+            )
+        )
+    for femelement_table in meshtools.iter_femelement_table_chunks(fem_mesh):
+        if write_z88_elements(femelement_table, z88_element_type, f) is False:
+            return
 
 
 def write_z88_mesh_to_file(femnodes_mesh, femelement_table, z88_element_type, f):
-    node_dimension = 3  # 2 for 2D not supported
+    node_dof = get_z88_node_dof(z88_element_type)
+    if node_dof is None:
+        return
+    write_z88_header(len(femnodes_mesh), len(femelement_table), node_dof, f)
+    # nodes
+    for node in femnodes_mesh:
+        vec = femnodes_mesh[node]
+        f.write(f"{node} {node_dof} {vec.x:.6f} {vec.y:.6f} {vec.z:.6f}\n")
+    # elements
+    write_z88_elements(femelement_table, z88_element_type, f)
+
+
+def get_z88_node_dof(z88_element_type):
     if (
         z88_element_type == 4
         or z88_element_type == 17
@@ -419,9 +444,12 @@ def write_z88_mesh_to_file(femnodes_mesh, femelement_table, z88_element_type, f)
         node_dof = 6  # schalenelemente
     else:
         Console.PrintError("Error: wrong z88_element_type.\n")
-        return
-    node_count = len(femnodes_mesh)
-    element_count = len(femelement_table)
+        return None
+    return node_dof
+
+
+def write_z88_header(node_count, element_count, node_dof, f):
+    node_dimension = 3  # 2 for 2D not supported
     dofs = node_dof * node_count
     unknown_flag = 0
     written_by = "written by FreeCAD"
@@ -432,11 +460,9 @@ def write_z88_mesh_to_file(femnodes_mesh, femelement_table, z88_element_type, f)
             node_dimension, node_count, element_count, dofs, unknown_flag, written_by
         )
     )
-    # nodes
-    for node in femnodes_mesh:
-        vec = femnodes_mesh[node]
-        f.write(f"{node} {node_dof} {vec.x:.6f} {vec.y:.6f} {vec.z:.6f}\n")
-    # elements
+
+
+def write_z88_elements(femelement_table, z88_element_type, f):
     for element in femelement_table:
         # z88_element_type is checked for every element
         # but mixed elements are not supported up to date
@@ -518,7 +544,7 @@ def write_z88_mesh_to_file(femnodes_mesh, femelement_table, z88_element_type, f)
         else:
             Console.PrintError(f"Writing of Z88 elementtype {z88_element_type} not supported.\n")
             # TODO support schale12 (made from prism15) and schale16 (made from hexa20)
-            return
+            return False
 
 
 # Helper
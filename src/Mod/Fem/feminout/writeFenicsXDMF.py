@@ -29,20 +29,33 @@ __url__ = "https://www.freecad.org"
 #  \ingroup FEM
 #  \brief FreeCAD Fenics Mesh XDMF writer for FEM workbench
 
+import os
+
 import numpy as np
 from xml.etree import ElementTree as ET  # parsing xml files and exporting
 
 from FreeCAD import Console
 
+from femmesh import meshtools
 from .importToolsFem import get_FemMeshObjectDimension
 from .importToolsFem import get_FemMeshObjectElementTypes
 from .importToolsFem import get_FemMeshObjectOrder
 from .importToolsFem import get_FemMeshObjectMeshGroups
 from .importToolsFem import get_MaxDimElementFromList
 
+has_h5py = True
+try:
+    import h5py
+except ImportError:
+    Console.PrintLog("No h5py available, XDMF heavy data is written inline as XML text.\n")
+    has_h5py = False
+
 ENCODING_ASCII = "ASCII"
 ENCODING_HDF5 = "HDF5"
 
+# number of nodes or elements taken from the FemMesh at once
+CHUNK_SIZE = 100000
+
 FreeCAD_Group_Dimensions = {"Vertex": 0, "Edge": 1, "Face": 2, "Volume": 3}
 
 FreeCAD_to_Fenics_XDMF_dict = {
@@ -77,9 +90,26 @@ def tuples_to_numpy(tpls, numbers_per_line):
     return np.array([list(t) for t in tpls])[:, :numbers_per_line]
 
 
-def write_fenics_mesh_points_xdmf(fem_mesh_obj, geometrynode, encoding=ENCODING_ASCII):
+def add_hdf5_dataitem(parentnode, hdf5_file, shape, dtype, **attributes):
+    """
+    Adds a DataItem referencing a new dataset in the HDF5 sidecar file
+    and returns the dataset to be filled
+    """
+    name = "data%d" % len(hdf5_file)
+    dataset = hdf5_file.create_dataset(name, shape, dtype=dtype)
+    dataitem = ET.SubElement(
+        parentnode, "DataItem", Dimensions="%d %d" % shape, Format="HDF", **attributes
+    )
+    dataitem.text = f"{os.path.basename(hdf5_file.filename)}:/{name}"
+    return dataset
+
+
+def write_fenics_mesh_points_xdmf(
+    fem_mesh_obj, geometrynode, encoding=ENCODING_ASCII, hdf5_file=None
+):
     """
     Writes either into hdf5 file or into open mesh file
+    Returns the sorted node ids, the index of a node id is its Fenics node index
     """
 
     numnodes = fem_mesh_obj.FemMesh.NodeCount
@@ -92,37 +122,46 @@ def write_fenics_mesh_points_xdmf(fem_mesh_obj, geometrynode, encoding=ENCODING_
     elif dim == 3:
         geometrynode.set("GeometryType", "XYZ")
 
-    recalc_nodes_ind_dict = {}
+    node_ids = np.empty(numnodes, dtype=np.int64)
+    node_chunks = meshtools.iter_femnodes_chunks(fem_mesh_obj.FemMesh, CHUNK_SIZE)
 
     if encoding == ENCODING_ASCII:
         dataitem = ET.SubElement(
             geometrynode, "DataItem", Dimensions="%d %d" % (numnodes, effective_dim), Format="XML"
         )
-        nodes = []
-        for ind, (key, node) in enumerate(list(fem_mesh_obj.FemMesh.Nodes.items())):
-            nodes.append(node)
-            recalc_nodes_ind_dict[key] = ind
-
-        dataitem.text = numpy_array_to_str(points_to_numpy(nodes, dim=effective_dim))
+        texts = []
+        start = 0
+        for ids, coords in node_chunks:
+            node_ids[start : start + len(ids)] = ids
+            start += len(ids)
+            texts.append(numpy_array_to_str(coords[:, :effective_dim]))
+        dataitem.text = "\n".join(texts)
     elif encoding == ENCODING_HDF5:
-        pass
+        dataset = add_hdf5_dataitem(
+            geometrynode,
+            hdf5_file,
+            (numnodes, effective_dim),
+            "f8",
+            NumberType="Float",
+            Precision="8",
+        )
+        start = 0
+        for ids, coords in node_chunks:
+            node_ids[start : start + len(ids)] = ids
+            dataset[start : start + len(ids)] = coords[:, :effective_dim]
+            start += len(ids)
 
-    return recalc_nodes_ind_dict
+    return node_ids
 
 
 def write_fenics_mesh_codim_xdmf(
-    fem_mesh_obj, topologynode, nodes_dict, codim=0, encoding=ENCODING_ASCII
+    fem_mesh_obj, topologynode, node_ids, codim=0, encoding=ENCODING_ASCII, hdf5_file=None
 ):
     mesh_dimension = get_FemMeshObjectDimension(fem_mesh_obj)
 
     element_types = get_FemMeshObjectElementTypes(fem_mesh_obj, remove_zero_element_entries=True)
     element_order = get_FemMeshObjectOrder(fem_mesh_obj)
     # we get all elements from mesh to decide which one to write by selection of codim
-    """
-    nodeindices = [(
-        nodes_dict[ind] for ind in fem_mesh_obj.FemMesh.getElementNodes(fc_volume_ind)
-    ) for (fen_ind, fc_volume_ind) in enumerate(fc_cells)]
-    """
     writeout_element_dimension = mesh_dimension - codim
 
     num_topo, name_topo, dim_topo = (0, "", 0)
@@ -150,10 +189,14 @@ def write_fenics_mesh_codim_xdmf(
             "Dimension of mesh incompatible with export" + f" XDMF function: {dim_topo}\n"
         )
 
-    nodeindices = [
-        (nodes_dict[ind] for ind in fem_mesh_obj.FemMesh.getElementNodes(fc_topo_ind))
-        for (fen_ind, fc_topo_ind) in enumerate(fc_topo)
-    ]
+    def nodeindices_chunks():
+        # Fenics node indices of the elements, CHUNK_SIZE elements at once
+        for start in range(0, len(fc_topo), CHUNK_SIZE):
+            element_nodes = [
+                fem_mesh_obj.FemMesh.getElementNodes(fc_topo_ind)
+                for fc_topo_ind in fc_topo[start : start + CHUNK_SIZE]
+            ]
+            yield np.searchsorted(node_ids, tuples_to_numpy(element_nodes, nodes_per_element))
 
     if encoding == ENCODING_ASCII:
         dataitem = ET.SubElement(
@@ -163,15 +206,21 @@ def write_fenics_mesh_codim_xdmf(
             Dimensions="%d %d" % (num_topo, nodes_per_element),
             Format="XML",
         )
-        dataitem.text = numpy_array_to_str(tuples_to_numpy(nodeindices, nodes_per_element))
+        dataitem.text = "\n".join(numpy_array_to_str(npa) for npa in nodeindices_chunks())
     elif encoding == ENCODING_HDF5:
-        pass
+        dataset = add_hdf5_dataitem(
+            topologynode, hdf5_file, (len(fc_topo), nodes_per_element), "u4", NumberType="UInt"
+        )
+        start = 0
+        for npa in nodeindices_chunks():
+            dataset[start : start + len(npa)] = npa
+            start += len(npa)
 
     return fc_topo
 
 
 def write_fenics_mesh_scalar_cellfunctions(
-    name, cell_array, attributenode, encoding=ENCODING_ASCII
+    name, cell_array, attributenode, encoding=ENCODING_ASCII, hdf5_file=None
 ):
     attributenode.set("AttributeType", "Scalar")
     attributenode.set("Center", "Cell")
@@ -185,7 +234,15 @@ def write_fenics_mesh_scalar_cellfunctions(
         )
         dataitem.text = numpy_array_to_str(cell_array)
     elif encoding == ENCODING_HDF5:
-        pass
+        dataset = add_hdf5_dataitem(
+            attributenode,
+            hdf5_file,
+            (num_cells, num_dims),
+            "i8",
+            NumberType="Int",
+            Precision="8",
+        )
+        dataset[:] = cell_array
 
 
 """
@@ -230,7 +287,26 @@ Example: mesh with two topologies and one mesh function for the facet one
 def write_fenics_mesh_xdmf(fem_mesh_obj, outputfile, group_values_dict={}, encoding=ENCODING_ASCII):
     """
     For the export of xdmf.
+    With HDF5 encoding, which needs h5py, the node coordinates, the topologies
+    and the cell functions are written to an .h5 file next to the outputfile,
+    taking CHUNK_SIZE nodes or elements from the FemMesh at once.
     """
+    hdf5_file = None
+    if encoding == ENCODING_HDF5:
+        if not has_h5py:
+            Console.PrintError("XDMF HDF5 encoding needs h5py, the file is not written.\n")
+            return
+        hdf5_file = h5py.File(os.path.splitext(outputfile)[0] + ".h5", "w")
+    try:
+        write_fenics_mesh_xdmf_data(
+            fem_mesh_obj, outputfile, group_values_dict, encoding, hdf5_file
+        )
+    finally:
+        if hdf5_file is not None:
+            hdf5_file.close()
+
+
+def write_fenics_mesh_xdmf_data(fem_mesh_obj, outputfile, group_values_dict, encoding, hdf5_file):
 
     Console.PrintMessage(f"Converting {fem_mesh_obj.Label} to fenics XDMF File\n")
     Console.PrintMessage(f"Dimension of mesh: {get_FemMeshObjectDimension(fem_mesh_obj)}\n")
@@ -252,9 +328,11 @@ def write_fenics_mesh_xdmf(fem_mesh_obj, outputfile, group_values_dict={}, encod
 
     # ***********************************
     # write base topo and geometry
-    nodes_dict = write_fenics_mesh_points_xdmf(fem_mesh_obj, base_geometry, encoding=encoding)
+    node_ids = write_fenics_mesh_points_xdmf(
+        fem_mesh_obj, base_geometry, encoding=encoding, hdf5_file=hdf5_file
+    )
     write_fenics_mesh_codim_xdmf(
-        fem_mesh_obj, base_topology, nodes_dict, codim=0, encoding=encoding
+        fem_mesh_obj, base_topology, node_ids, codim=0, encoding=encoding, hdf5_file=hdf5_file
     )
     # ***********************************
 
@@ -283,16 +361,16 @@ def write_fenics_mesh_xdmf(fem_mesh_obj, outputfile, group_values_dict={}, encod
         mesh_function_topology_description = write_fenics_mesh_codim_xdmf(
             fem_mesh_obj,
             mesh_function_topology,
-            nodes_dict,
+            node_ids,
             codim=mesh_function_codim,
             encoding=encoding,
+            hdf5_file=hdf5_file,
         )
 
         mesh_function_geometry = ET.SubElement(mesh_function_grid, "Geometry", Reference="XML")
         mesh_function_geometry.text = "/Xdmf/Domain/Grid/Geometry"
         mesh_function_attribute = ET.SubElement(mesh_function_grid, "Attribute")
 
-        elem_dict = {}
         elem_mark_group, elem_mark_default = group_values_dict.get(g, (1, 0))
 
         # TODO: is it better to save all groups each at once or collect all codim equal
@@ -300,15 +378,18 @@ def write_fenics_mesh_xdmf(fem_mesh_obj, outputfile, group_values_dict={}, encod
         # TODO: nevertheless there has to be a dialog
         # which fixes the default value and the mark value
 
-        for e in fem_mesh.getGroupElements(g):
-            elem_dict[e] = elem_mark_group
-
-        val_array = np.array(
-            [elem_dict.get(e, elem_mark_default) for e in mesh_function_topology_description]
+        val_array = np.where(
+            np.isin(mesh_function_topology_description, fem_mesh.getGroupElements(g)),
+            elem_mark_group,
+            elem_mark_default,
         )
         topo_array = np.vstack((val_array,)).T
         write_fenics_mesh_scalar_cellfunctions(
-            mesh_function_name, topo_array, mesh_function_attribute, encoding=ENCODING_ASCII
+            mesh_function_name,
+            topo_array,
+            mesh_function_attribute,
+            encoding=encoding,
+            hdf5_file=hdf5_file,
         )
 
     # TODO: improve cell functions support
@@ -34,6 +34,8 @@ __url__ = "https://www.freecad.org"
 
 import time
 
+import numpy as np
+
 import FreeCAD
 import Fem
 
@@ -52,6 +54,12 @@ out_mesh = femmesh2mesh.femmesh_2_mesh(fem_mesh, result, scale)
 import Mesh
 Mesh.show(Mesh.Mesh(out_mesh))
 
+# large meshes, deformed surface written to stl without the mesh object
+facets = femmesh2mesh.get_skin_facets(
+    fem_mesh, (result.NodeNumbers, result.DisplacementVectors), scale
+)
+Mesh.Mesh(facets.tolist()).write("/tmp/deformed.stl")
+
 """
 # These dictionaries list the nodes, that define faces of an element.
 # The key is the face number, used internally by FreeCAD.
@@ -89,171 +97,152 @@ face_dicts = {
 }
 
 
-def femmesh_2_mesh(myFemMesh, myResults=None, myDispScale=1):
-    shiftBits = 20  # allows a million nodes, needs to be higher for more nodes in a FemMesh
+# faces of face elements, tria3 or tria6 and quad4 or quad8 (ignoring mid-nodes)
+triaFaces = {1: [0, 1, 2]}
+
+quadFaces = {1: [0, 1, 2, 3]}
+
+shell_face_dicts = {
+    3: triaFaces,
+    4: quadFaces,
+    6: triaFaces,
+    8: quadFaces,
+}
 
-    # This code generates a dict and a faceCode for each face of all elements
-    # All faceCodes are than sorted.
+
+def get_femmesh_skin_faces(femmesh):
+    """Returns the faces on the surface of a FemMesh as node id arrays
+    (triangles (n, 3), quads (m, 4)).
+
+    For a volume mesh these are the element faces without a counterpart,
+    for a face mesh the faces themselves. Mid-nodes are ignored.
+    """
+    elements = ()
+    element_face_dicts = {}
+    if femmesh.VolumeCount > 0:
+        elements = femmesh.Volumes
+        element_face_dicts = face_dicts
+    elif femmesh.FaceCount > 0:
+        elements = femmesh.Faces
+        element_face_dicts = shell_face_dicts
+
+    # element nodes grouped by element node count
+    element_groups = {}
+    for ele in elements:
+        element_nodes = femmesh.getElementNodes(ele)
+        element_groups.setdefault(len(element_nodes), []).append(element_nodes)
+
+    faces = {3: [], 4: []}
+    for node_count, group in element_groups.items():
+        element_nodes = np.array(group, dtype=np.int64)
+        # unsupported element types raise a KeyError
+        for face_def in element_face_dicts[node_count].values():
+            faces[len(face_def)].append(element_nodes[:, face_def])
+
+    return tuple(
+        _get_single_faces(np.concatenate(faces[n]) if faces[n] else np.empty((0, n), np.int64))
+        for n in (3, 4)
+    )
+
+
+def _get_single_faces(faces):
+    # faces which do not have a counterpart are the faces on the surface of the mesh.
+    # The faces are sorted by their sorted node ids, equal faces are adjacent afterwards.
+    # Like the former pairwise search, of an odd count of equal faces one remains.
+    if len(faces) == 0:
+        return faces
+    keys = np.sort(faces, axis=1)
+    order = np.lexsort(keys.T[::-1])
+    keys = keys[order]
+    run_start = np.flatnonzero(np.concatenate(([True], np.any(keys[1:] != keys[:-1], axis=1))))
+    run_count = np.diff(np.append(run_start, len(keys)))
+    single = run_start[run_count % 2 == 1] + run_count[run_count % 2 == 1] - 1
+    return faces[order[single]]
+
+
+def _get_skin_triangles(trias, quads):
+    # quads are split into the triangles (P1, P2, P3) and (P3, P4, P1)
+    quad_trias = np.stack((quads[:, [0, 1, 2]], quads[:, [2, 3, 0]]), axis=1).reshape(-1, 3)
+    return np.concatenate((trias, quad_trias))
+
+
+def _get_positions(ids, search_ids, name):
+    # positions of search_ids in the id array ids
+    ids = np.asarray(ids, dtype=np.int64)
+    sorter = np.argsort(ids, kind="stable")
+    idx = np.searchsorted(ids, search_ids, sorter=sorter)
+    if np.any(idx >= len(ids)) or np.any(ids[sorter[idx]] != search_ids):
+        raise ValueError(f"Nodes of the mesh surface not found in {name}")
+    return sorter[idx]
+
+
+def _get_node_points(femmesh, node_ids, node_displacements=None, disp_scale=1):
+    # coordinates of the nodes node_ids, displaced if node_displacements are given
+    nodes = femmesh.Nodes
+    mesh_node_ids = np.fromiter(nodes, dtype=np.int64, count=len(nodes))
+    mesh_coords = np.array(list(nodes.values()), dtype=float).reshape(-1, 3)
+    points = mesh_coords[_get_positions(mesh_node_ids, node_ids, "FemMesh")]
+    if node_displacements is not None:
+        disp_node_ids, displacements = node_displacements
+        displacements = np.array(displacements, dtype=float).reshape(-1, 3)
+        disp_positions = _get_positions(disp_node_ids, node_ids, "displacements")
+        points += displacements[disp_positions] * disp_scale
+    return points
+
+
+def get_skin_facets(femmesh, node_displacements=None, disp_scale=1):
+    """Returns the triangles of the surface of a FemMesh as array (n, 9)
+    of the corner coordinates, as accepted by Mesh.Mesh(facets.tolist()).
+
+    node_displacements: tuple (node ids, displacements), e.g.
+        (result.NodeNumbers, result.DisplacementVectors), for the deformed surface
+    disp_scale: scale factor of the displacements
+    """
+    triangles = _get_skin_triangles(*get_femmesh_skin_faces(femmesh))
+    points = _get_node_points(femmesh, triangles, node_displacements, disp_scale)
+    return points.reshape(-1, 9)
+
+
+def femmesh_2_mesh(myFemMesh, myResults=None, myDispScale=1):
+    # The faces on the surface are the element faces without a counterpart,
+    # see get_femmesh_skin_faces().
 
     start_time = time.process_time()
-    faceCodeList = []
-    faceCodeDict = {}
-
-    if myFemMesh.VolumeCount > 0:
-        for ele in myFemMesh.Volumes:
-            element_nodes = myFemMesh.getElementNodes(ele)
-            # print("element_node: ", element_nodes)
-            faceDef = face_dicts[len(element_nodes)]
-
-            for key in faceDef:
-                nodeList = []
-                codeList = []
-                faceCode = 0
-                shifter = 0
-                for nodeIdx in faceDef[key]:
-                    nodeList.append(element_nodes[nodeIdx])
-                    codeList.append(element_nodes[nodeIdx])
-                codeList.sort()
-                for node in codeList:
-                    faceCode += node << shifter
-                    # x << n: x shifted left by n bits = Multiplication
-                    shifter += shiftBits
-                # print("codeList: ", codeList)
-                faceCodeDict[faceCode] = nodeList
-                faceCodeList.append(faceCode)
-    elif myFemMesh.FaceCount > 0:
-        for ele in myFemMesh.Faces:
-            element_nodes = myFemMesh.getElementNodes(ele)
-            # print("element_node: ", element_nodes)
-            if len(element_nodes) in [3, 6]:
-                faceDef = {1: [0, 1, 2]}
-            else:  # quad element
-                faceDef = {1: [0, 1, 2, 3]}
-
-            for key in faceDef:
-                nodeList = []
-                codeList = []
-                faceCode = 0
-                shifter = 0
-                for nodeIdx in faceDef[key]:
-                    nodeList.append(element_nodes[nodeIdx])
-                    codeList.append(element_nodes[nodeIdx])
-                codeList.sort()
-                for node in codeList:
-                    faceCode += node << shifter
-                    # x << n: x shifted left by n bits = Multiplication
-                    shifter += shiftBits
-                # print("codeList: ", codeList)
-                faceCodeDict[faceCode] = nodeList
-                faceCodeList.append(faceCode)
-
-    faceCodeList.sort()
-    allFaces = len(faceCodeList)
-    actFaceIdx = 0
-    singleFaces = []
-    # Here we search for faces, which do not have a counterpart.
-    # These are the faces on the surface of the mesh.
-    while actFaceIdx < allFaces:
-        if actFaceIdx < (allFaces - 1):
-            if faceCodeList[actFaceIdx] == faceCodeList[actFaceIdx + 1]:
-                actFaceIdx += 2
-            else:
-                # print("found a single Face: ", faceCodeList[actFaceIdx])
-                singleFaces.append(faceCodeList[actFaceIdx])
-                actFaceIdx += 1
-        else:
-            FreeCAD.Console.PrintMessage(f"Found a last Face: {faceCodeList[actFaceIdx]}\n")
-            singleFaces.append(faceCodeList[actFaceIdx])
-            actFaceIdx += 1
-
-    output_mesh = []
+    node_displacements = None
+    loaded = []
     if myResults:
         FreeCAD.Console.PrintMessage(f"{myResults.Name}\n")
-        for myFace in singleFaces:
-            face_nodes = faceCodeDict[myFace]
-            dispVec0 = myResults.DisplacementVectors[myResults.NodeNumbers.index(face_nodes[0])]
-            dispVec1 = myResults.DisplacementVectors[myResults.NodeNumbers.index(face_nodes[1])]
-            dispVec2 = myResults.DisplacementVectors[myResults.NodeNumbers.index(face_nodes[2])]
-            triangle = [
-                myFemMesh.getNodeById(face_nodes[0]) + dispVec0 * myDispScale,
-                myFemMesh.getNodeById(face_nodes[1]) + dispVec1 * myDispScale,
-                myFemMesh.getNodeById(face_nodes[2]) + dispVec2 * myDispScale,
-            ]
-            output_mesh.extend(triangle)
-            # print("my triangle: ", triangle)
-            if len(face_nodes) == 4:
-                dispVec3 = myResults.DisplacementVectors[myResults.NodeNumbers.index(face_nodes[3])]
-                triangle = [
-                    myFemMesh.getNodeById(face_nodes[2]) + dispVec2 * myDispScale,
-                    myFemMesh.getNodeById(face_nodes[3]) + dispVec3 * myDispScale,
-                    myFemMesh.getNodeById(face_nodes[0]) + dispVec0 * myDispScale,
-                ]
-                output_mesh.extend(triangle)
-                # print("my 2. triangle: ", triangle)
-
-    else:
-        for myFace in singleFaces:
-            face_nodes = faceCodeDict[myFace]
-            triangle = [
-                myFemMesh.getNodeById(face_nodes[0]),
-                myFemMesh.getNodeById(face_nodes[1]),
-                myFemMesh.getNodeById(face_nodes[2]),
-            ]
-            output_mesh.extend(triangle)
-            # print("my triangle: ", triangle)
-            if len(face_nodes) == 4:
-                triangle = [
-                    myFemMesh.getNodeById(face_nodes[2]),
-                    myFemMesh.getNodeById(face_nodes[3]),
-                    myFemMesh.getNodeById(face_nodes[0]),
-                ]
-                output_mesh.extend(triangle)
-                # print("my 2. triangle: ", triangle)
+        from femresult import resulttools
+
+        loaded = resulttools.load_result_fields(myResults, ["DisplacementVectors"])
+        node_displacements = (myResults.NodeNumbers, myResults.DisplacementVectors)
+
+    try:
+        trias, quads = get_femmesh_skin_faces(myFemMesh)
+        triangles = _get_skin_triangles(trias, quads)
+        points = _get_node_points(myFemMesh, triangles, node_displacements, myDispScale)
+    finally:
+        # fields loaded from the field file are not kept in the result object
+        if loaded:
+            resulttools.release_result_fields(myResults, loaded)
+    output_mesh = [FreeCAD.Vector(*point) for point in points.reshape(-1, 3).tolist()]
 
     end_time = time.process_time()
     FreeCAD.Console.PrintMessage(f"Mesh by surface search method: {end_time - start_time}\n")
     # call to mesh_2_femmesh to convert mesh to femmesh before return statement
-    mesh2femmesh = mesh_2_femmesh(myFemMesh, singleFaces, faceCodeDict)
+    mesh2femmesh = mesh_2_femmesh(myFemMesh, triangles)
     return output_mesh
 
 
 # additional function to convert mesh to femmesh
-def mesh_2_femmesh(myFemMesh, singleFaces, faceCodeDict):
+def mesh_2_femmesh(myFemMesh, triangles):
     start_time = time.process_time()
     femmesh = Fem.FemMesh()
-    myfemmesh = myFemMesh.Nodes
-    # nodes contains the nodes that are used
-    nodes = {}
-    for myFace in singleFaces:
-        face_nodes = faceCodeDict[myFace]
-        for j in (0, 1, 2):
-            try:
-                nodes[face_nodes[j]] += 1
-            except:
-                nodes[face_nodes[j]] = 0
-        if len(face_nodes) == 4:
-            j = 3
-            try:
-                nodes[face_nodes[j]] += 1
-            except:
-                nodes[face_nodes[j]] = 0
-    sfNode = femmesh.addNode
-    sfFace = femmesh.addFace
-    for key in myFemMesh.Nodes:
-        mynode = myfemmesh[key]
-        try:
-            if nodes[key] >= 0:
-                sfNode(mynode[0], mynode[1], mynode[2], key)
-        except:
-            pass
-
-    output_mesh = []
-
-    for myFace in singleFaces:
-        face_nodes = faceCodeDict[myFace]
-        sfFace(face_nodes[0], face_nodes[1], face_nodes[2])
-        if len(face_nodes) == 4:
-            sfFace(face_nodes[2], face_nodes[3], face_nodes[0])
+    # the nodes that are used
+    node_ids = np.unique(triangles)
+    coords = _get_node_points(myFemMesh, node_ids)
+    femmesh.addNodeList(coords.ravel().tolist(), node_ids.tolist())
+    femmesh.addFaceList(triangles.ravel().tolist(), [3] * len(triangles))
     obj = FreeCAD.ActiveDocument.addObject("Fem::FemMeshObject", "Mesh2Fem")
     obj.FemMesh = femmesh
     end_time = time.process_time()
@@ -27,6 +27,7 @@ __url__ = "https://www.freecad.org"
 ## \addtogroup FEM
 #  @{
 
+import hashlib
 import os
 import re
 import shutil
@@ -38,6 +39,7 @@ from PySide.QtCore import QProcess, QThread
 import FreeCAD
 from FreeCAD import Console
 from FreeCAD import Units
+from freecad import utils
 
 import Fem
 from . import meshtools
@@ -52,6 +54,130 @@ class GmshError(Exception):
     pass
 
 
+def get_cache_dir():
+    return os.path.join(FreeCAD.getUserCachePath(), "FemGmshMesh")
+
+
+def clear_cache():
+    shutil.rmtree(get_cache_dir(), ignore_errors=True)
+
+
+# node count of the VTK cell types Gmsh writes
+_VTK_CELL_NODE_COUNT = {
+    1: 1,  # vertex
+    3: 2,  # line
+    21: 3,  # quadratic edge
+    5: 3,  # triangle
+    22: 6,  # quadratic triangle
+    9: 4,  # quad
+    23: 8,  # quadratic quad
+    10: 4,  # tetra
+    24: 10,  # quadratic tetra
+    12: 8,  # hexahedron
+    25: 20,  # quadratic hexahedron
+    13: 6,  # wedge
+    26: 15,  # quadratic wedge
+    14: 5,  # pyramid
+    27: 13,  # quadratic pyramid
+}
+_VTK_SECTION = re.compile(r"^(POINTS|CELLS|CELL_TYPES|CELL_DATA|POINT_DATA)\b(.*)$", re.MULTILINE)
+
+
+def _read_vtk_grid(file_name, cell_array):
+    # sections of a legacy ASCII VTK unstructured grid as Gmsh writes it. Points, cell types
+    # and cell data are kept as text, only the cell connectivity needs to be changed on merge
+    with open(file_name) as f:
+        text = f.read()
+    sections = {}
+    matches = list(_VTK_SECTION.finditer(text))
+    for match, next_match in zip(matches, matches[1:] + [None]):
+        end = next_match.start() if next_match else len(text)
+        sections[match.group(1)] = (match.group(2).split(), text[match.end() : end])
+    if "POINTS" not in sections or "CELLS" not in sections or "CELL_TYPES" not in sections:
+        raise GmshError(f"No ASCII VTK unstructured grid: {file_name}\n")
+
+    point_count = int(sections["POINTS"][0][0])
+    cell_count = int(sections["CELLS"][0][0])
+    cells = np.fromstring(sections["CELLS"][1], dtype=np.int64, sep=" ")
+    cell_types = sections["CELL_TYPES"][1].strip()
+    type_ids = np.fromstring(cell_types, dtype=np.int64, sep=" ")
+    node_count_table = np.full(max(_VTK_CELL_NODE_COUNT) + 2, -1)
+    node_count_table[list(_VTK_CELL_NODE_COUNT)] = list(_VTK_CELL_NODE_COUNT.values())
+    node_counts = node_count_table[np.clip(type_ids, 0, len(node_count_table) - 1)]
+    starts = np.concatenate(([0], np.cumsum(node_counts + 1)[:-1])).astype(np.int64)
+    if (
+        len(node_counts) != cell_count
+        or len(cells) != (node_counts + 1).sum()
+        or (cells[starts] != node_counts).any()
+    ):
+        raise GmshError(f"Unsupported cells in VTK file: {file_name}\n")
+    # every cell entry except the node counts is a point index
+    point_indices = np.ones(len(cells), dtype=bool)
+    point_indices[starts] = False
+
+    cell_values = None
+    if "CELL_DATA" in sections:
+        values = re.search(
+            rf"^SCALARS {cell_array} \w+(?: 1)?\s*\nLOOKUP_TABLE \S+\s*\n",
+            sections["CELL_DATA"][1],
+            re.MULTILINE,
+        )
+        if values:
+            tokens = sections["CELL_DATA"][1][values.end() :].split(None, cell_count)
+            cell_values = " ".join(tokens[:cell_count])
+
+    return {
+        "point_type": sections["POINTS"][0][1],
+        "point_count": point_count,
+        "points": sections["POINTS"][1].strip(),
+        "cell_count": cell_count,
+        "cells": cells,
+        "point_indices": point_indices,
+        "cell_types": cell_types,
+        "cell_values": cell_values,
+    }
+
+
+def merge_vtk_meshes(mesh_files, merged_file, cell_array="CellEntityIds"):
+    """merge the legacy ASCII VTK unstructured grids Gmsh writes into one grid
+    the points and cells are appended in the order of mesh_files, thus the node and element ids
+    of a FemMesh read from merged_file are consecutive per mesh file. The cell_array values,
+    the Gmsh physical tags, are kept as they are.
+    """
+    grids = [_read_vtk_grid(file_name, cell_array) for file_name in mesh_files]
+    point_count = sum(grid["point_count"] for grid in grids)
+    cell_count = sum(grid["cell_count"] for grid in grids)
+    cell_size = sum(len(grid["cells"]) for grid in grids)
+    with open(merged_file, "w") as f:
+        f.write("# vtk DataFile Version 2.0\n")
+        f.write(f"{os.path.splitext(os.path.basename(merged_file))[0]}, merged by FreeCAD\n")
+        f.write("ASCII\n")
+        f.write("DATASET UNSTRUCTURED_GRID\n")
+        f.write(f"POINTS {point_count} {grids[0]['point_type']}\n")
+        for grid in grids:
+            if grid["points"]:
+                f.write(grid["points"] + "\n")
+        f.write(f"\nCELLS {cell_count} {cell_size}\n")
+        offset = 0
+        for grid in grids:
+            cells = grid["cells"].copy()
+            cells[grid["point_indices"]] += offset
+            offset += grid["point_count"]
+            if len(cells):
+                f.write(" ".join(map(str, cells.tolist())) + "\n")
+        f.write(f"\nCELL_TYPES {cell_count}\n")
+        for grid in grids:
+            if grid["cell_types"]:
+                f.write(grid["cell_types"] + "\n")
+        if all(grid["cell_values"] is not None for grid in grids):
+            f.write(f"\nCELL_DATA {cell_count}\n")
+            f.write(f"SCALARS {cell_array} int 1\n")
+            f.write("LOOKUP_TABLE default\n")
+            for grid in grids:
+                if grid["cell_values"]:
+                    f.write(grid["cell_values"] + "\n")
+
+
 class GmshTools(ObjectTools):
 
     name = "Gmsh"
@@ -206,11 +332,18 @@ class GmshTools(ObjectTools):
         # other initializations
         self.temp_file_geometry = ""
         self.temp_file_mesh = ""
+        self.cache_file = ""
+        self.mesh_from_cache = False
         self.mesh_name = ""
         self.gmsh_bin = ""
         self._field_counter = 0
         self._background_fields = []
 
+        # independent bodies meshed in parallel processes
+        self.body_data = []  # list of dict, one entry per body
+        self.body_entities = None  # element indices of the whole shape for the body geo file
+        self.body_processes = 1
+
     def update_mesh_data(self):
         self.start_logs()
         self.get_dimension()
@@ -220,8 +353,11 @@ class GmshTools(ObjectTools):
         self.get_transfinite_data()
 
     def write_gmsh_input_files(self):
-        self.write_part_file()
-        self.write_geo()
+        if self.body_data:
+            self.write_body_files()
+        else:
+            self.write_part_file()
+            self.write_geo()
 
     def convert(self):
         # converts all available vtk/eement files into msh files, and add element definition
@@ -267,18 +403,32 @@ class GmshTools(ObjectTools):
         self.update_mesh_data()
         self.get_tmp_file_paths()
         self.get_gmsh_command()
+        self.get_body_data()
         self.write_gmsh_input_files()
         self.convert()
+        self.get_cache_file()
 
     def compute(self):
         log_level = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Gmsh").GetString(
             "LogVerbosity", "3"
         )
-        command_list = ["-v", log_level, "-", self.model_file]
-        self.process.start(self.gmsh_bin, command_list)
+        self.mesh_from_cache = False
+        if self.body_data:
+            return self.compute_bodies(log_level)
+        if self.cache_file and os.path.isfile(self.cache_file):
+            # identical meshing request, the mesh is taken from the cache without Gmsh
+            shutil.copyfile(self.cache_file, self.temp_file_mesh)
+            os.utime(self.cache_file)
+            self.mesh_from_cache = True
+            Console.PrintMessage("  Mesh is taken from the cache: " + self.cache_file + "\n")
+            self.complete()
+            return self.process
+        self.process.start(self.gmsh_bin, ["-v", log_level, "-", self.model_file])
         return self.process
 
     def update_properties(self):
+        if self.body_data:
+            merge_vtk_meshes([body["mesh_file"] for body in self.body_data], self.temp_file_mesh)
         fem_mesh = Fem.FemMesh()
         if self.group_elements and ".vtk" in self.temp_file_mesh:
             fem_mesh.read(self.temp_file_mesh, vtk_cell_group_array="CellEntityIds")
@@ -290,6 +440,70 @@ class GmshTools(ObjectTools):
         self.rename_groups()
         self.postprocess_groups()
 
+        if self.cache_file and not self.mesh_from_cache:
+            self.write_cache_file(self.temp_file_mesh, self.cache_file)
+        for body in self.body_data:
+            if body["cache_file"] and not body["from_cache"]:
+                self.write_cache_file(body["mesh_file"], body["cache_file"])
+
+    def compute_bodies(self, log_level):
+        # body meshes of an identical meshing request are taken from the cache, the others
+        # are meshed by parallel Gmsh processes started from the body meshing script
+        geo_files = []
+        for body in self.body_data:
+            body["from_cache"] = bool(body["cache_file"]) and os.path.isfile(body["cache_file"])
+            if body["from_cache"]:
+                shutil.copyfile(body["cache_file"], body["mesh_file"])
+                os.utime(body["cache_file"])
+            else:
+                geo_files.append(os.path.basename(body["geo_file"]))
+        Console.PrintMessage(
+            "  {} bodies, {} body meshes are taken from the cache\n".format(
+                len(self.body_data), len(self.body_data) - len(geo_files)
+            )
+        )
+        if not geo_files:
+            self.mesh_from_cache = True
+            self.complete()
+            return self.process
+        processes = min(len(geo_files), self.body_processes)
+        self.process.setWorkingDirectory(self.obj.WorkingDirectory)
+        self.process.start(
+            utils.get_python_exe(),
+            ["-E", self.model_file, self.gmsh_bin, log_level, str(processes), *geo_files],
+        )
+        return self.process
+
+    body_mesh_code = """
+# mesh the bodies of a shape in parallel Gmsh processes
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+gmsh_bin, log_level, processes, *geo_files = sys.argv[1:]
+
+
+def run_gmsh(geo_file):
+    return subprocess.run(
+        [gmsh_bin, "-v", log_level, "-", geo_file],
+        capture_output=True,
+        text=True,
+        creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+    )
+
+
+failed = False
+with ThreadPoolExecutor(int(processes)) as pool:
+    futures = {pool.submit(run_gmsh, geo_file): geo_file for geo_file in geo_files}
+    for future in as_completed(futures):
+        result = future.result()
+        print("Gmsh finished", futures[future], flush=True)
+        print(result.stdout, end="", flush=True)
+        print(result.stderr, end="", file=sys.stderr, flush=True)
+        failed = failed or result.returncode != 0
+sys.exit(1 if failed else 0)
+"""
+
     def create_mesh(self):
         # for backward compatibility only
         self.run(True)
@@ -367,6 +581,63 @@ class GmshTools(ObjectTools):
         Console.PrintMessage("  " + self.temp_file_mesh + "\n")
         Console.PrintMessage("  " + self.model_file + "\n")
 
+    def get_cache_file(self):
+        # content-addressed mesh cache. The key is the hash of the geo file, which holds all
+        # mesh parameter (size fields, boundary layers, transfinite settings, groups), of the
+        # files merged by the geo file (brep geometry, result views) and of the Gmsh binary
+        gmsh_param = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Gmsh")
+        if not gmsh_param.GetBool("UseMeshCache", True):
+            self.cache_file = ""
+            return
+        if self.body_data:
+            # every body mesh is cached on its own, only changed bodies are meshed again
+            self.cache_file = ""
+            for body in self.body_data:
+                body["cache_file"] = self.get_geo_cache_file(body["geo_file"], body["mesh_file"])
+        else:
+            self.cache_file = self.get_geo_cache_file(self.model_file, self.temp_file_mesh)
+
+    def get_geo_cache_file(self, model_file, mesh_file):
+        temp_dir = os.path.dirname(model_file)
+        key = hashlib.sha256()
+        bin_stat = os.stat(shutil.which(self.gmsh_bin))
+        key.update(f"{self.gmsh_bin} {bin_stat.st_size} {bin_stat.st_mtime_ns}".encode())
+        merged_files = []
+        with open(model_file) as geo:
+            for line in geo:
+                # comments contain the absolute file paths, they do not change the mesh
+                if line.startswith("//"):
+                    continue
+                key.update(line.encode())
+                merged = re.match(r"""Merge ["'](.+)["'];""", line)
+                if merged:
+                    merged_files.append(os.path.join(temp_dir, merged.group(1)))
+        for file_name in merged_files:
+            with open(file_name, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    key.update(chunk)
+        file_type = os.path.splitext(mesh_file)[1]
+        return os.path.join(get_cache_dir(), key.hexdigest() + file_type)
+
+    def write_cache_file(self, mesh_file, cache_file):
+        cache_dir = os.path.dirname(cache_file)
+        os.makedirs(cache_dir, exist_ok=True)
+        # copy and rename, a concurrent run never reads a partly written cache file
+        temp_cache_file = f"{cache_file}.{os.getpid()}.tmp"
+        shutil.copyfile(mesh_file, temp_cache_file)
+        os.replace(temp_cache_file, cache_file)
+
+        # remove the least recently used meshes
+        max_entries = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Gmsh").GetInt(
+            "MeshCacheSize", 50
+        )
+        entries = [
+            os.path.join(cache_dir, f) for f in os.listdir(cache_dir) if not f.endswith(".tmp")
+        ]
+        entries.sort(key=os.path.getmtime, reverse=True)
+        for entry in entries[max_entries:]:
+            os.remove(entry)
+
     def get_gmsh_command(self):
         self.gmsh_bin = FreeCAD.ParamGet(
             "User parameter:BaseApp/Preferences/Mod/Fem/Gmsh"
@@ -407,6 +678,100 @@ class GmshTools(ObjectTools):
             "Solid": len(geom.Solids),
         }
 
+    def get_body_data(self):
+        # opt-in, the bodies of the shape are meshed in parallel Gmsh processes and the body
+        # meshes are merged afterwards. The bodies must not share any shape element, their
+        # meshes would not match at the interface
+        self.body_data = []
+        gmsh_param = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Gmsh")
+        if not gmsh_param.GetBool("MeshBodiesInParallel", False):
+            return
+        global_pla = self.part_obj.getGlobalPlacement()
+        geom = self.part_obj.getPropertyOfGeometry()
+        geom_trans = geom.transformed(FreeCAD.Placement().Matrix)
+        geom_trans.Placement = global_pla
+        solids = geom_trans.Solids
+        if len(solids) < 2:
+            return
+        if not self.temp_file_mesh.endswith(".vtk"):
+            Console.PrintWarning(
+                "  Parallel meshing of bodies needs VTK mesh files, "
+                "the shape is meshed in one process.\n"
+            )
+            return
+        if (
+            self.size_field_list
+            or self.bl_setting_list
+            or self.transfinite_curve_settings
+            or self.transfinite_surface_settings
+            or self.transfinite_volume_settings
+        ):
+            Console.PrintMessage(
+                "  Mesh refinements refer to the whole shape, the shape is meshed in one process.\n"
+            )
+            return
+        sub_shapes = {"Vertex": "Vertexes", "Edge": "Edges", "Face": "Faces", "Solid": "Solids"}
+        for attr in sub_shapes.values():
+            if len(getattr(geom_trans, attr)) != sum(len(getattr(s, attr)) for s in solids):
+                Console.PrintMessage(
+                    "  The bodies share shape elements or the shape has elements outside of the "
+                    "bodies, the shape is meshed in one process.\n"
+                )
+                return
+
+        # the element indices of the whole shape, a body has its own indices starting with 1
+        shape_indices = {}
+        for attr in sub_shapes.values():
+            for index, sub_shape in enumerate(getattr(geom_trans, attr), 1):
+                shape_indices.setdefault(sub_shape.hashCode(), []).append((index, sub_shape))
+
+        def get_shape_index(sub_shape):
+            for index, shape in shape_indices[sub_shape.hashCode()]:
+                if shape.isSame(sub_shape):
+                    return index
+
+        temp_dir = self.obj.WorkingDirectory
+        geometry_name = os.path.splitext(os.path.basename(self.temp_file_geometry))[0]
+        mesh_type = os.path.splitext(self.temp_file_mesh)[1]
+        for i, solid in enumerate(solids, 1):
+            self.body_data.append(
+                {
+                    "shape": solid,
+                    "entities": {
+                        group: [get_shape_index(sub) for sub in getattr(solid, attr)]
+                        for group, attr in sub_shapes.items()
+                    },
+                    "geometry_file": os.path.join(temp_dir, f"{geometry_name}_Body{i}.brep"),
+                    "mesh_file": os.path.join(temp_dir, f"{self.mesh_name}_Body{i}{mesh_type}"),
+                    "geo_file": os.path.join(temp_dir, f"shape2mesh_Body{i}.geo"),
+                    "cache_file": "",
+                    "from_cache": False,
+                }
+            )
+        self.body_processes = min(
+            len(solids), gmsh_param.GetInt("NumOfThreads", QThread.idealThreadCount())
+        )
+        Console.PrintMessage(
+            f"  {len(solids)} bodies are meshed in up to {self.body_processes} processes\n"
+        )
+
+    def write_body_files(self):
+        # a brep, geo and mesh file per body, the model file is the script to run Gmsh
+        # for the bodies in parallel
+        shape_files = (self.temp_file_geometry, self.temp_file_mesh)
+        for body in self.body_data:
+            self.temp_file_geometry = body["geometry_file"]
+            self.temp_file_mesh = body["mesh_file"]
+            self.model_file = body["geo_file"]
+            self.body_entities = body["entities"]
+            body["shape"].exportBrep(self.temp_file_geometry)
+            self.write_geo()
+        self.temp_file_geometry, self.temp_file_mesh = shape_files
+        self.body_entities = None
+        self.model_file = os.path.join(self.obj.WorkingDirectory, "bodies2mesh.py")
+        with open(self.model_file, "w") as f:
+            f.write(self.body_mesh_code)
+
     def postprocess_groups(self):
         # The created groups are for shape elements only: vertex, face, edge and solid
         # From those we need to create new groups for the analysis features
@@ -1464,11 +1829,17 @@ class GmshTools(ObjectTools):
                     case "Vertex":
                         phy_shape = "Point"
 
-                geo.write(f"For i In {{1:{element_count} }}\n")
-                geo.write(
-                    f'\tPhysical {phy_shape}(Sprintf("{group}%g", i), {phy_tag}+i) = {{i}};\n'
-                )
-                geo.write("EndFor\n")
+                if self.body_entities is None:
+                    geo.write(f"For i In {{1:{element_count} }}\n")
+                    geo.write(
+                        f'\tPhysical {phy_shape}(Sprintf("{group}%g", i), {phy_tag}+i) = {{i}};\n'
+                    )
+                    geo.write("EndFor\n")
+                else:
+                    # body geo file, the groups keep name and tag of the whole shape element
+                    for i, index in enumerate(self.body_entities[group], 1):
+                        tag = phy_tag + index
+                        geo.write(f'Physical {phy_shape}("{group}{index}", {tag}) = {{{i}}};\n')
 
                 # store physical tags for later rename
                 for i in range(element_count):
@@ -1619,6 +1990,9 @@ class GmshTools(ObjectTools):
             cpu_count = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Gmsh").GetInt(
                 "NumOfThreads", QThread.idealThreadCount()
             )
+            if self.body_data:
+                # the parallel body processes share the threads
+                cpu_count = max(1, cpu_count // self.body_processes)
             geo.write("// enable multi-core processing\n")
             geo.write(f"General.NumThreads = {cpu_count};\n")
             geo.write("\n")
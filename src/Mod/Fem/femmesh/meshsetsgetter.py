@@ -35,6 +35,46 @@ import FreeCAD
 from femmesh import meshtools
 from femtools.femutils import type_of_obj
 
+# mesh object: (femelement_table, node_element_index) of its FemMesh
+_mesh_tables = {}
+
+
+def get_mesh_tables(mesh_obj, femmesh):
+    """The femelement_table and the NodeElementIndex of the FemMesh of mesh_obj.
+
+    They are built once and used by every MeshSetsGetter of the mesh object
+    until its FemMesh is changed. Both are used read only.
+    """
+    tables = _mesh_tables.get(mesh_obj)
+    if tables is None:
+        _MeshObserver.attach()
+        femelement_table = meshtools.get_femelement_table(femmesh)
+        tables = (femelement_table, meshtools.NodeElementIndex(femelement_table))
+        _mesh_tables[mesh_obj] = tables
+    return tables
+
+
+class _MeshObserver:
+
+    _instance = None
+
+    @classmethod
+    def attach(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+            FreeCAD.addDocumentObserver(cls._instance)
+
+    def slotChangedObject(self, obj, prop):
+        if prop == "FemMesh":
+            _mesh_tables.pop(obj, None)
+
+    def slotDeletedObject(self, obj):
+        _mesh_tables.pop(obj, None)
+
+    def slotDeletedDocument(self, doc):
+        for obj in doc.Objects:
+            _mesh_tables.pop(obj, None)
+
 
 class MeshSetsGetter:
     def __init__(self, analysis_obj, solver_obj, mesh_obj, member):
@@ -87,6 +127,7 @@ class MeshSetsGetter:
         self.femelement_table = {}
         self.constraint_conflict_nodes = []
         self.femnodes_ele_table = {}
+        self.node_element_index = None
         self.femelements_edges_only = []
         self.femelements_faces_only = []
         self.femelement_volumes_table = {}
@@ -95,6 +136,9 @@ class MeshSetsGetter:
         self.femelement_count_test = True
         self.mat_geo_sets = []
 
+        # constraint object name --> seconds, filled by get_mesh_sets
+        self.sets_timings = {}
+
         # subelements masks
         self.edge_masks = {
             "mask_tria3": {},
@@ -116,11 +160,10 @@ class MeshSetsGetter:
         if self.mesh_object:
             if not self.femnodes_mesh:
                 self.femnodes_mesh = self.femmesh.Nodes
-            if not self.femelement_table:
-                self.femelement_table = meshtools.get_femelement_table(self.femmesh)
-            if not self.femnodes_ele_table:
-                self.femnodes_ele_table = meshtools.get_femnodes_ele_table(
-                    self.femnodes_mesh, self.femelement_table
+            if self.node_element_index is None:
+                # built once per mesh, all constraints are searched on this index
+                self.femelement_table, self.node_element_index = get_mesh_tables(
+                    self.mesh_object, self.femmesh
                 )
 
     @property
@@ -235,36 +278,75 @@ class MeshSetsGetter:
         self.get_beam_elements()
         self.get_rotation1D_elements()
 
-        # constraints element sets getter
-        self.get_constraints_centrif_elements()
-        self.get_constraints_bodyheatsource_elements()
-
-        # constraints node sets getter
-        self.get_constraints_fixed_nodes()
-        self.get_constraints_displacement_nodes()
-        self.get_constraints_rigidbody_nodes()
-        self.get_constraints_planerotation_nodes()
-
-        # constraints surface sets getter
-        self.get_constraints_contact_faces()
-        self.get_constraints_tie_faces()
-        self.get_constraints_sectionprint_faces()
-        self.get_constraints_transform_nodes()
-        self.get_constraints_temperature_nodes()
-        self.get_constraints_initialtemperature_nodes()
-        self.get_constraints_electrostatic_nodes()
-        self.get_constraints_electricchargedensity_nodes()
-
-        # constraints sets with constraint data
-        self.get_constraints_force_nodeloads()
-        self.get_constraints_pressure_faces()
-        self.get_constraints_heatflux_faces()
-        self.get_constraints_electrostatic_faces()
-        self.get_constraints_electricchargedensity_faces()
+        # constraints sets getter
+        self.get_constraints_sets(
+            [
+                # constraints element sets getter
+                self.get_constraints_centrif_elements,
+                self.get_constraints_bodyheatsource_elements,
+                # constraints node sets getter
+                self.get_constraints_fixed_nodes,
+                self.get_constraints_displacement_nodes,
+                self.get_constraints_rigidbody_nodes,
+                self.get_constraints_planerotation_nodes,
+                # constraints surface sets getter
+                self.get_constraints_contact_faces,
+                self.get_constraints_tie_faces,
+                self.get_constraints_sectionprint_faces,
+                self.get_constraints_transform_nodes,
+                self.get_constraints_temperature_nodes,
+                self.get_constraints_initialtemperature_nodes,
+                self.get_constraints_electrostatic_nodes,
+                self.get_constraints_electricchargedensity_nodes,
+                # constraints sets with constraint data
+                self.get_constraints_force_nodeloads,
+                self.get_constraints_pressure_faces,
+                self.get_constraints_heatflux_faces,
+                self.get_constraints_electrostatic_faces,
+                self.get_constraints_electricchargedensity_faces,
+            ]
+        )
+        self.print_sets_timings()
 
         setstime = round((time.process_time() - time_start), 3)
         FreeCAD.Console.PrintMessage(f"Getting mesh data time: {setstime} seconds.\n")
 
+    def get_constraints_sets(self, getters):
+        # The getters run one after another.  They search the references on the FemMesh
+        # and the shapes of the constraints, neither of which can be sent to worker
+        # processes, and threads would serialize on the GIL.  The time spent on each
+        # constraint object is kept in sets_timings to spot the slow references.
+        self._load_tables()
+        self.sets_timings = {}
+        for getter in getters:
+            getter()
+        self.constraint_conflict_nodes = [
+            node
+            for femobj in (
+                self.member.cons_fixed + self.member.cons_displacement + self.member.cons_rigidbody
+            )
+            for node in femobj.get("Nodes", [])
+        ]
+
+    def _timed(self, femobjs):
+        # yields the femobjs, the time until the next one is asked for
+        # is added to the timing of the constraint object
+        for femobj in femobjs:
+            time_start = time.perf_counter()
+            yield femobj
+            name = femobj["Object"].Name
+            seconds = time.perf_counter() - time_start
+            self.sets_timings[name] = self.sets_timings.get(name, 0.0) + seconds
+
+    def get_sets_timings_report(self):
+        # slowest constraint first
+        timings = sorted(self.sets_timings.items(), key=lambda t: t[1], reverse=True)
+        return "".join(f"    {name}: {round(seconds, 3)} seconds\n" for name, seconds in timings)
+
+    def print_sets_timings(self):
+        FreeCAD.Console.PrintLog("Mesh data time per constraint:\n")
+        FreeCAD.Console.PrintLog(self.get_sets_timings_report())
+
     # ********************************************************************************************
     # ********************************************************************************************
     # node sets
@@ -272,13 +354,12 @@ class MeshSetsGetter:
         if not self.member.cons_fixed:
             return
         # get nodes
-        for femobj in self.member.cons_fixed:
+        for femobj in self._timed(self.member.cons_fixed):
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
+            # the nodes are added to constraint_conflict_nodes in get_constraints_sets,
+            # they are needed by constraint plane rotation
             femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
-            # add nodes to constraint_conflict_nodes, needed by constraint plane rotation
-            for node in femobj["Nodes"]:
-                self.constraint_conflict_nodes.append(node)
         # if mixed mesh with solids the node set needs to be split
         # because solid nodes do not have rotational degree of freedom
         if self.femmesh.Volumes and (
@@ -287,7 +368,7 @@ class MeshSetsGetter:
             FreeCAD.Console.PrintMessage("We need to find the solid nodes.\n")
             if not self.femelement_volumes_table:
                 self.femelement_volumes_table = meshtools.get_femelement_volumes_table(self.femmesh)
-            for femobj in self.member.cons_fixed:
+            for femobj in self._timed(self.member.cons_fixed):
                 # femobj --> dict, FreeCAD document object is femobj["Object"]
                 nds_solid = []
                 nds_faceedge = []
@@ -307,31 +388,29 @@ class MeshSetsGetter:
         if not self.member.cons_rigidbody:
             return
         # get nodes
-        for femobj in self.member.cons_rigidbody:
+        for femobj in self._timed(self.member.cons_rigidbody):
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
+            # the nodes are added to constraint_conflict_nodes in get_constraints_sets,
+            # they are needed by constraint plane rotation
             femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
-            # add nodes to constraint_conflict_nodes, needed by constraint plane rotation
-            for node in femobj["Nodes"]:
-                self.constraint_conflict_nodes.append(node)
 
     def get_constraints_displacement_nodes(self):
         if not self.member.cons_displacement:
             return
         # get nodes
-        for femobj in self.member.cons_displacement:
+        for femobj in self._timed(self.member.cons_displacement):
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
+            # the nodes are added to constraint_conflict_nodes in get_constraints_sets,
+            # they are needed by constraint plane rotation
             femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
-            # add nodes to constraint_conflict_nodes, needed by constraint plane rotation
-            for node in femobj["Nodes"]:
-                self.constraint_conflict_nodes.append(node)
 
     def get_constraints_planerotation_nodes(self):
         if not self.member.cons_planerotation:
             return
         # get nodes
-        for femobj in self.member.cons_planerotation:
+        for femobj in self._timed(self.member.cons_planerotation):
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
             femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
@@ -340,7 +419,7 @@ class MeshSetsGetter:
         if not self.member.cons_transform:
             return
         # get nodes
-        for femobj in self.member.cons_transform:
+        for femobj in self._timed(self.member.cons_transform):
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
             femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
@@ -349,7 +428,7 @@ class MeshSetsGetter:
         if not self.member.cons_temperature:
             return
         # get nodes
-        for femobj in self.member.cons_temperature:
+        for femobj in self._timed(self.member.cons_temperature):
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
             femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
@@ -358,7 +437,7 @@ class MeshSetsGetter:
         if not self.member.cons_initialtemperature:
             return
         # get nodes
-        for femobj in self.member.cons_initialtemperature:
+        for femobj in self._timed(self.member.cons_initialtemperature):
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
             femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
@@ -376,7 +455,7 @@ class MeshSetsGetter:
         if not self.member.cons_electrostatic:
             return
         # get nodes
-        for femobj in self.member.cons_electrostatic:
+        for femobj in self._timed(self.member.cons_electrostatic):
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             if femobj["Object"].BoundaryCondition == "Dirichlet":
                 print_obj_info(femobj["Object"])
@@ -388,7 +467,7 @@ class MeshSetsGetter:
         if not self.member.cons_electricchargedensity:
             return
         # get nodes
-        for femobj in self.member.cons_electricchargedensity:
+        for femobj in self._timed(self.member.cons_electricchargedensity):
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             if femobj["Object"].Concentrated:
                 print_obj_info(femobj["Object"])
@@ -400,7 +479,7 @@ class MeshSetsGetter:
         if not self.member.cons_force:
             return
         # check shape type of reference shape
-        for femobj in self.member.cons_force:
+        for femobj in self._timed(self.member.cons_force):
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"], log=True)
             if femobj["RefShapeType"] == "Vertex":
@@ -424,10 +503,7 @@ class MeshSetsGetter:
                     "    mesh without needed data --> The femelement_table "
                     "and femnodes_mesh are not needed for node load calculation.\n"
                 )
-                if not self.femnodes_mesh:
-                    self.femnodes_mesh = self.femmesh.Nodes
-                if not self.femelement_table:
-                    self.femelement_table = meshtools.get_femelement_table(self.femmesh)
+                self._load_tables()
         # get node loads
         FreeCAD.Console.PrintLog(
             "    Finite element mesh nodes will be retrieved by searching "
@@ -437,7 +513,7 @@ class MeshSetsGetter:
             "    The appropriate finite element mesh node load values will "
             "be calculated according to the finite element definition.\n"
         )
-        for femobj in self.member.cons_force:
+        for femobj in self._timed(self.member.cons_force):
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             frc_obj = femobj["Object"]
             print_obj_info(frc_obj)
@@ -469,14 +545,14 @@ class MeshSetsGetter:
 
     # faces sets
     def get_constraints_pressure_faces(self):
-        for femobj in self.member.cons_pressure:
+        for femobj in self._timed(self.member.cons_pressure):
             obj = femobj["Object"]
             result = self._get_elements(obj)
 
             femobj["PressureFaces"] = result
 
     def get_constraints_electrostatic_faces(self):
-        for femobj in self.member.cons_electrostatic:
+        for femobj in self._timed(self.member.cons_electrostatic):
             obj = femobj["Object"]
             if obj.BoundaryCondition == "Neumann":
                 result = self._get_elements(obj)
@@ -484,7 +560,7 @@ class MeshSetsGetter:
                 femobj["ElectricFluxFaces"] = result
 
     def get_constraints_electricchargedensity_faces(self):
-        for femobj in self.member.cons_electricchargedensity:
+        for femobj in self._timed(self.member.cons_electricchargedensity):
             obj = femobj["Object"]
             result = self._get_elements(obj)
 
@@ -494,7 +570,7 @@ class MeshSetsGetter:
                 femobj["ChargeDensityElements"] = result
 
     def get_constraints_contact_faces(self):
-        for femobj in self.member.cons_contact:
+        for femobj in self._timed(self.member.cons_contact):
             obj = femobj["Object"]
             result = self._get_elements(obj)
 
@@ -509,7 +585,7 @@ class MeshSetsGetter:
     #                from one side of the geometric face are needed
 
     def get_constraints_tie_faces(self):
-        for femobj in self.member.cons_tie:
+        for femobj in self._timed(self.member.cons_tie):
             obj = femobj["Object"]
             result = self._get_elements(obj)
 
@@ -517,14 +593,14 @@ class MeshSetsGetter:
             femobj["TieMasterFaces"] = result[-1:]
 
     def get_constraints_sectionprint_faces(self):
-        for femobj in self.member.cons_sectionprint:
+        for femobj in self._timed(self.member.cons_sectionprint):
             obj = femobj["Object"]
             result = self._get_elements(obj)
 
             femobj["SectionPrintFaces"] = result
 
     def get_constraints_heatflux_faces(self):
-        for femobj in self.member.cons_heatflux:
+        for femobj in self._timed(self.member.cons_heatflux):
             obj = femobj["Object"]
             result = self._get_elements(obj)
 
@@ -534,14 +610,14 @@ class MeshSetsGetter:
     # ********************************************************************************************
     # element sets constraints
     def get_constraints_centrif_elements(self):
-        for femobj in self.member.cons_centrif:
+        for femobj in self._timed(self.member.cons_centrif):
             obj = femobj["Object"]
             result = self._get_elements(obj)
 
             femobj["CentrifElements"] = result
 
     def get_constraints_bodyheatsource_elements(self):
-        for femobj in self.member.cons_bodyheatsource:
+        for femobj in self._timed(self.member.cons_bodyheatsource):
             obj = femobj["Object"]
             result = self._get_elements(obj)
 
@@ -589,18 +665,13 @@ class MeshSetsGetter:
             FreeCAD.Console.PrintMessage(all_found)
             FreeCAD.Console.PrintMessage("\n")
         if all_found is False:
-            if not self.femelement_table:
-                self.femelement_table = meshtools.get_femelement_table(self.femmesh)
-            # we're going to use the binary search for get_femelements_by_femnodes()
-            # thus we need the parameter values self.femnodes_ele_table
-            if not self.femnodes_mesh:
-                self.femnodes_mesh = self.femmesh.Nodes
-            if not self.femnodes_ele_table:
-                self.femnodes_ele_table = meshtools.get_femnodes_ele_table(
-                    self.femnodes_mesh, self.femelement_table
-                )
+            # we're going to use the array based search of the node element index
+            self._load_tables()
             control = meshtools.get_femelement_sets(
-                self.femmesh, self.femelement_table, femobjs, self.femnodes_ele_table
+                self.femmesh,
+                self.femelement_table,
+                femobjs,
+                node_element_index=self.node_element_index,
             )
             # we only need to set it, if it is still True
             if (self.femelement_count_test is True) and (control is False):
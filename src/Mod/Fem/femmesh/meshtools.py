@@ -27,6 +27,8 @@ __url__ = "https://www.freecad.org"
 ## \addtogroup FEM
 #  @{
 
+from itertools import chain
+
 import numpy as np
 
 import FreeCAD
@@ -60,13 +62,18 @@ def get_femnodes_by_femobj_with_references(femmesh, femobj):
 
 
 # ************************************************************************************************
-def get_femelements_by_references(femmesh, femelement_table, references, femnodes_ele_table=None):
+def get_femelements_by_references(
+    femmesh, femelement_table, references, femnodes_ele_table=None, node_element_index=None
+):
     """get the femelements for a list of references"""
     references_femelements = []
     for ref in references:
         # femnodes for the current ref
         ref_femnodes = get_femnodes_by_refshape(femmesh, ref)
-        if femnodes_ele_table:
+        if node_element_index is not None:
+            # array based search on the NodeElementIndex of the femelement_table
+            references_femelements += node_element_index.get_femelements_by_femnodes(ref_femnodes)
+        elif femnodes_ele_table:
             # blind fast binary search, works for volumes only
             # femelements for all references
             references_femelements += get_femelements_by_femnodes_bin(
@@ -170,6 +177,43 @@ def get_femelement_edges_table(femmesh, edges_only=None):
     return table
 
 
+# ************************************************************************************************
+def get_femelement_ids(femmesh):
+    """the ids of the elements get_femelement_table() returns the nodes of"""
+    if is_solid_femmesh(femmesh):
+        return femmesh.Volumes
+    elif is_face_femmesh(femmesh):
+        return femmesh.Faces
+    elif is_edge_femmesh(femmesh):
+        return femmesh.Edges
+    FreeCAD.Console.PrintError("Neither solid nor face nor edge femmesh!\n")
+    return ()
+
+
+# ************************************************************************************************
+def iter_femelement_table_chunks(femmesh, chunk_size=100000):
+    """get_femelement_table() split in tables of at most chunk_size elements
+    to write large meshes element by element with bounded memory"""
+    element_ids = get_femelement_ids(femmesh)
+    for start in range(0, len(element_ids), chunk_size):
+        yield {i: femmesh.getElementNodes(i) for i in element_ids[start : start + chunk_size]}
+
+
+# ************************************************************************************************
+def iter_femnodes_chunks(femmesh, chunk_size=100000):
+    """the nodes of femmesh in chunks of ascending node ids
+    yields a tuple of an id array and an (n, 3) coordinate array per chunk
+    """
+    last_id = 0
+    while True:
+        # every chunk resumes after the last node id of the chunk before
+        ids, coords = femmesh.getNodeList(last_id, chunk_size)
+        if not ids:
+            return
+        last_id = ids[-1]
+        yield np.array(ids, dtype=np.int64), np.array(coords).reshape(-1, 3)
+
+
 # ************************************************************************************************
 def get_femnodes_ele_table(femnodes_mesh, femelement_table):
     """the femnodes_ele_table contains for each node its membership in elements
@@ -348,6 +392,128 @@ def get_element_faces_from_binary_search(
     return faces
 
 
+# ************************************************************************************************
+class NodeElementIndex:
+    """Array based node to element incidence index of a femelement_table.
+
+    It replaces the femnodes_ele_table and the bit_pattern_dict for searching elements
+    by node sets. The index is built once for a femelement_table and afterwards
+    used read only, thus it can be shared by all constraints of one mesh.
+
+    element_ids: element ids in the order of the femelement_table
+    node_counts: number of nodes of each element
+    element_nodes: node ids of each element, padded with a dummy node id
+    node_ptr, node_elements: CSR table, the positions of the elements of node n
+        are node_elements[node_ptr[n]:node_ptr[n + 1]]
+    node_bits: bit of the node in the bit pattern of the element,
+        the same position coding as used by get_femnodes_ele_table()
+    """
+
+    def __init__(self, femelement_table):
+        ele_count = len(femelement_table)
+        self.element_ids = np.fromiter(femelement_table, dtype=np.int64, count=ele_count)
+        self.node_counts = np.fromiter(
+            map(len, femelement_table.values()), dtype=np.int64, count=ele_count
+        )
+        flat_nodes = np.fromiter(
+            chain.from_iterable(femelement_table.values()),
+            dtype=np.int64,
+            count=int(self.node_counts.sum()),
+        )
+        self.max_node_count = int(self.node_counts.max()) if ele_count else 0
+        # node ids are used as array index, the dummy node id is never part of a node set
+        self.dummy_node = int(flat_nodes.max()) + 1 if flat_nodes.size else 0
+
+        ele_pos = np.repeat(np.arange(ele_count), self.node_counts)
+        ele_start = np.cumsum(self.node_counts) - self.node_counts
+        node_pos = np.arange(flat_nodes.size) - np.repeat(ele_start, self.node_counts)
+        self.element_nodes = np.full((ele_count, self.max_node_count), self.dummy_node)
+        self.element_nodes[ele_pos, node_pos] = flat_nodes
+
+        order = np.argsort(flat_nodes, kind="stable")
+        self.node_elements = ele_pos[order]
+        self.node_bits = np.left_shift(1, node_pos[order])
+        self.node_ptr = np.zeros(self.dummy_node + 2, dtype=np.int64)
+        np.cumsum(np.bincount(flat_nodes, minlength=self.dummy_node + 1), out=self.node_ptr[1:])
+
+    def _get_node_array(self, node_set):
+        nodes = np.fromiter(node_set, dtype=np.int64)
+        # nodes not in any element of the table are not of any interest
+        return np.unique(nodes[(nodes >= 0) & (nodes < self.dummy_node)])
+
+    def get_bit_patterns(self, node_set):
+        """Returns the element positions of all elements with at least one node
+        in node_set and their bit patterns, see get_bit_pattern_dict().
+        """
+        nodes = self._get_node_array(node_set)
+        starts = self.node_ptr[nodes]
+        counts = self.node_ptr[nodes + 1] - starts
+        # positions in node_elements of all elements of all nodes
+        incidences = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(
+            counts.sum()
+        )
+        elements = self.node_elements[incidences]
+        # every node is only once in an element, thus summing up the bits is an or
+        patterns = np.bincount(
+            elements, weights=self.node_bits[incidences], minlength=len(self.element_ids)
+        ).astype(np.int64)
+        positions = np.flatnonzero(patterns)
+        return positions, patterns[positions]
+
+    def get_bit_pattern_dict(self, node_set):
+        """Returns the bit_pattern_dict of get_bit_pattern_dict() for node_set."""
+        patterns = np.zeros(len(self.element_ids), dtype=np.int64)
+        positions, set_patterns = self.get_bit_patterns(node_set)
+        patterns[positions] = set_patterns
+        return {
+            ele: [node_count, pattern]
+            for ele, node_count, pattern in zip(
+                self.element_ids.tolist(), self.node_counts.tolist(), patterns.tolist()
+            )
+        }
+
+    def get_femelements_by_femnodes(self, node_set):
+        """Returns the ids of all elements with all their nodes in node_set,
+        in the order of the femelement_table.
+        """
+        positions, patterns = self.get_bit_patterns(node_set)
+        full_masks = np.left_shift(1, self.node_counts[positions]) - 1
+        return self.element_ids[positions[patterns == full_masks]].tolist()
+
+    def get_femelements_by_masks(self, node_set, masks):
+        """Returns [[element id, mask value], ...] for all elements with all nodes
+        of a mask in node_set. The same as get_element_faces_from_binary_search().
+
+        masks: {node count of element: {bit mask: mask value, ...}, ...}
+        """
+        positions, patterns = self.get_bit_patterns(node_set)
+        node_counts = self.node_counts[positions]
+        found_positions = []
+        found_values = []
+        for node_count, mask_dict in masks.items():
+            of_node_count = node_counts == node_count
+            if not mask_dict or not of_node_count.any():
+                continue
+            count_positions = positions[of_node_count]
+            count_patterns = patterns[of_node_count]
+            for key, value in mask_dict.items():
+                found = (count_patterns & key) == key
+                found_positions.append(count_positions[found])
+                found_values.append(np.full(np.count_nonzero(found), value))
+        if not found_positions:
+            return []
+        found_positions = np.concatenate(found_positions)
+        found_values = np.concatenate(found_values)
+        # order of the femelement_table, the mask order is kept for each element
+        order = np.argsort(found_positions, kind="stable")
+        return [
+            [ele, value]
+            for ele, value in zip(
+                self.element_ids[found_positions[order]].tolist(), found_values[order].tolist()
+            )
+        ]
+
+
 # ************************************************************************************************
 def get_femelements_by_femnodes_bin(femelement_table, femnodes_ele_table, node_list):
     """for every femelement of femelement_table
@@ -376,6 +542,7 @@ def get_femelements_by_femnodes_std(femelement_table, node_list):
     nodes: nodelist"""
     FreeCAD.Console.PrintMessage("std search: get_femelements_by_femnodes_std\n")
     e = []  # elementlist
+    node_list = set(node_list)
     for elementID in sorted(femelement_table):
         nodecount = 0
         for nodeID in femelement_table[elementID]:
@@ -451,7 +618,9 @@ def get_femvolumeelements_by_femfacenodes(femelement_table, node_list):
 
 
 # ************************************************************************************************
-def get_femelement_sets(femmesh, femelement_table, fem_objects, femnodes_ele_table=None):
+def get_femelement_sets(
+    femmesh, femelement_table, fem_objects, femnodes_ele_table=None, node_element_index=None
+):
     # fem_objects = FreeCAD FEM document objects
     # get femelements for reference shapes of each obj.References
     count_femelements = 0
@@ -468,7 +637,7 @@ def get_femelement_sets(femmesh, femelement_table, fem_objects, femnodes_ele_tab
         if obj.References:
             ref_shape_femelements = []
             ref_shape_femelements = get_femelements_by_references(
-                femmesh, femelement_table, obj.References, femnodes_ele_table
+                femmesh, femelement_table, obj.References, femnodes_ele_table, node_element_index
             )
             ref_shape_femelements_array = np.zeros_like(referenced_femelements)
             ref_shape_femelements_array[ref_shape_femelements] = 1
@@ -817,15 +986,10 @@ def get_force_obj_edge_nodeload_table(femmesh, femelement_table, femnodes_mesh,
             #     { meshedgeID : ( nodeID, ... , nodeID ) }
             edge_table = get_ref_edgenodes_table(femmesh, femelement_table, ref_edge)
 
-            # node_length_table:
-            #     [ (nodeID, length), ... , (nodeID, length) ]
-            # some nodes will have more than one entry
-            node_length_table = get_ref_edgenodes_lengths(femnodes_mesh, edge_table)
-
             # node_sum_length_table:
             #     { nodeID : Length, ... , nodeID : Length }
             # LengthSum for each node, one entry for each node
-            node_sum_length_table = get_ref_shape_node_sum_geom_table(node_length_table)
+            node_sum_length_table = get_ref_edgenodes_length_sums(femnodes_mesh, edge_table)
 
             # node_load_table:
             #     { nodeID : NodeLoad, ... , nodeID : NodeLoad }
@@ -917,7 +1081,8 @@ def get_force_obj_edge_nodeload_table(femmesh, femelement_table, femnodes_mesh,
 # ************************************************************************************************
 def get_ref_edgenodes_table(femmesh, femelement_table, refedge):
     edge_table = {}  # { meshedgeID : ( nodeID, ... , nodeID ) }
-    refedge_nodes = femmesh.getNodesByEdge(refedge)
+    # set for the node lookups
+    refedge_nodes = set(femmesh.getNodesByEdge(refedge))
     if is_solid_femmesh(femmesh):
         refedge_fem_volumeelements = []
         # if at least two nodes of a femvolumeelement are in
@@ -984,42 +1149,54 @@ def get_ref_edgenodes_lengths(femnodes_mesh, edge_table):
             "Error in get_ref_edgenodes_lengths(): Empty femnodes_mesh or edge_table!\n"
         )
         return []
-    node_length_table = []
-    mesh_edge_length = 0
-    # FreeCAD.Console.PrintMessage("{}\n".format(len(edge_table)))
-    for me in edge_table:
-        femmesh_edgetype = len(edge_table[me])
-        if femmesh_edgetype == 2:  # 2 node femmesh edge
-            # end_node_length = mesh_edge_length / 2
-            #    ______
-            #  P1      P2
-            P1 = femnodes_mesh[edge_table[me][0]]
-            P2 = femnodes_mesh[edge_table[me][1]]
-            edge_vec = P2 - P1
-            mesh_edge_length = edge_vec.Length
-            # FreeCAD.Console.PrintMessage("{}\n".format(mesh_edge_length))
-            end_node_length = mesh_edge_length / 2.0
-            node_length_table.append((edge_table[me][0], end_node_length))
-            node_length_table.append((edge_table[me][1], end_node_length))
-
-        elif femmesh_edgetype == 3:  # 3 node femmesh edge
-            # end_node_length = mesh_edge_length / 6
-            # middle_node_length = mesh_edge_length * 2 / 3
-            #   _______ _______
-            # P1       P3      P2
-            P1 = femnodes_mesh[edge_table[me][0]]
-            P2 = femnodes_mesh[edge_table[me][1]]
-            P3 = femnodes_mesh[edge_table[me][2]]
-            edge_vec1 = P3 - P1
-            edge_vec2 = P2 - P3
-            mesh_edge_length = edge_vec1.Length + edge_vec2.Length
-            # FreeCAD.Console.PrintMessage("{} --> {}\n".format(me, mesh_edge_length))
-            end_node_length = mesh_edge_length / 6.0
-            middle_node_length = mesh_edge_length * 2.0 / 3.0
-            node_length_table.append((edge_table[me][0], end_node_length))
-            node_length_table.append((edge_table[me][1], end_node_length))
-            node_length_table.append((edge_table[me][2], middle_node_length))
-    return node_length_table
+    nodes, lengths = _get_element_node_geoms(
+        femnodes_mesh, edge_table, _get_edge_lengths, _EDGE_NODE_LENGTH_FACTORS
+    )
+    return list(zip(nodes.tolist(), lengths.tolist()))
+
+
+# ************************************************************************************************
+def get_ref_edgenodes_length_sums(femnodes_mesh, edge_table):
+    # { nodeID : length, ... , nodeID : length }
+    # sum of the node_lengths of get_ref_edgenodes_lengths, one entry for each node
+    if (not femnodes_mesh) or (not edge_table):
+        FreeCAD.Console.PrintError(
+            "Error in get_ref_edgenodes_length_sums(): Empty femnodes_mesh or edge_table!\n"
+        )
+        return {}
+    nodes, lengths = _get_element_node_geoms(
+        femnodes_mesh, edge_table, _get_edge_lengths, _EDGE_NODE_LENGTH_FACTORS
+    )
+    return _get_node_sum_geom_table(nodes, lengths)
+
+
+# node_length factors (numerators, denominator) of the mesh edge length for every node
+#   2 node edge: end nodes 1/2
+#    ______
+#  P1      P2
+#   3 node edge: end nodes 1/6, middle node 2/3
+#   _______ _______
+# P1       P3      P2
+_EDGE_NODE_LENGTH_FACTORS = {
+    2: ((1.0, 1.0), 2.0),
+    3: ((1.0, 1.0, 4.0), 6.0),
+}
+
+# node index pairs of the straight segments of a mesh edge
+_EDGE_SEGMENTS = {
+    2: ((0, 1),),
+    3: ((0, 2), (2, 1)),
+}
+
+
+def _get_edge_lengths(node_count, points):
+    # points: array (edges, node_count, 3) of the node coordinates of the mesh edges
+    lengths = None
+    for i, j in _EDGE_SEGMENTS[node_count]:
+        vec = points[:, j] - points[:, i]
+        length = np.sqrt(vec[:, 0] * vec[:, 0] + vec[:, 1] * vec[:, 1] + vec[:, 2] * vec[:, 2])
+        lengths = length if lengths is None else lengths + length
+    return lengths
 
 
 # ***** Face loads *******************************************************************************
@@ -1060,15 +1237,10 @@ def get_force_obj_face_nodeload_table(femmesh, femelement_table, femnodes_mesh,
             #    { meshfaceID : ( nodeID, ... , nodeID ) }
             face_table = get_ref_facenodes_table(femmesh, femelement_table, ref_face)
 
-            # node_area_table:
-            #    [ (nodeID, Area), ... , (nodeID, Area) ]
-            # some nodes will have more than one entry
-            node_area_table = get_ref_facenodes_areas(femnodes_mesh, face_table)
-
             # node_sum_area_table:
             #    { nodeID : Area, ... , nodeID : Area }
             # AreaSum for each node, one entry for each node
-            node_sum_area_table = get_ref_shape_node_sum_geom_table(node_area_table)
+            node_sum_area_table = get_ref_facenodes_area_sums(femnodes_mesh, face_table)
 
             # node_load_table:
             #    { nodeID : NodeLoad, ... , nodeID : NodeLoad }
@@ -1129,7 +1301,7 @@ def get_ref_facenodes_table(femmesh, femelement_table, ref_face):
             # they are not sorted, we just have the nodes.
             # We need to sort them according to the
             # shell mesh notation of tria3, tria6, quad4, quad8
-            ref_face_nodes = femmesh.getNodesByFace(ref_face)
+            ref_face_nodes = set(femmesh.getNodesByFace(ref_face))
             # try to use getccxVolumesByFace() to get the volume ids
             # of element with elementfaces on the ref_face
             # --> should work for tetra4 and tetra10
@@ -1172,7 +1344,7 @@ def get_ref_facenodes_table(femmesh, femelement_table, ref_face):
             for mf in faces:
                 face_table[mf] = femmesh.getElementNodes(mf)
     elif is_face_femmesh(femmesh):
-        ref_face_nodes = femmesh.getNodesByFace(ref_face)
+        ref_face_nodes = set(femmesh.getNodesByFace(ref_face))
         ref_face_elements = get_femelements_by_femnodes_std(femelement_table, ref_face_nodes)
         for mf in ref_face_elements:
             face_table[mf] = femelement_table[mf]
@@ -1194,138 +1366,106 @@ def get_ref_facenodes_areas(femnodes_mesh, face_table):
     if (not femnodes_mesh) or (not face_table):
         FreeCAD.Console.PrintError("Error: Empty femnodes_mesh or face_table!\n")
         return []
-    node_area_table = []
-    mesh_face_area = 0
-    for mf in face_table:
-        femmesh_facetype = len(face_table[mf])
-        # nodes in face_table need to be in the right node order for the following calculations
-        if femmesh_facetype == 3:  # 3 node femmesh face triangle
-            # corner_node_area = mesh_face_area / 3.0
-            #      P3
-            #      /\
-            #     /  \
-            #    /____\
-            #  P1      P2
-            P1 = femnodes_mesh[face_table[mf][0]]
-            P2 = femnodes_mesh[face_table[mf][1]]
-            P3 = femnodes_mesh[face_table[mf][2]]
-
-            mesh_face_area = get_triangle_area(P1, P2, P3)
-            corner_node_area = mesh_face_area / 3.0
-
-            node_area_table.append((face_table[mf][0], corner_node_area))
-            node_area_table.append((face_table[mf][1], corner_node_area))
-            node_area_table.append((face_table[mf][2], corner_node_area))
-
-        elif femmesh_facetype == 4:  # 4 node femmesh face quad
-            # corner_node_area = mesh_face_area / 4.0
-            #  P4_______P3
-            #    |     /|
-            #    | t2 / |
-            #    |   /  |
-            #    |  /   |
-            #    | / t1 |
-            #    |/_____|
-            #  P1       P2
-            P1 = femnodes_mesh[face_table[mf][0]]
-            P2 = femnodes_mesh[face_table[mf][1]]
-            P3 = femnodes_mesh[face_table[mf][2]]
-            P4 = femnodes_mesh[face_table[mf][3]]
-
-            mesh_face_t1_area = get_triangle_area(P1, P2, P3)
-            mesh_face_t2_area = get_triangle_area(P1, P3, P4)
-            mesh_face_area = mesh_face_t1_area + mesh_face_t2_area
-            corner_node_area = mesh_face_area / 4.0
-
-            node_area_table.append((face_table[mf][0], corner_node_area))
-            node_area_table.append((face_table[mf][1], corner_node_area))
-            node_area_table.append((face_table[mf][2], corner_node_area))
-            node_area_table.append((face_table[mf][3], corner_node_area))
-
-        elif femmesh_facetype == 6:  # 6 node femmesh face triangle
-            # corner_node_area = 0
-            # middle_node_area = mesh_face_area / 3.0
-            #         P3
-            #         /\
-            #        /t3\
-            #       /    \
-            #     P6------P5
-            #     / \ t4 / \
-            #    /t1 \  /t2 \
-            #   /_____\/_____\
-            # P1      P4      P2
-            P1 = femnodes_mesh[face_table[mf][0]]
-            P2 = femnodes_mesh[face_table[mf][1]]
-            P3 = femnodes_mesh[face_table[mf][2]]
-            P4 = femnodes_mesh[face_table[mf][3]]
-            P5 = femnodes_mesh[face_table[mf][4]]
-            P6 = femnodes_mesh[face_table[mf][5]]
-
-            mesh_face_t1_area = get_triangle_area(P1, P4, P6)
-            mesh_face_t2_area = get_triangle_area(P2, P5, P4)
-            mesh_face_t3_area = get_triangle_area(P3, P6, P5)
-            mesh_face_t4_area = get_triangle_area(P4, P5, P6)
-            mesh_face_area = (
-                mesh_face_t1_area + mesh_face_t2_area + mesh_face_t3_area + mesh_face_t4_area
-            )
-            middle_node_area = mesh_face_area / 3.0
-
-            node_area_table.append((face_table[mf][0], 0))
-            node_area_table.append((face_table[mf][1], 0))
-            node_area_table.append((face_table[mf][2], 0))
-            node_area_table.append((face_table[mf][3], middle_node_area))
-            node_area_table.append((face_table[mf][4], middle_node_area))
-            node_area_table.append((face_table[mf][5], middle_node_area))
-
-        elif femmesh_facetype == 8:  # 8 node femmesh face quad
-            # corner_node_area = -mesh_face_area / 12.0  (negative!)
-            # mid-side nodes = mesh_face_area / 3.0
-            #  P4_________P7________P3
-            #    |      / |  \      |
-            #    | t4 /   |    \ t3 |
-            #    |  /     |      \  |
-            #    |/       |        \|
-            #  P8|    t5  |   t6    |P6
-            #    |\       |       / |
-            #    |  \     |     /   |
-            #    | t1 \   |   /  t2 |
-            #    |______\_|_/_______|
-            #  P1         P5        P2
-            P1 = femnodes_mesh[face_table[mf][0]]
-            P2 = femnodes_mesh[face_table[mf][1]]
-            P3 = femnodes_mesh[face_table[mf][2]]
-            P4 = femnodes_mesh[face_table[mf][3]]
-            P5 = femnodes_mesh[face_table[mf][4]]
-            P6 = femnodes_mesh[face_table[mf][5]]
-            P7 = femnodes_mesh[face_table[mf][6]]
-            P8 = femnodes_mesh[face_table[mf][7]]
-
-            mesh_face_t1_area = get_triangle_area(P1, P5, P8)
-            mesh_face_t2_area = get_triangle_area(P5, P2, P6)
-            mesh_face_t3_area = get_triangle_area(P6, P3, P7)
-            mesh_face_t4_area = get_triangle_area(P7, P4, P8)
-            mesh_face_t5_area = get_triangle_area(P5, P7, P8)
-            mesh_face_t6_area = get_triangle_area(P5, P6, P7)
-            mesh_face_area = (
-                mesh_face_t1_area
-                + mesh_face_t2_area
-                + mesh_face_t3_area
-                + mesh_face_t4_area
-                + mesh_face_t5_area
-                + mesh_face_t6_area
-            )
-            corner_node_area = -mesh_face_area / 12.0
-            middle_node_area = mesh_face_area / 3.0
+    nodes, areas = _get_element_node_geoms(
+        femnodes_mesh, face_table, _get_face_areas, _FACE_NODE_AREA_FACTORS
+    )
+    return list(zip(nodes.tolist(), areas.tolist()))
+
+
+# ************************************************************************************************
+def get_ref_facenodes_area_sums(femnodes_mesh, face_table):
+    # { nodeID : Area, ... , nodeID : Area }
+    # sum of the node_areas of get_ref_facenodes_areas, one entry for each node
+    if (not femnodes_mesh) or (not face_table):
+        FreeCAD.Console.PrintError("Error: Empty femnodes_mesh or face_table!\n")
+        return {}
+    nodes, areas = _get_element_node_geoms(
+        femnodes_mesh, face_table, _get_face_areas, _FACE_NODE_AREA_FACTORS
+    )
+    return _get_node_sum_geom_table(nodes, areas)
+
+
+# node_area factors (numerators, denominator) of the mesh face area for every node,
+# nodes in face_table need to be in the right node order
+#   3 node triangle: corner nodes 1/3
+#   4 node quad: corner nodes 1/4
+#   6 node triangle: corner nodes 0, middle nodes 1/3
+#   8 node quad: corner nodes -1/12 (negative!), middle nodes 1/3
+_FACE_NODE_AREA_FACTORS = {
+    3: ((1.0, 1.0, 1.0), 3.0),
+    4: ((1.0, 1.0, 1.0, 1.0), 4.0),
+    6: ((0.0, 0.0, 0.0, 1.0, 1.0, 1.0), 3.0),
+    8: ((-1.0, -1.0, -1.0, -1.0, 4.0, 4.0, 4.0, 4.0), 12.0),
+}
+
+# node index triples of the triangles the mesh face area is summed up from
+#      P3            P4_______P3            P3                 P4_________P7________P3
+#      /\              |     /|             /\                   |      / |  \      |
+#     /  \             | t2 / |            /t3\                  | t4 /   |    \ t3 |
+#    /____\            |   /  |           /    \                 |  /     |      \  |
+#  P1      P2          |  /   |         P6------P5               |/       |        \|
+#                      | / t1 |         / \ t4 / \            P8|    t5  |   t6    |P6
+#                      |/_____|        /t1 \  /t2 \              |\       |       / |
+#                    P1       P2      /_____\/_____\             |  \     |     /   |
+#                                   P1      P4      P2           | t1 \   |   /  t2 |
+#                                                                |______\_|_/_______|
+#                                                              P1         P5        P2
+_FACE_TRIANGLES = {
+    3: ((0, 1, 2),),
+    4: ((0, 1, 2), (0, 2, 3)),
+    6: ((0, 3, 5), (1, 4, 3), (2, 5, 4), (3, 4, 5)),
+    8: ((0, 4, 7), (4, 1, 5), (5, 2, 6), (6, 3, 7), (4, 6, 7), (4, 5, 6)),
+}
+
+
+def _get_face_areas(node_count, points):
+    # points: array (faces, node_count, 3) of the node coordinates of the mesh faces
+    areas = None
+    for i, j, k in _FACE_TRIANGLES[node_count]:
+        # same as get_triangle_area
+        vec3 = np.cross(points[:, j] - points[:, i], points[:, k] - points[:, i])
+        area = 0.5 * np.sqrt(
+            vec3[:, 0] * vec3[:, 0] + vec3[:, 1] * vec3[:, 1] + vec3[:, 2] * vec3[:, 2]
+        )
+        areas = area if areas is None else areas + area
+    return areas
 
-            node_area_table.append((face_table[mf][0], corner_node_area))
-            node_area_table.append((face_table[mf][1], corner_node_area))
-            node_area_table.append((face_table[mf][2], corner_node_area))
-            node_area_table.append((face_table[mf][3], corner_node_area))
-            node_area_table.append((face_table[mf][4], middle_node_area))
-            node_area_table.append((face_table[mf][5], middle_node_area))
-            node_area_table.append((face_table[mf][6], middle_node_area))
-            node_area_table.append((face_table[mf][7], middle_node_area))
-    return node_area_table
+
+def _get_element_node_geoms(femnodes_mesh, element_table, get_geoms, node_geom_factors):
+    # node IDs and node_geoms (length or area) of all elements of element_table as flat arrays
+    # in the order of element_table, elements of unknown node count are skipped
+    node_counts = np.fromiter(
+        (len(nodes) for nodes in element_table.values()), dtype=np.int64, count=len(element_table)
+    )
+    offsets = np.concatenate(([0], np.cumsum(node_counts)))
+    nodes = np.fromiter(
+        chain.from_iterable(element_table.values()), dtype=np.int64, count=offsets[-1]
+    )
+    unique_nodes, node_index = np.unique(nodes, return_inverse=True)
+    coords = np.array(
+        [tuple(femnodes_mesh[node]) for node in unique_nodes.tolist()], dtype=float
+    ).reshape(-1, 3)
+
+    geoms = np.zeros(len(nodes))
+    known = np.zeros(len(nodes), dtype=bool)
+    for node_count, (numerators, denominator) in node_geom_factors.items():
+        elements = np.flatnonzero(node_counts == node_count)
+        if len(elements) == 0:
+            continue
+        positions = offsets[elements][:, None] + np.arange(node_count)
+        element_geoms = get_geoms(node_count, coords[node_index[positions]])
+        geoms[positions] = element_geoms[:, None] * np.array(numerators) / denominator
+        known[positions] = True
+    return nodes[known], geoms[known]
+
+
+def _get_node_sum_geom_table(nodes, geoms):
+    # same as get_ref_shape_node_sum_geom_table for node and geom arrays,
+    # the nodes are in the order of their first occurrence
+    unique_nodes, first_index, inverse = np.unique(nodes, return_index=True, return_inverse=True)
+    sums = np.bincount(inverse, weights=geoms, minlength=len(unique_nodes))
+    order = np.argsort(first_index)
+    return dict(zip(unique_nodes[order].tolist(), sums[order].tolist()))
 
 
 # ************************************************************************************************
@@ -1585,16 +1725,12 @@ def get_elements_by_references(sets_getter, femobj_ref):
         node_set = get_femnodes_by_references(sets_getter.femmesh, [sub])
         charged_volume_node_set = sorted(set(node_set))
 
-        bit_pattern_dict = get_bit_pattern_dict(
-            sets_getter.femelement_table, sets_getter.femnodes_ele_table, charged_volume_node_set
-        )
         sh = feat.getSubObject(sub_ref)
-        if sh.ShapeType == "Solid":
-            elem = get_element_volumes_elements_from_binary_search(bit_pattern_dict)
-        elif sh.ShapeType == "Face":
-            elem = get_element_faces_elements_from_binary_search(bit_pattern_dict)
-        elif sh.ShapeType == "Edge":
-            elem = get_element_edges_elements_from_binary_search(bit_pattern_dict)
+        if sh.ShapeType in ["Solid", "Face", "Edge"]:
+            # the femelement_table only has elements of the dimension of the reference shape
+            elem = sets_getter.node_element_index.get_femelements_by_femnodes(
+                charged_volume_node_set
+            )
 
         result = (sub, elem)
 
@@ -1624,20 +1760,46 @@ def get_subelements_by_references(sets_getter, femobj_ref, face_masks, edge_mask
         node_set = get_femnodes_by_references(sets_getter.femmesh, [sub])
         charged_face_node_set = sorted(set(node_set))
 
-        bit_pattern_dict = get_bit_pattern_dict(
-            sets_getter.femelement_table, sets_getter.femnodes_ele_table, charged_face_node_set
-        )
         sh = feat.getSubObject(sub_ref)
         if sh.ShapeType == "Face":
-            sub_elem = get_element_faces_from_binary_search(bit_pattern_dict, **face_masks)
+            sub_elem = sets_getter.node_element_index.get_femelements_by_masks(
+                charged_face_node_set, get_masks_by_node_count(face_masks)
+            )
         elif sh.ShapeType == "Edge":
-            sub_elem = get_element_edges_from_binary_search(bit_pattern_dict, **edge_masks)
+            sub_elem = sets_getter.node_element_index.get_femelements_by_masks(
+                charged_face_node_set, get_masks_by_node_count(edge_masks)
+            )
 
         result = (sub, sub_elem)
 
     return result
 
 
+def get_masks_by_node_count(masks):
+    """Converts face_masks or edge_masks of the sets getter, {"mask_tetra4": {...}, ...},
+    into {4: {...}, ...} as used by NodeElementIndex.get_femelements_by_masks()
+    """
+    masks_by_node_count = {}
+    for name, mask_dict in masks.items():
+        if mask_dict:
+            masks_by_node_count[_MASK_NODE_COUNTS[name]] = mask_dict
+    return masks_by_node_count
+
+
+_MASK_NODE_COUNTS = {
+    "mask_tria3": 3,
+    "mask_tria6": 6,
+    "mask_quad4": 4,
+    "mask_quad8": 8,
+    "mask_tetra4": 4,
+    "mask_tetra10": 10,
+    "mask_hexa8": 8,
+    "mask_hexa20": 20,
+    "mask_penta6": 6,
+    "mask_penta15": 15,
+}
+
+
 # ************************************************************************************************
 # ***** groups ***********************************************************************************
 def get_mesh_group_elements(mesh_group_obj, aPart):
@@ -1952,8 +2114,9 @@ def get_femmesh_eletype(femmesh, femelement_table=None):
     if not femmesh:
         FreeCAD.Console.PrintError("Error: No femmesh.\n")
     if not femelement_table:
-        FreeCAD.Console.PrintWarning("The femelement_table needs to be calculated.\n")
-        femelement_table = get_femelement_table(femmesh)
+        # only the first element is needed
+        element_ids = get_femelement_ids(femmesh)[:1]
+        femelement_table = {i: femmesh.getElementNodes(i) for i in element_ids}
     # in some cases lowest key in femelement_table is not [1]
     for elem in sorted(femelement_table):
         elem_length = len(femelement_table[elem])
@@ -29,10 +29,19 @@ __url__ = "https://www.freecad.org"
 #  \ingroup FEM
 #  \brief base objects for data extractors
 
+import hashlib
+import os
+import uuid
+
+import numpy as np
+
+from vtkmodules.util import numpy_support as vtk_np
 from vtkmodules.vtkCommonCore import vtkIntArray
 from vtkmodules.vtkCommonCore import vtkDoubleArray
 from vtkmodules.vtkCommonDataModel import vtkTable
 
+import FreeCAD
+
 from PySide.QtCore import QT_TRANSLATE_NOOP
 
 from . import base_fempythonobject
@@ -62,6 +71,208 @@ def get_extraction_dimension(obj):
     return obj.Proxy.ExtractionDimension
 
 
+# frame index
+# ###########
+# The values of a point or cell field over all frames of a source are stored as one
+# (points, frames, components) array in a .npy file of the user cache. The history
+# of a point is a single slice of the memory mapped file then, instead of a pipeline
+# update for every frame. A file is used as long as the source, the frames, the
+# state of the results and the field values of the last frame are unchanged.
+#
+# The state of the results is the document file they are restored from, with its size
+# and modification time, and the settings of the filters the source is made of. So the
+# index of a saved document is used again after a restart. Results modified after that
+# get a state which is only valid in this process, see _pipeline_state().
+
+_frame_arrays = {}  # index file: memory mapped frame array
+_pipeline_states = {}  # vtk algorithm address: (vtk pipeline modification time, state)
+
+# vtk modification times are only valid in the process they are taken in
+_session = uuid.uuid4().hex
+
+
+def get_frame_index_dir(doc):
+    # one directory per document, the index of a document can be cleared at once
+    doc_key = hashlib.sha256((doc.FileName or doc.Name).encode()).hexdigest()[:16]
+    return os.path.join(FreeCAD.getUserCachePath(), "FemPostFrames", f"{doc.Name}_{doc_key}")
+
+
+def _field_values(dataset, field):
+    # (points or cells, components) array of the field, None if there is none
+    if field == "Position":
+        array = dataset.GetPoints().GetData()
+    else:
+        array = dataset.GetPointData().GetAbstractArray(field)
+        if array is None:
+            array = dataset.GetCellData().GetAbstractArray(field)
+        if array is None:
+            return None
+    values = vtk_np.vtk_to_numpy(array)
+    return values.reshape(len(values), -1)
+
+
+_skipped_settings = {"Label", "Label2", "Visibility", "ExpressionEngine", "Frame", "Group"}
+_skipped_setting_types = {"Fem::PropertyPostDataObject", "App::PropertyPythonObject"}
+
+
+def _filter_settings(obj, settings, visited):
+    # property values of obj and the post objects it links to, data and view
+    # properties are skipped
+    if obj.Name in visited:
+        return
+    visited.add(obj.Name)
+    settings.append(f"{obj.Name}\0{obj.TypeId}")
+    for prop in sorted(getattr(obj, "PropertiesList", [])):
+        if prop in _skipped_settings:
+            continue
+        if obj.getTypeIdOfProperty(prop) in _skipped_setting_types:
+            continue
+        value = obj.getPropertyByName(prop)
+        links = value if isinstance(value, (list, tuple)) else [value]
+        if links and all(isinstance(link, FreeCAD.DocumentObject) for link in links):
+            settings.append(f"{prop}\0{[link.Name for link in links]}")
+            for link in links:
+                if "FemPost" in link.TypeId:
+                    _filter_settings(link, settings, visited)
+        else:
+            settings.append(f"{prop}\0{value!r}")
+
+
+def _results_state(source):
+    # the document file the results are restored from and the settings of every
+    # filter the source is made of, None for results of an unsaved document
+    doc_file = source.Document.FileName
+    if not doc_file or not os.path.isfile(doc_file):
+        return None
+    stat = os.stat(doc_file)
+    settings = [f"{doc_file}\0{stat.st_size}\0{stat.st_mtime_ns}"]
+    visited = set()
+    obj = source
+    while obj is not None:
+        _filter_settings(obj, settings, visited)
+        for child in getattr(obj, "Group", []):
+            _filter_settings(child, settings, visited)
+        obj = obj.getParentPostGroup() if hasattr(obj, "getParentPostGroup") else None
+    return "\0".join(settings)
+
+
+def _pipeline_state(source, algo):
+    # changes with every modification of the results, the filters or their inputs,
+    # but not with the requested timestep. The vtk modification time tells if the
+    # results are modified in this process since their state was taken
+    executive = algo.GetExecutive()
+    executive.UpdatePipelineMTime()
+    mtime = executive.GetPipelineMTime()
+    key = algo.GetAddressAsString("vtkObject")
+    entry = _pipeline_states.get(key)
+    if entry is not None and entry[0] == mtime:
+        return entry[1]
+    state = None
+    if entry is None:
+        state = _results_state(source)
+        # the address may be taken by a new algorithm later
+        algo.AddObserver("DeleteEvent", lambda *args: _pipeline_states.pop(key, None))
+    if state is None:
+        state = f"{_session}\0{mtime}"
+    _pipeline_states[key] = (mtime, state)
+    return state
+
+
+def get_frame_array(source, field, timesteps):
+    """
+    Returns the (points, frames, components) array of a point field, or of a cell
+    field as (cells, frames, components) array, or "Position" for the point
+    coordinates or "Index" for the point indices, over all timesteps of the source.
+    Returns None if there is no such field or the frames differ in its size.
+    """
+    algo = source.getOutputAlgorithm()
+    algo.UpdateTimeStep(timesteps[-1])
+    dataset = algo.GetOutputDataObject(0)
+    if field == "Index":
+        num = dataset.GetPoints().GetNumberOfPoints()
+        indices = np.arange(num, dtype=np.int32)[:, None, None]
+        return np.broadcast_to(indices, (num, len(timesteps), 1))
+    last = _field_values(dataset, field)
+    if last is None:
+        return None
+
+    fingerprint = hashlib.sha256()
+    fingerprint.update(f"{source.Name}\0{field}\0{last.shape}\0".encode())
+    fingerprint.update(_pipeline_state(source, algo).encode())
+    fingerprint.update(np.asarray(timesteps, dtype=np.float64).tobytes())
+    fingerprint.update(np.ascontiguousarray(last, dtype=np.float64).tobytes())
+    index_dir = get_frame_index_dir(source.Document)
+    index_file = os.path.join(index_dir, fingerprint.hexdigest() + ".npy")
+
+    if index_file in _frame_arrays:
+        return _frame_arrays[index_file]
+    if os.path.isfile(index_file):
+        os.utime(index_file)  # mark as recently used
+        _frame_arrays[index_file] = np.load(index_file, mmap_mode="r")
+        return _frame_arrays[index_file]
+
+    # visit every frame once, its values are one column of the index
+    os.makedirs(index_dir, exist_ok=True)
+    temp_file = f"{index_file}.{os.getpid()}.tmp"
+    shape = (last.shape[0], len(timesteps), last.shape[1])
+    frames = np.lib.format.open_memmap(temp_file, mode="w+", dtype=np.float64, shape=shape)
+    complete = True
+    for i, timestep in enumerate(timesteps):
+        algo.UpdateTimeStep(timestep)
+        values = _field_values(algo.GetOutputDataObject(0), field)
+        if values is None or values.shape != last.shape:
+            complete = False
+            break
+        frames[:, i, :] = values
+    frames.flush()
+    del frames
+    if not complete:
+        os.remove(temp_file)
+        return None
+    # rename, a concurrent run never reads a partly written index file
+    os.replace(temp_file, index_file)
+    _prune_frame_index(index_dir)
+
+    _frame_arrays[index_file] = np.load(index_file, mmap_mode="r")
+    return _frame_arrays[index_file]
+
+
+def _prune_frame_index(index_dir):
+    # remove the least recently used index files of the document
+    max_entries = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/General").GetInt(
+        "PostFrameIndexSize", 20
+    )
+    entries = [os.path.join(index_dir, f) for f in os.listdir(index_dir) if not f.endswith(".tmp")]
+    entries.sort(key=os.path.getmtime, reverse=True)
+    for entry in entries[max_entries:]:
+        _frame_arrays.pop(entry, None)
+        try:
+            os.remove(entry)
+        except OSError:
+            pass  # still memory mapped somewhere
+
+
+def get_point_history(source, field, timesteps, idx):
+    """
+    Returns a vtkDoubleArray with the values of the field at point or cell index idx
+    for every timestep, taken from the frame index. None if there is no index.
+    """
+    frames = get_frame_array(source, field, timesteps)
+    if frames is None:
+        return None
+
+    # safeguard for invalid access
+    if idx < 0 or len(frames) - 1 < idx:
+        raise Exception(f"Invalid index: {idx} is not in range 0 - {len(frames)-1}")
+
+    return vtk_np.numpy_to_vtk(np.array(frames[idx], dtype=np.float64), deep=True)
+
+
+def get_frame_values(frames, frame):
+    """Returns a vtk array with the values of all points of one frame of get_frame_array()"""
+    return vtk_np.numpy_to_vtk(np.array(frames[:, frame]), deep=True)
+
+
 # Base class for all extractors with common source and table handling functionality
 # Note: Never use directly, always subclass! This class does not create a
 #       ExtractionType/Dimension variable, hence will not work correctly.
@@ -104,10 +104,14 @@ class PostFieldData1D(base_fempostextractors.Extractor1D):
 
         else:
             algo = obj.Source.getOutputAlgorithm()
-            for timestep in timesteps:
-                algo.UpdateTimeStep(timestep)
-                dataset = algo.GetOutputDataObject(0)
-                array = self._x_array_from_dataset(obj, dataset)
+            frames = base_fempostextractors.get_frame_array(obj.Source, obj.XField, timesteps)
+            for i, timestep in enumerate(timesteps):
+                if frames is not None:
+                    array = base_fempostextractors.get_frame_values(frames, i)
+                else:
+                    algo.UpdateTimeStep(timestep)
+                    dataset = algo.GetOutputDataObject(0)
+                    array = self._x_array_from_dataset(obj, dataset)
 
                 if array.GetNumberOfComponents() > 1:
                     array.SetName(f"{obj.XField} ({obj.XComponent}) - {timestep}")
@@ -167,7 +171,16 @@ class PostIndexOverFrames1D(base_fempostextractors.Extractor1D):
         frame_array = vtkDoubleArray()
         idx = obj.Index
 
+        history = None
         if timesteps:
+            # a single slice of the frame index, None if there is none
+            history = base_fempostextractors.get_point_history(
+                obj.Source, obj.XField, timesteps, idx
+            )
+
+        if history is not None:
+            frame_array = history
+        elif timesteps:
             setup = False
             for i, timestep in enumerate(timesteps):
 
@@ -112,18 +112,27 @@ class PostFieldData2D(base_fempostextractors.Extractor2D):
 
         else:
             algo = obj.Source.getOutputAlgorithm()
-            for timestep in timesteps:
-                algo.UpdateTimeStep(timestep)
-                dataset = algo.GetOutputDataObject(0)
+            x_frames = base_fempostextractors.get_frame_array(obj.Source, obj.XField, timesteps)
+            y_frames = base_fempostextractors.get_frame_array(obj.Source, obj.YField, timesteps)
+            for i, timestep in enumerate(timesteps):
+                if x_frames is None or y_frames is None:
+                    algo.UpdateTimeStep(timestep)
+                    dataset = algo.GetOutputDataObject(0)
 
-                xarray = self._x_array_from_dataset(obj, dataset)
+                if x_frames is not None:
+                    xarray = base_fempostextractors.get_frame_values(x_frames, i)
+                else:
+                    xarray = self._x_array_from_dataset(obj, dataset)
                 if xarray.GetNumberOfComponents() > 1:
                     xarray.SetName(f"X - {obj.XField} ({obj.XComponent}) - {timestep}")
                 else:
                     xarray.SetName(f"X - {obj.XField} - {timestep}")
                 self._x_array_component_to_table(obj, xarray, table)
 
-                yarray = self._y_array_from_dataset(obj, dataset)
+                if y_frames is not None:
+                    yarray = base_fempostextractors.get_frame_values(y_frames, i)
+                else:
+                    yarray = self._y_array_from_dataset(obj, dataset)
                 if yarray.GetNumberOfComponents() > 1:
                     yarray.SetName(f"{obj.YField} ({obj.YComponent}) - {timestep}")
                 else:
@@ -192,7 +201,21 @@ class PostIndexOverFrames2D(base_fempostextractors.Extractor2D):
         frame_y_array = vtkDoubleArray()
         idx = obj.Index
 
+        history = None
         if timesteps:
+            # a single slice of the frame index, None if there is none
+            history = base_fempostextractors.get_point_history(
+                obj.Source, obj.YField, timesteps, idx
+            )
+
+        if history is not None:
+            frame_x_array.SetNumberOfTuples(len(timesteps))
+            frame_x_array.SetNumberOfComponents(1)
+            for i, timestep in enumerate(timesteps):
+                frame_x_array.SetTuple1(i, timestep)
+            frame_y_array = history
+
+        elif timesteps:
             setup = False
             frame_x_array.SetNumberOfTuples(len(timesteps))
             frame_x_array.SetNumberOfComponents(1)
@@ -227,6 +227,8 @@ class ResultMechanical(base_fempythonobject.BaseFemPythonObject):
         obj.addProperty("App::PropertyFloatList", "CriticalStrainRatio", "NodeData", "", True)
         obj.setPropertyStatus("CriticalStrainRatio", "LockDynamic")
 
+        self.add_field_file_property(obj)
+
         # initialize the Stats with the appropriate count of items
         # see fill_femresult_stats in femresult/resulttools.py
         zero_list = 26 * [0]
@@ -255,3 +257,19 @@ class ResultMechanical(base_fempythonobject.BaseFemPythonObject):
             for i in range(12, -1, -1):
                 del temp[3 * i + 1]
             obj.Stats = temp
+
+        # migrate old result objects, property "FieldFile" was added
+        if not hasattr(obj, "FieldFile"):
+            self.add_field_file_property(obj)
+
+    def add_field_file_property(self, obj):
+        # node result fields moved out of the document object,
+        # see store_result_fields in femresult/resulttools.py
+        obj.addProperty(
+            "App::PropertyFileIncluded",
+            "FieldFile",
+            "Base",
+            "Binary file with the node result fields",
+            True,
+        )
+        obj.setPropertyStatus("FieldFile", "LockDynamic")
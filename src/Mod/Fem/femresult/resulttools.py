@@ -27,6 +27,8 @@ __url__ = "https://www.freecad.org"
 #  @{
 
 import numpy as np
+import os
+import tempfile
 from math import isnan
 
 import FreeCAD
@@ -141,10 +143,13 @@ def show_displacement(resultobj, displacement_factor=0.0):
     if FreeCAD.GuiUp:
         if resultobj.Mesh.ViewObject.Visibility is False:
             resultobj.Mesh.ViewObject.Visibility = True
+        loaded = load_result_fields(resultobj, ["DisplacementVectors"])
         resultobj.Mesh.ViewObject.setNodeDisplacementByVectors(
             resultobj.NodeNumbers, resultobj.DisplacementVectors
         )
         resultobj.Mesh.ViewObject.applyDisplacement(displacement_factor)
+        # the view provider keeps its own copy
+        release_result_fields(resultobj, loaded)
 
 
 def show_result(resultobj, result_type="Sabs", limit=None):
@@ -169,6 +174,9 @@ def show_result(resultobj, result_type="Sabs", limit=None):
         reset_mesh_color(resultobj.Mesh)
         return
     if resultobj:
+        loaded = load_result_fields(
+            resultobj, ["vonMises", "DisplacementLengths", "DisplacementVectors"]
+        )
         if result_type == "Sabs":
             values = resultobj.vonMises
         elif result_type == "Uabs":
@@ -179,6 +187,8 @@ def show_result(resultobj, result_type="Sabs", limit=None):
             d = zip(*resultobj.DisplacementVectors)
             values = list(d[match[result_type]])
         show_color_by_scalar_with_cutoff(resultobj, values, limit)
+        # the view provider keeps its own copy
+        release_result_fields(resultobj, loaded)
     else:
         FreeCAD.Console.PrintError("Error, No result object given.\n")
 
@@ -312,40 +322,24 @@ def fill_femresult_stats(res_obj):
     temp_min = temp_max = 0
     mflow_min = mflow_max = npress_min = npress_max = 0
 
-    if res_obj.DisplacementVectors:
-        x_max, y_max, z_max = map(max, zip(*res_obj.DisplacementVectors))
-        x_min, y_min, z_min = map(min, zip(*res_obj.DisplacementVectors))
-    if res_obj.DisplacementLengths:
-        a_min = min(res_obj.DisplacementLengths)
-        a_max = max(res_obj.DisplacementLengths)
-    if res_obj.vonMises:
-        s_min = min(res_obj.vonMises)
-        s_max = max(res_obj.vonMises)
-    if res_obj.PrincipalMax:
-        p1_min = min(res_obj.PrincipalMax)
-        p1_max = max(res_obj.PrincipalMax)
-    if res_obj.PrincipalMed:
-        p2_min = min(res_obj.PrincipalMed)
-        p2_max = max(res_obj.PrincipalMed)
-    if res_obj.PrincipalMin:
-        p3_min = min(res_obj.PrincipalMin)
-        p3_max = max(res_obj.PrincipalMin)
-    if res_obj.MaxShear:
-        ms_min = min(res_obj.MaxShear)
-        ms_max = max(res_obj.MaxShear)
-    if res_obj.Peeq:
-        peeq_min = min(res_obj.Peeq)
-        peeq_max = max(res_obj.Peeq)
-    if res_obj.Temperature:
-        temp_min = min(res_obj.Temperature)
-        temp_max = max(res_obj.Temperature)
-    if res_obj.MassFlowRate:
-        # DisplacementVectors is empty, no_of_values needs to be set
-        mflow_min = min(res_obj.MassFlowRate)
-        mflow_max = max(res_obj.MassFlowRate)
-    if res_obj.NetworkPressure:
-        npress_min = min(res_obj.NetworkPressure)
-        npress_max = max(res_obj.NetworkPressure)
+    # every property is read only once, reading them creates a copy of all values
+    # NaN values, which can happen on Calculix frd result files, are ignored
+    disp = res_obj.DisplacementVectors
+    if disp:
+        disp = np.array(disp, dtype=float)
+        x_min, y_min, z_min = np.nanmin(disp, axis=0).tolist()
+        x_max, y_max, z_max = np.nanmax(disp, axis=0).tolist()
+    a_min, a_max = calculate_min_max(res_obj.DisplacementLengths)
+    s_min, s_max = calculate_min_max(res_obj.vonMises)
+    p1_min, p1_max = calculate_min_max(res_obj.PrincipalMax)
+    p2_min, p2_max = calculate_min_max(res_obj.PrincipalMed)
+    p3_min, p3_max = calculate_min_max(res_obj.PrincipalMin)
+    ms_min, ms_max = calculate_min_max(res_obj.MaxShear)
+    peeq_min, peeq_max = calculate_min_max(res_obj.Peeq)
+    temp_min, temp_max = calculate_min_max(res_obj.Temperature)
+    # DisplacementVectors is empty for MassFlowRate and NetworkPressure
+    mflow_min, mflow_max = calculate_min_max(res_obj.MassFlowRate)
+    npress_min, npress_max = calculate_min_max(res_obj.NetworkPressure)
 
     res_obj.Stats = [
         x_min,
@@ -411,19 +405,32 @@ def add_disp_apps(res_obj):
     return res_obj
 
 
-def add_von_mises(res_obj):
-    mstress = []
-    iterator = zip(
-        res_obj.NodeStressXX,
-        res_obj.NodeStressYY,
-        res_obj.NodeStressZZ,
-        res_obj.NodeStressXY,
-        res_obj.NodeStressXZ,
-        res_obj.NodeStressYZ,
+def get_stress_array(res_obj):
+    """Returns the node stresses of a result object as (N, 6) numpy array.
+
+    Each row is (Sxx, Syy, Szz, Sxy, Sxz, Syz).
+
+    Parameters
+    ----------
+    resultobj : Fem::ResultMechanical
+        FreeCAD FEM mechanical result object
+    """
+
+    stresses = np.column_stack(
+        (
+            res_obj.NodeStressXX,
+            res_obj.NodeStressYY,
+            res_obj.NodeStressZZ,
+            res_obj.NodeStressXY,
+            res_obj.NodeStressXZ,
+            res_obj.NodeStressYZ,
+        )
     )
-    for Sxx, Syy, Szz, Sxy, Sxz, Syz in iterator:
-        mstress.append(calculate_von_mises((Sxx, Syy, Szz, Sxy, Sxz, Syz)))
-    res_obj.vonMises = mstress
+    return stresses.astype(float, copy=False).reshape(-1, 6)
+
+
+def add_von_mises(res_obj):
+    res_obj.vonMises = calculate_von_mises_array(get_stress_array(res_obj)).tolist()
     FreeCAD.Console.PrintLog("Added von Mises stress.\n")
     return res_obj
 
@@ -433,28 +440,12 @@ def add_principal_stress_std(res_obj):
     # TODO may be use only one container for principal stresses in result object
     # https://forum.freecad.org/viewtopic.php?f=18&t=33106&p=416006#p416006
     # but which one is better
-    prinstress1 = []
-    prinstress2 = []
-    prinstress3 = []
-    shearstress = []
-    iterator = zip(
-        res_obj.NodeStressXX,
-        res_obj.NodeStressYY,
-        res_obj.NodeStressZZ,
-        res_obj.NodeStressXY,
-        res_obj.NodeStressXZ,
-        res_obj.NodeStressYZ,
-    )
-    for Sxx, Syy, Szz, Sxy, Sxz, Syz in iterator:
-        prin1, prin2, prin3, shear = calculate_principal_stress_std((Sxx, Syy, Szz, Sxy, Sxz, Syz))
-        prinstress1.append(prin1)
-        prinstress2.append(prin2)
-        prinstress3.append(prin3)
-        shearstress.append(shear)
-    res_obj.PrincipalMax = prinstress1
-    res_obj.PrincipalMed = prinstress2
-    res_obj.PrincipalMin = prinstress3
-    res_obj.MaxShear = shearstress
+    principal = calculate_principal_stress_std_array(get_stress_array(res_obj))
+    prinstress1, prinstress2, prinstress3, shearstress = principal.T
+    res_obj.PrincipalMax = prinstress1.tolist()
+    res_obj.PrincipalMed = prinstress2.tolist()
+    res_obj.PrincipalMin = prinstress3.tolist()
+    res_obj.MaxShear = shearstress.tolist()
     FreeCAD.Console.PrintLog("Added standard principal stresses and max shear values.\n")
 
     #
@@ -506,20 +497,20 @@ def calculate_csr(ps1, ps2, ps3, alpha, beta, res_obj):
             unless available from extensive research experiments
             T = pressure / von Mises stress (stress triaxiality)
     """
-    csr = []  # critical strain ratio
+    ps1 = np.asarray(ps1, dtype=float)
+    ps2 = np.asarray(ps2, dtype=float)
+    ps3 = np.asarray(ps3, dtype=float)
     nsr = len(ps1)  # number of stress results
-    for i in range(nsr):
-        p = (ps1[i] + ps2[i] + ps3[i]) / 3.0  # pressure
-        svm = np.sqrt(
-            1.5 * (ps1[i] - p) ** 2 + 1.5 * (ps2[i] - p) ** 2 + 1.5 * (ps3[i] - p) ** 2
-        )  # von Mises stress: https://en.wikipedia.org/wiki/Von_Mises_yield_criterion
-        if svm != 0.0:
-            T = p / svm  # stress triaxiality
-        else:
-            T = 0.0
-        critical_strain = alpha * np.exp(-beta * T)  # critical strain
-        csr.append(abs(res_obj.Peeq[i]) / critical_strain)  # critical strain ratio
-    return csr
+    p = (ps1 + ps2 + ps3) / 3.0  # pressure
+    svm = np.sqrt(
+        1.5 * (ps1 - p) ** 2 + 1.5 * (ps2 - p) ** 2 + 1.5 * (ps3 - p) ** 2
+    )  # von Mises stress: https://en.wikipedia.org/wiki/Von_Mises_yield_criterion
+    T = np.zeros(nsr)  # stress triaxiality
+    np.divide(p, svm, out=T, where=svm != 0.0)
+    critical_strain = alpha * np.exp(-beta * T)  # critical strain
+    peeq = np.asarray(res_obj.Peeq[:nsr], dtype=float)
+    csr = np.abs(peeq) / critical_strain  # critical strain ratio
+    return csr.tolist()
 
 
 def get_concrete_nodes(res_obj):
@@ -705,6 +696,117 @@ def compact_result(res_obj):
     return res_obj
 
 
+def get_result_field_names(res_obj):
+    """Returns the names of the node result fields of a result object
+    which can be kept in its field file, NodeNumbers are always kept.
+    """
+    return [
+        prop
+        for prop in res_obj.PropertiesList
+        if res_obj.getGroupOfProperty(prop) == "NodeData" and prop != "NodeNumbers"
+    ]
+
+
+def store_result_fields(res_obj):
+    """Moves the node result fields of a result object into its field file.
+
+    The fields are written to a binary npz file, which is included in the
+    document by the property FieldFile, and the field properties are emptied.
+    Thus the fields are neither kept in memory nor loaded on document opening.
+    They are loaded again by load_result_fields().
+
+    Parameters
+    ----------
+    res_obj : Fem::ResultMechanical
+        FreeCAD FEM mechanical result object
+    """
+    if not hasattr(res_obj, "FieldFile"):
+        FreeCAD.Console.PrintWarning(
+            f"Result object {res_obj.Label} does not support a field file.\n"
+        )
+        return
+    fields = {}
+    for name in get_result_field_names(res_obj):
+        values = getattr(res_obj, name)
+        if len(values) > 0:
+            fields[name] = np.array(values, dtype=float)
+    if not fields:
+        return
+
+    fd, field_file = tempfile.mkstemp(prefix=res_obj.Name + "_", suffix=".npz")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            # not compressed, single fields can be read from the file
+            np.savez(f, **fields)
+        # the file is copied into the document
+        res_obj.FieldFile = field_file
+    finally:
+        if os.path.isfile(field_file):
+            os.remove(field_file)
+    for name in fields:
+        setattr(res_obj, name, [])
+    FreeCAD.Console.PrintLog(
+        f"Result fields of {res_obj.Label} moved into the field file: {list(fields)}\n"
+    )
+
+
+def load_result_fields(res_obj, field_names=None):
+    """Loads node result fields from the field file of a result object.
+
+    Only empty field properties are filled. Nothing is done if the result
+    object has no field file.
+
+    Parameters
+    ----------
+    res_obj : Fem::ResultMechanical
+        FreeCAD FEM mechanical result object
+    field_names : list of str, optional
+        the fields to load, all fields of the field file if not given
+
+    Returns
+    -------
+    list of str
+        the names of the fields which were loaded
+    """
+    loaded = []
+    field_file = getattr(res_obj, "FieldFile", "")
+    if not field_file or not os.path.isfile(field_file):
+        return loaded
+    with np.load(field_file) as data:
+        names = data.files if field_names is None else set(field_names) & set(data.files)
+        for name in names:
+            if len(getattr(res_obj, name)) == 0:
+                # every access of data[name] reads the member from the file again
+                arr = data[name]
+                values = arr.tolist()
+                if arr.ndim == 2:
+                    # vector list properties need tuples
+                    values = list(map(tuple, values))
+                setattr(res_obj, name, values)
+                loaded.append(name)
+    return loaded
+
+
+def release_result_fields(res_obj, field_names=None):
+    """Empties the node result fields which are kept in the field file of a
+    result object to free their memory, see store_result_fields().
+
+    Parameters
+    ----------
+    res_obj : Fem::ResultMechanical
+        FreeCAD FEM mechanical result object
+    field_names : list of str, optional
+        the fields to empty, all fields of the field file if not given
+    """
+    field_file = getattr(res_obj, "FieldFile", "")
+    if not field_file or not os.path.isfile(field_file):
+        return
+    with np.load(field_file) as data:
+        names = data.files if field_names is None else set(field_names) & set(data.files)
+        for name in names:
+            setattr(res_obj, name, [])
+
+
 def calculate_von_mises(stress_tensor):
     """Calculate Von mises stress.
     See http://en.wikipedia.org/wiki/Von_Mises_yield_criterion
@@ -746,6 +848,44 @@ def calculate_principal_stress_std(stress_tensor):
     return (eigvals[0], eigvals[1], eigvals[2], maxshear)
 
 
+def calculate_von_mises_array(stresses):
+    """Calculate Von mises stress for many stress tensors at once.
+    See calculate_von_mises()
+
+    stresses ... (N, 6) array, each row (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+    returns (N,) array
+    """
+    stresses = np.asarray(stresses, dtype=float).reshape(-1, 6)
+    normal = stresses[:, :3]
+    shear = stresses[:, 3:]
+    pressure = normal.mean(axis=1, keepdims=True)
+    von_mises = np.sqrt(
+        1.5 * np.square(normal - pressure).sum(axis=1) + 3.0 * np.square(shear).sum(axis=1)
+    )
+    return von_mises
+
+
+def calculate_principal_stress_std_array(stresses):
+    """Calculate principal stresses and max shear for many stress tensors at once.
+    See calculate_principal_stress_std()
+
+    stresses ... (N, 6) array, each row (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+    returns (N, 4) array, each row (prin1, prin2, prin3, maxshear), prin1 >= prin2 >= prin3
+    rows with NaN in the stress tensor are all NaN
+    """
+    stresses = np.asarray(stresses, dtype=float).reshape(-1, 6)
+    result = np.full((len(stresses), 4), np.nan)
+    valid = ~np.isnan(stresses).any(axis=1)
+    s11, s22, s33, s12, s31, s23 = stresses[valid].T
+    # https://forum.freecad.org/viewtopic.php?f=18&t=24637&start=10#p240408
+    sigma = np.stack((s11, s12, s31, s12, s22, s23, s31, s23, s33), axis=1).reshape(-1, 3, 3)
+    # eigvalsh returns the eigenvalues in ascending order
+    eigvals = np.linalg.eigvalsh(sigma)[:, ::-1]
+    result[valid, :3] = eigvals
+    result[valid, 3] = (eigvals[:, 0] - eigvals[:, 2]) / 2.0
+    return result
+
+
 def calculate_principal_stress_reinforced(stress_tensor):
     """Calculate principal stress vectors and values.
 
@@ -976,7 +1116,19 @@ def calculate_mohr_coulomb(prin1, prin3, phi, fck):
 
 def calculate_disp_abs(displacements):
     # see https://forum.freecad.org/viewtopic.php?f=18&t=33106&start=100#p296657
-    return [np.linalg.norm(nd) for nd in displacements]
+    if not len(displacements):
+        return []
+    return np.linalg.norm(np.asarray(displacements, dtype=float), axis=1).tolist()
+
+
+def calculate_min_max(values):
+    """Returns (minimum, maximum) of values, NaN values are ignored.
+    (0.0, 0.0) is returned for empty values.
+    """
+    if not len(values):
+        return (0.0, 0.0)
+    values = np.asarray(values, dtype=float)
+    return (float(np.nanmin(values)), float(np.nanmax(values)))
 
 
 ##  @}
@@ -40,6 +40,7 @@ import Fem
 
 from . import writer
 from .. import settings
+from .. import telemetry
 from .calculixutils import define_masks
 
 from femmesh import meshsetsgetter
@@ -115,7 +116,11 @@ class CalculiXTools(ObjectTools):
         self.process.setProcessEnvironment(env)
         self.process.setWorkingDirectory(self.obj.WorkingDirectory)
 
-        command_list = ["-i", os.path.join(self.obj.WorkingDirectory, self.input_deck)]
+        input_deck = os.path.join(self.obj.WorkingDirectory, self.input_deck)
+        self.monitor = telemetry.CalculiXMonitor(
+            input_deck, os.path.join(self.obj.WorkingDirectory, telemetry.LOG_FILE)
+        )
+        command_list = ["-i", input_deck]
         self.process.start(ccx_bin, command_list)
 
         return self.process
@@ -27,8 +27,14 @@ __url__ = "https://www.freecad.org"
 
 
 import codecs
+import hashlib
+from itertools import chain
 from os.path import join
 
+import numpy as np
+
+import FreeCAD
+
 from femmesh import meshtools
 
 
@@ -73,14 +79,27 @@ def write_mesh(ccxwriter):
         file_name_split = ccxwriter.mesh_name + "_" + write_name + ".inp"
         ccxwriter.femmesh_file = join(ccxwriter.dir_name, file_name_split)
 
-        ccxwriter.femmesh.writeABAQUS(
-            ccxwriter.femmesh_file,
-            element_param,
-            group_param,
-            volVariant=vol_variant,
-            faceVariant=face_variant,
-            edgeVariant=edge_variant,
-        )
+        # the fluid section handling changes the mesh file after writing, never reuse it
+        fingerprint = None
+        if not ccxwriter.member.geos_fluidsection:
+            fingerprint = get_mesh_fingerprint(
+                ccxwriter, element_param, group_param, vol_variant, face_variant, edge_variant
+            )
+        if fingerprint is not None and ccxwriter.is_include_file_current(
+            file_name_split, fingerprint
+        ):
+            FreeCAD.Console.PrintMessage("Mesh is unchanged, the mesh file is not written.\n")
+        else:
+            ccxwriter.femmesh.writeABAQUS(
+                ccxwriter.femmesh_file,
+                element_param,
+                group_param,
+                volVariant=vol_variant,
+                faceVariant=face_variant,
+                edgeVariant=edge_variant,
+            )
+            if fingerprint is not None:
+                ccxwriter.set_include_fingerprint(file_name_split, fingerprint)
 
         inpfile = codecs.open(ccxwriter.file_name, "w", encoding="utf-8")
         inpfile.write("{}\n".format(59 * "*"))
@@ -103,3 +122,28 @@ def write_mesh(ccxwriter):
         inpfile.write("\n\n")
 
     return inpfile
+
+
+def get_mesh_fingerprint(ccxwriter, *write_params):
+    # hash of all the mesh file is written from, much faster than writing the mesh file
+    getter = ccxwriter.meshdatagetter
+    index = getter.node_element_index
+    if index is None:
+        return None
+    femmesh = ccxwriter.femmesh
+    femnodes_mesh = getter.femnodes_mesh
+    fingerprint = hashlib.sha256()
+    fingerprint.update(repr(write_params).encode())
+    fingerprint.update(
+        repr(
+            (femmesh.NodeCount, femmesh.EdgeCount, femmesh.FaceCount, femmesh.VolumeCount)
+        ).encode()
+    )
+    fingerprint.update(np.fromiter(femnodes_mesh, dtype=np.int64).tobytes())
+    fingerprint.update(
+        np.fromiter(chain.from_iterable(femnodes_mesh.values()), dtype=np.float64).tobytes()
+    )
+    fingerprint.update(index.element_ids.tobytes())
+    fingerprint.update(index.node_counts.tobytes())
+    fingerprint.update(index.element_nodes.tobytes())
+    return fingerprint.hexdigest()
@@ -221,6 +221,8 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
 
         # close file
         inpfile.close()
+        if self.split_inpfile:
+            self.save_include_fingerprints()
 
         writetime = round((time.process_time() - time_start), 3)
         FreeCAD.Console.PrintMessage(f"Writing time CalculiX input file: {writetime} seconds.\n")
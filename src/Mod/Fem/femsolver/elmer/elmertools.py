@@ -34,6 +34,7 @@ import FreeCAD
 
 from . import writer
 from .. import settings
+from .. import telemetry
 
 from femtools import membertools
 from femtools.objecttools import ObjectTools
@@ -86,6 +87,9 @@ class ElmerTools(ObjectTools):
         env.insert("OMP_NUM_THREADS", str(num_thr))
         self.process.setProcessEnvironment(env)
         self.process.setWorkingDirectory(self.obj.WorkingDirectory)
+        self.monitor = telemetry.ElmerMonitor(
+            os.path.join(self.obj.WorkingDirectory, telemetry.LOG_FILE)
+        )
 
         if num_proc > 1:
             # MPI parallel computing version
@@ -0,0 +1,319 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association <www.freecad.org>      *
+# *                                                                         *
+# *   This file is part of FreeCAD.                                         *
+# *                                                                         *
+# *   FreeCAD is free software: you can redistribute it and/or modify it    *
+# *   under the terms of the GNU Lesser General Public License as           *
+# *   published by the Free Software Foundation, either version 2.1 of the  *
+# *   License, or (at your option) any later version.                       *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful, but        *
+# *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU      *
+# *   Lesser General Public License for more details.                       *
+# *                                                                         *
+# *   You should have received a copy of the GNU Lesser General Public      *
+# *   License along with FreeCAD. If not, see                               *
+# *   <https://www.gnu.org/licenses/>.                                      *
+# *                                                                         *
+# ***************************************************************************
+"""Run a CalculiX analysis for every case of a parameter table.
+
+A case is a dictionary which maps "ObjectName.PropertyName" to the value of
+the property for this case. Entries of dictionary properties like the
+material card are set by "ObjectName.PropertyName.Key", e.g.:
+
+    cases = [
+        {"ConstraintForce.Force": "1000 N", "MaterialSolid.Material.YoungsModulus": "200 GPa"},
+        {"ConstraintForce.Force": "2000 N", "MaterialSolid.Material.YoungsModulus": "70 GPa"},
+    ]
+    summary = sweep.run_sweep(doc.SolverCalculiX, cases, "/tmp/sweep")
+
+The document is changed and the input deck is written in the main thread case
+by case, the solver binaries run meanwhile in a bounded pool of processes.
+"""
+
+__title__ = "FreeCAD FEM solver parameter sweep"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+
+import csv
+import hashlib
+import json
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+import FreeCAD
+
+from . import settings
+from . import telemetry
+from femsolver.calculix import calculixtools
+from femtools import membertools
+
+SUMMARY_FILE = "sweep_summary.csv"
+CASE_FILE = "sweep_case.json"
+
+
+def run_sweep(solver, cases, base_dir, max_workers=None, solver_threads=1):
+    """Run *solver* for every case of *cases* and return the summary table.
+
+    :param solver: a CalculiX solver object (Fem::SolverCalculiX) inside an analysis
+    :param cases: list of case dictionaries, see module documentation
+    :param base_dir: every case is run in its own directory base_dir/case_NNNN
+    :param max_workers: number of solver processes running at the same time,
+        the number of CPU cores is used if None
+    :param solver_threads: number of threads of each solver process (OMP_NUM_THREADS)
+
+    Returns one dictionary per case with the keys "Case", "Status",
+    "MaxVonMises", "MaxDisplacement", "WorkingDirectory" and the case parameter.
+    The values are of the last result step. The table is written to
+    base_dir/sweep_summary.csv too.
+
+    The input deck of a case is only written if the model changed since the last
+    sweep run in this directory, otherwise the deck of the last run is used.
+    The convergence records of a case are written to its telemetry.jsonl, a
+    callback of femsolver.telemetry returning True stops the case.
+    Every case is applied to the original document, parameters of a case are not
+    kept for the next one. The document is reset to its original state after the sweep.
+    """
+    if solver.Proxy.Type != "Fem::SolverCalculiX":
+        raise ValueError(f"Parameter sweep not supported for solver type {solver.Proxy.Type}")
+    ccx_binary = settings.get_binary("Calculix")
+    if not ccx_binary:
+        raise ValueError("CalculiX binary not found")
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    os.makedirs(base_dir, exist_ok=True)
+
+    doc = solver.Document
+    original_values = {}
+    original_meshes = {}
+    original_working_dir = solver.WorkingDirectory
+    futures = []
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for index, case in enumerate(cases):
+                case_dir = os.path.join(base_dir, f"case_{index:04d}")
+                os.makedirs(case_dir, exist_ok=True)
+                FreeCAD.Console.PrintMessage(f"Sweep case {index}: {case}\n")
+                try:
+                    _setup_case(solver, case, original_values, original_meshes)
+                    input_file = _prepare_case(solver, case, case_dir)
+                except Exception as e:
+                    futures.append((index, case, case_dir, None, f"Prepare failed: {e}"))
+                    continue
+                future = executor.submit(
+                    _solve_case,
+                    ccx_binary,
+                    input_file,
+                    solver_threads,
+                    solver.PastixMixedPrecision,
+                )
+                futures.append((index, case, case_dir, future, None))
+    finally:
+        # reset the document to the state before the sweep
+        _restore_document(doc, original_values, original_meshes)
+        solver.WorkingDirectory = original_working_dir
+        doc.recompute()
+
+    summary = []
+    for index, case, case_dir, future, status in futures:
+        row = {"Case": index}
+        row.update(case)
+        row.update({"Status": status, "MaxVonMises": None, "MaxDisplacement": None})
+        if future is not None:
+            row.update(future.result())
+        row["WorkingDirectory"] = case_dir
+        summary.append(row)
+        if row["Status"] != "Finished":
+            FreeCAD.Console.PrintWarning(f"Sweep case {index}: {row['Status']}\n")
+
+    _write_summary(os.path.join(base_dir, SUMMARY_FILE), summary)
+    return summary
+
+
+def get_frd_summary(frd_file):
+    """Returns maximum von Mises stress and maximum displacement of the last
+    result step of a CalculiX frd file as dictionary with the keys
+    "MaxVonMises" and "MaxDisplacement".
+    """
+    from feminout.importCcxFrdResults import iter_frd_result_steps
+    from femresult.resulttools import calculate_min_max
+    from femresult.resulttools import calculate_von_mises_array
+
+    summary = {"MaxVonMises": None, "MaxDisplacement": None}
+    for step in iter_frd_result_steps(frd_file, steps=[-1], fields=("disp", "stress")):
+        if "stress" in step:
+            von_mises = calculate_von_mises_array(step["stress"][1])
+            summary["MaxVonMises"] = calculate_min_max(von_mises)[1]
+        if "disp" in step:
+            disp_abs = np.linalg.norm(step["disp"][1], axis=1)
+            summary["MaxDisplacement"] = calculate_min_max(disp_abs)[1]
+    return summary
+
+
+def _setup_case(solver, case, original_values, original_meshes):
+    # every case starts from the original document, the values of the case before
+    # must not be kept for parameters the case does not set
+    doc = solver.Document
+    _restore_document(doc, original_values, original_meshes)
+    changed_objects = _apply_case(doc, case, original_values)
+    doc.recompute()
+    mesh_obj = membertools.get_mesh_to_solve(solver.getParentGroup())
+    # the mesh depends on its own parameter and on the geometry
+    if mesh_obj in changed_objects or any(
+        obj in mesh_obj.OutListRecursive for obj in changed_objects
+    ):
+        original_meshes.setdefault(mesh_obj.Name, mesh_obj.FemMesh.copy())
+        _remesh(mesh_obj)
+
+
+def _restore_document(doc, original_values, original_meshes):
+    for (obj_name, prop_name), value in original_values.items():
+        setattr(doc.getObject(obj_name), prop_name, value)
+    for obj_name, femmesh in original_meshes.items():
+        doc.getObject(obj_name).FemMesh = femmesh.copy()
+
+
+def _apply_case(doc, case, original_values):
+    changed_objects = []
+    for key, value in case.items():
+        obj_name, prop_name, *dict_key = key.split(".", 2)
+        obj = doc.getObject(obj_name)
+        if obj is None:
+            raise ValueError(f"Object {obj_name} of sweep parameter {key} not found")
+        old_value = getattr(obj, prop_name)
+        original_values.setdefault((obj_name, prop_name), old_value)
+        if dict_key:
+            new_value = dict(old_value)
+            new_value[dict_key[0]] = value
+            value = new_value
+        setattr(obj, prop_name, value)
+        if obj not in changed_objects:
+            changed_objects.append(obj)
+    return changed_objects
+
+
+def _remesh(mesh_obj):
+    mesh_type = getattr(getattr(mesh_obj, "Proxy", None), "Type", "")
+    if mesh_type == "Fem::FemMeshGmsh":
+        from femmesh import gmshtools
+
+        tool = gmshtools.GmshTools(mesh_obj)
+    elif mesh_type == "Fem::FemMeshNetgen":
+        from femmesh import netgentools
+
+        tool = netgentools.NetgenTools(mesh_obj)
+    else:
+        return
+    if not tool.run(blocking=True):
+        raise RuntimeError(f"Meshing of {mesh_obj.Label} failed")
+
+
+def _get_fingerprint(solver, case):
+    # the case and all analysis members the input deck is written from
+    fingerprint = hashlib.sha256()
+    fingerprint.update(json.dumps(case, sort_keys=True, default=str).encode())
+    for obj in sorted(solver.getParentGroup().Group, key=lambda o: o.Name):
+        if obj.isDerivedFrom("Fem::FemPostObject") or obj.isDerivedFrom("Fem::FemResultObject"):
+            continue
+        fingerprint.update(obj.Name.encode())
+        fingerprint.update(obj.Content.encode())
+        if obj.isDerivedFrom("Fem::FemMeshObject"):
+            femmesh = obj.FemMesh
+            fingerprint.update(np.array(list(femmesh.Nodes.values()), dtype=float).tobytes())
+            fingerprint.update(str(femmesh.ElementCount).encode())
+    return fingerprint.hexdigest()
+
+
+def _prepare_case(solver, case, case_dir):
+    # the working directory is part of the fingerprint through the solver content
+    solver.WorkingDirectory = case_dir
+    case_file = os.path.join(case_dir, CASE_FILE)
+    fingerprint = _get_fingerprint(solver, case)
+    if os.path.isfile(case_file):
+        with open(case_file) as f:
+            last_run = json.load(f)
+        if last_run.get("Fingerprint") == fingerprint and os.path.isfile(
+            last_run.get("InputFile", "")
+        ):
+            FreeCAD.Console.PrintLog(f"Sweep: input deck of {case_dir} is reused.\n")
+            return last_run["InputFile"]
+
+    # check and input deck writing of the solver
+    tool = calculixtools.CalculiXTools(solver)
+    tool.prepare()
+    with open(case_file, "w") as f:
+        json.dump(
+            {"Case": case, "Fingerprint": fingerprint, "InputFile": tool.model_file},
+            f,
+            indent=4,
+            default=str,
+        )
+    return tool.model_file
+
+
+def _solve_case(ccx_binary, input_file, solver_threads, pastix_mixed_precision):
+    # runs in a worker thread, must not touch the document
+    working_dir = os.path.dirname(input_file)
+    input_deck = os.path.splitext(input_file)[0]
+    frd_file = input_deck + ".frd"
+    if os.path.isfile(frd_file):
+        os.remove(frd_file)
+    env = dict(
+        os.environ,
+        OMP_NUM_THREADS=str(solver_threads),
+        PASTIX_MIXED_PRECISION="1" if pastix_mixed_precision else "0",
+    )
+    monitor = telemetry.CalculiXMonitor(input_deck, os.path.join(working_dir, telemetry.LOG_FILE))
+    try:
+        with open(os.path.join(working_dir, "sweep_solver.log"), "wb") as f:
+            process = subprocess.Popen(
+                [ccx_binary, "-i", input_deck],
+                cwd=working_dir,
+                env=env,
+                stdout=f,
+                stderr=subprocess.STDOUT,
+            )
+            monitor.pid = process.pid
+            # the telemetry callbacks may stop diverging cases early
+            while process.poll() is None:
+                try:
+                    process.wait(timeout=0.5)
+                except subprocess.TimeoutExpired:
+                    pass
+                monitor.poll()
+                if monitor.stop_requested:
+                    process.kill()
+                    process.wait()
+                    return {"Status": "Stopped by telemetry callback"}
+    finally:
+        monitor.close()
+    if process.returncode != 0:
+        return {"Status": f"Solver failed with exit code {process.returncode}"}
+    if not os.path.isfile(frd_file):
+        return {"Status": "No frd result file"}
+    try:
+        result = get_frd_summary(frd_file)
+    except Exception as e:
+        return {"Status": f"Reading results failed: {e}"}
+    result["Status"] = "Finished"
+    return result
+
+
+def _write_summary(summary_file, summary):
+    fieldnames = []
+    for row in summary:
+        for key in row:
+            if key not in fieldnames:
+                fieldnames.append(key)
+    with open(summary_file, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(summary)
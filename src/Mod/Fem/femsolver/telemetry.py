@@ -0,0 +1,237 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association <www.freecad.org>      *
+# *                                                                         *
+# *   This file is part of FreeCAD.                                         *
+# *                                                                         *
+# *   FreeCAD is free software: you can redistribute it and/or modify it    *
+# *   under the terms of the GNU Lesser General Public License as           *
+# *   published by the Free Software Foundation, either version 2.1 of the  *
+# *   License, or (at your option) any later version.                       *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful, but        *
+# *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU      *
+# *   Lesser General Public License for more details.                       *
+# *                                                                         *
+# *   You should have received a copy of the GNU Lesser General Public      *
+# *   License along with FreeCAD. If not, see                               *
+# *   <https://www.gnu.org/licenses/>.                                      *
+# *                                                                         *
+# ***************************************************************************
+"""Convergence telemetry of solver runs.
+
+The output of CalculiX and Elmer is parsed into convergence records while the
+solver runs. A record is a dictionary with the keys "solver", "type", "time"
+(wall time in seconds since the solver start) and "memory" (resident memory of
+the solver process in MiB, None if unknown) and the values of its type:
+
+    CalculiX "increment", from the .sta file: "step", "increment", "attempt",
+        "iterations", "total_time", "step_time", "increment_time"
+    CalculiX "iteration", from the .cvg file: "step", "increment", "attempt",
+        "iteration", "contact_elements", "residual_force", "correction_disp",
+        "residual_flux", "correction_temp" (in percent)
+    Elmer "nonlinear" and "steady_state", from the ComputeChange lines:
+        "equation", "timestep", "iteration", "norm", "change"
+
+The records are written as JSON lines to the log file of the monitor, the
+solver tools use telemetry.jsonl in the working directory, and are passed to
+the callbacks. A callback returning True stops the solver run:
+
+    def stop_diverging(record):
+        return record["type"] == "iteration" and record["residual_force"] > 1e6
+
+    telemetry.add_callback(stop_diverging)
+
+Callbacks of sweep runs are called from the worker threads.
+"""
+
+__title__ = "FreeCAD FEM solver convergence telemetry"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+
+import json
+import os
+import re
+import time
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+LOG_FILE = "telemetry.jsonl"
+
+_callbacks = []
+
+
+def add_callback(callback):
+    """call callback(record) for every record of all solver runs"""
+    if callback not in _callbacks:
+        _callbacks.append(callback)
+
+
+def remove_callback(callback):
+    if callback in _callbacks:
+        _callbacks.remove(callback)
+
+
+def get_memory(pid):
+    """resident memory of the process pid in MiB, None if it is not available"""
+    if not pid:
+        return None
+    if psutil is not None:
+        try:
+            return round(psutil.Process(pid).memory_info().rss / 2**20, 1)
+        except psutil.Error:
+            return None
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return round(int(line.split()[1]) / 2**10, 1)
+    except OSError:
+        pass
+    return None
+
+
+class ConvergenceMonitor:
+    """writes the records of a solver run to log_file and passes them to the callbacks"""
+
+    solver = ""
+
+    def __init__(self, log_file, pid=None):
+        self.log_file = log_file
+        self.pid = pid
+        self.callbacks = []
+        self.stop_requested = False
+        self.start_time = time.monotonic()
+        self._line_rest = ""
+        # a new run starts a new log
+        open(self.log_file, "w").close()
+
+    def add_record(self, record_type, values):
+        record = {
+            "solver": self.solver,
+            "type": record_type,
+            "time": round(time.monotonic() - self.start_time, 3),
+            "memory": get_memory(self.pid),
+        }
+        record.update(values)
+        with open(self.log_file, "a") as f:
+            f.write(json.dumps(record) + "\n")
+        for callback in _callbacks + self.callbacks:
+            if callback(record):
+                self.stop_requested = True
+        return record
+
+    def feed(self, text):
+        """parse solver output, incomplete lines are kept for the next call"""
+        lines = (self._line_rest + text).split("\n")
+        self._line_rest = lines.pop()
+        for line in lines:
+            self.parse_line(line.rstrip("\r"))
+
+    def parse_line(self, line):
+        pass
+
+    def poll(self):
+        """read new records of the solver files"""
+        pass
+
+    def close(self):
+        if self._line_rest:
+            self.feed("\n")
+        self.poll()
+
+
+class CalculiXMonitor(ConvergenceMonitor):
+    """reads the .sta and .cvg files CalculiX writes for every increment and iteration"""
+
+    solver = "CalculiX"
+    sta_keys = ("step", "increment", "attempt", "iterations")
+    sta_times = ("total_time", "step_time", "increment_time")
+    cvg_keys = ("step", "increment", "attempt", "iteration", "contact_elements")
+    cvg_values = ("residual_force", "correction_disp", "residual_flux", "correction_temp")
+
+    def __init__(self, input_deck, log_file, pid=None):
+        super().__init__(log_file, pid)
+        self._files = {}
+        # the iterations of an increment are read before its summary
+        for ext, record_type in ((".cvg", "iteration"), (".sta", "increment")):
+            file_name = input_deck + ext
+            # the files of a former run would be read as new records
+            if os.path.isfile(file_name):
+                os.remove(file_name)
+            self._files[file_name] = [record_type, 0, ""]
+
+    def poll(self):
+        for file_name, state in self._files.items():
+            record_type, position, rest = state
+            try:
+                with open(file_name) as f:
+                    f.seek(position)
+                    text = f.read()
+                    state[1] = f.tell()
+            except OSError:
+                continue
+            lines = (rest + text).split("\n")
+            state[2] = lines.pop()
+            for line in lines:
+                self.parse_row(record_type, line.split())
+
+    def parse_row(self, record_type, row):
+        if record_type == "increment":
+            keys, values = self.sta_keys, self.sta_times
+        else:
+            keys, values = self.cvg_keys, self.cvg_values
+        if len(row) != len(keys) + len(values):
+            return None
+        try:
+            record = dict(zip(keys, map(int, row[: len(keys)])))
+            record.update(zip(values, map(float, row[len(keys) :])))
+        except ValueError:
+            # header lines
+            return None
+        return self.add_record(record_type, record)
+
+
+class ElmerMonitor(ConvergenceMonitor):
+    """parses the change of the nonlinear and steady state iterations of the Elmer output"""
+
+    solver = "Elmer"
+    change_line = re.compile(
+        r"ComputeChange:\s+(NS|SS)\s+\(ITER=(\d+)\)\s+\(NRM,RELC\):\s+\(\s*(\S+)\s+(\S+)\s*\)"
+        r"\s*::\s*(.*\S)"
+    )
+    timestep_line = re.compile(r"MAIN: Time:\s+(\d+)/")
+
+    def __init__(self, log_file, pid=None):
+        super().__init__(log_file, pid)
+        self.timestep = 1
+
+    def parse_line(self, line):
+        timestep = self.timestep_line.search(line)
+        if timestep:
+            self.timestep = int(timestep.group(1))
+            return None
+        change = self.change_line.search(line)
+        if not change:
+            return None
+        try:
+            norm, relative_change = float(change.group(3)), float(change.group(4))
+        except ValueError:
+            # Fortran writes NaN and overflowed numbers as text or stars
+            norm = relative_change = float("nan")
+        return self.add_record(
+            "nonlinear" if change.group(1) == "NS" else "steady_state",
+            {
+                "equation": change.group(5),
+                "timestep": self.timestep,
+                "iteration": int(change.group(2)),
+                "norm": norm,
+                "change": relative_change,
+            },
+        )
@@ -28,6 +28,9 @@ __url__ = "https://www.freecad.org"
 ## \addtogroup FEM
 #  @{
 
+import hashlib
+import io
+import json
 import os
 from os.path import join
 
@@ -104,6 +107,9 @@ class FemInputWriter:
         self.femelement_edges_table = {}
         self.femelement_count_test = True
 
+        # include file name --> fingerprint of its content of the last writing
+        self.include_fingerprints = None
+
         # deprecated, leave for compatibility reasons
         # do not add new objects
         # only the ones which exists on 0.19 release are kept
@@ -173,12 +179,54 @@ class FemInputWriter:
         if self.split_inpfile is True:
             file_name_split = f"{self.mesh_name}_{write_name}.inp"
             f.write(f"*INCLUDE,INPUT={file_name_split}\n")
-            inpfile_split = open(join(self.dir_name, file_name_split), "w")
+            inpfile_split = io.StringIO()
             constraint_sets_loop_writing(inpfile_split, femobjs, write_before, write_after)
-            inpfile_split.close()
+            content = inpfile_split.getvalue()
+            fingerprint = hashlib.sha256(content.encode("utf-8")).hexdigest()
+            if not self.is_include_file_current(file_name_split, fingerprint):
+                with open(join(self.dir_name, file_name_split), "w") as inpfile_split:
+                    inpfile_split.write(content)
+                self.set_include_fingerprint(file_name_split, fingerprint)
         else:
             constraint_sets_loop_writing(f, femobjs, write_before, write_after)
 
+    # ********************************************************************************************
+    # include files of a split input file are only written if their content has changed
+    # the fingerprints of the last writing are kept in a json file in the working directory
+    def get_include_fingerprints_file(self):
+        return join(self.dir_name, self.mesh_object.Name + "_fingerprints.json")
+
+    def is_include_file_current(self, file_name_split, fingerprint):
+        if self.include_fingerprints is None:
+            self.include_fingerprints = {}
+            fingerprints_file = self.get_include_fingerprints_file()
+            if os.path.isfile(fingerprints_file):
+                try:
+                    with open(fingerprints_file) as f:
+                        self.include_fingerprints = json.load(f)
+                except (OSError, ValueError):
+                    pass
+                # removed until the writing is finished, an interrupted writing
+                # must not leave fingerprints of include files not written
+                os.remove(fingerprints_file)
+        last_fingerprint = self.include_fingerprints.pop(file_name_split, None)
+        if last_fingerprint == fingerprint and os.path.isfile(join(self.dir_name, file_name_split)):
+            self.include_fingerprints[file_name_split] = fingerprint
+            FreeCAD.Console.PrintLog(f"Include file {file_name_split} is unchanged.\n")
+            return True
+        return False
+
+    def set_include_fingerprint(self, file_name_split, fingerprint):
+        if self.include_fingerprints is None:
+            self.include_fingerprints = {}
+        self.include_fingerprints[file_name_split] = fingerprint
+
+    def save_include_fingerprints(self):
+        if not self.include_fingerprints:
+            return
+        with open(self.get_include_fingerprints_file(), "w") as f:
+            json.dump(self.include_fingerprints, f, indent=4)
+
     # write constraint property data
     def write_constraints_propdata(self, f, femobjs, con_module):
 
@@ -164,7 +164,7 @@ class _BaseLogTaskPanel(base_femtaskpanel._BaseTaskPanel, ABC):
 
     def write_output(self):
         self.write_log(
-            self.tool.process.readAllStandardOutput().data().decode("utf-8"),
+            self.tool.read_output(),
             QtGui.QColor(getOutputWinColor("Logging")),
         )
 
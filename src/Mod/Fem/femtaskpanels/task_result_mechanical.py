@@ -67,6 +67,8 @@ class _TaskPanel:
     def __init__(self, obj):
         self.result_obj = obj
         self.mesh_obj = self.result_obj.Mesh
+        # result fields kept in the field file are loaded as long as the task panel is open
+        resulttools.load_result_fields(self.result_obj)
         # task panel should be started by use of setEdit of view provider
         # in view provider checks: Mesh, active analysis and
         # if Mesh and result are in active analysis
@@ -804,6 +806,7 @@ class _TaskPanel:
 
     def reject(self):
         self.reset_result_mesh()
+        resulttools.release_result_fields(self.result_obj)
         plt.close()
         # if the tasks panel is called from Command obj is not in edit mode
         # thus reset edit does not close the dialog, maybe don't call but set in edit instead
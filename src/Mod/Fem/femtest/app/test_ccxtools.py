@@ -26,6 +26,8 @@ __title__ = "CcxTools FEM unit tests"
 __author__ = "Bernd Hahnebach"
 __url__ = "https://www.freecad.org"
 
+import json
+import os
 import unittest
 from os.path import join
 
@@ -120,6 +122,38 @@ class TestCcxTools(unittest.TestCase):
             res_obj_name=res_obj_name,
         )
 
+    # ********************************************************************************************
+    def test_box_static_split_input_reuse(self):
+        from femexamples.boxanalysis_static import setup
+
+        setup(self.document, "ccxtools", test_mode=True)
+        analysis_dir = testtools.get_fem_test_tmp_dir(self.pre_dir_name + "box_static_split")
+        solver_object = self.document.CalculiXCcxTools
+        solver_object.SplitInputWriter = True
+        fea = ccxtools.FemToolsCcx(self.document.Analysis, solver_object, test_mode=True)
+        fea.update_objects()
+        fea.setup_working_dir(analysis_dir)
+
+        fea.write_inp_file()
+        mesh_file = join(analysis_dir, self.mesh_name + "_femesh.inp")
+        fixed_file = join(analysis_dir, self.mesh_name + "_constraints_fixed_node_sets.inp")
+        self.assertTrue(os.path.isfile(mesh_file), "Mesh include file not written")
+        self.assertTrue(os.path.isfile(fixed_file), "Node set include file not written")
+        os.utime(mesh_file, (0, 0))
+        os.utime(fixed_file, (0, 0))
+
+        # only the force value changed, the include files are reused
+        self.document.Force.Force = "20000 N"
+        self.document.recompute()
+        fea.write_inp_file()
+        self.assertEqual(os.path.getmtime(mesh_file), 0, "Mesh include file was written again")
+        self.assertEqual(os.path.getmtime(fixed_file), 0, "Node set file was written again")
+
+        # changed mesh writing parameter, the mesh file is written again
+        solver_object.ReducedIntegration = not solver_object.ReducedIntegration
+        fea.write_inp_file()
+        self.assertNotEqual(os.path.getmtime(mesh_file), 0, "Mesh include file not written")
+
     # ********************************************************************************************
     def test_ccx_buckling_flexuralbuckling(self):
         from femexamples.ccx_buckling_flexuralbuckling import setup
@@ -280,6 +314,61 @@ class TestCcxTools(unittest.TestCase):
         setup(self.document, "ccxtools")
         self.input_file_writing_test(get_namefromdef("test_"))
 
+    # ********************************************************************************************
+    def test_mesh_sets_timings(self):
+        from femexamples.ccx_cantilever_faceload import setup
+        from femmesh import meshsetsgetter
+        from femtools import membertools
+
+        setup(self.document, "ccxtools")
+        fea = ccxtools.FemToolsCcx(
+            self.document.Analysis, self.document.CalculiXCcxTools, test_mode=True
+        )
+        fea.update_objects()
+        getter = meshsetsgetter.MeshSetsGetter(
+            fea.analysis, fea.solver, fea.mesh, membertools.AnalysisMember(fea.analysis)
+        )
+        getter.get_mesh_sets()
+
+        # one timing for each constraint object
+        self.assertEqual(sorted(getter.sets_timings), ["Fixed", "Force"])
+        self.assertTrue(all(seconds >= 0 for seconds in getter.sets_timings.values()))
+
+        # slowest constraint first
+        getter.sets_timings = {"Fixed": 0.25, "Force": 1.5}
+        self.assertEqual(
+            getter.get_sets_timings_report(), "    Force: 1.5 seconds\n    Fixed: 0.25 seconds\n"
+        )
+
+    # ********************************************************************************************
+    def test_mesh_tables_cache(self):
+        from femexamples.ccx_cantilever_faceload import setup
+        from femmesh import meshsetsgetter
+        from femtools import membertools
+
+        setup(self.document, "ccxtools")
+        fea = ccxtools.FemToolsCcx(
+            self.document.Analysis, self.document.CalculiXCcxTools, test_mode=True
+        )
+        fea.update_objects()
+
+        def get_mesh_sets_getter():
+            return meshsetsgetter.MeshSetsGetter(
+                fea.analysis, fea.solver, fea.mesh, membertools.AnalysisMember(fea.analysis)
+            )
+
+        # the tables of a mesh are built once
+        first = get_mesh_sets_getter()
+        second = get_mesh_sets_getter()
+        self.assertIs(second.femelement_table, first.femelement_table)
+        self.assertIs(second.node_element_index, first.node_element_index)
+
+        # and built again if the mesh is changed
+        fea.mesh.FemMesh = fea.mesh.FemMesh
+        changed = get_mesh_sets_getter()
+        self.assertIsNot(changed.node_element_index, first.node_element_index)
+        self.assertEqual(changed.femelement_table, first.femelement_table)
+
     # ********************************************************************************************
     def test_frequency_beamsimple(self):
         from femexamples.frequency_beamsimple import setup
@@ -336,6 +425,51 @@ class TestCcxTools(unittest.TestCase):
         setup(self.document, "ccxtools", test_mode=True)
         self.input_file_writing_test(get_namefromdef("test_"))
 
+    # ********************************************************************************************
+    def test_telemetry_records(self):
+        from femsolver import telemetry
+
+        working_dir = testtools.get_fem_test_tmp_dir(self.pre_dir_name + "telemetry")
+        input_deck = join(working_dir, "telemetry")
+        monitor = telemetry.CalculiXMonitor(input_deck, join(working_dir, telemetry.LOG_FILE))
+        records = []
+
+        def stop_at_third_record(record):
+            records.append(record)
+            return len(records) == 3
+
+        monitor.callbacks.append(stop_at_third_record)
+
+        with open(input_deck + ".cvg", "w") as f:
+            f.write(
+                " SUMMARY OF C0NVERGENCE INFORMATION\n"
+                "  STEP   INC  ATT  ITER     CONT.   RESID.        CORR.      RESID.      CORR.\n"
+                "     1     1    1    1        0  0.1000E+03  0.1000E+03  0.0000E+00  0.0000E+00\n"
+                "     1     1    1    2        0  0.2500E+01  0.4000E+"
+            )
+        monitor.poll()
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["type"], "iteration")
+        self.assertEqual(records[0]["residual_force"], 100.0)
+        with open(input_deck + ".cvg", "a") as f:
+            f.write("00  0.0000E+00  0.0000E+00\n")
+        with open(input_deck + ".sta", "w") as f:
+            f.write(
+                "SUMMARY OF JOB INFORMATION\n"
+                "  STEP      INC     ATT  ITRS     TOT TIME     STEP TIME         INC TIME\n"
+                "     1        1       1     2  0.100000E+01  0.100000E+01  0.100000E+01\n"
+            )
+        monitor.close()
+        self.assertEqual(len(records), 3)
+        self.assertEqual(records[1]["correction_disp"], 0.4)
+        self.assertEqual(records[2]["type"], "increment")
+        self.assertEqual(records[2]["iterations"], 2)
+        self.assertTrue(monitor.stop_requested)
+
+        with open(join(working_dir, telemetry.LOG_FILE)) as f:
+            logged = [json.loads(line) for line in f]
+        self.assertEqual(logged, records)
+
     # ********************************************************************************************
     def input_file_writing_test(
         self,
@@ -27,10 +27,13 @@ import unittest
 import importlib
 import shutil
 from os.path import join
+from unittest import mock
 
 import FreeCAD
+import Part
 
 import Fem
+import ObjectsFem
 from femexamples import manager
 from femtools.femutils import is_derived_from
 from femmesh import gmshtools
@@ -373,3 +376,142 @@ class TestGMSHRefinements(TestGMSHBase):
         except gmshtools.GmshError:
             # this exception is thrown if gmsh is not available. We pass in this case
             pass
+
+
+class TestGMSHCache(TestGMSHBase):
+    fcc_print("import TestGMSHCache")
+
+    # ********************************************************************************************
+    def test_00print(self):
+        # since method name starts with 00 this will be run first
+        # this test just prints a line with stars
+
+        fcc_print(
+            "\n{0}\n{1} run FEM TestGMSHCache tests {2}\n{0}".format(100 * "*", 10 * "*", 61 * "*")
+        )
+
+    # ********************************************************************************************
+    def test_GMSHMeshCache(self):
+
+        # the user's mesh cache is not touched by the test
+        cache_dir = join(testtools.get_fem_test_tmp_dir(self.__class__.__name__), "cache")
+        patcher = mock.patch.object(gmshtools, "get_cache_dir", return_value=cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        try:
+            self.load_example_file("gmsh_transfinite_manual")
+            gmsh = self.get_gmsh_objects()[0]
+            gmshtools.clear_cache()
+
+            tool = gmshtools.GmshTools(gmsh)
+            tool.create_mesh()
+            self.assertFalse(tool.mesh_from_cache, "First mesh run is taken from the cache")
+            node_count = gmsh.FemMesh.NodeCount
+
+            # identical meshing request
+            gmsh.FemMesh = Fem.FemMesh()
+            tool = gmshtools.GmshTools(gmsh)
+            tool.create_mesh()
+            self.assertTrue(tool.mesh_from_cache, "Identical mesh run is not taken from the cache")
+            self.assertEqual(gmsh.FemMesh.NodeCount, node_count)
+            self.compare_exact_mesh_to_sample(gmsh)
+
+            # changed mesh parameter
+            gmsh.ElementOrder = "1st" if gmsh.ElementOrder == "2nd" else "2nd"
+            tool = gmshtools.GmshTools(gmsh)
+            tool.create_mesh()
+            self.assertFalse(tool.mesh_from_cache, "Changed mesh run is taken from the cache")
+
+        except gmshtools.GmshError:
+            # this exception is thrown if gmsh is not available. We pass in this case
+            pass
+
+
+class TestGMSHBodies(TestGMSHBase):
+    fcc_print("import TestGMSHBodies")
+
+    # ********************************************************************************************
+    def test_00print(self):
+        # since method name starts with 00 this will be run first
+        # this test just prints a line with stars
+
+        fcc_print(
+            "\n{0}\n{1} run FEM TestGMSHBodies tests {2}\n{0}".format(100 * "*", 10 * "*", 60 * "*")
+        )
+
+    # ********************************************************************************************
+    def test_merge_vtk_meshes(self):
+        sample_path = join(testtools.get_fem_test_home_dir(), "gmsh", "Cube_Volume.vtk")
+        merged_path = join(testtools.get_fem_test_tmp_dir(self.__class__.__name__), "merged.vtk")
+        gmshtools.merge_vtk_meshes([sample_path, sample_path], merged_path)
+
+        sample = Fem.FemMesh()
+        sample.read(sample_path, vtk_cell_group_array="CellEntityIds")
+        merged = Fem.FemMesh()
+        merged.read(merged_path, vtk_cell_group_array="CellEntityIds")
+
+        self.assertEqual(merged.NodeCount, 2 * sample.NodeCount)
+        self.assertEqual(merged.VolumeCount, 2 * sample.VolumeCount)
+        self.assertEqual(merged.FaceCount, 2 * sample.FaceCount)
+        # the second mesh is appended with shifted node ids
+        for idx in range(1, sample.NodeCount + 1):
+            self.assertTrue(merged.Nodes[idx + sample.NodeCount].isEqual(sample.Nodes[idx], 1e-9))
+        self.assertEqual(
+            merged.getElementNodes(merged.Volumes[-1]),
+            tuple(n + sample.NodeCount for n in sample.getElementNodes(sample.Volumes[-1])),
+        )
+        # the groups hold the elements of both meshes
+        self.assertEqual(len(merged.Groups), len(sample.Groups))
+        for sample_group, merged_group in zip(sample.Groups, merged.Groups):
+            self.assertEqual(
+                len(merged.getGroupElements(merged_group)),
+                2 * len(sample.getGroupElements(sample_group)),
+            )
+
+    # ********************************************************************************************
+    def test_GMSHBodiesInParallel(self):
+
+        part = self.document.addObject("Part::Feature", "Boxes")
+        part.Shape = Part.makeCompound(
+            [Part.makeBox(10, 10, 10), Part.makeBox(10, 10, 10, FreeCAD.Vector(20, 0, 0))]
+        )
+        gmsh = ObjectsFem.makeMeshGmsh(self.document)
+        gmsh.Shape = part
+        gmsh.CharacteristicLengthMax = 5
+        self.document.recompute()
+
+        gmsh_param = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Gmsh")
+        in_parallel = gmsh_param.GetBool("MeshBodiesInParallel", False)
+        try:
+            gmsh_param.SetBool("MeshBodiesInParallel", False)
+            self.execute_gmsh(gmsh)
+            serial_mesh = gmsh.FemMesh.copy()
+
+            gmsh_param.SetBool("MeshBodiesInParallel", True)
+            tool = gmshtools.GmshTools(gmsh)
+            tool.create_mesh()
+            self.assertEqual(len(tool.body_data), 2, "The bodies are not meshed on their own")
+            mesh = gmsh.FemMesh
+
+            # both runs mesh the same boxes, small differences between gmsh runs are allowed
+            self.assertLess(abs(mesh.NodeCount - serial_mesh.NodeCount), 0.05 * mesh.NodeCount)
+            self.assertLess(
+                abs(mesh.VolumeCount - serial_mesh.VolumeCount), 0.05 * mesh.VolumeCount
+            )
+            self.assertEqual(
+                sorted(mesh.getGroupName(i) for i in mesh.Groups),
+                sorted(serial_mesh.getGroupName(i) for i in serial_mesh.Groups),
+            )
+            # every volume belongs to the solid group of its box
+            solid_groups = [i for i in mesh.Groups if mesh.getGroupName(i).startswith("Solid")]
+            self.assertEqual(
+                sum(len(mesh.getGroupElements(i)) for i in solid_groups), mesh.VolumeCount
+            )
+
+        except gmshtools.GmshError:
+            # this exception is thrown if gmsh is not available. We pass in this case
+            pass
+
+        finally:
+            gmsh_param.SetBool("MeshBodiesInParallel", in_parallel)
@@ -192,6 +192,169 @@ class TestMeshCommon(unittest.TestCase):
             f"Problem in test_writeAbaqus_precision, \n{read_node_line}\n{expected}",
         )
 
+    # ********************************************************************************************
+    def test_node_element_index(self):
+        from femmesh import meshtools
+
+        # two hexa8 sharing a face and a tetra4 on top
+        femelement_table = {
+            1: (1, 2, 3, 4, 5, 6, 7, 8),
+            2: (5, 6, 7, 8, 9, 10, 11, 12),
+            5: (9, 10, 11, 13),
+        }
+        femnodes_mesh = dict.fromkeys(range(1, 14))
+        femnodes_ele_table = meshtools.get_femnodes_ele_table(femnodes_mesh, femelement_table)
+        index = meshtools.NodeElementIndex(femelement_table)
+
+        node_sets = ([5, 6, 7, 8], list(range(5, 14)), [9, 10, 11, 13], [])
+        for node_set in node_sets:
+            self.assertEqual(
+                index.get_bit_pattern_dict(node_set),
+                meshtools.get_bit_pattern_dict(femelement_table, femnodes_ele_table, node_set),
+                f"Bit patterns of node set {node_set} are unexpected",
+            )
+            self.assertEqual(
+                index.get_femelements_by_femnodes(node_set),
+                meshtools.get_femelements_by_femnodes_std(femelement_table, node_set),
+                f"Elements of node set {node_set} are unexpected",
+            )
+
+        # element faces by masks, face 1 of hexa8 2 and face 2 of hexa8 1
+        masks = {8: {0b00001111: 1, 0b11110000: 2}}
+        self.assertEqual(index.get_femelements_by_masks([5, 6, 7, 8], masks), [[1, 2], [2, 1]])
+
+    # ********************************************************************************************
+    def test_ref_face_and_edge_node_geoms(self):
+        from femmesh import meshtools
+
+        # unit square in z=0, corner nodes 1-4, mid nodes 5-8, see get_ref_facenodes_areas
+        v = FreeCAD.Vector
+        femnodes_mesh = {
+            1: v(0, 0, 0),
+            2: v(1, 0, 0),
+            3: v(1, 1, 0),
+            4: v(0, 1, 0),
+            5: v(0.5, 0, 0),
+            6: v(1, 0.5, 0),
+            7: v(0.5, 1, 0),
+            8: v(0, 0.5, 0),
+        }
+        cases = (
+            ({1: (1, 2, 3, 4)}, {1: 0.25, 2: 0.25, 3: 0.25, 4: 0.25}),
+            ({1: (1, 2, 3), 2: (1, 3, 4)}, {1: 1 / 3, 2: 1 / 6, 3: 1 / 3, 4: 1 / 6}),
+            (
+                {1: (1, 2, 3, 4, 5, 6, 7, 8)},
+                {
+                    1: -1 / 12,
+                    2: -1 / 12,
+                    3: -1 / 12,
+                    4: -1 / 12,
+                    5: 1 / 3,
+                    6: 1 / 3,
+                    7: 1 / 3,
+                    8: 1 / 3,
+                },
+            ),
+        )
+        for face_table, expected in cases:
+            area_sums = meshtools.get_ref_facenodes_area_sums(femnodes_mesh, face_table)
+            self.assertEqual(list(area_sums), list(expected))
+            for node, area in expected.items():
+                self.assertAlmostEqual(area_sums[node], area, places=12)
+            self.assertEqual(
+                area_sums,
+                meshtools.get_ref_shape_node_sum_geom_table(
+                    meshtools.get_ref_facenodes_areas(femnodes_mesh, face_table)
+                ),
+            )
+
+        # seg2 and seg3 edges along the bottom side
+        length_sums = meshtools.get_ref_edgenodes_length_sums(
+            femnodes_mesh, {1: (1, 5), 2: (5, 2), 3: (1, 2, 5)}
+        )
+        self.assertEqual(list(length_sums), [1, 5, 2])
+        self.assertAlmostEqual(length_sums[1], 0.25 + 1 / 6, places=12)
+        self.assertAlmostEqual(length_sums[5], 0.5 + 2 / 3, places=12)
+        self.assertAlmostEqual(length_sums[2], 0.25 + 1 / 6, places=12)
+
+    # ********************************************************************************************
+    def test_femmesh_skin_faces(self):
+        from femmesh import femmesh2mesh
+
+        # two hexa8 sharing a face
+        fm = Fem.FemMesh()
+        corners = ((0, 0), (1, 0), (1, 1), (0, 1))
+        for i in range(12):
+            x, y = corners[i % 4]
+            fm.addNode(x, y, i // 4, i + 1)
+        fm.addVolume([1, 2, 3, 4, 5, 6, 7, 8], 1)
+        fm.addVolume([5, 6, 7, 8, 9, 10, 11, 12], 2)
+
+        trias, quads = femmesh2mesh.get_femmesh_skin_faces(fm)
+        self.assertEqual(len(trias), 0)
+        self.assertEqual(len(quads), 10, "The shared face is not removed from the surface")
+        self.assertNotIn([5, 6, 7, 8], sorted(sorted(q) for q in quads.tolist()))
+
+        # deformed surface, every node moved by (0, 0, 1) scaled by 2
+        facets = femmesh2mesh.get_skin_facets(fm, (list(range(1, 13)), [(0, 0, 1)] * 12), 2)
+        self.assertEqual(facets.shape, (20, 9))
+        self.assertEqual(facets[:, 2::3].min(), 2.0)
+        self.assertEqual(facets[:, 2::3].max(), 4.0)
+
+    # ********************************************************************************************
+    def test_read_inp_arrays(self):
+        from feminout import importInpMesh
+        from feminout import importToolsFem
+
+        # hexa8 and a quad4 on its bottom, the elements in an include file
+        # with a continuation line and a comment inside the data block
+        tmp_dir = testtools.get_fem_test_tmp_dir("mesh_common_inp_arrays")
+        with open(join(tmp_dir, "elements.inp"), "w") as f:
+            f.write("*ELEMENT, TYPE=C3D8, ELSET=Eall\n1, 1, 2, 3, 4, 5,\n6, 7, 8\n")
+            f.write("** comment\n*ELEMENT, TYPE=S4\n2, 1, 2, 3, 4\n")
+        inp_file = join(tmp_dir, "mesh.inp")
+        with open(inp_file, "w") as f:
+            f.write("*NODE, NSET=Nall\n")
+            corners = ((0, 0), (1, 0), (1, 1), (0, 1))
+            for i in range(8):
+                f.write("{}, {}, {}, {}\n".format(i + 1, *corners[i % 4], i // 4))
+            f.write("*INCLUDE, INPUT=elements.inp\n*STEP\n*NODE\n9, 0, 0, 0\n")
+
+        mesh_arrays = importInpMesh.read_inp_arrays(inp_file)
+        self.assertEqual(mesh_arrays["Nodes"][0].tolist(), list(range(1, 9)))
+        self.assertEqual(mesh_arrays["Hexa8Elem"][1].tolist(), [[6, 7, 8, 5, 2, 3, 4, 1]])
+
+        fm = importToolsFem.make_femmesh_arrays(mesh_arrays)
+        expected = importToolsFem.make_femmesh(importInpMesh.read_inp(inp_file))
+        self.assertEqual(fm.Nodes, expected.Nodes, "Nodes of inp mesh are unexpected")
+        self.assertEqual(fm.Faces, expected.Faces, "Faces of inp mesh are unexpected")
+        self.assertEqual(fm.Volumes, expected.Volumes, "Volumes of inp mesh are unexpected")
+        for ele in expected.Faces + expected.Volumes:
+            self.assertEqual(fm.getElementNodes(ele), expected.getElementNodes(ele))
+
+    # ********************************************************************************************
+    def test_mesh_npz(self):
+        import importlib
+        from femexamples.meshes import generate_mesh
+
+        # a mesh with edges, faces, volumes and groups
+        mesh_name = "mesh_canticcx_tetra10"
+        module = importlib.import_module("femexamples.meshes." + mesh_name)
+        expected = generate_mesh.mesh_from_existing(module.create_nodes, module.create_elements)
+        fm = generate_mesh.mesh_from_npz(mesh_name)
+
+        self.assertEqual(fm.Nodes, expected.Nodes, "Nodes of npz mesh are unexpected")
+        self.assertEqual(fm.Edges, expected.Edges, "Edges of npz mesh are unexpected")
+        self.assertEqual(fm.Faces, expected.Faces, "Faces of npz mesh are unexpected")
+        self.assertEqual(fm.Volumes, expected.Volumes, "Volumes of npz mesh are unexpected")
+        for ele in expected.Volumes:
+            self.assertEqual(fm.getElementNodes(ele), expected.getElementNodes(ele))
+        self.assertEqual(
+            [(fm.getGroupName(g), fm.getGroupElements(g)) for g in fm.Groups],
+            [(expected.getGroupName(g), expected.getGroupElements(g)) for g in expected.Groups],
+            "Groups of npz mesh are unexpected",
+        )
+
 
 # ************************************************************************************************
 # ************************************************************************************************
@@ -450,6 +613,111 @@ class TestMeshEleTetra10(unittest.TestCase):
 
         self.compare_mesh_files(femmesh_testfile, femmesh_outfile, file_extension)
 
+    # ********************************************************************************************
+    def test_tetra10_bdf(self):
+        # tetra10 element: writing to Nastran mesh file format in chunks from the FemMesh
+        from feminout import exportNastranMesh
+
+        file_extension = "bdf"
+        outfile = self.get_file_paths(file_extension)[0]
+
+        exportNastranMesh.write(self.femmesh, outfile)  # write the mesh
+        with open(outfile) as f:
+            lines = f.read().splitlines()
+        grids = [ln for ln in lines if ln.startswith("GRID*")]
+        self.assertEqual(len(grids), self.femmesh.NodeCount)
+        self.assertEqual(grids[0].split(), ["GRID*", "1", "6.00000000E+00", "1.20000000E+01"])
+        ctetra = [i for i, ln in enumerate(lines) if ln.startswith("CTETRA")]
+        self.assertEqual(len(ctetra), 1)
+        # N1, N3, N2, N4, N7, N6, N5, N8, N10, N9
+        self.assertEqual(
+            lines[ctetra[0]].split(), ["CTETRA", "1", "1", "1", "3", "2", "4", "7", "6"]
+        )
+        self.assertEqual(lines[ctetra[0] + 1].split(), ["5", "8", "10", "9"])
+        self.assertEqual(lines[-1], "ENDDATA")
+
+    # ********************************************************************************************
+    def test_tetra10_nodes_chunks(self):
+        # nodes in chunks of ascending node ids, the node ids do not need to be contiguous
+        from femmesh import meshtools
+
+        self.femmesh.addNode(1, 2, 3, 1000)
+        chunks = list(meshtools.iter_femnodes_chunks(self.femmesh, chunk_size=3))
+        self.assertEqual([len(ids) for ids, coords in chunks], [3, 3, 3, 2])
+        ids = [i for chunk_ids, coords in chunks for i in chunk_ids.tolist()]
+        self.assertEqual(ids, sorted(self.femmesh.Nodes))
+        coords = [c for chunk_ids, chunk_coords in chunks for c in chunk_coords.tolist()]
+        self.assertEqual(coords, [list(self.femmesh.Nodes[i]) for i in ids])
+
+    # ********************************************************************************************
+    def test_tetra10_z88_chunks(self):
+        # tetra10 element: the Z88 file written in chunks from the FemMesh
+        # has to be the same as the one written from the node and element tables
+        from femmesh import meshtools
+        from feminout import importZ88Mesh
+
+        file_extension = "z88"
+        outfile = self.get_file_paths(file_extension)[0]
+
+        importZ88Mesh.write(self.femmesh, outfile)
+        tablefile = outfile + ".table"
+        z88_element_type = importZ88Mesh.get_z88_element_type(self.femmesh)
+        with open(tablefile, "w") as f:
+            importZ88Mesh.write_z88_mesh_to_file(
+                self.femmesh.Nodes,
+                meshtools.get_femelement_table(self.femmesh),
+                z88_element_type,
+                f,
+            )
+        with open(outfile) as f:
+            chunked = f.read()
+        with open(tablefile) as f:
+            expected = f.read()
+        self.assertEqual(chunked, expected)
+
+    # ********************************************************************************************
+    def test_tetra10_xdmf_hdf5(self):
+        # tetra10 element: writing to XDMF with the heavy data in an HDF5 file
+        from xml.etree import ElementTree as ET
+        from feminout import writeFenicsXDMF
+
+        if not writeFenicsXDMF.has_h5py:
+            self.skipTest("h5py is not available")
+        import h5py
+
+        file_extension = "xdmf"
+        outfile = self.get_file_paths(file_extension)[0]
+        group = self.femmesh.addGroup("solid", "Volume")
+        self.femmesh.addGroupElements(group, [1])
+        mesh_obj = self.document.addObject("Fem::FemMeshObject", self.elem)
+        mesh_obj.FemMesh = self.femmesh
+
+        writeFenicsXDMF.write_fenics_mesh_xdmf(
+            mesh_obj, outfile, encoding=writeFenicsXDMF.ENCODING_HDF5
+        )
+        h5file = outfile[: -len(file_extension)] + "h5"
+        root = ET.parse(outfile).getroot()
+        geometry = root.find("Domain/Grid/Geometry/DataItem")
+        topology = root.find("Domain/Grid/Topology/DataItem")
+        self.assertEqual(geometry.get("Format"), "HDF")
+        self.assertEqual(geometry.get("NumberType"), "Float")
+        self.assertEqual(geometry.get("Precision"), "8")
+        self.assertEqual(geometry.get("Dimensions"), "10 3")
+        self.assertEqual(topology.get("NumberType"), "UInt")
+        self.assertEqual(topology.get("Dimensions"), "1 10")
+        cells = root.find("Domain/Grid[@Name='solid_mesh']/Attribute/DataItem")
+        self.assertEqual(cells.get("NumberType"), "Int")
+        self.assertEqual(cells.get("Precision"), "8")
+        with h5py.File(h5file, "r") as f:
+            nodes = f[geometry.text.split(":/")[1]][()]
+            elements = f[topology.text.split(":/")[1]][()]
+            cell_values = f[cells.text.split(":/")[1]][()]
+        expected_nodes = [list(self.expected_nodes["nodes"][i]) for i in range(1, 11)]
+        self.assertEqual(nodes.tolist(), expected_nodes)
+        # Fenics node indices start with 0
+        self.assertEqual(elements.tolist(), [list(range(10))])
+        self.assertEqual(cell_values.tolist(), [[1]])
+
 
 # ************************************************************************************************
 # ************************************************************************************************
@@ -26,6 +26,7 @@ __author__ = "Bernd Hahnebach"
 __url__ = "https://www.freecad.org"
 
 import unittest
+from math import isnan
 from os.path import join
 
 import FreeCAD
@@ -97,6 +98,40 @@ class TestResult(unittest.TestCase):
             "Calculated principal stresses are not the expected values.",
         )
 
+    # ********************************************************************************************
+    def test_stress_array(self):
+        from femresult.resulttools import calculate_principal_stress_std as pr
+        from femresult.resulttools import calculate_principal_stress_std_array as pr_array
+        from femresult.resulttools import calculate_von_mises as vm
+        from femresult.resulttools import calculate_von_mises_array as vm_array
+
+        nan = float("NaN")
+        stresses = (
+            self.get_stress_values(),
+            (2.000, -2.000, 5.000, 6.000, -4.000, 2.000),
+            (0.0, 0.0, 0.0, 0.0, 0.0, 0.0),
+            (1.0, nan, 0.0, 0.0, 0.0, 0.0),
+        )
+        mises = vm_array(stresses)
+        prin = pr_array(stresses)
+        self.assertEqual(mises.shape, (4,))
+        self.assertEqual(prin.shape, (4, 4))
+        for i, stress in enumerate(stresses[:3]):
+            self.assertAlmostEqual(
+                mises[i],
+                vm(stress),
+                places=8,
+                msg="Batched von Mises stress differs from single calculation.",
+            )
+            for value, expected in zip(prin[i], pr(stress)):
+                self.assertAlmostEqual(
+                    value,
+                    expected,
+                    places=8,
+                    msg="Batched principal stresses differ from single calculation.",
+                )
+        self.assertTrue(all(isnan(value) for value in prin[3]))
+
     # ********************************************************************************************
     def test_stress_principal_reinforced(self):
         expected_principal = (-178.0076, -194.0749, -468.9075, 145.4499)
@@ -191,3 +226,304 @@ class TestResult(unittest.TestCase):
         self.assertEqual(
             disp_abs, expected_dispabs, "Calculated displacement abs are not the expected values."
         )
+
+    # ********************************************************************************************
+    def test_read_frd_result_arrays(self):
+        from feminout import importCcxFrdResults as frd
+
+        frd_file = join(testtools.get_fem_test_home_dir(), "calculix", "box_static.frd")
+        m = frd.read_frd_result(frd_file)
+        arrays = frd.read_frd_result_arrays(frd_file)
+
+        node_ids, node_coords = arrays["Nodes"]
+        self.assertEqual(node_ids.tolist(), list(m["Nodes"]))
+        self.assertEqual(node_coords.tolist(), [list(v) for v in m["Nodes"].values()])
+        elem_ids, elem_nodes = arrays["Tetra10Elem"]
+        self.assertEqual(elem_ids.tolist(), list(m["Tetra10Elem"]))
+        self.assertEqual(elem_nodes.tolist(), [list(e) for e in m["Tetra10Elem"].values()])
+
+        self.assertEqual(len(arrays["Results"]), len(m["Results"]))
+        result_set = m["Results"][-1]
+        step = arrays["Results"][-1]
+        disp_ids, disp = step["disp"]
+        self.assertEqual(disp_ids.tolist(), list(result_set["disp"]))
+        self.assertEqual(disp.tolist(), [list(v) for v in result_set["disp"].values()])
+        stress_ids, stress = step["stress"]
+        self.assertEqual(stress.tolist(), [list(s) for s in result_set["stress"].values()])
+
+        # only the selected step and field
+        steps = list(frd.iter_frd_result_steps(frd_file, steps=[-1], fields=["stress"]))
+        self.assertEqual(len(steps), 1)
+        self.assertNotIn("disp", steps[0])
+        self.assertEqual(steps[0]["stress"][1].tolist(), stress.tolist())
+
+    # ********************************************************************************************
+    def test_frd_summary(self):
+        from femsolver import sweep
+
+        frd_file = join(testtools.get_fem_test_home_dir(), "calculix", "box_static.frd")
+        summary = sweep.get_frd_summary(frd_file)
+        # Sabs and Uabs maximum of box_static_expected_values
+        self.assertAlmostEqual(summary["MaxVonMises"], 2203.5090958167, places=6)
+        self.assertAlmostEqual(summary["MaxDisplacement"], 0.0937383460, places=8)
+
+    # ********************************************************************************************
+    def test_result_field_file(self):
+        import ObjectsFem
+        from femresult import resulttools
+
+        res_obj = ObjectsFem.makeResultMechanical(self.document, "Result")
+        res_obj.NodeNumbers = [1, 2, 3]
+        disp = [(0.0, 0.5, 1.0), (1.5, 2.0, 2.5), (3.0, 3.5, 4.0)]
+        res_obj.DisplacementVectors = disp
+        res_obj.vonMises = [10.0, 20.0, 30.0]
+
+        resulttools.store_result_fields(res_obj)
+        self.assertTrue(res_obj.FieldFile, "No field file written")
+        self.assertEqual(len(res_obj.DisplacementVectors), 0)
+        self.assertEqual(len(res_obj.vonMises), 0)
+        self.assertEqual(res_obj.NodeNumbers, [1, 2, 3])
+
+        # only the requested field
+        loaded = resulttools.load_result_fields(res_obj, ["vonMises"])
+        self.assertEqual(loaded, ["vonMises"])
+        self.assertEqual(res_obj.vonMises, [10.0, 20.0, 30.0])
+        self.assertEqual(len(res_obj.DisplacementVectors), 0)
+
+        # fields which are loaded already are not loaded again
+        loaded = resulttools.load_result_fields(res_obj)
+        self.assertEqual(loaded, ["DisplacementVectors"])
+        self.assertEqual([tuple(v) for v in res_obj.DisplacementVectors], disp)
+
+        # only the requested field
+        resulttools.release_result_fields(res_obj, ["vonMises"])
+        self.assertEqual(len(res_obj.vonMises), 0)
+        self.assertEqual(len(res_obj.DisplacementVectors), 3)
+
+        resulttools.release_result_fields(res_obj)
+        self.assertEqual(len(res_obj.DisplacementVectors), 0)
+        self.assertEqual(len(res_obj.vonMises), 0)
+
+    # ********************************************************************************************
+    def test_sweep_case_setup(self):
+        from femexamples.ccx_cantilever_nodeload import setup
+        from femsolver import sweep
+
+        setup(self.document, "ccxtools", test_mode=True)
+        solver = self.document.CalculiXCcxTools
+        force = self.document.Force
+        material = self.document.FemMaterial
+        original_force = force.Force.Value
+        original_youngs = material.Material["YoungsModulus"]
+        original_values = {}
+        original_meshes = {}
+
+        sweep._setup_case(solver, {"Force.Force": "1000 N"}, original_values, original_meshes)
+        self.assertEqual(force.Force.Value, FreeCAD.Units.Quantity("1000 N").Value)
+        self.assertEqual(material.Material["YoungsModulus"], original_youngs)
+
+        # the second case changes another property, the force of the first one is reset
+        case = {"FemMaterial.Material.YoungsModulus": "70000 MPa"}
+        sweep._setup_case(solver, case, original_values, original_meshes)
+        self.assertEqual(force.Force.Value, original_force)
+        self.assertEqual(material.Material["YoungsModulus"], "70000 MPa")
+
+        sweep._restore_document(self.document, original_values, original_meshes)
+        self.assertEqual(force.Force.Value, original_force)
+        self.assertEqual(material.Material["YoungsModulus"], original_youngs)
+        self.assertEqual(original_meshes, {})
+
+
+# ************************************************************************************************
+# ************************************************************************************************
+def get_frame_source(document, frames):
+    # a post processing source with one point field "T" and one cell field "C",
+    # frames is a list with the point values of every timestep
+    import numpy as np
+    from vtkmodules.util import numpy_support as vtk_np
+    from vtkmodules.util.vtkAlgorithm import VTKPythonAlgorithmBase
+    from vtkmodules.vtkCommonCore import vtkPoints
+    from vtkmodules.vtkCommonDataModel import vtkUnstructuredGrid
+    from vtkmodules.vtkCommonExecutionModel import vtkStreamingDemandDrivenPipeline as pipeline
+
+    class FrameAlgorithm(VTKPythonAlgorithmBase):
+        def __init__(self):
+            super().__init__(nInputPorts=0, nOutputPorts=1, outputType="vtkUnstructuredGrid")
+
+        def RequestInformation(self, request, inInfo, outInfo):
+            info = outInfo.GetInformationObject(0)
+            timesteps = [float(t) for t in range(len(frames))]
+            info.Set(pipeline.TIME_STEPS(), timesteps, len(timesteps))
+            info.Set(pipeline.TIME_RANGE(), [timesteps[0], timesteps[-1]], 2)
+            return 1
+
+        def RequestData(self, request, inInfo, outInfo):
+            info = outInfo.GetInformationObject(0)
+            timestep = 0.0
+            if info.Has(pipeline.UPDATE_TIME_STEP()):
+                timestep = info.Get(pipeline.UPDATE_TIME_STEP())
+            values = np.array(frames[int(round(timestep))], dtype=float)
+            points = vtkPoints()
+            for i in range(len(values)):
+                points.InsertNextPoint(i, 0, 0)
+            dataset = vtkUnstructuredGrid.GetData(outInfo)
+            dataset.SetPoints(points)
+            point_array = vtk_np.numpy_to_vtk(values, deep=True)
+            point_array.SetName("T")
+            dataset.GetPointData().AddArray(point_array)
+            # one cell value per frame, the sum of the point values
+            cell_array = vtk_np.numpy_to_vtk(values.sum(keepdims=True), deep=True)
+            cell_array.SetName("C")
+            dataset.GetCellData().AddArray(cell_array)
+            return 1
+
+    class FrameSource:
+        def __init__(self):
+            self.Name = "FrameSource"
+            self.TypeId = "Fem::FemPostPipeline"
+            self.Document = document
+            self.algorithm = FrameAlgorithm()
+
+        def getOutputAlgorithm(self):
+            return self.algorithm
+
+    return FrameSource()
+
+
+class TestFrameIndex(unittest.TestCase):
+    fcc_print("import TestFrameIndex")
+
+    # ********************************************************************************************
+    def setUp(self):
+        # setUp is executed before every test
+
+        if "BUILD_FEM_VTK_PYTHON" not in FreeCAD.__cmake__:
+            self.skipTest("FEM VTK Python support is not available")
+
+        # new document
+        self.document = FreeCAD.newDocument(self.__class__.__name__)
+        self.frames = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0]]
+        self.timesteps = [0.0, 1.0, 2.0]
+        self.source = get_frame_source(self.document, self.frames)
+
+    # ********************************************************************************************
+    def tearDown(self):
+        # tearDown is executed after every test
+        import shutil
+        from femobjects import base_fempostextractors
+
+        index_dir = base_fempostextractors.get_frame_index_dir(self.document)
+        for index_file in list(base_fempostextractors._frame_arrays):
+            if index_file.startswith(index_dir):
+                del base_fempostextractors._frame_arrays[index_file]
+        shutil.rmtree(index_dir, ignore_errors=True)
+        FreeCAD.closeDocument(self.document.Name)
+
+    # ********************************************************************************************
+    def test_00print(self):
+        # since method name starts with 00 this will be run first
+        # this test just prints a line with stars
+        fcc_print(
+            "\n{0}\n{1} run FEM TestFrameIndex tests {2}\n{0}".format(100 * "*", 10 * "*", 60 * "*")
+        )
+
+    # ********************************************************************************************
+    def test_point_history(self):
+        from femobjects import base_fempostextractors
+
+        history = base_fempostextractors.get_point_history(self.source, "T", self.timesteps, 1)
+        self.assertEqual(
+            [history.GetValue(i) for i in range(history.GetNumberOfTuples())], [2.0, 5.0, 8.0]
+        )
+        with self.assertRaises(Exception):
+            base_fempostextractors.get_point_history(self.source, "T", self.timesteps, 3)
+
+    # ********************************************************************************************
+    def test_frame_values(self):
+        from femobjects import base_fempostextractors
+
+        frames = base_fempostextractors.get_frame_array(self.source, "T", self.timesteps)
+        self.assertEqual(frames.shape, (3, 3, 1))
+        values = base_fempostextractors.get_frame_values(frames, 1)
+        self.assertEqual([values.GetValue(i) for i in range(3)], [4.0, 5.0, 6.0])
+
+        # cell fields are indexed as well
+        frames = base_fempostextractors.get_frame_array(self.source, "C", self.timesteps)
+        self.assertEqual(frames.shape, (1, 3, 1))
+        self.assertEqual(frames[0, :, 0].tolist(), [6.0, 15.0, 24.0])
+
+        # unknown fields have no index
+        self.assertIsNone(
+            base_fempostextractors.get_frame_array(self.source, "Unknown", self.timesteps)
+        )
+
+    # ********************************************************************************************
+    def test_frame_index_modified(self):
+        from femobjects import base_fempostextractors
+
+        frames = base_fempostextractors.get_frame_array(self.source, "T", self.timesteps)
+        self.assertEqual(frames[0, :, 0].tolist(), [1.0, 4.0, 7.0])
+
+        # a frame before the last one changes, the index must not be used anymore
+        self.frames[0][0] = 10.0
+        self.source.getOutputAlgorithm().Modified()
+        frames = base_fempostextractors.get_frame_array(self.source, "T", self.timesteps)
+        self.assertEqual(frames[0, :, 0].tolist(), [10.0, 4.0, 7.0])
+
+    # ********************************************************************************************
+    def test_frame_index_restart(self):
+        import os
+        from femobjects import base_fempostextractors
+
+        doc_file = join(testtools.get_fem_test_tmp_dir(self.__class__.__name__), "index.FCStd")
+        self.document.saveAs(doc_file)
+        frames = base_fempostextractors.get_frame_array(self.source, "T", self.timesteps)
+        index_dir = base_fempostextractors.get_frame_index_dir(self.document)
+        index_files = os.listdir(index_dir)
+        self.assertEqual(len(index_files), 1)
+
+        # a restart, new vtk objects in a new session use the index of the saved document
+        self.addCleanup(
+            setattr, base_fempostextractors, "_session", base_fempostextractors._session
+        )
+        base_fempostextractors._session = "restart"
+        base_fempostextractors._frame_arrays.clear()
+        base_fempostextractors._pipeline_states.clear()
+        self.source = get_frame_source(self.document, self.frames)
+        restarted = base_fempostextractors.get_frame_array(self.source, "T", self.timesteps)
+        self.assertEqual(os.listdir(index_dir), index_files)
+        self.assertEqual(restarted.tolist(), frames.tolist())
+
+        # a changed document file is indexed again
+        base_fempostextractors._pipeline_states.clear()
+        stat = os.stat(doc_file)
+        os.utime(doc_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        base_fempostextractors.get_frame_array(self.source, "T", self.timesteps)
+        self.assertEqual(len(os.listdir(index_dir)), 2)
+
+    # ********************************************************************************************
+    def test_prune_frame_index(self):
+        import os
+        import time
+        from femobjects import base_fempostextractors
+
+        index_dir = base_fempostextractors.get_frame_index_dir(self.document)
+        os.makedirs(index_dir, exist_ok=True)
+        now = time.time()
+        names = ["a.npy", "b.npy", "c.npy", "d.npy.1.tmp"]
+        for i, name in enumerate(names):
+            file_path = os.path.join(index_dir, name)
+            with open(file_path, "wb"):
+                pass
+            # a is the least recently used file
+            os.utime(file_path, (now + i, now + i))
+
+        fem_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/General")
+        index_size = fem_prefs.GetInt("PostFrameIndexSize", 20)
+        fem_prefs.SetInt("PostFrameIndexSize", 2)
+        try:
+            base_fempostextractors._prune_frame_index(index_dir)
+        finally:
+            fem_prefs.SetInt("PostFrameIndexSize", index_size)
+        # files being written are not removed
+        self.assertEqual(sorted(os.listdir(index_dir)), ["b.npy", "c.npy", "d.npy.1.tmp"])
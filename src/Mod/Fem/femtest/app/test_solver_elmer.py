@@ -171,6 +171,32 @@ class TestSolverElmer(unittest.TestCase):
         setup(self.document, "elmer", test_mode=True)
         self.input_file_writing_test(get_namefromdef("test_"))
 
+    # ********************************************************************************************
+    def test_telemetry_records(self):
+        from femsolver import telemetry
+
+        working_dir = testtools.get_fem_test_tmp_dir(self.pre_dir_name + "telemetry")
+        monitor = telemetry.ElmerMonitor(join(working_dir, telemetry.LOG_FILE))
+        records = []
+        monitor.callbacks.append(records.append)
+        monitor.feed(
+            "MAIN: Time: 2/10   2.0000000000000000E-002\n"
+            "ComputeChange: NS (ITER=3) (NRM,RELC): (  0.52478630      0.12000000E-03 ) "
+            ":: heat equation\n"
+            "ComputeChange: SS (ITER=1) (NRM,RELC): (   1.2345678      2.0000000     ) "
+            ":: heat"
+        )
+        self.assertEqual(len(records), 1)
+        monitor.feed(" equation\n")
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records[0]["type"], "nonlinear")
+        self.assertEqual(records[0]["timestep"], 2)
+        self.assertEqual(records[0]["iteration"], 3)
+        self.assertEqual(records[0]["change"], 1.2e-4)
+        self.assertEqual(records[1]["type"], "steady_state")
+        self.assertEqual(records[1]["equation"], "heat equation")
+        self.assertFalse(monitor.stop_requested)
+
     # ********************************************************************************************
     def input_file_writing_test(self, base_name):
         self.document.recompute()
@@ -40,6 +40,7 @@ make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_object.TestObjectCreate
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_object.TestObjectType
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_open.TestObjectOpen
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_result.TestResult
+make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_result.TestFrameIndex
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_solver_calculix.TestSolverCalculix
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_solver_elmer.TestSolverElmer
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_solver_mystran.TestSolverMystran
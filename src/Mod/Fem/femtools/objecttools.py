@@ -28,11 +28,15 @@ __url__ = "https://www.freecad.org"
 
 from PySide.QtCore import QProcess
 from abc import ABC, abstractmethod
+from collections import deque
 import os
 import tempfile
 
 import FreeCAD
 
+# count of process output chunks kept for read_output()
+OUTPUT_CHUNKS = 1000
+
 
 class ObjectTools(ABC):
     """Abstract base class for the work with solvers and meshers"""
@@ -44,8 +48,16 @@ class ObjectTools(ABC):
         self.process = QProcess()
         self.analysis = obj.getParentGroup()
         self.fem_param = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem")
+        # convergence monitor of the solver run, see femsolver.telemetry
+        self.monitor = None
+        # without a reader of read_output() the oldest output chunks are dropped
+        self._output = deque(maxlen=OUTPUT_CHUNKS)
+        # set if a run is completed without starting the process
+        self._completed = False
         self._create_working_directory()
 
+        self.process.started.connect(self._process_started)
+        self.process.readyReadStandardOutput.connect(self._read_output)
         self.process.finished.connect(self._process_finished)
 
     def _create_working_directory(self):
@@ -86,12 +98,50 @@ class ObjectTools(ABC):
         pass
 
     def run(self, blocking=False):
+        self._completed = False
         self.prepare()
         self.compute()
         if blocking:
-            return self.process.waitForFinished(-1)
+            return self._completed or self.process.waitForFinished(-1)
         return None
 
+    def complete(self):
+        """
+        Complete a run without starting the process, e.g. if the result is taken
+        from a cache. The finished signal is emitted for the connected receivers
+        """
+        self._completed = True
+        self.process.finished.emit(0, QProcess.ExitStatus.NormalExit)
+
+    def read_output(self):
+        """
+        Standard output of the process since the last call, at most
+        the last OUTPUT_CHUNKS chunks of it
+        """
+        output = "".join(self._output)
+        self._output.clear()
+        return output
+
+    def _process_started(self):
+        if self.monitor:
+            self.monitor.pid = self.process.processId()
+
+    def _read_output(self):
+        # the tool reads the output first, the task panel gets it by read_output()
+        output = self.process.readAllStandardOutput().data().decode("utf-8", errors="replace")
+        self._output.append(output)
+        if self.monitor:
+            self.monitor.feed(output)
+            self.monitor.poll()
+            if self.monitor.stop_requested:
+                FreeCAD.Console.PrintWarning(f"{self.name} run stopped by telemetry callback\n")
+                self.monitor.close()
+                self.monitor = None
+                self.process.kill()
+
     def _process_finished(self, code, status):
+        if self.monitor:
+            self.monitor.close()
+            self.monitor = None
         if status == QProcess.ExitStatus.NormalExit and code == 0:
             self.update_properties()